@@ -0,0 +1,102 @@
+"""add plan_stats table maintained by triggers
+
+Revision ID: b3e1f7a9c2d4
+Revises: e56f9b50e5f2
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e1f7a9c2d4'
+down_revision: Union[str, None] = 'e56f9b50e5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('plan_stats',
+    sa.Column('plan_id', sa.UUID(), nullable=False),
+    sa.Column('total_days', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('subscription_count', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.ForeignKeyConstraint(['plan_id'], ['plans.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('plan_id')
+    )
+    op.create_index('idx_plan_stats_subscription_count', 'plan_stats', ['subscription_count'], unique=False)
+
+    # Counters move in the same transaction as the row that changes them, whichever code path writes it
+    op.execute("""
+        CREATE OR REPLACE FUNCTION plan_stats_adjust(target_plan_id uuid, days_delta integer, subscriptions_delta integer)
+        RETURNS void AS $$
+        BEGIN
+            INSERT INTO plan_stats (plan_id, total_days, subscription_count)
+            SELECT target_plan_id, GREATEST(days_delta, 0), GREATEST(subscriptions_delta, 0)
+            WHERE EXISTS (SELECT 1 FROM plans WHERE id = target_plan_id)
+            ON CONFLICT (plan_id) DO UPDATE SET
+                total_days = GREATEST(plan_stats.total_days + days_delta, 0),
+                subscription_count = GREATEST(plan_stats.subscription_count + subscriptions_delta, 0);
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION plan_stats_track_items() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM plan_stats_adjust(NEW.plan_id, 1, 0);
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                PERFORM plan_stats_adjust(OLD.plan_id, -1, 0);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION plan_stats_track_enrollments() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                PERFORM plan_stats_adjust(NEW.plan_id, 0, 1);
+            END IF;
+            IF TG_OP IN ('DELETE', 'UPDATE') THEN
+                PERFORM plan_stats_adjust(OLD.plan_id, 0, -1);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_items_plan_stats
+        AFTER INSERT OR DELETE OR UPDATE OF plan_id ON items
+        FOR EACH ROW EXECUTE FUNCTION plan_stats_track_items();
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_user_plan_progress_plan_stats
+        AFTER INSERT OR DELETE OR UPDATE OF plan_id ON user_plan_progress
+        FOR EACH ROW EXECUTE FUNCTION plan_stats_track_enrollments();
+    """)
+
+    # Backfill from the current rows; user_plan_progress is unique per (user_id, plan_id)
+    op.execute("""
+        INSERT INTO plan_stats (plan_id, total_days, subscription_count)
+        SELECT plans.id,
+               (SELECT count(*) FROM items WHERE items.plan_id = plans.id),
+               (SELECT count(*) FROM user_plan_progress WHERE user_plan_progress.plan_id = plans.id)
+        FROM plans
+        ON CONFLICT (plan_id) DO UPDATE SET
+            total_days = EXCLUDED.total_days,
+            subscription_count = EXCLUDED.subscription_count;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_user_plan_progress_plan_stats ON user_plan_progress;")
+    op.execute("DROP TRIGGER IF EXISTS trg_items_plan_stats ON items;")
+    op.execute("DROP FUNCTION IF EXISTS plan_stats_track_enrollments();")
+    op.execute("DROP FUNCTION IF EXISTS plan_stats_track_items();")
+    op.execute("DROP FUNCTION IF EXISTS plan_stats_adjust(uuid, integer, integer);")
+    op.drop_index('idx_plan_stats_subscription_count', table_name='plan_stats')
+    op.drop_table('plan_stats')
@@ -0,0 +1,63 @@
+"""add trigram and full text search indexes for plans
+
+Revision ID: c8d2e4f6a1b3
+Revises: b3e1f7a9c2d4
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2e4f6a1b3'
+down_revision: Union[str, None] = 'b3e1f7a9c2d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    # Substring search on title and description (ILIKE '%term%') through trigram indexes
+    op.create_index('idx_plans_title_trgm', 'plans', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('idx_plans_description_trgm', 'plans', ['description'], unique=False, postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'})
+
+    # Ranked full text search, english plans are stemmed and the other languages use the simple config
+    op.add_column('plans', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    op.execute("""
+        CREATE OR REPLACE FUNCTION plans_search_vector_update() RETURNS trigger AS $$
+        DECLARE
+            search_config regconfig := CASE NEW.language::text WHEN 'EN' THEN 'english'::regconfig ELSE 'simple'::regconfig END;
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector(search_config, COALESCE(NEW.title, '')), 'A') ||
+                setweight(to_tsvector(search_config, COALESCE(NEW.description, '')), 'B');
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_plans_search_vector
+        BEFORE INSERT OR UPDATE OF title, description, language ON plans
+        FOR EACH ROW EXECUTE FUNCTION plans_search_vector_update();
+    """)
+    # Fire the trigger once for the existing rows
+    op.execute("UPDATE plans SET title = title;")
+    op.create_index('idx_plans_search_vector', 'plans', ['search_vector'], unique=False, postgresql_using='gin')
+
+    # The english-only expression index is superseded by the per-language vector
+    op.drop_index('idx_plans_search', table_name='plans', postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.create_index('idx_plans_search', 'plans', [sa.text("to_tsvector('english', title || ' ' || COALESCE(description, ''))")], unique=False, postgresql_using='gin')
+    op.drop_index('idx_plans_search_vector', table_name='plans', postgresql_using='gin')
+    op.execute("DROP TRIGGER IF EXISTS trg_plans_search_vector ON plans;")
+    op.execute("DROP FUNCTION IF EXISTS plans_search_vector_update();")
+    op.drop_column('plans', 'search_vector')
+    op.drop_index('idx_plans_description_trgm', table_name='plans', postgresql_using='gin')
+    op.drop_index('idx_plans_title_trgm', table_name='plans', postgresql_using='gin')
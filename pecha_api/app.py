@@ -36,6 +36,7 @@ from pecha_api.text_uploader.text_metadata import text_metadata_views
 from pecha_api.text_uploader.collections import uploader_collections_views
 from pecha_api.collections import collections_openpecha_views
 from pecha_api.routines import routines_views
+from pecha_api.cache import cache_views
 import uvicorn
 
 api = FastAPI(
@@ -78,6 +79,7 @@ api.include_router(routines_views.routines_router)
 api.include_router(collections_openpecha_views.collections_v2_router)
 
 api.include_router(routines_views.user_routine_router)
+api.include_router(cache_views.cache_router)
 api.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -2,13 +2,13 @@ import logging
 from typing import Dict, Any
 
 from jose import jwt
-import requests
 from jose import JWTError
 from passlib.context import CryptContext
 from datetime import datetime, timedelta, timezone
 
 from ..config import get_float, get
 from ..users.users_models import Users
+from .jwks_key_store import jwks_key_store
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -73,17 +73,10 @@ def decode_backend_token(token: str):
     return jwt.decode(token, get("JWT_SECRET_KEY"), algorithms=[get("JWT_ALGORITHM")], audience=get("JWT_AUD"))
 
 
-def get_auth0_public_key():
-    jwks_url = f"https://{get('DOMAIN_NAME')}/.well-known/jwks.json"
-    jwks = requests.get(jwks_url).json()
-    return {key["kid"]: key for key in jwks["keys"]}
-
-
 def verify_auth0_token(token: str):
     try:
-        jwks = get_auth0_public_key()
         unverified_header = jwt.get_unverified_header(token)
-        rsa_key = jwks.get(unverified_header["kid"])
+        rsa_key = jwks_key_store.get_key(unverified_header["kid"])
 
         if not rsa_key:
             raise ValueError("Unable to find appropriate key")
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..config import get, get_int
+
+_MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def _jwks_url() -> str:
+    return f"https://{get('DOMAIN_NAME')}/.well-known/jwks.json"
+
+
+class JwksKeyStore:
+    """
+    In-memory Auth0 signing keys, so verifying a token never waits on the network.
+    Keys are fetched before the app serves requests and refreshed by run_refresh_loop when the
+    Cache-Control max-age runs out; until then a known kid is served from memory, stale or not.
+    An unknown kid (key rotation) starts one rate limited re-fetch in a background thread and is
+    rejected until it lands. A failed fetch keeps the last good key set.
+    """
+
+    def __init__(self):
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._expires_at: float = 0.0
+        self._last_attempt_at: Optional[float] = None
+        self._fetch_thread: Optional[threading.Thread] = None
+        self._fetch_lock = threading.Lock()
+
+    def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        key = self._keys.get(kid)
+        if key is None:
+            self._request_refetch()
+        return key
+
+    async def refresh(self):
+        self._last_attempt_at = time.monotonic()
+        try:
+            async with httpx.AsyncClient(timeout=get_int("AUTH0_JWKS_FETCH_TIMEOUT")) as client:
+                response = await client.get(_jwks_url())
+                response.raise_for_status()
+            self._store(jwks=response.json(), cache_control=response.headers.get("cache-control"))
+        except Exception:
+            self._keep_last_good_keys()
+
+    async def run_refresh_loop(self):
+        """Refresh the keys whenever they expire, after the first refresh awaited in the app lifespan."""
+        while True:
+            await asyncio.sleep(max(self._expires_at - time.monotonic(), get_int("AUTH0_JWKS_MIN_REFETCH_INTERVAL")))
+            await self.refresh()
+
+    def _request_refetch(self):
+        """Start a re-fetch in a background thread, unless one is in flight or the last attempt is too recent."""
+        with self._fetch_lock:
+            if self._fetch_thread is not None:
+                return
+            last_attempt_at = self._last_attempt_at
+            if last_attempt_at is not None and time.monotonic() - last_attempt_at < get_int("AUTH0_JWKS_MIN_REFETCH_INTERVAL"):
+                return
+            self._last_attempt_at = time.monotonic()
+            self._fetch_thread = threading.Thread(target=self._refetch, name="jwks-refetch", daemon=True)
+            self._fetch_thread.start()
+
+    def _refetch(self):
+        try:
+            response = httpx.get(_jwks_url(), timeout=get_int("AUTH0_JWKS_FETCH_TIMEOUT"))
+            response.raise_for_status()
+            self._store(jwks=response.json(), cache_control=response.headers.get("cache-control"))
+        except Exception:
+            self._keep_last_good_keys()
+        finally:
+            with self._fetch_lock:
+                self._fetch_thread = None
+
+    def _store(self, jwks: Dict[str, Any], cache_control: Optional[str]):
+        self._keys = {key["kid"]: key for key in jwks["keys"]}
+        self._expires_at = time.monotonic() + self._max_age(cache_control)
+
+    def _keep_last_good_keys(self):
+        logging.warning(f"Failed to fetch Auth0 signing keys, keeping {len(self._keys)} cached keys", exc_info=True)
+        self._expires_at = time.monotonic() + get_int("AUTH0_JWKS_MIN_REFETCH_INTERVAL")
+
+    @staticmethod
+    def _max_age(cache_control: Optional[str]) -> int:
+        min_interval = get_int("AUTH0_JWKS_MIN_REFETCH_INTERVAL")
+        if cache_control:
+            match = _MAX_AGE_PATTERN.search(cache_control)
+            if match:
+                return max(int(match.group(1)), min_interval)
+            if "no-cache" in cache_control or "no-store" in cache_control:
+                return min_interval
+        return get_int("AUTH0_JWKS_DEFAULT_TTL")
+
+
+jwks_key_store = JwksKeyStore()
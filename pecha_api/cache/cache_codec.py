@@ -0,0 +1,184 @@
+import json
+import logging
+import zlib
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+from pecha_api import config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+# Every entry written by this module starts with HEADER_MAGIC + version + codec id + compression id.
+# Entries without the header are legacy plain JSON written before the codec layer existed.
+HEADER_MAGIC = b"\x00pc"
+HEADER_VERSION = 1
+HEADER_LENGTH = len(HEADER_MAGIC) + 3
+
+
+class CacheCodec(Enum):
+    RAW = 0
+    JSON = 1
+    ORJSON = 2
+    MSGPACK = 3
+
+
+class CacheCompression(Enum):
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+    LZ4 = 3
+
+
+def _to_primitive(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    return pydantic_encoder(value)
+
+
+def _encode_json(value: Any) -> bytes:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json().encode("utf-8")
+    return json.dumps(value, default=pydantic_encoder).encode("utf-8")
+
+
+def _encode_orjson(value: Any) -> bytes:
+    if isinstance(value, BaseModel):
+        # pydantic's rust serializer is faster than dumping to a dict first
+        return value.model_dump_json().encode("utf-8")
+    return orjson.dumps(value, default=_to_primitive)
+
+
+def _encode_msgpack(value: Any) -> bytes:
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    return msgpack.packb(value, default=_to_primitive, use_bin_type=True)
+
+
+_ENCODERS: Dict[CacheCodec, Callable[[Any], bytes]] = {
+    CacheCodec.JSON: _encode_json,
+    CacheCodec.ORJSON: _encode_orjson,
+    CacheCodec.MSGPACK: _encode_msgpack,
+}
+
+_DECODERS: Dict[CacheCodec, Callable[[bytes], Any]] = {
+    CacheCodec.RAW: lambda payload: payload,
+    CacheCodec.JSON: json.loads,
+    CacheCodec.ORJSON: lambda payload: orjson.loads(payload),
+    CacheCodec.MSGPACK: lambda payload: msgpack.unpackb(payload, raw=False),
+}
+
+_COMPRESSORS: Dict[CacheCompression, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    CacheCompression.ZLIB: (zlib.compress, zlib.decompress),
+    CacheCompression.ZSTD: (
+        lambda payload: zstandard.ZstdCompressor().compress(payload),
+        lambda payload: zstandard.ZstdDecompressor().decompress(payload)
+    ),
+    CacheCompression.LZ4: (
+        lambda payload: lz4_frame.compress(payload),
+        lambda payload: lz4_frame.decompress(payload)
+    ),
+}
+
+_CODEC_AVAILABLE = {
+    CacheCodec.JSON: True,
+    CacheCodec.ORJSON: orjson is not None,
+    CacheCodec.MSGPACK: msgpack is not None,
+}
+
+_COMPRESSION_AVAILABLE = {
+    CacheCompression.NONE: True,
+    CacheCompression.ZLIB: True,
+    CacheCompression.ZSTD: zstandard is not None,
+    CacheCompression.LZ4: lz4_frame is not None,
+}
+
+
+@lru_cache()
+def _resolve_codec(name: str) -> CacheCodec:
+    codec = CacheCodec[name.upper()]
+    if not _CODEC_AVAILABLE[codec]:
+        logging.warning(f"Cache codec {codec.name} is not installed, falling back to JSON")
+        return CacheCodec.JSON
+    return codec
+
+
+@lru_cache()
+def _resolve_compression(name: str) -> CacheCompression:
+    compression = CacheCompression[name.upper()]
+    if not _COMPRESSION_AVAILABLE[compression]:
+        logging.warning(f"Cache compression {compression.name} is not installed, falling back to ZLIB")
+        return CacheCompression.ZLIB
+    return compression
+
+
+def get_configured_codec() -> CacheCodec:
+    # resolved once per configured name, so a missing package is only reported once
+    return _resolve_codec(config.get("CACHE_CODEC"))
+
+
+def get_configured_compression() -> CacheCompression:
+    return _resolve_compression(config.get("CACHE_COMPRESSION"))
+
+
+def encode(
+    value: Any,
+    codec: CacheCodec = None,
+    compression: CacheCompression = None,
+    compression_threshold: int = None
+) -> bytes:
+    """Serialize a cache value and prefix it with the header describing how it was written."""
+    if isinstance(value, bytes):
+        codec, payload = CacheCodec.RAW, value
+    else:
+        codec = codec or get_configured_codec()
+        payload = _ENCODERS[codec](value)
+
+    compression = compression or get_configured_compression()
+    if compression_threshold is None:
+        compression_threshold = config.get_int("CACHE_COMPRESSION_THRESHOLD")
+    if compression == CacheCompression.NONE or len(payload) < compression_threshold:
+        compression = CacheCompression.NONE
+    else:
+        payload = _COMPRESSORS[compression][0](payload)
+
+    return HEADER_MAGIC + bytes([HEADER_VERSION, codec.value, compression.value]) + payload
+
+
+def decode(data: str | bytes) -> Any:
+    """Decode an entry written by any codec, or a legacy plain JSON entry."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if not data.startswith(HEADER_MAGIC):
+        return json.loads(data)
+
+    version, codec_id, compression_id = data[len(HEADER_MAGIC):HEADER_LENGTH]
+    if version != HEADER_VERSION:
+        raise ValueError(f"Unsupported cache entry version {version}")
+    codec = CacheCodec(codec_id)
+    compression = CacheCompression(compression_id)
+    payload = data[HEADER_LENGTH:]
+    if compression != CacheCompression.NONE:
+        payload = _COMPRESSORS[compression][1](payload)
+    return _DECODERS[codec](payload)
@@ -0,0 +1,157 @@
+"""
+Compare cache codecs on the biggest cached response shapes.
+
+    python -m pecha_api.cache.cache_codec_benchmark [--sections 200] [--segments 20] [--runs 20]
+"""
+import argparse
+import time
+import uuid
+from typing import Callable, List, Tuple, Type
+
+from pydantic import BaseModel
+
+from pecha_api.cache import cache_codec
+from pecha_api.cache.cache_codec import CacheCodec, CacheCompression
+from pecha_api.texts.texts_enums import PaginationDirection
+from pecha_api.texts.texts_response_models import (
+    DetailSection,
+    DetailTableOfContent,
+    DetailTableOfContentResponse,
+    DetailTextSegment,
+    Section,
+    TableOfContent,
+    TableOfContentResponse,
+    TableOfContentType,
+    TextDTO,
+    TextSegment,
+    Translation
+)
+
+SAMPLE_CONTENT = "<span class='text'>བྱང་ཆུབ་སེམས་དཔའ་སེམས་དཔའ་ཆེན་པོ་རྣམས་ཀྱིས་ཤེས་རབ་ཀྱི་ཕ་རོལ་ཏུ་ཕྱིན་པ་</span>"
+
+
+def _text_detail() -> TextDTO:
+    return TextDTO(
+        id=str(uuid.uuid4()),
+        title="བྱང་ཆུབ་སེམས་དཔའི་སྤྱོད་པ་ལ་འཇུག་པ།",
+        language="bo",
+        type="version",
+        group_id=str(uuid.uuid4()),
+        is_published=True,
+        created_date="2025-01-01 00:00:00",
+        updated_date="2025-01-01 00:00:00",
+        published_date="2025-01-01 00:00:00",
+        published_by="admin",
+        categories=[str(uuid.uuid4())],
+        views=0
+    )
+
+
+def build_detail_table_of_content_response(sections: int, segments: int) -> DetailTableOfContentResponse:
+    return DetailTableOfContentResponse(
+        text_detail=_text_detail(),
+        content=DetailTableOfContent(
+            id=str(uuid.uuid4()),
+            text_id=str(uuid.uuid4()),
+            sections=[
+                DetailSection(
+                    id=str(uuid.uuid4()),
+                    title=f"Chapter {section_number}",
+                    section_number=section_number,
+                    segments=[
+                        DetailTextSegment(
+                            segment_id=str(uuid.uuid4()),
+                            segment_number=segment_number,
+                            content=SAMPLE_CONTENT,
+                            translation=Translation(
+                                text_id=str(uuid.uuid4()),
+                                language="en",
+                                content="The bodhisattvas, the great beings, the perfection of wisdom"
+                            )
+                        )
+                        for segment_number in range(1, segments + 1)
+                    ]
+                )
+                for section_number in range(1, sections + 1)
+            ]
+        ),
+        size=sections * segments,
+        pagination_direction=PaginationDirection.NEXT,
+        current_segment_position=1,
+        total_segments=sections * segments
+    )
+
+
+def build_table_of_content_response(sections: int, segments: int) -> TableOfContentResponse:
+    return TableOfContentResponse(
+        text_detail=_text_detail(),
+        contents=[
+            TableOfContent(
+                id=str(uuid.uuid4()),
+                type=TableOfContentType.TEXT,
+                text_id=str(uuid.uuid4()),
+                sections=[
+                    Section(
+                        id=str(uuid.uuid4()),
+                        title=f"Chapter {section_number}",
+                        section_number=section_number,
+                        segments=[
+                            TextSegment(segment_id=str(uuid.uuid4()), segment_number=segment_number)
+                            for segment_number in range(1, segments + 1)
+                        ]
+                    )
+                    for section_number in range(1, sections + 1)
+                ]
+            )
+        ]
+    )
+
+
+def _time_ms(function: Callable[[], object], runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        function()
+    return (time.perf_counter() - start) * 1000 / runs
+
+
+def benchmark(value: BaseModel, model_class: Type[BaseModel], runs: int) -> List[Tuple[str, int, float, float]]:
+    results = []
+    for codec in (CacheCodec.JSON, CacheCodec.ORJSON, CacheCodec.MSGPACK):
+        if not cache_codec._CODEC_AVAILABLE[codec]:
+            continue
+        for compression in CacheCompression:
+            if not cache_codec._COMPRESSION_AVAILABLE[compression]:
+                continue
+            encoded = cache_codec.encode(value, codec=codec, compression=compression, compression_threshold=0)
+            encode_ms = _time_ms(
+                lambda: cache_codec.encode(value, codec=codec, compression=compression, compression_threshold=0),
+                runs
+            )
+            # readers always rebuild the response model, so it is part of the decode cost
+            decode_ms = _time_ms(lambda: model_class(**cache_codec.decode(encoded)), runs)
+            results.append((f"{codec.name.lower()}+{compression.name.lower()}", len(encoded), encode_ms, decode_ms))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--segments", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    shapes = [
+        ("DetailTableOfContentResponse", DetailTableOfContentResponse,
+         build_detail_table_of_content_response(sections=args.sections, segments=args.segments)),
+        ("TableOfContentResponse", TableOfContentResponse,
+         build_table_of_content_response(sections=args.sections, segments=args.segments)),
+    ]
+    for name, model_class, value in shapes:
+        print(f"\n{name} ({args.sections} sections x {args.segments} segments, {args.runs} runs)")
+        print(f"{'codec':<20}{'bytes':>12}{'encode ms':>12}{'decode ms':>12}")
+        for codec_name, size, encode_ms, decode_ms in benchmark(value=value, model_class=model_class, runs=args.runs):
+            print(f"{codec_name:<20}{size:>12}{encode_ms:>12.2f}{decode_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,4 +28,15 @@ class CacheType(Enum):
     # Collection-specific cache types
     COLLECTIONS = "collections"
     COLLECTION_DETAIL = "collection_detail"
-    
\ No newline at end of file
+
+    TEXT_UPLOAD_CHECKPOINT = "text_upload_checkpoint"
+
+    SHARE_IMAGE = "share_image"
+
+    FEATURED_DAY = "featured_day"
+    
+
+class CacheTag(Enum):
+    TEXT = "text"
+    COLLECTION = "collection"
+    FEATURED_DAY = "featured_day"
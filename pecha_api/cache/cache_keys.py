@@ -0,0 +1,46 @@
+import hashlib
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from pecha_api.cache.cache_enums import CacheType, CacheTag
+
+_PART_SEPARATOR = "\x1f"
+
+
+class CacheKeys:
+
+    @staticmethod
+    def build(cache_type: CacheType, entity_id: Optional[str] = None, *variant: Any) -> str:
+        """
+        Build `{cache_type}:{entity_id}:{digest(variant)}`; cache_repository adds the global prefix.
+        Only the variant part (pagination, language, request options) is hashed.
+        """
+        key = cache_type.value if entity_id is None else f"{cache_type.value}:{entity_id}"
+        if not variant:
+            return key
+        return f"{key}:{CacheKeys._digest(variant)}"
+
+    @staticmethod
+    def tag(cache_tag: CacheTag, entity_id: Optional[str] = None) -> str:
+        if entity_id is None:
+            return f"tag:{cache_tag.value}"
+        return f"tag:{cache_tag.value}:{entity_id}"
+
+    @staticmethod
+    def _digest(variant: tuple) -> str:
+        joined = _PART_SEPARATOR.join(CacheKeys._part(part) for part in variant)
+        return hashlib.blake2b(joined.encode("utf-8"), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _part(part: Any) -> str:
+        if part is None:
+            return ""
+        if isinstance(part, str):
+            return part
+        if isinstance(part, Enum):
+            return str(part.value)
+        if isinstance(part, BaseModel):
+            return part.model_dump_json()
+        return str(part)
@@ -1,12 +1,14 @@
 import json
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Dict, Tuple
 
 from redis.asyncio import Redis
 
 from pecha_api import config
-from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.cache_enums import CacheType, CacheTag
+from pecha_api.cache.cache_keys import CacheKeys
+from pecha_api.cache import cache_codec
+from pecha_api.constants import Constants
 import logging
-from pydantic.json import pydantic_encoder
 
 
 _client: Optional[Redis] = None
@@ -27,15 +29,35 @@ def _build_key(key: str) -> str:
     return f"{prefix}{key}"
 
 
+def _serialize(value: Any) -> bytes:
+    return cache_codec.encode(value)
 
-async def set_cache(hash_key: str, value: Any, cache_time_out: int) -> bool:
-    #Set value in cache with type-specific timeout
+
+def _deserialize(value: str | bytes) -> Any:
+    try:
+        return cache_codec.decode(value)
+    except json.JSONDecodeError:
+        logging.error("Failed to decode JSON from cache", exc_info=True)
+        return value
+
+
+async def set_cache(hash_key: str, value: Any, cache_time_out: int, tags: Optional[List[str]] = None) -> bool:
+    #Set value in cache with type-specific timeout, registering the key in each tag set
     try:
         client = get_client()
         full_key = _build_key(hash_key)
-        if not isinstance(value, (str, bytes)):
-            value = json.dumps(value, default=pydantic_encoder)
-        return bool(await client.setex(full_key, cache_time_out, value))
+        if not tags:
+            return bool(await client.setex(full_key, cache_time_out, _serialize(value)))
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.setex(full_key, cache_time_out, _serialize(value))
+            for tag in tags:
+                tag_key = _build_key(tag)
+                pipe.sadd(tag_key, hash_key)
+                # the tag set lives as long as its longest lived member
+                pipe.expire(tag_key, cache_time_out, nx=True)
+                pipe.expire(tag_key, cache_time_out, gt=True)
+            results = await pipe.execute()
+        return bool(results[0])
     except Exception:
         logging.error("An error occurred in set_cache", exc_info=True)
         return False
@@ -49,16 +71,102 @@ async def get_cache_data(hash_key: str) -> Optional[Any]:
         value = await client.get(full_key)
         if value is None:
             return None
-        try:
-            return json.loads(value)
-        except json.JSONDecodeError:
-            logging.error("Failed to decode JSON from cache", exc_info=True)
-            return value
+        return _deserialize(value)
     except Exception:
         logging.error("An error occurred in get_cache_data", exc_info=True)
         return None
 
 
+async def get_cache_data_with_ttl(hash_key: str) -> Tuple[Optional[Any], Optional[int]]:
+    """Get value and its remaining time to live in seconds in one pipelined round trip"""
+    try:
+        client = get_client()
+        full_key = _build_key(hash_key)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.get(full_key)
+            pipe.ttl(full_key)
+            value, remaining_ttl = await pipe.execute()
+        if value is None:
+            return None, None
+        return _deserialize(value), remaining_ttl
+    except Exception:
+        logging.error("An error occurred in get_cache_data_with_ttl", exc_info=True)
+        return None, None
+
+
+async def acquire_lock(hash_key: str, token: str, lock_time_out_ms: int) -> bool:
+    """Try to take a short lived lock owned by token, returns False if another owner holds it"""
+    try:
+        client = get_client()
+        return bool(await client.set(_build_key(f"lock:{hash_key}"), token, nx=True, px=lock_time_out_ms))
+    except Exception:
+        logging.error("An error occurred in acquire_lock", exc_info=True)
+        return False
+
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+async def release_lock(hash_key: str, token: str) -> bool:
+    """Release the lock only if token still owns it"""
+    try:
+        client = get_client()
+        return bool(await client.eval(_RELEASE_LOCK_SCRIPT, 1, _build_key(f"lock:{hash_key}"), token))
+    except Exception:
+        logging.error("An error occurred in release_lock", exc_info=True)
+        return False
+
+
+async def get_many(hash_keys: List[str]) -> Dict[str, Any]:
+    """Get several values in one MGET round trip, keyed by hash key; misses are left out"""
+    try:
+        if not hash_keys:
+            return {}
+        client = get_client()
+        values = await client.mget([_build_key(key) for key in hash_keys])
+        return {
+            key: _deserialize(value)
+            for key, value in zip(hash_keys, values)
+            if value is not None
+        }
+    except Exception:
+        logging.error("An error occurred in get_many", exc_info=True)
+        return {}
+
+
+async def set_many(values: Dict[str, Any], cache_time_out: int) -> bool:
+    """Set several values with the same timeout in one pipelined round trip"""
+    try:
+        if not values:
+            return True
+        client = get_client()
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.setex(_build_key(key), cache_time_out, _serialize(value))
+            results = await pipe.execute()
+        return all(results)
+    except Exception:
+        logging.error("An error occurred in set_many", exc_info=True)
+        return False
+
+
+async def delete_many(hash_keys: List[str]) -> int:
+    """Delete several keys with a single DEL, returns the number of deleted entries"""
+    try:
+        if not hash_keys:
+            return 0
+        client = get_client()
+        return await client.delete(*[_build_key(key) for key in hash_keys])
+    except Exception:
+        logging.error("An error occurred in delete_many", exc_info=True)
+        return 0
+
+
 async def delete_cache(hash_key: str) -> bool:
     """Delete key from cache"""
     try:
@@ -101,31 +209,12 @@ async def update_cache(hash_key: str, value: Any, cache_time_out: int) -> bool:
             logging.warning(f"Cache key {hash_key} does not exist, cannot update")
             return False
         
-        # Serialize value
-        if not isinstance(value, (str, bytes)):
-            value = json.dumps(value, default=pydantic_encoder)
-
-        return bool(await client.setex(full_key, cache_time_out, value))
+        return bool(await client.setex(full_key, cache_time_out, _serialize(value)))
     except Exception:
         logging.error("An error occurred in update_cache", exc_info=True)
         return False
 
 
-async def _delete_cache_keys(keys_to_delete: List[str], operation_type: str) -> bool:
-    """Delete a list of full keys and log the operation."""
-    try:
-        client = get_client()
-        if keys_to_delete:
-            deleted_count = await client.delete(*keys_to_delete)
-            logging.info(f"Invalidated {deleted_count} cache entries for {operation_type}")
-            return deleted_count > 0
-        logging.info(f"No cache entries found for {operation_type}")
-        return True
-    except Exception:
-        logging.error(f"An error occurred while invalidating cache for {operation_type}", exc_info=True)
-        return False
-
-
 async def invalidate_cache_entries(text_id: Optional[str] = None, hash_keys: Optional[List[str]] = None) -> bool:
     try:
         # Validate input parameters
@@ -145,15 +234,53 @@ async def invalidate_cache_entries(text_id: Optional[str] = None, hash_keys: Opt
 
 async def invalidate_text_related_cache(text_id: str) -> bool:
     """Invalidate all cache entries related to a specific text_id"""
+    await invalidate_tags(tags=[CacheKeys.tag(CacheTag.TEXT, text_id)])
+    return True
+
+
+async def invalidate_tags(tags: List[str]) -> List[str]:
+    """Delete every entry registered under the given tags, returns the deleted hash keys"""
+    try:
+        if not tags:
+            return []
+        client = get_client()
+        tag_keys = [_build_key(tag) for tag in tags]
+        async with client.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members = await pipe.execute()
+        hash_keys = sorted({
+            member.decode("utf-8") if isinstance(member, bytes) else member
+            for tag_members in members
+            for member in tag_members
+        })
+        deleted_count = await client.unlink(*[_build_key(key) for key in hash_keys], *tag_keys)
+        logging.info(f"Invalidated {deleted_count} cache entries for tags {tags}")
+        return hash_keys
+    except Exception:
+        logging.error(f"An error occurred while invalidating cache for tags {tags}", exc_info=True)
+        return []
+
+
+async def invalidate_cache_by_prefix(key_prefix: str) -> bool:
+    """Invalidate every cache entry whose key starts with key_prefix, using non-blocking SCAN"""
+    operation_type = f"prefix: {key_prefix}"
     try:
         client = get_client()
-        prefix = config.get("CACHE_PREFIX")
-        pattern = f"{prefix}{text_id}"
-        keys_to_delete = await client.keys(pattern)
-        operation_type = f"text_id: {text_id}"
-        return await _delete_cache_keys(keys_to_delete, operation_type)
+        pattern = f"{_build_key(key_prefix)}*"
+        deleted_count = 0
+        batch: List[bytes] = []
+        async for key in client.scan_iter(match=pattern, count=Constants.CACHE_SCAN_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= Constants.CACHE_SCAN_BATCH_SIZE:
+                deleted_count += await client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted_count += await client.unlink(*batch)
+        logging.info(f"Invalidated {deleted_count} cache entries for {operation_type}")
+        return True
     except Exception:
-        logging.error(f"An error occurred while invalidating cache for text_id: {text_id}", exc_info=True)
+        logging.error(f"An error occurred while invalidating cache for {operation_type}", exc_info=True)
         return False
 
 
@@ -163,18 +290,10 @@ async def invalidate_multiple_cache_keys(hash_keys: List[str]) -> bool:
         if not hash_keys:
             return True
         client = get_client()
-        
-        # Build full keys
-        full_keys = [_build_key(key) for key in hash_keys]
-        
-        # Filter out non-existent keys
-        keys_to_delete: List[str] = []
-        for key in full_keys:
-            if await client.exists(key):
-                keys_to_delete.append(key)
-        
-        operation_type = f"{len(hash_keys)} hash keys"
-        return await _delete_cache_keys(keys_to_delete, operation_type)
+        # DEL ignores missing keys, so no per-key EXISTS round trip is needed
+        deleted_count = await client.delete(*[_build_key(key) for key in hash_keys])
+        logging.info(f"Invalidated {deleted_count} cache entries for {len(hash_keys)} hash keys")
+        return True
     except Exception:
         logging.error("An error occurred while invalidating multiple cache keys", exc_info=True)
-        return False
\ No newline at end of file
+        return False
@@ -0,0 +1,21 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class CacheTierStats(BaseModel):
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class CacheTypeStats(BaseModel):
+    cache_type: str
+    local_entries: int
+    local: CacheTierStats
+    remote: CacheTierStats
+
+
+class CacheStatsResponse(BaseModel):
+    local_cache_enabled: bool
+    stats: List[CacheTypeStats]
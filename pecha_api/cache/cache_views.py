@@ -0,0 +1,22 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException
+from starlette import status
+
+from pecha_api.error_contants import ErrorConstants
+from pecha_api.users.user_response_models import UserPrincipal
+from pecha_api.users.users_service import get_current_user_principal
+from .cache_response_models import CacheStatsResponse
+from .local_cache import local_cache
+
+cache_router = APIRouter(
+    prefix="/cache",
+    tags=["Cache"]
+)
+
+
+@cache_router.get("/stats", status_code=status.HTTP_200_OK)
+async def get_cache_stats(principal: Annotated[UserPrincipal, Depends(get_current_user_principal)]) -> CacheStatsResponse:
+    if not principal.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=ErrorConstants.ADMIN_ERROR_MESSAGE)
+    return local_cache.get_stats()
@@ -0,0 +1,184 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from pecha_api import config
+from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.cache_repository import get_client
+from pecha_api.cache.cache_response_models import CacheTierStats, CacheTypeStats, CacheStatsResponse
+
+# (max entries, ttl in seconds) per cache type; types not listed are never held in process
+LOCAL_CACHE_LIMITS: Dict[CacheType, Tuple[int, int]] = {
+    CacheType.TEXT_DETAIL: (
+        config.get_int("CACHE_LOCAL_TEXT_DETAIL_MAX_ENTRIES"),
+        config.get_int("CACHE_LOCAL_TEXT_DETAIL_TTL")
+    ),
+    CacheType.SEGMENT_INFO: (
+        config.get_int("CACHE_LOCAL_SEGMENT_INFO_MAX_ENTRIES"),
+        config.get_int("CACHE_LOCAL_SEGMENT_INFO_TTL")
+    ),
+}
+
+
+class _TierCounter:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def to_stats(self) -> CacheTierStats:
+        total = self.hits + self.misses
+        return CacheTierStats(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=round(self.hits / total, 4) if total else 0.0
+        )
+
+
+class LocalCache:
+    """In-process LRU cache holding validated model instances in front of Redis."""
+
+    def __init__(self, enabled: bool, limits: Dict[CacheType, Tuple[int, int]]):
+        self.enabled = enabled
+        self.limits = limits
+        self.instance_id = str(uuid.uuid4())
+        self._entries: Dict[CacheType, OrderedDict] = {cache_type: OrderedDict() for cache_type in limits}
+        self._local_counters: Dict[CacheType, _TierCounter] = {}
+        self._remote_counters: Dict[CacheType, _TierCounter] = {}
+
+    def _is_cacheable(self, cache_type: Optional[CacheType]) -> bool:
+        return self.enabled and cache_type in self.limits
+
+    def get(self, cache_type: CacheType, hash_key: str) -> Optional[BaseModel]:
+        if not self._is_cacheable(cache_type):
+            return None
+        entries = self._entries[cache_type]
+        entry = entries.get(hash_key)
+        if entry is not None and entry[0] < time.monotonic():
+            del entries[hash_key]
+            entry = None
+        self._local_counters.setdefault(cache_type, _TierCounter()).record(hit=entry is not None)
+        if entry is None:
+            return None
+        entries.move_to_end(hash_key)
+        # deep copy so callers mutating the response, nested lists included, do not leak into other requests
+        return entry[1].model_copy(deep=True)
+
+    def set(self, cache_type: CacheType, hash_key: str, value: BaseModel):
+        if not self._is_cacheable(cache_type) or not isinstance(value, BaseModel):
+            return
+        max_entries, ttl = self.limits[cache_type]
+        entries = self._entries[cache_type]
+        entries[hash_key] = (time.monotonic() + ttl, value)
+        entries.move_to_end(hash_key)
+        while len(entries) > max_entries:
+            entries.popitem(last=False)
+
+    def remember(self, cache_type: CacheType, hash_key: str, value: Any):
+        """Record the outcome of a Redis lookup and keep validated hits in process."""
+        if cache_type is None:
+            return
+        self._remote_counters.setdefault(cache_type, _TierCounter()).record(hit=value is not None)
+        if value is not None:
+            self.set(cache_type=cache_type, hash_key=hash_key, value=value)
+
+    def invalidate(self, cache_type: Optional[CacheType], hash_keys: List[str]):
+        if not self.enabled:
+            return
+        targets = [self._entries[cache_type]] if cache_type in self._entries else list(self._entries.values())
+        for entries in targets:
+            for hash_key in hash_keys:
+                entries.pop(hash_key, None)
+
+    def clear(self):
+        for entries in self._entries.values():
+            entries.clear()
+
+    def apply_invalidation_message(self, raw_message: str | bytes):
+        try:
+            message = json.loads(raw_message)
+        except (TypeError, ValueError):
+            logging.error("Invalid local cache invalidation message", exc_info=True)
+            return
+        if message.get("origin") == self.instance_id:
+            return
+        cache_type = message.get("cache_type")
+        self.invalidate(
+            cache_type=CacheType(cache_type) if cache_type else None,
+            hash_keys=message.get("hash_keys", [])
+        )
+
+    def get_stats(self) -> CacheStatsResponse:
+        cache_types = set(self._local_counters) | set(self._remote_counters)
+        return CacheStatsResponse(
+            local_cache_enabled=self.enabled,
+            stats=[
+                CacheTypeStats(
+                    cache_type=cache_type.value,
+                    local_entries=len(self._entries.get(cache_type, {})),
+                    local=self._local_counters.get(cache_type, _TierCounter()).to_stats(),
+                    remote=self._remote_counters.get(cache_type, _TierCounter()).to_stats()
+                )
+                for cache_type in sorted(cache_types, key=lambda cache_type: cache_type.value)
+            ]
+        )
+
+
+local_cache = LocalCache(
+    enabled=config.get("CACHE_LOCAL_ENABLED").lower() == "true",
+    limits=LOCAL_CACHE_LIMITS
+)
+
+
+def _invalidation_channel() -> str:
+    return f"{config.get('CACHE_PREFIX')}{config.get('CACHE_LOCAL_INVALIDATION_CHANNEL')}"
+
+
+async def publish_local_cache_invalidation(hash_keys: List[str], cache_type: Optional[CacheType] = None) -> bool:
+    """Drop entries from this worker's local cache and tell the other workers to do the same."""
+    if not local_cache.enabled or not hash_keys:
+        return False
+    local_cache.invalidate(cache_type=cache_type, hash_keys=hash_keys)
+    message = {
+        "origin": local_cache.instance_id,
+        "cache_type": cache_type.value if cache_type else None,
+        "hash_keys": hash_keys
+    }
+    try:
+        await get_client().publish(_invalidation_channel(), json.dumps(message))
+        return True
+    except Exception:
+        logging.error("An error occurred while publishing local cache invalidation", exc_info=True)
+        return False
+
+
+async def listen_for_local_cache_invalidations():
+    while True:
+        try:
+            pubsub = get_client().pubsub()
+            await pubsub.subscribe(_invalidation_channel())
+            try:
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        local_cache.apply_invalidation_message(message["data"])
+            finally:
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # entries published while disconnected may be missed, so start from an empty cache
+            logging.error("Local cache invalidation listener failed, reconnecting", exc_info=True)
+            local_cache.clear()
+            await asyncio.sleep(1)
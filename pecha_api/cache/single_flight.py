@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from pecha_api import config
+from pecha_api.cache.cache_repository import (
+    acquire_lock,
+    release_lock,
+    get_cache_data_with_ttl
+)
+
+T = TypeVar("T")
+
+_in_flight: Dict[str, asyncio.Future] = {}
+# keeps a strong reference to background refreshes so they are not garbage collected mid-flight
+_background_refreshes: Dict[str, asyncio.Task] = {}
+
+
+async def single_flight(
+    key: str,
+    loader: Callable[[], Awaitable[T]],
+    read: Optional[Callable[[], Awaitable[Optional[T]]]] = None
+) -> T:
+    """
+    Run loader once per key for all concurrent callers of this process.
+    With the redis lock enabled, workers that lose the lock poll read() for the winner's result.
+    """
+    future = _in_flight.get(key)
+    if future is not None:
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # the leader's request was cancelled (client disconnect), not this one: load it here
+            return await single_flight(key=key, loader=loader, read=read)
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[key] = future
+    try:
+        result = await _load_with_lock(key=key, loader=loader, read=read)
+    except BaseException as e:
+        if isinstance(e, asyncio.CancelledError):
+            future.cancel()
+        else:
+            future.set_exception(e)
+            # mark the exception as retrieved when nobody else was waiting for it
+            future.exception()
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        _in_flight.pop(key, None)
+
+
+async def _load_with_lock(
+    key: str,
+    loader: Callable[[], Awaitable[T]],
+    read: Optional[Callable[[], Awaitable[Optional[T]]]]
+) -> T:
+    if read is None or config.get("CACHE_SINGLE_FLIGHT_LOCK_ENABLED").lower() != "true":
+        return await loader()
+
+    token = str(uuid.uuid4())
+    lock_time_out_ms = config.get_int("CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT_MS")
+    if await acquire_lock(hash_key=key, token=token, lock_time_out_ms=lock_time_out_ms):
+        try:
+            return await loader()
+        finally:
+            await release_lock(hash_key=key, token=token)
+
+    wait_interval_ms = config.get_int("CACHE_SINGLE_FLIGHT_WAIT_INTERVAL_MS")
+    for _ in range(max(1, lock_time_out_ms // wait_interval_ms)):
+        await asyncio.sleep(wait_interval_ms / 1000)
+        cached_data = await read()
+        if cached_data is not None:
+            return cached_data
+    logging.warning(f"Timed out waiting for another worker to load {key}, loading it here")
+    return await loader()
+
+
+def stale_refresh_window(cache_time_out: int) -> int:
+    # at most a tenth of the entry's lifetime, short lived entries would otherwise always be stale
+    return min(config.get_int("CACHE_STALE_REFRESH_WINDOW"), cache_time_out // 10)
+
+
+async def get_cache_data_with_refresh(hash_key: str, refresh: Callable[[], Awaitable[Any]], cache_time_out: int) -> Optional[Any]:
+    """
+    Get a cached value stored for cache_time_out seconds; when it is inside its stale window,
+    keep serving it and let one background task rebuild it through refresh.
+    """
+    cache_data, remaining_ttl = await get_cache_data_with_ttl(hash_key=hash_key)
+    if cache_data is not None and remaining_ttl is not None and 0 <= remaining_ttl <= stale_refresh_window(cache_time_out):
+        schedule_refresh(key=hash_key, refresh=refresh)
+    return cache_data
+
+
+def schedule_refresh(key: str, refresh: Callable[[], Awaitable[Any]]):
+    refresh_key = f"refresh:{key}"
+    if refresh_key in _background_refreshes:
+        return
+    task = asyncio.create_task(_refresh(key=refresh_key, refresh=refresh))
+    _background_refreshes[refresh_key] = task
+    task.add_done_callback(lambda _: _background_refreshes.pop(refresh_key, None))
+
+
+async def _refresh(key: str, refresh: Callable[[], Awaitable[Any]]):
+    try:
+        if config.get("CACHE_SINGLE_FLIGHT_LOCK_ENABLED").lower() != "true":
+            await single_flight(key=key, loader=refresh)
+            return
+        # another worker holding the lock is already refreshing this entry
+        token = str(uuid.uuid4())
+        if not await acquire_lock(hash_key=key, token=token, lock_time_out_ms=config.get_int("CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT_MS")):
+            return
+        try:
+            await single_flight(key=key, loader=refresh)
+        finally:
+            await release_lock(hash_key=key, token=token)
+    except Exception:
+        logging.error(f"Background cache refresh failed for {key}", exc_info=True)
@@ -1,16 +1,22 @@
 from pecha_api.utils import Utils
 
+import logging
+from typing import List
+
+from pecha_api.cache.cache_keys import CacheKeys
 from pecha_api.cache.cache_repository import (
     get_cache_data,
     set_cache,
     clear_cache,
+    invalidate_tags,
 )
+from pecha_api.cache.local_cache import publish_local_cache_invalidation
 from pecha_api import config
 from .collections_response_models import (
     CollectionsResponse,
     CollectionModel
 )
-from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.cache_enums import CacheType, CacheTag
 
 async def get_collections_cache(parent_id: str = None, language: str = None, skip: int = None, limit: int = None, cache_type: CacheType = None) -> CollectionsResponse:
     """Get collections cache asynchronously."""
@@ -48,4 +54,16 @@ async def delete_collection_cache(collection_id: str = None, cache_type: CacheTy
     """Delete collection cache asynchronously."""
     payload = [collection_id, cache_type]
     hashed_key: str = Utils.generate_hash_key(payload=payload)
-    await clear_cache(hash_key=hashed_key) 
\ No newline at end of file
+    await clear_cache(hash_key=hashed_key) 
+
+
+async def invalidate_collection_cache(collection_ids: List[str]) -> bool:
+    """Drop every cached listing of the texts in these collections."""
+    try:
+        tags = [CacheKeys.tag(CacheTag.COLLECTION, collection_id) for collection_id in collection_ids if collection_id]
+        invalidated_keys: List[str] = await invalidate_tags(tags=tags)
+        await publish_local_cache_invalidation(hash_keys=invalidated_keys)
+        return True
+    except Exception:
+        logging.error(f"Error invalidating cache for collections {collection_ids}", exc_info=True)
+        return False
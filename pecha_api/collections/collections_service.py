@@ -14,7 +14,8 @@ from .collections_cache_service import (
     set_collections_cache,
     get_collection_detail_cache,
     set_collection_detail_cache,
-    delete_collection_cache
+    delete_collection_cache,
+    invalidate_collection_cache
 )
 from pecha_api.cache.cache_enums import CacheType
 from ..users.users_service import verify_admin_access
@@ -136,6 +137,7 @@ async def update_existing_collection(collection_id: str, update_collection_reque
     is_admin = verify_admin_access(token=token)
     if is_admin:
         updated_collection = await update_collection_titles(collection_id=collection_id, update_collection_request=update_collection_request)
+        await invalidate_collection_cache(collection_ids=[collection_id])
         if language is None:
             language = get("DEFAULT_LANGUAGE")
         return CollectionModel(
@@ -155,6 +157,7 @@ async def delete_existing_collection(collection_id: str, token: str):
     is_admin = verify_admin_access(token=token)
     if is_admin:
         await delete_collection(collection_id=collection_id)
+        await invalidate_collection_cache(collection_ids=[collection_id])
         return collection_id
     
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=ErrorConstants.ADMIN_ERROR_MESSAGE)
@@ -2,6 +2,9 @@
 class Constants:
 
     QUERY_BATCH_SIZE=100
+    MAPPING_EDGE_REBUILD_BATCH_SIZE=1000
+    CACHE_SCAN_BATCH_SIZE=500
+    TABLE_OF_CONTENT_SEGMENT_INDEX_VERSION = 1
     MINUTE_IN_SECONDS = 60
     HOUR_IN_SECONDS = 3600
     DAY_IN_SECONDS = 86400
@@ -1,11 +1,42 @@
+from typing import Callable, TypeVar
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.orm import declarative_base
-from ..config import get
+from starlette.concurrency import run_in_threadpool
 
+from ..config import get, get_int
 
-engine = create_engine(get("DATABASE_URL"))
+T = TypeVar("T")
+
+
+def _pool_options() -> dict:
+    return dict(
+        pool_size=get_int("DATABASE_POOL_SIZE"),
+        max_overflow=get_int("DATABASE_MAX_OVERFLOW"),
+        pool_recycle=get_int("DATABASE_POOL_RECYCLE"),
+        pool_timeout=get_int("DATABASE_POOL_TIMEOUT"),
+        pool_pre_ping=get("DATABASE_POOL_PRE_PING").lower() == "true",
+    )
+
+
+engine = create_engine(get("DATABASE_URL"), **_pool_options())
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
\ No newline at end of file
+Base = declarative_base()
+
+
+async def run_with_session(work: Callable[[Session], T]) -> T:
+    """
+    Opens a sync session and runs work(db) in the threadpool, so a slow query called from an
+    async service does not block the event loop.
+    """
+    def _run() -> T:
+        with SessionLocal() as db:
+            return work(db)
+
+    return await run_in_threadpool(_run)
+
+
+def dispose_engine():
+    engine.dispose()
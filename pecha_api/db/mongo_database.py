@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -9,10 +10,22 @@ from ..topics.topics_models import Topic
 from ..collections.collections_models import Collection
 from ..terms.terms_models import Term
 from ..texts.texts_models import Text
-from ..texts.segments.segments_models import Segment
-from ..texts.texts_models import TableOfContent
+from ..texts.segments.segments_models import Segment, SegmentMappingEdge
+from ..texts.texts_models import TableOfContent, TableOfContentSegmentIndex
 from ..texts.groups.groups_models import Group
 from ..config import get
+from .database import dispose_engine
+from ..cache.local_cache import local_cache, listen_for_local_cache_invalidations
+from ..auth.jwks_key_store import jwks_key_store
+from ..text_uploader.uploader_http_client import uploader_http_client
+from ..plans.featured.featured_day_service import run_featured_day_prewarm_loop
+from ..plans.media.media_services import shutdown_image_executor
+from ..search.local_search_index import (
+    is_local_search_enabled,
+    open_local_search_index,
+    run_flush_loop,
+    flush_local_search_index
+)
 from fastapi import HTTPException
 
 mongodb_client = None
@@ -29,15 +42,43 @@ async def lifespan(api: FastAPI):
 
     # Initialize collections and indexes if necessary
     try:
-        await init_beanie(database=mongodb,document_models=[Collection, Term, Topic, Text, Segment, TableOfContent, Group])
+        await init_beanie(database=mongodb,document_models=[Collection, Term, Topic, Text, Segment, TableOfContent, TableOfContentSegmentIndex, SegmentMappingEdge, Group])
         logging.info("Beanie initialized with the 'terms' collection.")
         
     except Exception as e:
         logging.error(f"Error during collection initialization: {e}")
         raise
+    invalidation_listener = None
+    if local_cache.enabled:
+        invalidation_listener = asyncio.create_task(listen_for_local_cache_invalidations())
+    # tokens are verified against these keys, they are in place before the first request
+    await jwks_key_store.refresh()
+    jwks_refresher = asyncio.create_task(jwks_key_store.run_refresh_loop())
+    search_index_builder = None
+    search_index_flusher = None
+    if is_local_search_enabled():
+        search_index_builder = await open_local_search_index()
+        search_index_flusher = asyncio.create_task(run_flush_loop())
+    featured_day_prewarmer = None
+    if get("FEATURED_DAY_PREWARM_ENABLED").lower() == "true":
+        featured_day_prewarmer = asyncio.create_task(run_featured_day_prewarm_loop())
     # Yield control back to FastAPI
     yield
 
+    jwks_refresher.cancel()
+    if invalidation_listener:
+        invalidation_listener.cancel()
+    if search_index_builder:
+        search_index_builder.cancel()
+    if search_index_flusher:
+        search_index_flusher.cancel()
+        await flush_local_search_index()
+    if featured_day_prewarmer:
+        featured_day_prewarmer.cancel()
+    shutdown_image_executor()
+    await uploader_http_client.aclose()
+
     # Close the MongoDB connection when the application shuts down
     if mongodb_client:
-        mongodb_client.close()
\ No newline at end of file
+        mongodb_client.close()
+    dispose_engine()
\ No newline at end of file
@@ -12,6 +12,8 @@ class ErrorConstants:
     VERSION_NOT_FOUND_MESSAGE="Version not found"
     SHORT_URL_GENERATION_FAILED_MESSAGE="Short URL generation failed"
     SHEET_TITLE_REQUIRED_MESSAGE="Sheet title is required"
+    TEXT_UPLOAD_INCOMPLETE_MESSAGE="Text upload incomplete, run the upload again to resume"
+    SEARCH_REINDEX_IN_PROGRESS_MESSAGE="Search reindex already in progress"
     # Image Error Messages
     IMAGE_ERROR_MESSAGE = "Only image files are allowed"
     IMAGE_SIZE_ERROR_MESSAGE = "File size exceeds 1MB limit"
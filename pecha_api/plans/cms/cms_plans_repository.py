@@ -11,6 +11,7 @@ from pecha_api.plans.users.plan_users_models import UserPlanProgress
 from fastapi import HTTPException
 from starlette import status
 from pecha_api.plans.plans_response_models import PlansRepositoryResponse, PlanWithAggregates
+from pecha_api.plans.shared.plan_search import build_plan_search_filter
 
 def save_plan(db: Session, plan: Plan):
     try:
@@ -39,7 +40,7 @@ def get_plans_by_author_id(
     if not is_admin:
         filters.append(Plan.author_id == author_id)
     if search:
-        filters.append(Plan.title.ilike(f"%{search}%"))
+        filters.append(build_plan_search_filter(search))
 
     # Aggregates (matching provided SQL): SUM of item day_number and COUNT DISTINCT of subscribers
     total_days_label = func.count(func.distinct(PlanItem.id)).label("total_days")
@@ -21,6 +21,7 @@ from sqlalchemy.orm import Session
 from pecha_api.db.database import SessionLocal
 from pecha_api.config import get
 from pecha_api.uploads.S3_utils import generate_presigned_access_url
+from pecha_api.plans.featured.featured_day_cache_service import invalidate_featured_day_cache
 from uuid import uuid4, UUID
 from fastapi import HTTPException
 from pecha_api.plans.auth.plan_auth_models import ResponseError
@@ -270,7 +271,8 @@ async def update_plan_details(token: str, plan_id: UUID, update_plan_request: Up
         plan.updated_by = author_details.email
         
         plan = update_plan(db, plan)
-        
+        await invalidate_featured_day_cache()
+
         image_url = None
         plan_image_url = plan.image_url
         if plan_image_url:
@@ -312,6 +314,7 @@ async def update_selected_plan_status(token:str,plan_id: UUID, plan_status_updat
 
         plan.status = plan_status_update.status
         plan = update_plan(db=db, plan=plan)
+        await invalidate_featured_day_cache()
         return PlanDTO(
             id=plan.id,
             title=plan.title,
@@ -331,7 +334,7 @@ async def delete_selected_plan(token:str,plan_id: UUID):
     with SessionLocal() as db:
         plan = _check_author_plan_availability(plan_id=plan_id, author_id=current_author.id, is_admin=current_author.is_admin)
         _soft_delete_plan_by_id(db=db, plan_id=plan.id, author=current_author)
-        return
+    await invalidate_featured_day_cache()
 
 def _get_task_subtasks_dto(subtasks: List[PlanSubTask]) -> List[SubTaskDTO]:
 
@@ -390,9 +393,10 @@ def _check_published_plan_day_availability(plan_id: UUID, plan_status: PlanStatu
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=ResponseError(error=BAD_REQUEST, message=PLAN_MUST_HAVE_AT_LEAST_ONE_DAY_WITH_CONTENT_TO_BE_PUBLISHED).model_dump())
         return
 
-def update_plan_featured_service(token:str, plan_id: UUID):
+async def update_plan_featured_service(token:str, plan_id: UUID):
     current_author = validate_and_extract_author_details(token=token)
     with SessionLocal() as db:
         plan = _check_author_plan_availability(plan_id=plan_id, author_id=current_author.id, is_admin=current_author.is_admin)
         plan.featured = not plan.featured
-        plan = update_plan(db=db, plan=plan)
\ No newline at end of file
+        plan = update_plan(db=db, plan=plan)
+    await invalidate_featured_day_cache()
@@ -98,9 +98,9 @@ async def get_plan_day_content(authentication_credential: Annotated[HTTPAuthoriz
 
 
 @cms_plans_router.patch("/{plan_id}/featured", status_code=status.HTTP_204_NO_CONTENT)
-def update_plan_featured(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
+async def update_plan_featured(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                               plan_id: UUID):
-    return update_plan_featured_service(
+    return await update_plan_featured_service(
         token=authentication_credential.credentials,
         plan_id=plan_id,
     )
\ No newline at end of file
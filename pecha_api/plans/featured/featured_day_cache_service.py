@@ -0,0 +1,64 @@
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional
+
+from pecha_api import config
+from pecha_api.cache.cache_enums import CacheType, CacheTag
+from pecha_api.cache.cache_keys import CacheKeys
+from pecha_api.cache.cache_repository import get_cache_data, set_cache, invalidate_tags
+from pecha_api.cache.local_cache import publish_local_cache_invalidation
+from ..plans_enums import ContentType
+from .featured_day_response_model import PlanDayDTO
+
+
+def featured_day_cache_key(language: str, day: date) -> str:
+    return CacheKeys.build(CacheType.FEATURED_DAY, language, day.isoformat())
+
+
+def seconds_until_end_of_day(day: date) -> int:
+    end_of_day = datetime.combine(day + timedelta(days=1), time.min)
+    return max(int((end_of_day - datetime.now()).total_seconds()), 1)
+
+
+def _has_signed_urls(featured_day: PlanDayDTO) -> bool:
+    return any(
+        subtask.content_type == ContentType.IMAGE
+        for task in featured_day.tasks
+        for subtask in task.subtasks
+    )
+
+
+def featured_day_cache_timeout(day: date, featured_day: PlanDayDTO) -> int:
+    """Until the day ends, but never past the point where its presigned image urls stop being valid."""
+    cache_time_out = seconds_until_end_of_day(day)
+    if _has_signed_urls(featured_day):
+        # a url handed out by the presigned url cache has at least the refresh margin left to live
+        cache_time_out = min(cache_time_out, config.get_int("AWS_PRESIGNED_URL_REFRESH_MARGIN"))
+    return cache_time_out
+
+
+async def get_featured_day_cache(language: str, day: date) -> Optional[PlanDayDTO]:
+    cache_data = await get_cache_data(hash_key=featured_day_cache_key(language=language, day=day))
+    if cache_data and isinstance(cache_data, dict):
+        return PlanDayDTO(**cache_data)
+    return None
+
+
+async def set_featured_day_cache(language: str, day: date, featured_day: PlanDayDTO):
+    await set_cache(
+        hash_key=featured_day_cache_key(language=language, day=day),
+        value=featured_day,
+        cache_time_out=featured_day_cache_timeout(day=day, featured_day=featured_day),
+        tags=[CacheKeys.tag(CacheTag.FEATURED_DAY)]
+    )
+
+
+async def invalidate_featured_day_cache() -> bool:
+    """Drop every cached featured day: a plan edit can change which day is picked or what it shows."""
+    try:
+        invalidated_keys: List[str] = await invalidate_tags(tags=[CacheKeys.tag(CacheTag.FEATURED_DAY)])
+        await publish_local_cache_invalidation(hash_keys=invalidated_keys)
+        return True
+    except Exception:
+        logging.error("Error invalidating the featured day cache", exc_info=True)
+        return False
@@ -1,29 +1,64 @@
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
-from typing import List
+from sqlalchemy import and_, func
+from typing import List, Optional
 from ..plans_models import Plan
 from ..items.plan_items_models import PlanItem
 from ..tasks.plan_tasks_models import PlanTask
-from ..tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from ..plans_enums import PlanStatus
 
-def get_all_featured_plan_days(db: Session, language: str = "EN") -> List[PlanItem]:
-   
-    query = (
+
+def _featured_plan_days_query(db: Session, language: str):
+    return (
         db.query(PlanItem)
         .join(Plan, PlanItem.plan_id == Plan.id)
+        .filter(
+            and_(
+                Plan.featured == True,
+                Plan.status == PlanStatus.PUBLISHED,
+                Plan.language == language
+            )
+        )
+    )
+
+
+def count_featured_plan_days(db: Session, language: str = "EN") -> int:
+    return _featured_plan_days_query(db, language=language).with_entities(func.count(PlanItem.id)).scalar() or 0
+
+
+def get_featured_plan_day_by_offset(db: Session, offset: int, language: str = "EN") -> Optional[PlanItem]:
+    # the day is picked on the items alone, then loaded with its tasks; a joined eager load
+    # would page over task and subtask rows instead of days
+    plan_item_id = (
+        _featured_plan_days_query(db, language=language)
+        .with_entities(PlanItem.id)
+        .order_by(PlanItem.plan_id, PlanItem.day_number, PlanItem.id)
+        .offset(offset)
+        .limit(1)
+        .scalar()
+    )
+    if plan_item_id is None:
+        return None
+    return (
+        db.query(PlanItem)
         .options(
             joinedload(PlanItem.tasks)
             .joinedload(PlanTask.sub_tasks)
         )
+        .filter(PlanItem.id == plan_item_id)
+        .first()
+    )
+
+
+def get_featured_plan_languages(db: Session) -> List[str]:
+    rows = (
+        db.query(Plan.language)
         .filter(
             and_(
                 Plan.featured == True,
-                Plan.status == PlanStatus.PUBLISHED,
-                Plan.language == language
+                Plan.status == PlanStatus.PUBLISHED
             )
         )
+        .distinct()
         .all()
     )
-    
-    return query
+    return [row.language.value for row in rows]
@@ -1,12 +1,20 @@
+import asyncio
 from fastapi import HTTPException, status
-from ...db.database import SessionLocal
-from .featured_day_repository import get_all_featured_plan_days
+from sqlalchemy.orm import Session
+from typing import Optional
+from ...db.database import run_with_session
+from .featured_day_repository import (
+    count_featured_plan_days,
+    get_featured_plan_day_by_offset,
+    get_featured_plan_languages
+)
+from .featured_day_cache_service import get_featured_day_cache, set_featured_day_cache, seconds_until_end_of_day
 from .featured_day_response_model import PlanDayDTO, TaskDTO, SubTaskDTO
 from ...uploads.S3_utils import generate_presigned_access_url
-from ...config import get
+from ...config import get, get_int
 from ..plans_enums import ContentType
 import logging
-from datetime import datetime
+from datetime import datetime, date, timedelta
 
 from ..response_message import NO_FEATURED_PLANS_WITH_DAYS_FOUND
 
@@ -41,23 +49,60 @@ def build_task_dto(task) -> TaskDTO:
     )
 
 
-def get_featured_day_service(language: str) -> PlanDayDTO:
-    with SessionLocal() as db:
-        featured_days = get_all_featured_plan_days(db, language=language.upper())
-        
-        if not featured_days:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,detail=NO_FEATURED_PLANS_WITH_DAYS_FOUND)
-        
-        index = datetime.now().date().toordinal() % len(featured_days)
-        selected_day_item = featured_days[index]
-        
-        tasks = [
-            build_task_dto(task) 
-            for task in sorted(selected_day_item.tasks, key=lambda t: t.display_order)
-        ]
-        
-        return PlanDayDTO(
-            id=selected_day_item.id,
-            day_number=selected_day_item.day_number,
-            tasks=tasks
-        )
\ No newline at end of file
+def _load_featured_day(db: Session, language: str, day: date) -> Optional[PlanDayDTO]:
+    # every featured day of the language gets its turn, one per calendar day
+    candidate_count = count_featured_plan_days(db, language=language)
+    if not candidate_count:
+        return None
+    selected_day_item = get_featured_plan_day_by_offset(db, offset=day.toordinal() % candidate_count, language=language)
+    if selected_day_item is None:
+        return None
+
+    tasks = [
+        build_task_dto(task)
+        for task in sorted(selected_day_item.tasks, key=lambda t: t.display_order)
+    ]
+
+    return PlanDayDTO(
+        id=selected_day_item.id,
+        day_number=selected_day_item.day_number,
+        tasks=tasks
+    )
+
+
+async def build_featured_day(language: str, day: date) -> Optional[PlanDayDTO]:
+    featured_day = await run_with_session(lambda db: _load_featured_day(db, language=language, day=day))
+    if featured_day is not None:
+        await set_featured_day_cache(language=language, day=day, featured_day=featured_day)
+    return featured_day
+
+
+async def get_featured_day_service(language: str) -> PlanDayDTO:
+    language = language.upper()
+    today = datetime.now().date()
+    featured_day = await get_featured_day_cache(language=language, day=today)
+    if featured_day is None:
+        featured_day = await build_featured_day(language=language, day=today)
+
+    if featured_day is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND,detail=NO_FEATURED_PLANS_WITH_DAYS_FOUND)
+    return featured_day
+
+
+async def prewarm_featured_days(day: date):
+    languages = await run_with_session(get_featured_plan_languages)
+    for language in languages:
+        await build_featured_day(language=language, day=day)
+
+
+async def run_featured_day_prewarm_loop():
+    """Build the next day's featured days shortly before midnight so the first requests of the day hit the cache."""
+    while True:
+        today = datetime.now().date()
+        await asyncio.sleep(max(seconds_until_end_of_day(today) - get_int("FEATURED_DAY_PREWARM_LEAD"), 0))
+        try:
+            await prewarm_featured_days(day=today + timedelta(days=1))
+        except Exception as e:
+            logger.error(f"Failed to prewarm the featured days: {e}")
+        # schedule the next run once the day has turned
+        await asyncio.sleep(seconds_until_end_of_day(today))
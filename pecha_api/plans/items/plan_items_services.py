@@ -11,8 +11,9 @@ from pecha_api.plans.authors.plan_authors_model import Author
 from .plan_items_response_models import ItemDTO, ReorderDaysRequest
 from pecha_api.plans.authors.plan_authors_service import validate_and_extract_author_details
 from pecha_api.db.database import SessionLocal
+from pecha_api.plans.featured.featured_day_cache_service import invalidate_featured_day_cache
 
-def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
+async def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
     current_author = validate_and_extract_author_details(token=token)
 
     with SessionLocal() as db_session:
@@ -25,6 +26,7 @@ def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
             created_by=current_author.email
         )
         saved_item = save_plan_item(db=db_session, plan_item=plan_item)
+    await invalidate_featured_day_cache()
 
     return ItemDTO(
         id=saved_item.id,
@@ -32,7 +34,7 @@ def create_plan_item(token: str, plan_id: UUID) -> ItemDTO:
         day_number=saved_item.day_number
     )
 
-def delete_plan_day_by_id(token: str, plan_id: UUID, day_id: UUID) -> None:
+async def delete_plan_day_by_id(token: str, plan_id: UUID, day_id: UUID) -> None:
     current_author = validate_and_extract_author_details(token=token)
 
     with SessionLocal() as db_session:
@@ -41,13 +43,15 @@ def delete_plan_day_by_id(token: str, plan_id: UUID, day_id: UUID) -> None:
         item = get_day_by_plan_day_id(db=db_session, plan_id=plan.id, day_id=day_id)
         delete_day_by_id(db=db_session, plan_id=plan.id, day_id=item.id)
         _reorder_day_display_order(db=db_session, plan_id=plan.id)
+    await invalidate_featured_day_cache()
 
-def update_plans_day_number(token: str, plan_id: UUID, reorder_days_request: ReorderDaysRequest) -> None:
+async def update_plans_day_number(token: str, plan_id: UUID, reorder_days_request: ReorderDaysRequest) -> None:
     current_author = validate_and_extract_author_details(token=token)
     with SessionLocal() as db_session:
         plan = _get_author_plan(plan_id=plan_id, current_author=current_author,is_admin=current_author.is_admin)
         _check_duplicate_day_number_payload(payload=reorder_days_request)
         update_days_in_bulk_by_plan_id(db=db_session, plan_id=plan.id, days=reorder_days_request.days)
+    await invalidate_featured_day_cache()
 
 def _reorder_day_display_order(db: SessionLocal(), plan_id: UUID) -> None:
 
@@ -17,7 +17,7 @@ items_router = APIRouter(
 async def create_new_item(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                       plan_id: UUID):
 
-    return create_plan_item(
+    return await create_plan_item(
         token=authentication_credential.credentials,
         plan_id=plan_id
     )
@@ -26,7 +26,7 @@ async def create_new_item(authentication_credential: Annotated[HTTPAuthorization
 async def delete_item(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                       plan_id: UUID,
                       day_id: UUID):
-    return delete_plan_day_by_id(
+    return await delete_plan_day_by_id(
         token=authentication_credential.credentials,
         plan_id=plan_id,
         day_id=day_id
@@ -37,7 +37,7 @@ async def delete_item(authentication_credential: Annotated[HTTPAuthorizationCred
 async def reorder_days(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                       plan_id: UUID,
                       reorder_days_request: ReorderDaysRequest):
-    update_plans_day_number(
+    await update_plans_day_number(
         token=authentication_credential.credentials,
         plan_id=plan_id,
         reorder_days_request=reorder_days_request
@@ -0,0 +1,89 @@
+import io
+from typing import Iterable, List, Optional, Tuple
+
+from PIL import Image, features
+
+# kept free of application imports, it is what the image worker processes load
+
+# format name -> (Pillow format, file extension, content type)
+IMAGE_FORMATS = {
+    "jpeg": ("JPEG", "jpg", "image/jpeg"),
+    "webp": ("WEBP", "webp", "image/webp"),
+    "avif": ("AVIF", "avif", "image/avif"),
+}
+
+# largest first, every version is resized from the one before it: (name, max width, quality)
+IMAGE_VERSIONS = (
+    ("original", None, 90),
+    ("medium", 800, 85),
+    ("thumbnail", 200, 80),
+)
+
+
+def get_supported_formats(formats: Iterable[str]) -> List[str]:
+    """JPEG always, followed by the requested formats this Pillow build can encode."""
+    supported = ["jpeg"]
+    for image_format in formats:
+        image_format = image_format.strip().lower()
+        if image_format in IMAGE_FORMATS and image_format not in supported and features.check(image_format):
+            supported.append(image_format)
+    return supported
+
+
+def convert_to_rgb(image: Image.Image) -> Image.Image:
+    """
+    Convert image to RGB mode for JPEG compatibility.
+    Handles transparency by adding white background.
+    """
+    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        if image.mode == 'P':
+            image = image.convert('RGBA')
+        background.paste(image, mask=image.split()[3] if image.mode == 'RGBA' else image.split()[1])
+        return background
+    elif image.mode != 'RGB':
+        return image.convert('RGB')
+    return image
+
+
+def downscale(image: Image.Image, max_width: int) -> Image.Image:
+    """Resize to max_width keeping the aspect ratio, never upscaling."""
+    if image.width <= max_width:
+        return image
+    new_height = int(max_width * image.height / image.width)
+    # reducing_gap shrinks by an integer factor with reduce() first, LANCZOS only runs on the last step
+    return image.resize((max_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+
+
+def encode_image(image: Image.Image, image_format: str, quality: int) -> bytes:
+    pillow_format = IMAGE_FORMATS[image_format][0]
+    options = {"quality": quality}
+    if image_format == "jpeg":
+        options["optimize"] = True
+    elif image_format == "webp":
+        # the default method 4 takes about twice as long for no smaller a file
+        options["method"] = 2
+    elif image_format == "avif":
+        # the default speed is several times slower for a barely smaller file
+        options["speed"] = 8
+    output = io.BytesIO()
+    image.save(output, format=pillow_format, **options)
+    return output.getvalue()
+
+
+def render_image_versions(data: bytes, formats: List[str], max_width: Optional[int] = None) -> List[Tuple[str, str, bytes]]:
+    """Decode the upload once and encode every version in each of the formats as (version, format, bytes)."""
+    image = Image.open(io.BytesIO(data))
+    if max_width and image.width > max_width:
+        # JPEG only: decode at the smallest 1/2, 1/4 or 1/8 scale still at least max_width wide
+        image.draft("RGB", (max_width, int(max_width * image.height / image.width)))
+    image = convert_to_rgb(image)
+
+    renditions = []
+    for version_name, version_width, quality in IMAGE_VERSIONS:
+        width = version_width or max_width
+        if width:
+            image = downscale(image, width)
+        for image_format in formats:
+            renditions.append((version_name, image_format, encode_image(image, image_format, quality)))
+    return renditions
@@ -1,10 +1,18 @@
+from typing import Dict
 from pydantic import BaseModel
 from pecha_api.plans.response_message import IMAGE_UPLOAD_SUCCESS
 
+class ImageVersionUrlModel(BaseModel):
+    thumbnail: str
+    medium: str
+    original: str
+
 class ImageUrlModel(BaseModel):
     thumbnail: str
     medium: str
     original: str
+    # the same versions in the formats rendered next to the JPEG ones, e.g. "webp", "avif"
+    formats: Dict[str, ImageVersionUrlModel] = {}
 
 class PlanUploadResponse(BaseModel):
     image: ImageUrlModel
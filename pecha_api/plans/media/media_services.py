@@ -1,5 +1,10 @@
+import asyncio
+import multiprocessing
 import os, uuid
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from fastapi import UploadFile, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
 from PIL import Image
 import io
@@ -7,9 +12,10 @@ import io
 
 from ...config import get, get_int
 from ...image_utils import ImageUtils
-from ...uploads.S3_utils import upload_bytes, generate_presigned_access_url
+from ...uploads.S3_utils import upload_bytes, sign_many
 from ...plans.authors.plan_authors_service import validate_and_extract_author_details
-from .media_response_models import PlanUploadResponse, ImageUrlModel, TextImageUploadResponse
+from .media_response_models import PlanUploadResponse, ImageUrlModel, ImageVersionUrlModel, TextImageUploadResponse
+from .image_pipeline import IMAGE_FORMATS, get_supported_formats, render_image_versions
 from ...plans.response_message import (
     IMAGE_UPLOAD_SUCCESS,
     INVALID_FILE_FORMAT,
@@ -20,6 +26,8 @@ from .media_repository import create_text_image
 from ...error_contants import ErrorConstants
 from ...db.database import SessionLocal
 
+_image_executor: Optional[ProcessPoolExecutor] = None
+
 
 def validate_file(file: UploadFile) -> None:
     file_extension = os.path.splitext(file.filename.lower())[1] if file.filename else ''
@@ -30,135 +38,93 @@ def validate_file(file: UploadFile) -> None:
         raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=FILE_TOO_LARGE)
 
 
-def convert_to_rgb(image: Image.Image) -> Image.Image:
-    """
-    Convert image to RGB mode for JPEG compatibility.
-    Handles transparency by adding white background.
-    """
-    if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
-        background = Image.new('RGB', image.size, (255, 255, 255))
-        if image.mode == 'P':
-            image = image.convert('RGBA')
-        background.paste(image, mask=image.split()[3] if image.mode == 'RGBA' else image.split()[1])
-        return background
-    elif image.mode != 'RGB':
-        return image.convert('RGB')
-    return image
-
-
-def compress_image_to_size(image: Image.Image, max_width: int, quality: int = 85) -> io.BytesIO:
-    """
-    Resize and compress image to specified width while maintaining aspect ratio.
-    
-    Args:
-        image: PIL Image object
-        max_width: Maximum width in pixels
-        quality: JPEG quality (1-100)
-    
-    Returns:
-        BytesIO object containing compressed image
-    """
-    # Calculate new dimensions maintaining aspect ratio
-    aspect_ratio = image.height / image.width
-    new_width = min(image.width, max_width)
-    new_height = int(new_width * aspect_ratio)
-    
-    # Resize image using high-quality LANCZOS resampling
-    resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-    
-    # Convert to RGB if necessary
-    resized_image = convert_to_rgb(resized_image)
-    
-    # Save to BytesIO with compression
-    output = io.BytesIO()
-    resized_image.save(output, format='JPEG', quality=quality, optimize=True)
-    output.seek(0)
-    return output
+def _get_image_executor() -> Optional[ProcessPoolExecutor]:
+    # None renders in the event loop's default thread pool, for development and tests
+    global _image_executor
+    if _image_executor is None and get_int("MEDIA_IMAGE_WORKERS") > 0:
+        _image_executor = ProcessPoolExecutor(
+            max_workers=get_int("MEDIA_IMAGE_WORKERS"),
+            # spawned workers only import the Pillow pipeline, not a copy of the running app
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _image_executor
 
 
-def compress_image_original_size(image: Image.Image, quality: int = 90) -> io.BytesIO:
-    """
-    Compress image at original dimensions without resizing.
-    
-    Args:
-        image: PIL Image object
-        quality: JPEG quality (1-100)
-    
-    Returns:
-        BytesIO object containing compressed image
-    """
-    # Convert to RGB if necessary
-    rgb_image = convert_to_rgb(image)
-    
-    # Save to BytesIO with compression
-    output = io.BytesIO()
-    rgb_image.save(output, format='JPEG', quality=quality, optimize=True)
-    output.seek(0)
-    return output
+def shutdown_image_executor():
+    global _image_executor
+    if _image_executor is not None:
+        _image_executor.shutdown(wait=False, cancel_futures=True)
+        _image_executor = None
 
 
-def read_image_from_upload(file: UploadFile) -> Image.Image:
+def read_image_from_upload(file: UploadFile) -> bytes:
     file.file.seek(0)
+    data = file.file.read()
     try:
-        return Image.open(file.file)
+        # only the header is parsed here, the pixels are decoded by the image workers
+        Image.open(io.BytesIO(data))
     except Exception:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid image file")
+    return data
 
 
-def build_image_versions(original_image: Image.Image) -> list[tuple[str, io.BytesIO]]:
-    thumbnail_image = compress_image_to_size(original_image.copy(), 200, quality=80)
-    medium_image = compress_image_to_size(original_image.copy(), 800, quality=85)
-    original_compressed = compress_image_original_size(original_image.copy(), quality=90)
-    return [
-        ("thumbnail", thumbnail_image),
-        ("medium", medium_image),
-        ("original", original_compressed),
+async def build_image_versions(data: bytes) -> list[tuple[str, str, bytes]]:
+    loop = asyncio.get_running_loop()
+    executor = _get_image_executor()
+    max_width = get_int("MEDIA_IMAGE_MAX_WIDTH")
+    # one job per format, encoding dominates so decoding the upload in each job is cheaper than shipping pixels around
+    renders = [
+        loop.run_in_executor(executor, partial(render_image_versions, data=data, formats=[image_format], max_width=max_width))
+        for image_format in get_supported_formats(get("MEDIA_IMAGE_FORMATS").split(","))
     ]
-
-
-def upload_image_versions(*, image_path_full: str, file_name: str, image_versions: list[tuple[str, io.BytesIO]]) -> tuple[ImageUrlModel, str]:
-    image_urls = {}
-    original_key = ""
-
-    for version_name, compressed_image in image_versions:
-        s3_key = f"{image_path_full}/{version_name}/{file_name}.jpg"
-        upload_key = upload_bytes(
-            bucket_name=get("AWS_BUCKET_NAME"),
-            s3_key=s3_key,
-            file=compressed_image,
-            content_type="image/jpeg",
-        )
-        if version_name == "original":
-            original_key = upload_key
-
-        presigned_url = generate_presigned_access_url(
-            bucket_name=get("AWS_BUCKET_NAME"),
-            s3_key=upload_key,
-        )
-
-        image_urls[version_name] = presigned_url
-
+    return [image_version for image_versions in await asyncio.gather(*renders) for image_version in image_versions]
+
+
+async def upload_image_versions(*, image_path_full: str, file_name: str, image_versions: list[tuple[str, str, bytes]]) -> tuple[ImageUrlModel, str]:
+    bucket_name = get("AWS_BUCKET_NAME")
+    uploads = []
+    for version_name, image_format, data in image_versions:
+        _, extension, content_type = IMAGE_FORMATS[image_format]
+        uploads.append(run_in_threadpool(
+            upload_bytes,
+            bucket_name=bucket_name,
+            s3_key=f"{image_path_full}/{version_name}/{file_name}.{extension}",
+            file=io.BytesIO(data),
+            content_type=content_type,
+        ))
+    upload_keys = dict(zip(
+        [(version_name, image_format) for version_name, image_format, _ in image_versions],
+        await asyncio.gather(*uploads)
+    ))
+    presigned_urls = sign_many(bucket_name=bucket_name, s3_keys=upload_keys.values())
+
+    image_urls: dict[str, dict[str, str]] = {}
+    for (version_name, image_format), upload_key in upload_keys.items():
+        image_urls.setdefault(image_format, {})[version_name] = presigned_urls[upload_key]
+
+    jpeg_urls = image_urls.pop("jpeg")
     image_url_model = ImageUrlModel(
-        thumbnail=image_urls["thumbnail"],
-        medium=image_urls["medium"],
-        original=image_urls["original"],
+        thumbnail=jpeg_urls["thumbnail"],
+        medium=jpeg_urls["medium"],
+        original=jpeg_urls["original"],
+        formats={image_format: ImageVersionUrlModel(**urls) for image_format, urls in image_urls.items()},
     )
-    return image_url_model, original_key
+    return image_url_model, upload_keys[("original", "jpeg")]
 
 
-def prepare_image_upload(*, file: UploadFile, image_path_full: str) -> tuple[ImageUrlModel, str]:
+async def prepare_image_upload(*, file: UploadFile, image_path_full: str) -> tuple[ImageUrlModel, str]:
         
-    original_image = read_image_from_upload(file)
+    data = read_image_from_upload(file)
     file_name, _ = os.path.splitext(file.filename)
-    image_versions = build_image_versions(original_image)
-    return upload_image_versions(
+    image_versions = await build_image_versions(data)
+    return await upload_image_versions(
         image_path_full=image_path_full,
         file_name=file_name,
         image_versions=image_versions,
     )
 
 
-def upload_plan_image(token: str, plan_id: Optional[str], file: UploadFile) -> PlanUploadResponse:
+async def upload_plan_image(token: str, plan_id: Optional[str], file: UploadFile) -> PlanUploadResponse:
 
     validate_and_extract_author_details(token=token)
     validate_file(file)
@@ -167,7 +133,7 @@ def upload_plan_image(token: str, plan_id: Optional[str], file: UploadFile) -> P
     path = "images/plan_images"
     image_path_full = f"{path}/{plan_id}/{unique_id}" if plan_id is not None else f"{path}/{unique_id}"
 
-    image_url_model, original_key = prepare_image_upload(
+    image_url_model, original_key = await prepare_image_upload(
         file=file,
         image_path_full=image_path_full,
     )
@@ -192,7 +158,7 @@ async def upload_text_image(token: str, text_id: str, file: UploadFile) -> TextI
     unique_id = str(uuid.uuid4())
     path = "images/text_images"
     image_path_full = f"{path}/{text_id}/{unique_id}"
-    image_url_model, original_key = prepare_image_upload(
+    image_url_model, original_key = await prepare_image_upload(
         file=file,
         image_path_full=image_path_full,
     )
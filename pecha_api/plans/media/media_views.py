@@ -14,7 +14,7 @@ media_router = APIRouter(
 
 @media_router.post("/upload", status_code=status.HTTP_201_CREATED)
 async def upload_media_image(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)], plan_id: Optional[str] = Query(None), file: UploadFile = File(...)) -> PlanUploadResponse:
-    return upload_plan_image(token=authentication_credential.credentials, plan_id=plan_id, file=file)
+    return await upload_plan_image(token=authentication_credential.credentials, plan_id=plan_id, file=file)
 
 
 @media_router.post("/upload/text", status_code=status.HTTP_201_CREATED)
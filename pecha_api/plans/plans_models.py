@@ -1,10 +1,10 @@
-from sqlalchemy import Column, String, DateTime, Boolean, UUID, Text, Index, text, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, UUID, Text, Index, Integer, text, ForeignKey
 from ..db.database import Base
 from uuid import uuid4
 import _datetime
 from _datetime import datetime
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from .plans_enums import LanguageCodeEnum, DifficultyLevelEnum, PlanStatusEnum
 
 
@@ -32,6 +32,8 @@ class Plan(Base):
     deleted_at = Column(DateTime(timezone=True))
     deleted_by = Column(String(255))
 
+    # weighted title/description vector in the text search config of the plan language, set by a trigger
+    search_vector = Column(TSVECTOR, nullable=True)
 
     author = relationship("Author", backref="plans", passive_deletes=True)
 
@@ -39,7 +41,21 @@ class Plan(Base):
         # Indexes for plan discovery
         Index("idx_plans_discovery", "tags", "status"),
         Index("idx_plans_featured", "featured", postgresql_where=text("featured = TRUE")),
-        Index("idx_plans_search", text("to_tsvector('english', title || ' ' || COALESCE(description, ''))"),
-              postgresql_using="gin"),
+        Index("idx_plans_search_vector", "search_vector", postgresql_using="gin"),
+        Index("idx_plans_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("idx_plans_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
         Index("idx_plans_tags", "tags", postgresql_using="gin"),
     )
+
+
+class PlanStats(Base):
+    # one row per plan, kept in step by triggers on items and user_plan_progress
+    __tablename__ = "plan_stats"
+
+    plan_id = Column(UUID(as_uuid=True), ForeignKey('plans.id', ondelete='CASCADE'), primary_key=True)
+    total_days = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    subscription_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+
+    __table_args__ = (
+        Index("idx_plan_stats_subscription_count", "subscription_count"),
+    )
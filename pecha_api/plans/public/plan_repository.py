@@ -2,11 +2,11 @@ from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func, desc, asc
 from typing import Optional, Tuple, List
 from uuid import UUID
-from pecha_api.plans.plans_models import Plan
+from pecha_api.plans.plans_models import Plan, PlanStats
 from pecha_api.plans.items.plan_items_models import PlanItem
-from pecha_api.plans.users.plan_users_models import UserPlanProgress
 from pecha_api.plans.plans_enums import PlanStatus
 from pecha_api.plans.public.plan_response_models import PlanWithAggregates
+from pecha_api.plans.shared.plan_search import build_plan_search_filter, build_plan_search_rank
 
 DEFAULT_SKIP = 0
 DEFAULT_LIMIT = 20
@@ -17,23 +17,22 @@ DEFAULT_SORT_ORDER = "asc"
 DEFAULT_TAG = None
 
 def get_aggregate_counts():
-    total_days_label = func.count(func.distinct(PlanItem.id)).label("total_days")
-    subscription_count_label = func.count(func.distinct(UserPlanProgress.user_id)).label("subscription_count")
+    # counters are materialized in plan_stats, a plan without a row has no days and no subscribers yet
+    total_days_label = func.coalesce(PlanStats.total_days, 0).label("total_days")
+    subscription_count_label = func.coalesce(PlanStats.subscription_count, 0).label("subscription_count")
     return total_days_label, subscription_count_label
 
 
 def get_published_plans_query(db: Session, total_days_label, subscription_count_label, language: str):
     query = (
-        db.query(Plan, total_days_label, subscription_count_label)
-        .outerjoin(PlanItem, PlanItem.plan_id == Plan.id)
-        .outerjoin(UserPlanProgress, UserPlanProgress.plan_id == Plan.id)
+        db.query(Plan, total_days_label, subscription_count_label, func.count().over().label("total"))
+        .outerjoin(PlanStats, PlanStats.plan_id == Plan.id)
         .options(selectinload(Plan.author))
         .filter(
             Plan.language == language,
             Plan.deleted_at.is_(None),
             Plan.status == PlanStatus.PUBLISHED
         )
-        .group_by(Plan.id)
     )
     
     return query
@@ -41,7 +40,7 @@ def get_published_plans_query(db: Session, total_days_label, subscription_count_
 
 def apply_search_filter(query, search: Optional[str]):
     if search:
-        query = query.filter(Plan.title.ilike(f"%{search}%"))
+        query = query.filter(build_plan_search_filter(search))
     return query
 
 def apply_tag_filter(query, tag: Optional[str]):
@@ -49,7 +48,10 @@ def apply_tag_filter(query, tag: Optional[str]):
         query = query.filter(Plan.tags.contains([tag]))
     return query
 
-def apply_sorting(query, sort_by: str, sort_order: str, total_days_label, subscription_count_label):
+def apply_sorting(query, sort_by: str, sort_order: str, total_days_label, subscription_count_label, search: Optional[str] = None):
+    if search and sort_by == DEFAULT_SORT_BY:
+        # a search sorted by the default title puts the best matches first
+        query = query.order_by(desc(build_plan_search_rank(search)))
     sort_column_map = {
         "title": Plan.title,
         "total_days": total_days_label,
@@ -58,19 +60,24 @@ def apply_sorting(query, sort_by: str, sort_order: str, total_days_label, subscr
     
     sort_column = sort_column_map.get(sort_by, Plan.title)
     
+    # plan id breaks ties so pages do not overlap
     if sort_order == "desc":
-        return query.order_by(desc(sort_column))
+        return query.order_by(desc(sort_column), Plan.id)
     else:
-        return query.order_by(asc(sort_column))
+        return query.order_by(asc(sort_column), Plan.id)
 
 
 def convert_to_plan_aggregates(rows):
     return [
         PlanWithAggregates(plan=plan, total_days=total_days, subscription_count=subscription_count)
-        for plan, total_days, subscription_count in rows
+        for plan, total_days, subscription_count, _ in rows
     ]
 
 
+def get_total_from_rows(rows) -> int:
+    return rows[0].total if rows else 0
+
+
 def get_published_plans_from_db(db: Session, 
     skip: int = DEFAULT_SKIP, 
     limit: int = DEFAULT_LIMIT, 
@@ -79,15 +86,18 @@ def get_published_plans_from_db(db: Session,
     sort_by: str = DEFAULT_SORT_BY,
     sort_order: str = DEFAULT_SORT_ORDER,
     tag: Optional[str] = DEFAULT_TAG
-):
+) -> Tuple[List[PlanWithAggregates], int]:
     total_days_label, subscription_count_label = get_aggregate_counts()
     query = get_published_plans_query(db, total_days_label, subscription_count_label, language)
     query = apply_search_filter(query, search)
     query = apply_tag_filter(query, tag)
-    query = apply_sorting(query, sort_by, sort_order, total_days_label, subscription_count_label)
+    query = apply_sorting(query, sort_by, sort_order, total_days_label, subscription_count_label, search)
     rows = query.offset(skip).limit(limit).all()
+    if not rows and skip > 0:
+        # the window total rides on the page rows, a page past the end needs its own count
+        return [], get_published_plans_count(db=db, search=search, language=language, tag=tag)
     
-    return convert_to_plan_aggregates(rows)
+    return convert_to_plan_aggregates(rows), get_total_from_rows(rows)
 
 
 def get_published_plans_count(db: Session, search: Optional[str] = DEFAULT_SEARCH, language: str = DEFAULT_LANGUAGE, tag: Optional[str] = DEFAULT_TAG) -> int:
@@ -96,10 +106,8 @@ def get_published_plans_count(db: Session, search: Optional[str] = DEFAULT_SEARC
         Plan.status == PlanStatus.PUBLISHED,
         Plan.language == language
     )
-    if search:
-        query = query.filter(Plan.title.ilike(f"%{search}%"))
-    if tag:
-        query = query.filter(Plan.tags.contains([tag]))
+    query = apply_search_filter(query, search)
+    query = apply_tag_filter(query, tag)
     return query.scalar()
 
 
@@ -122,22 +130,25 @@ def get_plan_item_by_day_number(db: Session, plan_id: UUID, day_number: int) ->
         ).first()
 
 def get_published_plans_by_author_id(db: Session, author_id: UUID, skip: int, limit: int) -> Tuple[List[PlanWithAggregates], int]:
-    total_days_label = func.count(func.distinct(PlanItem.id)).label("total_days")
-    subscription_count_label = func.count(func.distinct(UserPlanProgress.user_id)).label("subscription_count")
+    total_days_label, subscription_count_label = get_aggregate_counts()
     query = (
         db.query(
             Plan,
             total_days_label,
-            subscription_count_label
+            subscription_count_label,
+            func.count().over().label("total")
         )
-        .outerjoin(PlanItem, PlanItem.plan_id == Plan.id)
-        .outerjoin(UserPlanProgress, UserPlanProgress.plan_id == Plan.id)
+        .outerjoin(PlanStats, PlanStats.plan_id == Plan.id)
         .filter(Plan.author_id == author_id, Plan.status == PlanStatus.PUBLISHED, Plan.deleted_at.is_(None))
-        .group_by(Plan.id)
+        .order_by(Plan.id)
     )
-    total = query.count()
     rows = query.offset(skip).limit(limit).all()
-    return convert_to_plan_aggregates(rows), total
+    if not rows and skip > 0:
+        total = db.query(func.count(Plan.id)).filter(
+            Plan.author_id == author_id, Plan.status == PlanStatus.PUBLISHED, Plan.deleted_at.is_(None)
+        ).scalar()
+        return [], total
+    return convert_to_plan_aggregates(rows), get_total_from_rows(rows)
 
 
 def get_all_unique_tags(db: Session, language: str = "EN") -> List[str]:
@@ -5,7 +5,7 @@ from typing import Optional
 from starlette import status
 from pecha_api.config import get
 from fastapi import HTTPException
-from pecha_api.db.database import SessionLocal
+from pecha_api.db.database import SessionLocal, run_with_session
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.plans.items.plan_items_repository import get_days_by_plan_id, get_plan_day_with_tasks_and_subtasks
 from pecha_api.plans.public.plan_response_models import PublicPlansResponse, PublicPlanDTO, PlanDayDTO, AuthorDTO,PlanDaysResponse, PlanDayBasic, SubTaskDTO, TaskDTO, ImageUrlModel, TagsResponse
@@ -13,7 +13,7 @@ from pecha_api.plans.items.plan_items_models import PlanItem
 from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_models import PlanSubTask
 from pecha_api.plans.cms.cms_plans_repository import get_plan_by_id
 from pecha_api.uploads.S3_utils import generate_presigned_access_url
-from pecha_api.plans.public.plan_repository import (get_published_plans_from_db, get_published_plans_count, get_published_plan_by_id, get_all_unique_tags)
+from pecha_api.plans.public.plan_repository import (get_published_plans_from_db, get_published_plan_by_id, get_all_unique_tags)
 
 logger = logging.getLogger(__name__)
 
@@ -41,62 +41,19 @@ async def get_published_plans(
     ) -> PublicPlansResponse:
     
     try:
-        with SessionLocal() as db:
-            language_upper = language.upper()
-            plan_aggregates = get_published_plans_from_db(db=db, skip=skip, limit=limit, search=search, language=language_upper, sort_by=sort_by, sort_order=sort_order, tag=tag)
-            
-            plan_dtos = []
-            for plan_aggregate in plan_aggregates:
-                plan = plan_aggregate.plan
-                
-                plan_image = await get_image_url(image_url=plan.image_url)
-                
-                author_dto = None
-                if plan.author:
-                    author_image = await get_image_url(image_url=plan.author.image_url)
-                    author_dto = AuthorDTO(
-                        id=plan.author.id, 
-                        firstname=plan.author.first_name, 
-                        lastname=plan.author.last_name, 
-                        image=author_image 
-                    )
-                
-                plan_dto = PublicPlanDTO(
-                    id=plan.id,
-                    title=plan.title,
-                    description=plan.description,
-                    language=plan.language.value if hasattr(plan.language, 'value') else plan.language,
-                    difficulty_level=plan.difficulty_level,
-                    image=plan_image,
-                    total_days=plan_aggregate.total_days,
-                    tags=plan.tags if plan.tags else [],
-                    author=author_dto
-                )
-                plan_dtos.append(plan_dto)
-            
-            total = get_published_plans_count(db=db, search=search, language=language_upper, tag=tag)
-            
-            return PublicPlansResponse(plans=plan_dtos, skip=skip, limit=limit, total=total)
-    
-    except Exception as e:
-        logger.error(f"Error fetching published plans: {str(e)}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to fetch published plans: {str(e)}"
-        )
+        language_upper = language.upper()
 
+        def _load_published_plans(db):
+            return get_published_plans_from_db(db=db, skip=skip, limit=limit, search=search, language=language_upper, sort_by=sort_by, sort_order=sort_order, tag=tag)
 
-async def get_published_plan(plan_id: UUID) -> PublicPlanDTO:
+        plan_aggregates, total = await run_with_session(_load_published_plans)
+
+        plan_dtos = []
+        for plan_aggregate in plan_aggregates:
+            plan = plan_aggregate.plan
+
+            plan_image = await get_image_url(image_url=plan.image_url)
 
-    try:
-        with SessionLocal() as db:
-            plan = get_published_plan_by_id(db=db, plan_id=plan_id)
-            
-            if not plan:
-                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.PLAN_NOT_FOUND)
-            
-            plan_image= await get_image_url(image_url=plan.image_url)
-            
             author_dto = None
             if plan.author:
                 author_image = await get_image_url(image_url=plan.author.image_url)
@@ -104,23 +61,69 @@ async def get_published_plan(plan_id: UUID) -> PublicPlanDTO:
                     id=plan.author.id, 
                     firstname=plan.author.first_name, 
                     lastname=plan.author.last_name, 
-                    image=author_image
+                    image=author_image 
                 )
-            
-            
-            total_days = db.query(PlanItem).filter(PlanItem.plan_id == plan_id).count()  
 
-            return PublicPlanDTO(
+            plan_dto = PublicPlanDTO(
                 id=plan.id,
                 title=plan.title,
                 description=plan.description,
                 language=plan.language.value if hasattr(plan.language, 'value') else plan.language,
                 difficulty_level=plan.difficulty_level,
-                image=plan_image,  
-                total_days=total_days,
+                image=plan_image,
+                total_days=plan_aggregate.total_days,
                 tags=plan.tags if plan.tags else [],
                 author=author_dto
             )
+            plan_dtos.append(plan_dto)
+
+        return PublicPlansResponse(plans=plan_dtos, skip=skip, limit=limit, total=total)
+    
+    except Exception as e:
+        logger.error(f"Error fetching published plans: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to fetch published plans: {str(e)}"
+        )
+
+
+async def get_published_plan(plan_id: UUID) -> PublicPlanDTO:
+
+    try:
+        def _load_published_plan(db):
+            plan = get_published_plan_by_id(db=db, plan_id=plan_id)
+            if not plan:
+                return None, 0
+            return plan, db.query(PlanItem).filter(PlanItem.plan_id == plan_id).count()
+
+        plan, total_days = await run_with_session(_load_published_plan)
+
+        if not plan:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.PLAN_NOT_FOUND)
+
+        plan_image= await get_image_url(image_url=plan.image_url)
+
+        author_dto = None
+        if plan.author:
+            author_image = await get_image_url(image_url=plan.author.image_url)
+            author_dto = AuthorDTO(
+                id=plan.author.id, 
+                firstname=plan.author.first_name, 
+                lastname=plan.author.last_name, 
+                image=author_image
+            )
+
+        return PublicPlanDTO(
+            id=plan.id,
+            title=plan.title,
+            description=plan.description,
+            language=plan.language.value if hasattr(plan.language, 'value') else plan.language,
+            difficulty_level=plan.difficulty_level,
+            image=plan_image,  
+            total_days=total_days,
+            tags=plan.tags if plan.tags else [],
+            author=author_dto
+        )
     
     except Exception as e:
         logger.error(f"Error fetching published plan details: {str(e)}", exc_info=True)
@@ -132,23 +135,27 @@ async def get_published_plan(plan_id: UUID) -> PublicPlanDTO:
 
 async def get_plan_days(plan_id: UUID) -> PlanDaysResponse:
     """Get all days for a specific plan"""
-    
-    with SessionLocal() as db:
+
+    def _load_plan_days(db):
         plan_model = get_plan_by_id(db=db, plan_id=plan_id)
         if not plan_model:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=ErrorConstants.PLAN_NOT_FOUND
-            )
-        plan_days=get_days_by_plan_id(db=db, plan_id=plan_id)
-        days_basic =[]
-        for day_model in plan_days:
-            day_basic = PlanDayBasic(
-                id=str(day_model.id),
-                day_number=day_model.day_number,
-            )
-            days_basic.append(day_basic)
-        return PlanDaysResponse(days=days_basic)
+            return None
+        return get_days_by_plan_id(db=db, plan_id=plan_id)
+
+    plan_days = await run_with_session(_load_plan_days)
+    if plan_days is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=ErrorConstants.PLAN_NOT_FOUND
+        )
+    days_basic =[]
+    for day_model in plan_days:
+        day_basic = PlanDayBasic(
+            id=str(day_model.id),
+            day_number=day_model.day_number,
+        )
+        days_basic.append(day_basic)
+    return PlanDaysResponse(days=days_basic)
 
 def _get_task_subtasks_dto(subtasks: List[PlanSubTask]) -> List[SubTaskDTO]:
 
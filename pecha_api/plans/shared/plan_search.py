@@ -0,0 +1,41 @@
+from typing import Optional
+
+from sqlalchemy import func, literal, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+from pecha_api.plans.plans_models import Plan
+
+# must match the configs plans_search_vector_update picks per plan language
+ENGLISH_SEARCH_CONFIG = "english"
+DEFAULT_SEARCH_CONFIG = "simple"
+
+
+def _escape_like_(search: str) -> str:
+    return search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_plan_search_query(search: str):
+    # a query term matches stemmed english plans as well as plans indexed with the simple config
+    return func.websearch_to_tsquery(literal(ENGLISH_SEARCH_CONFIG).cast(REGCONFIG), search).op("||")(
+        func.websearch_to_tsquery(literal(DEFAULT_SEARCH_CONFIG).cast(REGCONFIG), search)
+    )
+
+
+def build_plan_search_filter(search: Optional[str]):
+    """Title or description substring match through the trigram indexes, or a full text match on both."""
+    if not search:
+        return None
+    pattern = f"%{_escape_like_(search)}%"
+    return or_(
+        Plan.title.ilike(pattern, escape="\\"),
+        Plan.description.ilike(pattern, escape="\\"),
+        Plan.search_vector.op("@@")(build_plan_search_query(search))
+    )
+
+
+def build_plan_search_rank(search: str):
+    # full text rank favours title hits (weight A), trigram similarity covers scripts without word breaks
+    return func.greatest(
+        func.ts_rank_cd(Plan.search_vector, build_plan_search_query(search)),
+        func.similarity(Plan.title, search)
+    )
@@ -17,6 +17,7 @@ from pecha_api.plans.auth.plan_auth_models import ResponseError
 from pecha_api.uploads.S3_utils import generate_presigned_access_url
 from pecha_api.config import get
 from pecha_api.plans.plans_enums import ContentType
+from pecha_api.plans.featured.featured_day_cache_service import invalidate_featured_day_cache
 
 def _get_max_display_order(plan_item_id: UUID) -> int:
     with SessionLocal() as db:
@@ -41,6 +42,7 @@ async def create_new_task(token: str, create_task_request: CreateTaskRequest, pl
         )
 
     saved_task = save_task(db=db,new_task=new_task)
+    await invalidate_featured_day_cache()
 
     return TaskDTO(
         id=saved_task.id,
@@ -59,6 +61,7 @@ async def delete_task_by_id(task_id: UUID, token: str):
         tasks = get_tasks_by_plan_item_id(db=db, plan_item_id=task.plan_item_id)
         if tasks:
             _reorder_sequentially(db=db, tasks=tasks)
+    await invalidate_featured_day_cache()
 
 async def change_task_day_service(token: str, task_id: UUID, update_task_request: UpdateTaskDayRequest) -> UpdatedTaskDayResponse:
     current_author = validate_and_extract_author_details(token=token)
@@ -79,6 +82,7 @@ async def change_task_day_service(token: str, task_id: UUID, update_task_request
             db=db, 
             updated_task=task
         )
+        await invalidate_featured_day_cache()
 
         return UpdatedTaskDayResponse(
             task_id=task.id, 
@@ -96,7 +100,8 @@ async def update_task_title_service(token: str, task_id: UUID, update_request: U
 
         task.title = update_request.title
         updated_task = update_task_title(db=db, updated_task=task)
-        
+        await invalidate_featured_day_cache()
+
         return UpdateTaskTitleResponse(
             task_id=updated_task.id,
             title=updated_task.title
@@ -109,6 +114,7 @@ async def change_task_order_service(token: str, day_id: UUID, update_task_order_
     with SessionLocal() as db:
         _check_duplicate_task_order(update_task_orders=update_task_order_request.tasks)
         update_task_order(db=db, day_id=day_id, update_task_orders=update_task_order_request.tasks)
+    await invalidate_featured_day_cache()
 
 
 async def get_task_subtasks_service(task_id: UUID, token: str) -> GetTaskResponse:
@@ -33,6 +33,7 @@ from pecha_api.plans.tasks.sub_tasks.plan_sub_tasks_response_model import (
 )
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.plans.response_message import SUBTASK_ORDER_FAILED
+from pecha_api.plans.featured.featured_day_cache_service import invalidate_featured_day_cache
 
 async def create_new_sub_tasks(token: str, create_task_request: SubTaskRequest) -> SubTaskResponse:
     current_author = validate_and_extract_author_details(token=token)
@@ -60,6 +61,7 @@ async def create_new_sub_tasks(token: str, create_task_request: SubTaskRequest)
             )
 
         saved_sub_tasks = save_sub_tasks_bulk(db=db, sub_tasks=new_sub_tasks)
+        await invalidate_featured_day_cache()
         created_sub_tasks=[
                 SubTaskDTO(
                     id=item.id,
@@ -114,6 +116,7 @@ async def update_sub_task_by_task_id(token: str, update_sub_task_request: Update
 
         if new_sub_tasks_to_create:
             save_sub_tasks_bulk(db=db, sub_tasks=new_sub_tasks_to_create)
+    await invalidate_featured_day_cache()
 
 
 async def change_subtask_order_service(token: str, task_id: UUID, update_subtask_order: SubTaskOrderRequest) -> None:
@@ -122,3 +125,4 @@ async def change_subtask_order_service(token: str, task_id: UUID, update_subtask
         task = _get_author_task(db=db, task_id=task_id, current_author=current_author,is_admin=current_author.is_admin)
         
         update_sub_task_order_in_bulk_by_task_id(db=db, sub_task_list=update_subtask_order.subtasks,task_id=task.id)
+    await invalidate_featured_day_cache()
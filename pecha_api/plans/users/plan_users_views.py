@@ -25,13 +25,15 @@ from pecha_api.plans.users.plan_users_service import (
     delete_task_service,
     get_user_plan_day_details_service
 )
+from pecha_api.users.users_service import get_current_user_principal
 
 
 oauth2_scheme = HTTPBearer()
 
 user_progress_router = APIRouter(
     prefix="/users/me",
-    tags=["User Progress"]
+    tags=["User Progress"],
+    dependencies=[Depends(get_current_user_principal)]
 )
 
 
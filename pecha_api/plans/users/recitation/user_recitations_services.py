@@ -18,18 +18,16 @@ from pecha_api.plans.users.recitation.user_recitations_response_models import (
     UpdateRecitationOrderRequest
 )
 from pecha_api.recitations.recitations_repository import get_text_images_by_text_ids
-from pecha_api.uploads.S3_utils import generate_presigned_access_url
+from pecha_api.uploads.S3_utils import sign_many
 from pecha_api.config import get
 from typing import Dict
 
 def get_image_url_map_by_text_ids(db, text_ids: list) -> Dict[str, str]:
     image_keys = get_text_images_by_text_ids(db=db, text_ids=text_ids)
     
+    signed_urls = sign_many(bucket_name=get("AWS_BUCKET_NAME"), s3_keys=image_keys.values())
     image_url_map = {
-        text_id: generate_presigned_access_url(
-            bucket_name=get("AWS_BUCKET_NAME"), 
-            s3_key=s3_key
-        )
+        text_id: signed_urls.get(s3_key, "")
         for text_id, s3_key in image_keys.items()
     }
     
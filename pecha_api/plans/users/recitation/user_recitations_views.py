@@ -15,11 +15,13 @@ from pecha_api.plans.users.recitation.user_recitations_services import (
     update_recitation_order_service,
     delete_user_recitation_service
 )
+from pecha_api.users.users_service import get_current_user_principal
 
 oauth2_scheme = HTTPBearer()
 user_recitation_router = APIRouter(
     prefix="/users/me",
-    tags=["User Recitations"]
+    tags=["User Recitations"],
+    dependencies=[Depends(get_current_user_principal)]
 )
 
 @user_recitation_router.post("/recitations", status_code=status.HTTP_200_OK)
@@ -12,11 +12,11 @@ from starlette import status
 from uuid import UUID
 
 from pecha_api.error_contants import ErrorConstants
+from pecha_api.constants import Constants
 from pecha_api.texts.texts_utils import TextUtils
 from pecha_api.texts.texts_response_models import TextDTO, TableOfContent
 from pecha_api.texts.texts_repository import get_contents_by_id, get_all_texts_by_group_id
 from pecha_api.texts.segments.segments_service import get_segment_by_id, get_related_mapped_segments, get_segment_details_by_id, get_related_mapped_segments_batch, get_segments_details_by_ids
-from pecha_api.texts.segments.segments_utils import SegmentUtils
 from pecha_api.texts.segments.segments_response_models import SegmentTranslation, SegmentTransliteration, SegmentAdaptation, SegmentRecitation
 from pecha_api.texts.segments.segments_response_models import SegmentDTO
 from pecha_api.recitations.recitations_response_models import (
@@ -31,7 +31,7 @@ from pecha_api.recitations.recitations_response_models import (
 from pecha_api.cache.cache_enums import CacheType
 from pecha_api.recitations.recication_cache_services import set_recitation_by_text_id_cache, get_recitation_by_text_id_cache
 from pecha_api.db.database import SessionLocal
-from pecha_api.uploads.S3_utils import generate_presigned_access_url
+from pecha_api.uploads.S3_utils import sign_many
 from pecha_api.config import get
 
 def get_recitations_with_image_urls(recitations: List[RecitationDTO]) -> List[RecitationDTO]:
@@ -40,10 +40,9 @@ def get_recitations_with_image_urls(recitations: List[RecitationDTO]) -> List[Re
     with SessionLocal() as db_session:
         image_keys = get_text_images_by_text_ids(db=db_session, text_ids=text_ids)
 
+    signed_urls = sign_many(bucket_name=get("AWS_BUCKET_NAME"), s3_keys=image_keys.values())
     image_url_map: Dict[str, str] = {
-        text_id: generate_presigned_access_url(
-            bucket_name=get("AWS_BUCKET_NAME"), s3_key=s3_key
-        )
+        text_id: signed_urls.get(s3_key, "")
         for text_id, s3_key in image_keys.items()
     }
 
@@ -112,31 +111,46 @@ async def get_text_details_by_text_id(text_id: str) -> TextDTO:
     return await TextUtils.get_text_detail_by_id(text_id=text_id)
 
 
-async def _filter_and_map_segments(
-    all_segments: List[SegmentDTO],
-    filter_type: str,
-    languages: List[str]
-) -> Dict[str, Segment]:
-    """Helper to filter segments by type and language."""
-    filtered = await SegmentUtils.filter_segment_mapping_by_type_or_text_id(
-        segments=all_segments,
-        type=TextType.VERSION.value
-    )
-    return filter_by_type_and_language(
-        type=filter_type,
-        segments=filtered,
-        languages=languages
+def _recitation_buckets_by_language(recitation_details_request: RecitationDetailsRequest) -> Dict[str, List[str]]:
+    """Map each requested language to the RecitationSegment fields it fills."""
+    requested_languages = {
+        "recitation": recitation_details_request.recitation,
+        "translations": recitation_details_request.translations,
+        "transliterations": recitation_details_request.transliterations,
+        "adaptations": recitation_details_request.adaptations,
+    }
+    buckets_by_language: Dict[str, List[str]] = {}
+    for bucket, languages in requested_languages.items():
+        for language in languages:
+            buckets_by_language.setdefault(language, []).append(bucket)
+    return buckets_by_language
+
+
+def _classify_recitation_segment(
+    segments: List[SegmentDTO],
+    text_details_dict: Dict[str, TextDTO],
+    buckets_by_language: Dict[str, List[str]]
+) -> RecitationSegment:
+    """Sort the version segments of one verse into their language buckets in a single pass."""
+    recitation_segment = RecitationSegment()
+    for segment in segments:
+        text_detail = text_details_dict.get(segment.text_id)
+        if not text_detail or str(text_detail.id) in Constants.excluded_text_ids:
+            continue
+        if text_detail.type != TextType.VERSION.value:
+            continue
+        for bucket in buckets_by_language.get(text_detail.language, []):
+            getattr(recitation_segment, bucket)[text_detail.language] = Segment(id=segment.id, content=segment.content)
+    return recitation_segment
+
+
+async def segments_mapping_by_toc(table_of_contents: List[TableOfContent], recitation_details_request: RecitationDetailsRequest) -> List[RecitationSegment]:
+
+    needs_mapped_segments = bool(
+        recitation_details_request.translations
+        or recitation_details_request.transliterations
+        or recitation_details_request.adaptations
     )
-
-
-async def segments_mapping_by_toc(table_of_contents: List[TableOfContent], recitation_details_request: RecitationDetailsRequest) -> List[Segment]:
-
-    needs_recitation = bool(recitation_details_request.recitation)
-    needs_translations = bool(recitation_details_request.translations)
-    needs_transliterations = bool(recitation_details_request.transliterations)
-    needs_adaptations = bool(recitation_details_request.adaptations)
-    
-    needs_mapped_segments = needs_translations or needs_transliterations or needs_adaptations
     
     all_segment_ids = []
     for table_of_content in table_of_contents:
@@ -152,63 +166,27 @@ async def segments_mapping_by_toc(table_of_contents: List[TableOfContent], recit
     mapped_segments_dict = {}
     if needs_mapped_segments:
         mapped_segments_dict = await get_related_mapped_segments_batch(parent_segment_ids=all_segment_ids)
-    
-    filter_mapped_segments = []
-    for table_of_content in table_of_contents:
-        section = table_of_content.sections[0]
 
-        for segment in section.segments:
-            recitation_segment = RecitationSegment()
-            segment_id = segment.segment_id
-            
-            segment_details = segment_details_dict.get(segment_id)
-            if not segment_details:
-                continue
-                
-            segment_model = SegmentDTO(
-                id=segment_details.id,
-                text_id=segment_details.text_id,
-                content=segment_details.content,
-                mapping=segment_details.mapping,
-                type=segment_details.type
+    # text metadata of every text taking part in the document, loaded once
+    related_text_ids = {segment.text_id for segment in segment_details_dict.values()}
+    for mapped_segments in mapped_segments_dict.values():
+        related_text_ids.update(segment.text_id for segment in mapped_segments)
+    text_details_dict = await TextUtils.get_text_details_by_ids(text_ids=list(related_text_ids))
+
+    buckets_by_language = _recitation_buckets_by_language(recitation_details_request=recitation_details_request)
+    filter_mapped_segments = []
+    for segment_id in all_segment_ids:
+        segment_details = segment_details_dict.get(segment_id)
+        if not segment_details:
+            continue
+        segments_for_recitation = [segment_details, *mapped_segments_dict.get(segment_id, [])]
+        filter_mapped_segments.append(
+            _classify_recitation_segment(
+                segments=segments_for_recitation,
+                text_details_dict=text_details_dict,
+                buckets_by_language=buckets_by_language
             )
-            
-            all_segments_for_filter = [segment_model]
-            
-            if needs_mapped_segments:
-                mapped_for_segment = mapped_segments_dict.get(segment_id, [])
-                all_segments_for_filter.extend(mapped_for_segment)
-            
-            if needs_recitation:
-                recitation_segment.recitation = await _filter_and_map_segments(
-                    all_segments=all_segments_for_filter,
-                    filter_type=RecitationListTextType.RECITATIONS.value,
-                    languages=recitation_details_request.recitation
-                )
-            
-            if needs_translations:
-                recitation_segment.translations = await _filter_and_map_segments(
-                    all_segments=all_segments_for_filter,
-                    filter_type=RecitationListTextType.TRANSLATIONS.value,
-                    languages=recitation_details_request.translations
-                )
-            
-            if needs_transliterations:
-                recitation_segment.transliterations = await _filter_and_map_segments(
-                    all_segments=all_segments_for_filter,
-                    filter_type=RecitationListTextType.TRANSLITERATIONS.value,
-                    languages=recitation_details_request.transliterations
-                )
-            
-            if needs_adaptations:
-                recitation_segment.adaptations = await _filter_and_map_segments(
-                    all_segments=all_segments_for_filter,
-                    filter_type=RecitationListTextType.ADAPTATIONS.value,
-                    languages=recitation_details_request.adaptations
-                )
-                
-           
-            filter_mapped_segments.append(recitation_segment)
+        )
     return filter_mapped_segments
 
 def filter_by_type_and_language(type:str,segments: List[Union[SegmentRecitation, SegmentTranslation, SegmentTransliteration, SegmentAdaptation]],languages: List[str]) -> Dict[str, Segment]:
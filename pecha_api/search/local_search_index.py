@@ -0,0 +1,350 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import struct
+import tempfile
+import threading
+import zlib
+from collections import Counter
+from heapq import nlargest
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from pecha_api.config import get, get_int
+from pecha_api.texts.segments.segments_enum import SegmentType
+from .search_tokenizer import SearchTokenizer
+
+_MAGIC = b"PSIX"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct(">4sBI")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def is_local_search_enabled() -> bool:
+    return get("SEARCH_ENGINE").lower() == "local"
+
+
+def _encode_postings(postings: Dict[int, int]) -> bytes:
+    # doc numbers ascending and delta encoded, every number as a varint
+    encoded = bytearray()
+    previous_doc_no = 0
+    for doc_no in sorted(postings):
+        for number in (doc_no - previous_doc_no, postings[doc_no]):
+            while number >= 0x80:
+                encoded.append((number & 0x7F) | 0x80)
+                number >>= 7
+            encoded.append(number)
+        previous_doc_no = doc_no
+    return bytes(encoded)
+
+
+def _decode_postings(encoded: bytes) -> Dict[int, int]:
+    numbers = []
+    number = 0
+    shift = 0
+    for byte in encoded:
+        number |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            numbers.append(number)
+            number = 0
+            shift = 0
+    postings = {}
+    doc_no = 0
+    for index in range(0, len(numbers), 2):
+        doc_no += numbers[index]
+        postings[doc_no] = numbers[index + 1]
+    return postings
+
+
+class IndexedSegment:
+    __slots__ = ("segment_id", "text_id", "length")
+
+    def __init__(self, segment_id: str, text_id: str, length: int):
+        self.segment_id = segment_id
+        self.text_id = text_id
+        self.length = length
+
+
+class LocalSearchIndex:
+    """
+    Embedded BM25 inverted index over the source segments, an Elasticsearch free engine for
+    SearchType.SOURCE. Postings live in memory and are snapshotted to one zlib compressed file
+    with delta/varint encoded postings. Removed segments are only dropped from the postings
+    when the index is compacted on save.
+    """
+
+    def __init__(self):
+        self._documents: Dict[int, IndexedSegment] = {}
+        self._segment_doc_nos: Dict[str, int] = {}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._next_doc_no = 0
+        self._total_length = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self._documents)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    def add_segments(self, segments: Iterable[Tuple[str, str, str]]):
+        """Index (segment_id, text_id, content) triples, replacing earlier versions of the same segments."""
+        tokenized = [
+            (segment_id, text_id, Counter(SearchTokenizer.tokenize(content)))
+            for segment_id, text_id, content in segments
+        ]
+        with self._lock:
+            for segment_id, text_id, term_counts in tokenized:
+                self._remove(segment_id=segment_id)
+                if not term_counts:
+                    continue
+                doc_no = self._next_doc_no
+                self._next_doc_no += 1
+                length = sum(term_counts.values())
+                self._documents[doc_no] = IndexedSegment(segment_id=segment_id, text_id=text_id, length=length)
+                self._segment_doc_nos[segment_id] = doc_no
+                self._total_length += length
+                for term, count in term_counts.items():
+                    self._postings.setdefault(term, {})[doc_no] = count
+            self._dirty = True
+
+    def remove_segments(self, segment_ids: Iterable[str]):
+        with self._lock:
+            for segment_id in segment_ids:
+                self._remove(segment_id=segment_id)
+            self._dirty = True
+
+    def remove_text(self, text_id: str):
+        with self._lock:
+            segment_ids = [document.segment_id for document in self._documents.values() if document.text_id == text_id]
+            for segment_id in segment_ids:
+                self._remove(segment_id=segment_id)
+            self._dirty = True
+
+    def get_text_ids(self, segment_ids: Iterable[str]) -> Dict[str, str]:
+        with self._lock:
+            return {
+                segment_id: self._documents[self._segment_doc_nos[segment_id]].text_id
+                for segment_id in segment_ids
+                if segment_id in self._segment_doc_nos
+            }
+
+    def _remove(self, segment_id: str):
+        doc_no = self._segment_doc_nos.pop(segment_id, None)
+        if doc_no is not None:
+            self._total_length -= self._documents.pop(doc_no).length
+
+    def search(self, query: str, text_id: Optional[str] = None, skip: int = 0, limit: int = 10) -> Tuple[List[Tuple[str, str, float]], int]:
+        """Ranked (segment_id, text_id, score) page and the number of matching segments."""
+        query_terms = Counter(SearchTokenizer.tokenize(query))
+        scores: Dict[int, float] = {}
+        with self._lock:
+            document_count = len(self._documents)
+            if document_count == 0 or not query_terms:
+                return [], 0
+            average_length = self._total_length / document_count
+            for term, query_count in query_terms.items():
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                # removed segments still counted in df until the next compaction, close enough for ranking
+                document_frequency = len(postings)
+                idf = math.log(1 + (document_count - document_frequency + 0.5) / (document_frequency + 0.5))
+                for doc_no, term_count in postings.items():
+                    document = self._documents.get(doc_no)
+                    if document is None or (text_id is not None and document.text_id != text_id):
+                        continue
+                    normalization = BM25_K1 * (1 - BM25_B + BM25_B * document.length / average_length)
+                    score = idf * term_count * (BM25_K1 + 1) / (term_count + normalization)
+                    scores[doc_no] = scores.get(doc_no, 0.0) + query_count * score
+            ranked = nlargest(skip + limit, scores.items(), key=lambda item: (item[1], -item[0]))
+            hits = [
+                (self._documents[doc_no].segment_id, self._documents[doc_no].text_id, score)
+                for doc_no, score in ranked[skip:]
+            ]
+        return hits, len(scores)
+
+    def save(self, path: str):
+        with self._lock:
+            self._compact()
+            documents = [
+                [document.segment_id, document.text_id, document.length]
+                for _, document in sorted(self._documents.items())
+            ]
+            postings_blob = bytearray()
+            terms = {}
+            for term, postings in self._postings.items():
+                encoded = _encode_postings(postings)
+                terms[term] = [len(postings_blob), len(encoded)]
+                postings_blob.extend(encoded)
+            self._dirty = False
+        header = zlib.compress(json.dumps({"documents": documents, "terms": terms}, ensure_ascii=False).encode("utf-8"))
+        body = zlib.compress(bytes(postings_blob))
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        # a temporary file of our own, so processes saving the same index never write into each other's file
+        index_file = tempfile.NamedTemporaryFile(
+            dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp", delete=False
+        )
+        try:
+            with index_file:
+                index_file.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, len(header)))
+                index_file.write(header)
+                index_file.write(body)
+            os.replace(index_file.name, path)
+        except Exception:
+            os.unlink(index_file.name)
+            raise
+
+    def load(self, path: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        with open(path, "rb") as index_file:
+            magic, version, header_length = _HEADER.unpack(index_file.read(_HEADER.size))
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                logging.warning(f"Ignoring local search index {path} with an unknown format")
+                return False
+            header = json.loads(zlib.decompress(index_file.read(header_length)).decode("utf-8"))
+            postings_blob = zlib.decompress(index_file.read())
+        documents = {
+            doc_no: IndexedSegment(segment_id=segment_id, text_id=text_id, length=length)
+            for doc_no, (segment_id, text_id, length) in enumerate(header["documents"])
+        }
+        postings = {
+            term: _decode_postings(postings_blob[offset:offset + size])
+            for term, (offset, size) in header["terms"].items()
+        }
+        with self._lock:
+            self._documents = documents
+            self._segment_doc_nos = {document.segment_id: doc_no for doc_no, document in documents.items()}
+            self._postings = postings
+            self._next_doc_no = len(documents)
+            self._total_length = sum(document.length for document in documents.values())
+            self._dirty = False
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._documents = {}
+            self._segment_doc_nos = {}
+            self._postings = {}
+            self._next_doc_no = 0
+            self._total_length = 0
+            self._dirty = True
+
+    def _compact(self):
+        # renumber the live segments from 0 and drop the postings of removed ones
+        renumbered = {old_doc_no: new_doc_no for new_doc_no, old_doc_no in enumerate(sorted(self._documents))}
+        compacted_postings = {}
+        for term, postings in self._postings.items():
+            live_postings = {
+                renumbered[doc_no]: count for doc_no, count in postings.items() if doc_no in renumbered
+            }
+            if live_postings:
+                compacted_postings[term] = live_postings
+        self._documents = {renumbered[doc_no]: document for doc_no, document in self._documents.items()}
+        self._segment_doc_nos = {document.segment_id: doc_no for doc_no, document in self._documents.items()}
+        self._postings = compacted_postings
+        self._next_doc_no = len(self._documents)
+
+
+local_search_index = LocalSearchIndex()
+
+
+def _is_searchable(segment) -> bool:
+    # sheet blocks (content, image...) are not part of any text
+    return segment.type == SegmentType.SOURCE
+
+
+async def index_segments(segments: List) -> None:
+    """Keep the local index in step with segment writes; does nothing when Elasticsearch serves search."""
+    if not is_local_search_enabled():
+        return
+    entries = [
+        (str(segment.id), segment.text_id, segment.content)
+        for segment in segments
+        if _is_searchable(segment)
+    ]
+    if entries:
+        # botok tokenization is CPU bound
+        await asyncio.to_thread(local_search_index.add_segments, entries)
+
+
+async def update_indexed_segment_contents(segments_content: Dict[str, str]) -> None:
+    if not is_local_search_enabled():
+        return
+    # only segments already in the index are searchable sources
+    text_ids = local_search_index.get_text_ids(segment_ids=segments_content.keys())
+    entries = [
+        (segment_id, text_id, segments_content[segment_id])
+        for segment_id, text_id in text_ids.items()
+    ]
+    if entries:
+        await asyncio.to_thread(local_search_index.add_segments, entries)
+
+
+def remove_indexed_segments(segment_ids: List[str]) -> None:
+    if is_local_search_enabled():
+        local_search_index.remove_segments(segment_ids=segment_ids)
+
+
+async def remove_indexed_text(text_id: str) -> None:
+    if is_local_search_enabled():
+        # scans every indexed segment under the index lock
+        await asyncio.to_thread(local_search_index.remove_text, text_id)
+
+
+async def build_local_search_index() -> int:
+    """Rebuild the index from the segments collection, in batches ordered by id."""
+    from pecha_api.texts.segments.segments_models import Segment
+
+    batch_size = get_int("LOCAL_SEARCH_BUILD_BATCH_SIZE")
+    local_search_index.clear()
+    last_id = None
+    while True:
+        query = {"type": SegmentType.SOURCE}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        segments = await Segment.find(query).sort("_id").limit(batch_size).to_list()
+        if not segments:
+            break
+        await asyncio.to_thread(
+            local_search_index.add_segments,
+            [(str(segment.id), segment.text_id, segment.content) for segment in segments]
+        )
+        last_id = segments[-1].id
+    await asyncio.to_thread(local_search_index.save, get("LOCAL_SEARCH_INDEX_PATH"))
+    logging.info(f"Local search index built with {local_search_index.size} segments")
+    return local_search_index.size
+
+
+async def open_local_search_index():
+    """Load the snapshot, or build it from Mongo in the background when there is none."""
+    path = get("LOCAL_SEARCH_INDEX_PATH")
+    loaded = await asyncio.to_thread(local_search_index.load, path)
+    if not loaded:
+        return asyncio.create_task(build_local_search_index())
+    return None
+
+
+async def run_flush_loop():
+    """Snapshot the index to disk after writes, for the lifetime of the application."""
+    while True:
+        await asyncio.sleep(get_int("LOCAL_SEARCH_FLUSH_INTERVAL"))
+        await flush_local_search_index()
+
+
+async def flush_local_search_index():
+    if local_search_index.dirty:
+        try:
+            await asyncio.to_thread(local_search_index.save, get("LOCAL_SEARCH_INDEX_PATH"))
+        except Exception as e:
+            logging.error(f"Failed to save local search index: {e}")
@@ -0,0 +1,261 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional
+
+from elasticsearch import AsyncElasticsearch
+from elasticsearch.helpers import async_bulk
+from fastapi import HTTPException
+from starlette import status
+
+from pecha_api.config import get, get_int
+from pecha_api.error_contants import ErrorConstants
+from pecha_api.texts.segments.segments_enum import SegmentType
+from pecha_api.texts.segments.segments_models import Segment
+from pecha_api.texts.texts_models import Text
+from .search_client import search_client
+from .search_response_models import TextIndex, SearchReindexResponse
+from .local_search_index import (
+    index_segments,
+    update_indexed_segment_contents,
+    remove_indexed_segments,
+    remove_indexed_text
+)
+
+SEGMENT_INDEX_MAPPINGS = {
+    "properties": {
+        "id": {"type": "keyword"},
+        "pecha_segment_id": {"type": "keyword"},
+        # the search query filters on text_id.keyword
+        "text_id": {"type": "text", "fields": {"keyword": {"type": "keyword"}}},
+        "content": {"type": "text"},
+        "mapped_text_ids": {"type": "keyword"},
+        "text": {
+            "properties": {
+                "title": {"type": "text"},
+                "language": {"type": "keyword"},
+                "published_date": {"type": "keyword"}
+            }
+        }
+    }
+}
+
+_reindex_task: Optional[asyncio.Task] = None
+# index being loaded by a reindex, incremental writes go there too so it does not miss them
+_building_index: Optional[str] = None
+
+
+def is_search_indexing_enabled() -> bool:
+    # an unset ELASTICSEARCH_URL defaults to None, which config.get returns as "None"
+    return get("SEARCH_ENGINE").lower() == "elasticsearch" and get("ELASTICSEARCH_URL") not in ("", "None")
+
+
+def _get_write_indices_() -> List[str]:
+    indices = [get("ELASTICSEARCH_SEGMENT_INDEX")]
+    if _building_index is not None:
+        indices.append(_building_index)
+    return indices
+
+
+def _get_mapped_text_ids_(segment) -> List[str]:
+    return sorted({mapping.parent_text_id for mapping in segment.mapping or []})
+
+
+def _build_segment_document_(segment, text: TextIndex) -> dict:
+    return {
+        "id": str(segment.id),
+        "pecha_segment_id": segment.pecha_segment_id,
+        "text_id": segment.text_id,
+        "content": segment.content,
+        "mapped_text_ids": _get_mapped_text_ids_(segment),
+        "text": text.model_dump()
+    }
+
+
+async def _get_text_metadata_(text_ids: List[str], text_metadata: Dict[str, Optional[TextIndex]]) -> Dict[str, Optional[TextIndex]]:
+    """Join the text fields every segment document carries, fetching only texts not seen yet."""
+    missing_text_ids = [text_id for text_id in set(text_ids) if text_id not in text_metadata]
+    if missing_text_ids:
+        texts = await Text.get_texts_by_ids(text_ids=missing_text_ids)
+        for text in texts:
+            text_metadata[str(text.id)] = TextIndex(
+                text_id=str(text.id),
+                language=text.language,
+                title=text.title,
+                published_date=text.published_date
+            )
+        for text_id in missing_text_ids:
+            text_metadata.setdefault(text_id, None)
+    return text_metadata
+
+
+async def _build_index_actions_(index: str, segments: List, text_metadata: Dict[str, Optional[TextIndex]]) -> List[dict]:
+    searchable_segments = [segment for segment in segments if segment.type == SegmentType.SOURCE]
+    await _get_text_metadata_(
+        text_ids=[segment.text_id for segment in searchable_segments],
+        text_metadata=text_metadata
+    )
+    return [
+        {
+            "_index": index,
+            "_id": str(segment.id),
+            "_source": _build_segment_document_(segment=segment, text=text_metadata[segment.text_id])
+        }
+        for segment in searchable_segments
+        # search results are grouped by text, a segment without its text cannot be shown
+        if text_metadata.get(segment.text_id) is not None
+    ]
+
+
+async def _generate_segment_actions_(index: str) -> AsyncIterator[dict]:
+    """Stream every source segment from a Mongo cursor, joining text metadata one batch at a time."""
+    batch_size = get_int("ELASTICSEARCH_REINDEX_BATCH_SIZE")
+    text_metadata: Dict[str, Optional[TextIndex]] = {}
+    batch = []
+    async for segment in Segment.find({"type": SegmentType.SOURCE}):
+        batch.append(segment)
+        if len(batch) >= batch_size:
+            for action in await _build_index_actions_(index=index, segments=batch, text_metadata=text_metadata):
+                yield action
+            batch = []
+    for action in await _build_index_actions_(index=index, segments=batch, text_metadata=text_metadata):
+        yield action
+
+
+async def _bulk_(client: AsyncElasticsearch, actions) -> tuple[int, int]:
+    return await async_bulk(
+        client,
+        actions,
+        chunk_size=get_int("ELASTICSEARCH_BULK_CHUNK_SIZE"),
+        max_chunk_bytes=get_int("ELASTICSEARCH_BULK_MAX_CHUNK_BYTES"),
+        raise_on_error=False,
+        stats_only=True,
+        # updates and deletes of segments that never reached the index are not failures
+        ignore_status=(404,)
+    )
+
+
+async def _swap_segment_alias_(client: AsyncElasticsearch, alias: str, index: str):
+    """Point the alias at the new index in one atomic step, then drop the indices it replaced."""
+    actions = [{"add": {"index": index, "alias": alias}}]
+    previous_indices = []
+    if await client.indices.exists_alias(name=alias):
+        previous_indices = list(await client.indices.get_alias(name=alias))
+        actions = [{"remove": {"index": previous_index, "alias": alias}} for previous_index in previous_indices] + actions
+    elif await client.indices.exists(index=alias):
+        # a concrete index still holds the alias name, it is replaced by the alias in the same step
+        actions.insert(0, {"remove_index": {"index": alias}})
+    await client.indices.update_aliases(actions=actions)
+    for previous_index in previous_indices:
+        await client.indices.delete(index=previous_index, ignore_unavailable=True)
+
+
+async def reindex_segments() -> SearchReindexResponse:
+    """Build a fresh segment index next to the live one and switch the alias once it is complete."""
+    global _building_index
+    client = search_client()
+    alias = get("ELASTICSEARCH_SEGMENT_INDEX")
+    index = f"{alias}-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
+    # no replicas and no refreshes while loading, both are restored before the index goes live
+    await client.indices.create(
+        index=index,
+        mappings=SEGMENT_INDEX_MAPPINGS,
+        settings={"number_of_replicas": 0, "refresh_interval": "-1"}
+    )
+    _building_index = index
+    try:
+        indexed, failed = await _bulk_(client=client, actions=_generate_segment_actions_(index=index))
+        await client.indices.put_settings(
+            index=index,
+            settings={"number_of_replicas": get_int("ELASTICSEARCH_SEGMENT_INDEX_REPLICAS"), "refresh_interval": "1s"}
+        )
+        await client.indices.refresh(index=index)
+        await _swap_segment_alias_(client=client, alias=alias, index=index)
+    except Exception:
+        await client.indices.delete(index=index, ignore_unavailable=True)
+        raise
+    finally:
+        _building_index = None
+    logging.info(f"Segment search index {index} is live with {indexed} segments, {failed} failed")
+    return SearchReindexResponse(index=index, indexed=indexed, failed=failed)
+
+
+async def _run_reindex_():
+    try:
+        await reindex_segments()
+    except Exception as e:
+        logging.error(f"Segment search reindex failed: {e}")
+
+
+def start_segment_reindex():
+    """Run the full reindex in the background, one at a time per process."""
+    global _reindex_task
+    if _reindex_task is not None and not _reindex_task.done():
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=ErrorConstants.SEARCH_REINDEX_IN_PROGRESS_MESSAGE)
+    _reindex_task = asyncio.create_task(_run_reindex_())
+
+
+async def _bulk_incremental_(actions: List[dict]):
+    # search lags behind rather than failing the write that triggered it
+    if not actions:
+        return
+    try:
+        indexed, failed = await _bulk_(client=search_client(), actions=actions)
+        if failed:
+            logging.warning(f"{failed} of {len(actions)} segment search index updates failed")
+    except Exception as e:
+        logging.error(f"Segment search index update failed: {e}")
+
+
+async def sync_search_segments(segments: List):
+    await index_segments(segments=segments)
+    if is_search_indexing_enabled():
+        text_metadata: Dict[str, Optional[TextIndex]] = {}
+        actions = []
+        for index in _get_write_indices_():
+            actions.extend(await _build_index_actions_(index=index, segments=segments, text_metadata=text_metadata))
+        await _bulk_incremental_(actions=actions)
+
+
+async def sync_search_segment_contents(segments_content: Dict[str, str]):
+    await update_indexed_segment_contents(segments_content=segments_content)
+    if is_search_indexing_enabled():
+        await _bulk_incremental_(actions=[
+            {"_op_type": "update", "_index": index, "_id": segment_id, "doc": {"content": content}}
+            for index in _get_write_indices_()
+            for segment_id, content in segments_content.items()
+        ])
+
+
+async def sync_search_segment_mappings(segments: List):
+    if is_search_indexing_enabled():
+        await _bulk_incremental_(actions=[
+            {"_op_type": "update", "_index": index, "_id": str(segment.id), "doc": {"mapped_text_ids": _get_mapped_text_ids_(segment)}}
+            for index in _get_write_indices_()
+            for segment in segments
+            if segment.type == SegmentType.SOURCE
+        ])
+
+
+async def remove_search_segments(segment_ids: List[str]):
+    remove_indexed_segments(segment_ids=segment_ids)
+    if is_search_indexing_enabled():
+        await _bulk_incremental_(actions=[
+            {"_op_type": "delete", "_index": index, "_id": segment_id}
+            for index in _get_write_indices_()
+            for segment_id in segment_ids
+        ])
+
+
+async def remove_search_text(text_id: str):
+    await remove_indexed_text(text_id=text_id)
+    if is_search_indexing_enabled():
+        try:
+            await search_client().delete_by_query(
+                index=",".join(_get_write_indices_()),
+                query={"term": {"text_id.keyword": text_id}},
+                conflicts="proceed",
+                wait_for_completion=False
+            )
+        except Exception as e:
+            logging.error(f"Failed to remove text {text_id} from the segment search index: {e}")
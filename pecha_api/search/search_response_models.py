@@ -82,3 +82,9 @@ class MultilingualSearchResponse(BaseModel):
 class SegmentLinkResponse(BaseModel):
     text_id: str
     segment_id: str
+
+
+class SearchReindexResponse(BaseModel):
+    index: str
+    indexed: int
+    failed: int
@@ -1,3 +1,4 @@
+import asyncio
 from elastic_transport import ObjectApiResponse
 from fastapi import HTTPException
 from starlette import status
@@ -5,6 +6,10 @@ from starlette import status
 from pecha_api.plans.response_message import NO_SEGMENTATION_IDS_RETURNED
 from .search_enums import SearchType
 from .search_client import search_client
+from .local_search_index import local_search_index, is_local_search_enabled
+from .search_indexer import start_segment_reindex
+from pecha_api.error_contants import ErrorConstants
+from pecha_api.users.users_service import verify_admin_access
 from pecha_api.config import get
 from typing import List, Dict, Optional
 from pecha_api.texts.segments.segments_models import Segment
@@ -51,12 +56,29 @@ async def get_search_results(query: str, search_type: SearchType, text_id: str =
     return response
 
 
+def reindex_search_segments(token: str) -> None:
+    is_admin: bool = verify_admin_access(token=token)
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=ErrorConstants.ADMIN_ERROR_MESSAGE
+        )
+    start_segment_reindex()
+
+
 async def _source_search(
         query: str, 
         text_id: str, 
         skip: int, 
         limit: int
 ) -> SearchResponse:
+    if is_local_search_enabled():
+        return await _local_source_search(
+            query=query,
+            text_id=text_id,
+            skip=skip,
+            limit=limit
+        )
     client = search_client()
     search_query = _generate_search_query(
         query=query,
@@ -76,6 +98,51 @@ async def _source_search(
     return search_response
 
 
+async def _local_source_search(
+        query: str,
+        text_id: str,
+        skip: int,
+        limit: int
+) -> SearchResponse:
+    # botok tokenization and the postings scan are CPU bound and wait on the index lock during a build
+    hits, total = await asyncio.to_thread(
+        local_search_index.search, query=query, text_id=text_id, skip=skip, limit=limit
+    )
+    segment_ids = [segment_id for segment_id, _, _ in hits]
+    segments = await Segment.get_segments_by_ids(segment_ids=segment_ids) if segment_ids else []
+    texts = await Text.get_texts_by_ids(text_ids=list({hit_text_id for _, hit_text_id, _ in hits})) if hits else []
+    segments_by_id = {str(segment.id): segment for segment in segments}
+    texts_by_id = {str(text.id): text for text in texts}
+    source_dict = {}
+    text_dict = {}
+    # hits are in rank order, texts are listed in the order of their best segment
+    for segment_id, hit_text_id, _ in hits:
+        segment = segments_by_id.get(segment_id)
+        text = texts_by_id.get(hit_text_id)
+        if segment is None or text is None:
+            continue
+        if hit_text_id not in source_dict:
+            source_dict[hit_text_id] = []
+            text_dict[hit_text_id] = TextIndex(
+                text_id=hit_text_id,
+                language=text.language,
+                title=text.title,
+                published_date=text.published_date
+            )
+        source_dict[hit_text_id].append({"id": segment_id, "content": segment.content})
+    sources: List[SourceResultItem] = _get_source_result_items_(text_dict=text_dict, source_dict=source_dict)
+    return SearchResponse(
+        search=Search(
+            text=query,
+            type=SearchType.SOURCE
+        ),
+        sources=sources,
+        skip=skip,
+        limit=limit,
+        total=min(MAX_SEARCH_LIMIT, total)
+    )
+
+
 def _process_source_search_response(query: str, search_response: ObjectApiResponse, skip: int, limit: int) -> SearchResponse:
     hits = search_response["hits"]["hits"]
     total = search_response["hits"]["total"]["value"] if "total" in search_response["hits"] else 0
@@ -0,0 +1,70 @@
+import logging
+import re
+import threading
+import unicodedata
+from typing import List, Optional
+
+_TIBETAN_RUN = re.compile(r"[\u0f00-\u0fff]+")
+# Han characters are terms on their own, any other run of word characters is one term
+_WORD = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]|[^\W\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+# shad, head marks and other signs; the tsheg (U+0F0B, U+0F0C) separates syllables inside a word
+_TIBETAN_PUNCTUATION = re.compile(r"[\u0f00-\u0f0a\u0f0d-\u0f17\u0f1a-\u0f1f\u0f34\u0f36\u0f38\u0f3a-\u0f3d\u0f85\u0fbe-\u0fda]+")
+_TSHEG = "\u0f0b"
+_SYLLABLE_SEPARATOR = re.compile(r"[\u0f0b\u0f0c]|" + _TIBETAN_PUNCTUATION.pattern)
+
+_word_tokenizer = None
+_word_tokenizer_lock = threading.Lock()
+_word_tokenizer_unavailable = False
+
+
+def _get_word_tokenizer():
+    """botok loads its dialect pack on first use, which may download it, so it is built lazily once per process."""
+    global _word_tokenizer, _word_tokenizer_unavailable
+    if _word_tokenizer is not None or _word_tokenizer_unavailable:
+        return _word_tokenizer
+    with _word_tokenizer_lock:
+        if _word_tokenizer is None and not _word_tokenizer_unavailable:
+            try:
+                from botok.tokenizers.wordtokenizer import WordTokenizer
+                _word_tokenizer = WordTokenizer()
+            except Exception as e:
+                _word_tokenizer_unavailable = True
+                logging.warning(f"botok is unavailable, Tibetan is tokenized by syllable: {e}")
+    return _word_tokenizer
+
+
+class SearchTokenizer:
+
+    @staticmethod
+    def tokenize(text: Optional[str]) -> List[str]:
+        """Index terms of a segment or a query: botok words for Tibetan, Unicode words elsewhere."""
+        if not text:
+            return []
+        normalized = unicodedata.normalize("NFC", text)
+        tokens: List[str] = []
+        position = 0
+        for tibetan_run in _TIBETAN_RUN.finditer(normalized):
+            tokens.extend(SearchTokenizer._tokenize_words(normalized[position:tibetan_run.start()]))
+            tokens.extend(SearchTokenizer._tokenize_tibetan(tibetan_run.group()))
+            position = tibetan_run.end()
+        tokens.extend(SearchTokenizer._tokenize_words(normalized[position:]))
+        return tokens
+
+    @staticmethod
+    def _tokenize_tibetan(text: str) -> List[str]:
+        word_tokenizer = _get_word_tokenizer()
+        if word_tokenizer is None:
+            words = _SYLLABLE_SEPARATOR.split(text)
+        else:
+            words = [token.text for token in word_tokenizer.tokenize(text)]
+        tokens = []
+        for word in words:
+            # "བཀྲ་ཤིས་" and "བཀྲ་ཤིས།" are the same word
+            term = _TIBETAN_PUNCTUATION.sub("", word).strip(_TSHEG).strip()
+            if term:
+                tokens.append(term)
+        return tokens
+
+    @staticmethod
+    def _tokenize_words(text: str) -> List[str]:
+        return _WORD.findall(text.casefold())
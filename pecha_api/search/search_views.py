@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Query
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Depends
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from .search_enums import SearchType, MultilingualSearchType
 from starlette import status
 
@@ -7,7 +10,8 @@ from typing import Optional
 from .search_service import (
     get_search_results,
     get_multilingual_search_results,
-    get_url_link as get_url_link_service
+    get_url_link as get_url_link_service,
+    reindex_search_segments
 )
 
 from .search_response_models import (
@@ -16,6 +20,8 @@ from .search_response_models import (
     SegmentLinkResponse,
 )
 
+oauth2_scheme = HTTPBearer()
+
 search_router = APIRouter(
     prefix="/search",
     tags=["Search"]
@@ -56,4 +62,8 @@ async def multilingual_search(
 
 @search_router.get("/chat/{pecha_segment_id}", status_code=status.HTTP_200_OK)
 async def get_url_link(pecha_segment_id: str) -> SegmentLinkResponse:
-    return await get_url_link_service(pecha_segment_id)
\ No newline at end of file
+    return await get_url_link_service(pecha_segment_id)
+
+@search_router.post("/reindex", status_code=status.HTTP_202_ACCEPTED)
+async def reindex_search(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)]) -> None:
+    reindex_search_segments(token=authentication_credential.credentials)
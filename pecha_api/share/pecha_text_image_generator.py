@@ -1,9 +1,41 @@
+import io
 import logging
 import textwrap
+import threading
+from functools import lru_cache
+from typing import Dict, Tuple
 from PIL import Image, ImageDraw, ImageFont
 from bs4 import BeautifulSoup
 from pecha_api.share.pecha_text_image_generator_config import CONFIG
 
+# FreeType faces must not be shared between threads, so every render worker keeps its own fonts
+_thread_fonts = threading.local()
+
+
+def _get_font(font_file_name: str, size: int) -> ImageFont.FreeTypeFont:
+    fonts: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = getattr(_thread_fonts, "fonts", None)
+    if fonts is None:
+        fonts = _thread_fonts.fonts = {}
+    font = fonts.get((font_file_name, size))
+    if font is None:
+        font = fonts[(font_file_name, size)] = ImageFont.truetype(font_file_name, size=size, encoding=CONFIG["ENCODING_UTF16"])
+    return font
+
+
+@lru_cache(maxsize=CONFIG["LOGO_CACHE_SIZE"])
+def _get_logo(logo_path: str, logo_height: int) -> Image.Image:
+    """Logo resized to logo_height; renders only read it, so one copy is shared by every thread."""
+    logo = Image.open(logo_path).convert('RGBA')
+    logo_ratio = logo.size[0] / logo.size[1]
+    logo_width = int(logo_height * logo_ratio)
+    return logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+
+
+def _to_png(img: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, format=CONFIG["IMAGE_FORMAT"])
+    return buffer.getvalue()
+
 class SyntheticImageGenerator:
     def __init__(
         self,
@@ -79,16 +111,15 @@ class SyntheticImageGenerator:
             anchor=CONFIG["ANCHOR_MIDDLE"]
         )
 
-    def save_image(
+    def render_image(
         self,
         text: str,
         ref_str: str,
-        img_file_name: str = None,
         text_color: str = None,
         logo_path: str = None
-    ) -> None:
+    ) -> Image.Image:
         """
-        Generate and save a synthetic image with the given text, reference, and options.
+        Generate a synthetic image with the given text, reference, and options.
         """
         font_file_name = CONFIG["FONT_PATHS"].get(self.font_type, CONFIG["FONT_PATHS"]["FALL_BACK"])
         # Define fonts and text color
@@ -96,8 +127,8 @@ class SyntheticImageGenerator:
             main_font_size = int(self.font_size * 1.5)
         else:
             main_font_size = self.font_size
-        main_font = ImageFont.truetype(font_file_name, size=main_font_size, encoding=CONFIG["ENCODING_UTF16"])
-        ref_font = ImageFont.truetype(font_file_name, size=int(main_font_size/2), encoding=CONFIG["ENCODING_UTF16"])
+        main_font = _get_font(font_file_name, main_font_size)
+        ref_font = _get_font(font_file_name, int(main_font_size/2))
         text_color_tuple = CONFIG["TEXT_COLOR"].get(text_color, CONFIG["TEXT_COLOR"]["DEFAULT"])
         # Calculate padding and max width
         max_width = self.image_width - (CONFIG["PADDING_X"] * 2)
@@ -121,8 +152,7 @@ class SyntheticImageGenerator:
         # Add logo if provided
         if logo_path:
             img = _add_logo_to_image(img, logo_path, self.image_width, self.image_height)
-        # Save the image
-        img.save(img_file_name or CONFIG["IMG_OUTPUT_PATH"])
+        return img
 
 def create_synthetic_data(
     text: str,
@@ -130,11 +160,10 @@ def create_synthetic_data(
     lang: str,
     bg_color: str,
     text_color: str = None,
-    logo_path: str = None,
-    output_path: str = None
-) -> None:
+    logo_path: str = None
+) -> Image.Image:
     """
-    Generate a synthetic image from text and reference string, saving to output_path.
+    Generate a synthetic image from text and reference string.
     """
     cleaned_text = _clean_text(text)
     font_type_lang = lang
@@ -145,7 +174,7 @@ def create_synthetic_data(
         font_type=font_type_lang,
         bg_color=CONFIG["BG_COLOR"].get(bg_color, CONFIG["BG_COLOR"]["DEFAULT"])
     )
-    generator.save_image(cleaned_text, ref_str, img_file_name=output_path or CONFIG["IMG_OUTPUT_PATH"], text_color=text_color, logo_path=logo_path)
+    return generator.render_image(cleaned_text, ref_str, text_color=text_color, logo_path=logo_path)
 
 def generate_segment_image(
     text: str = None,
@@ -153,21 +182,20 @@ def generate_segment_image(
     lang: str = None,
     bg_color: str = None,
     text_color: str = None,
-    logo_path: str = None,
-    output_path: str = None
-) -> None:
+    logo_path: str = None
+) -> bytes:
     """
-    Main entry to generate a text image or fallback logo image.
+    Main entry to generate a text image or fallback logo image, returned as PNG bytes.
+    Safe to call from several worker threads at once.
     """
     if text is not None and text != "":
-        create_synthetic_data(
+        img = create_synthetic_data(
             text=text,
             ref_str=ref_str,
             lang=lang,
             bg_color=bg_color,
             text_color=text_color,
-            logo_path=logo_path,
-            output_path=output_path
+            logo_path=logo_path
         )
     else:
         img = Image.new(
@@ -186,7 +214,7 @@ def generate_segment_image(
             )
         except (OSError, ValueError) as e:
             logging.warning(f"Error adding fallback logo: {e}")
-        img.save(output_path or CONFIG["IMG_OUTPUT_PATH"])
+    return _to_png(img)
 
 def _clean_text(content: str, max_lines: int = 4) -> str:
     """
@@ -216,11 +244,9 @@ def _add_logo_to_image(
     Add a centered logo to an RGBA image, returns composited image.
     """
     try:
-        logo = Image.open(logo_path).convert('RGBA')
         logo_height = int(image_height * (logo_height_ratio or CONFIG["LOGO_HEIGHT_RATIO"]))
-        logo_ratio = logo.size[0] / logo.size[1]
-        logo_width = int(logo_height * logo_ratio)
-        logo = logo.resize((logo_width, logo_height), Image.Resampling.LANCZOS)
+        logo = _get_logo(logo_path, logo_height)
+        logo_width = logo.size[0]
         logo_padded = Image.new('RGBA', (image_width, image_height), CONFIG["RGBA_TRANSPARENT"])
         logo_x = int(image_width/2 - logo_width/2)
         logo_y = int(image_height * (header_ratio or CONFIG["HEADER_RATIO"]) - logo_height/2)
@@ -0,0 +1,42 @@
+from typing import Optional
+
+from pecha_api import config
+from pecha_api.cache.cache_enums import CacheType, CacheTag
+from pecha_api.cache.cache_keys import CacheKeys
+from pecha_api.cache.cache_repository import get_cache_data, set_cache
+from .pecha_text_image_generator_config import CONFIG
+from .share_response_models import ShareRequest
+
+
+def share_image_cache_key(share_request: ShareRequest) -> str:
+    """Every input that changes the rendered image is part of the key."""
+    # segments and texts are drawn in the language of their text, so the request language is not part of their key
+    language = None
+    if share_request.segment_id is not None:
+        entity_id = f"segment:{share_request.segment_id}"
+    else:
+        entity_id = f"text:{share_request.text_id}"
+        # languages without their own font render with the fallback one
+        if share_request.text_id is None and share_request.language in CONFIG["FONT_PATHS"]:
+            language = share_request.language
+    return CacheKeys.build(
+        CacheType.SHARE_IMAGE,
+        entity_id,
+        language,
+        share_request.text_color,
+        share_request.bg_color
+    )
+
+
+async def get_share_image_cache(share_request: ShareRequest) -> Optional[bytes]:
+    cache_data = await get_cache_data(hash_key=share_image_cache_key(share_request))
+    if isinstance(cache_data, bytes):
+        return cache_data
+    return None
+
+
+async def set_share_image_cache(share_request: ShareRequest, text_id: Optional[str], data: bytes):
+    # tagged with the text so editing its title or segments drops the stale image
+    tags = [CacheKeys.tag(CacheTag.TEXT, text_id)] if text_id is not None else None
+    cache_time_out = config.get_int("CACHE_SHARE_IMAGE_TIMEOUT")
+    await set_cache(hash_key=share_image_cache_key(share_request), value=data, cache_time_out=cache_time_out, tags=tags)
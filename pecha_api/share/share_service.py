@@ -1,51 +1,79 @@
-from fastapi import HTTPException
-import io
-from pecha_api.error_contants import ErrorConstants
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Tuple
+
+from fastapi import Response
+from starlette import status
 from pecha_api.texts.segments.segments_utils import SegmentUtils
-from starlette.responses import StreamingResponse
 from pecha_api.texts.texts_utils import TextUtils
 from .pecha_text_image_generator import generate_segment_image
 from pecha_api.texts.segments.segments_service import get_segment_details_by_id
-from pecha_api.config import get
-import anyio
+from pecha_api.config import get, get_int
+from pecha_api.cache.single_flight import single_flight
 
 from pecha_api.share.share_response_models import (
     ShareRequest,
     ShortUrlResponse
 )
+from .share_enums import TextColor, BgColor
+from .share_cache_service import (
+    get_share_image_cache,
+    set_share_image_cache,
+    share_image_cache_key
+)
 
 from pecha_api.short_url.short_url_service import get_short_url
 
-from pecha_api.error_contants import ErrorConstants
-
 LOGO_PATH = "pecha_api/share/static/img/pecha-logo.png"
-IMAGE_PATH = "pecha_api/share/static/img/output.png"
 MEDIA_TYPE = "image/png"
 DEFAULT_OG_TITLE = get("SITE_NAME")
 DEFAULT_OG_DESCRIPTION = get("SITE_NAME")
 PECHA_FRONTEND_ENDPOINT = "https://webuddhist.com/chapter"
 
-async def get_generated_image():
-    try:
-        image_path = IMAGE_PATH
-        async with await anyio.open_file(image_path, "rb") as file:
-            image_bytes = await file.read()
+_render_executor: Optional[ThreadPoolExecutor] = None
 
-        return StreamingResponse(io.BytesIO(image_bytes), media_type=MEDIA_TYPE)
 
-    except HTTPException as error:
-        raise HTTPException(
-            status_code=error.status_code,
-            detail=ErrorConstants.IMAGE_NOT_FOUND_MESSAGE
+def _get_render_executor() -> ThreadPoolExecutor:
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ThreadPoolExecutor(
+            max_workers=get_int("SHARE_IMAGE_RENDER_WORKERS"),
+            thread_name_prefix="share-image"
         )
+    return _render_executor
+
+
+async def get_generated_image(share_request: ShareRequest, if_none_match: Optional[str] = None) -> Response:
+    image = await get_share_image(share_request=share_request)
+    etag = f'"{hashlib.sha256(image).hexdigest()[:32]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={get_int('CACHE_SHARE_IMAGE_TIMEOUT')}"
+    }
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=image, media_type=MEDIA_TYPE, headers=headers)
+
+
+async def get_share_image(share_request: ShareRequest) -> bytes:
+    cached_image = await get_share_image_cache(share_request=share_request)
+    if cached_image is not None:
+        return cached_image
+    # concurrent requests for the same image share one render
+    return await single_flight(
+        key=share_image_cache_key(share_request),
+        loader=partial(_render_share_image_, share_request=share_request),
+        read=partial(get_share_image_cache, share_request=share_request)
+    )
+
 
 async def generate_short_url(share_request: ShareRequest) -> ShortUrlResponse:
     og_description = DEFAULT_OG_DESCRIPTION
-    if share_request.logo:
-        _generate_logo_image_(share_request=share_request)
-
 
-    await _generate_segment_content_image_(share_request=share_request)
+    # rendered now so the first crawler fetching og_image is served from the cache
+    await get_share_image(share_request=share_request)
 
     payload = _generate_short_url_payload_(share_request=share_request, og_description=og_description)
     short_url: ShortUrlResponse = await get_short_url(payload=payload)
@@ -53,18 +81,17 @@ async def generate_short_url(share_request: ShareRequest) -> ShortUrlResponse:
     return short_url
 
 
+async def _render_share_image_(share_request: ShareRequest) -> bytes:
+    image, text_id = await _generate_segment_content_image_(share_request=share_request)
+    await set_share_image_cache(share_request=share_request, text_id=text_id, data=image)
+    return image
 
-def _generate_logo_image_(share_request: ShareRequest):
-    generate_segment_image(
-        text_color=share_request.text_color,
-        bg_color=share_request.bg_color,
-        logo_path=LOGO_PATH
-    )
 
-async def _generate_segment_content_image_(share_request: ShareRequest):
+async def _generate_segment_content_image_(share_request: ShareRequest) -> Tuple[bytes, Optional[str]]:
     main_content_text = get("SITE_NAME")
     reference_text = get("SITE_NAME")
     language = share_request.language
+    text_id = share_request.text_id
     # If segment_id is provided, get the segment details
     if share_request.segment_id is not None:
         await SegmentUtils.validate_segment_exists(segment_id=share_request.segment_id)
@@ -80,14 +107,20 @@ async def _generate_segment_content_image_(share_request: ShareRequest):
         main_content_text = text_detail.title
         language = text_detail.language
 
-    generate_segment_image(
-        text=main_content_text,
-        ref_str=reference_text,
-        lang=language,
-        text_color=share_request.text_color,
-        bg_color=share_request.bg_color,
-        logo_path=LOGO_PATH
+    # Pillow, font loading and html parsing are CPU bound, keep them off the event loop
+    image = await asyncio.get_running_loop().run_in_executor(
+        _get_render_executor(),
+        partial(
+            generate_segment_image,
+            text=main_content_text,
+            ref_str=reference_text,
+            lang=language,
+            text_color=share_request.text_color,
+            bg_color=share_request.bg_color,
+            logo_path=LOGO_PATH
+        )
     )
+    return image, text_id
 
 
 
@@ -102,10 +135,7 @@ def _generate_short_url_payload_(share_request: ShareRequest, og_description: st
         )
 
     pecha_backend_endpoint = get("PECHA_BACKEND_ENDPOINT")
-    if share_request.segment_id is not None:
-        image_url = f"{pecha_backend_endpoint}/share/image?segment_id={share_request.segment_id}&language={share_request.language}&logo={share_request.logo}"
-    else:
-        image_url = f"{pecha_backend_endpoint}/share/image?text_id={share_request.text_id}&language={share_request.language}&logo={share_request.logo}"
+    image_url = f"{pecha_backend_endpoint}/share/image?{_generate_image_query_(share_request=share_request)}"
     payload = {
         "url": share_request.url,
         "og_title": DEFAULT_OG_DESCRIPTION,
@@ -115,6 +145,22 @@ def _generate_short_url_payload_(share_request: ShareRequest, og_description: st
     }
     return payload
 
+def _generate_image_query_(share_request: ShareRequest) -> str:
+    # the query holds every part of the image cache key, so /share/image finds the rendered image
+    if share_request.segment_id is not None:
+        query = f"segment_id={share_request.segment_id}"
+    else:
+        query = f"text_id={share_request.text_id}"
+    if share_request.language is not None:
+        query += f"&language={share_request.language}"
+    query += f"&logo={share_request.logo}"
+    # default colors are left out to keep the url short
+    if share_request.text_color not in (None, TextColor.DEFAULT):
+        query += f"&text_color={share_request.text_color.value}"
+    if share_request.bg_color not in (None, BgColor.DEFAULT):
+        query += f"&bg_color={share_request.bg_color.value}"
+    return query
+
 def _generate_url_(
         content_id: str,
         content_index: int,
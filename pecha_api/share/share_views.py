@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Header, Query
 from starlette import status
 from typing import Optional
 
+from .share_enums import (
+    TextColor,
+    BgColor
+)
 from .share_response_models import (
     ShareRequest,
     ShortUrlResponse
@@ -19,10 +23,24 @@ share_router = APIRouter(
 
 @share_router.get("/image", status_code=status.HTTP_200_OK)
 async def get_image(
-    segment_id: Optional[str] = Query(default=None)
+    segment_id: Optional[str] = Query(default=None),
+    text_id: Optional[str] = Query(default=None),
+    language: Optional[str] = Query(default=None),
+    logo: bool = Query(default=False),
+    text_color: TextColor = Query(default=TextColor.DEFAULT),
+    bg_color: BgColor = Query(default=BgColor.DEFAULT),
+    if_none_match: Optional[str] = Header(default=None)
 ):
-    return await get_generated_image()
+    share_request = ShareRequest(
+        segment_id=segment_id,
+        text_id=text_id,
+        language=language,
+        logo=logo,
+        text_color=text_color,
+        bg_color=bg_color
+    )
+    return await get_generated_image(share_request=share_request, if_none_match=if_none_match)
 
 @share_router.post("", status_code=status.HTTP_201_CREATED)
 async def get_short_url(share_request: ShareRequest) -> ShortUrlResponse:
-    return await generate_short_url(share_request=share_request)
\ No newline at end of file
+    return await generate_short_url(share_request=share_request)
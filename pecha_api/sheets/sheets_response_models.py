@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel
 
 from pecha_api.texts.segments.segments_models import SegmentType
+from pecha_api.texts.segments.segments_response_models import CreateSegment
 
 class Source(BaseModel):
     position: int
@@ -77,4 +78,12 @@ class SheetImageResponse(BaseModel):
     key: str
 
 class SheetIdResponse(BaseModel):
-    sheet_id: str
\ No newline at end of file
+    sheet_id: str
+
+class SheetSegmentsDiff(BaseModel):
+    # content hash -> id of a stored segment the sheet keeps
+    segment_dict: Dict[str, str] = {}
+    # segment id -> new content of a segment edited in place
+    updated_segments: Dict[str, str] = {}
+    new_segments: List[CreateSegment] = []
+    deleted_segment_ids: List[str] = []
@@ -50,12 +50,14 @@ from pecha_api.texts.texts_service import (
     update_text_details,
     delete_text_by_text_id,
     get_sheet,
-    get_table_of_content_by_sheet_id
+    get_table_of_content_by_sheet_id,
+    update_table_of_content_in_place
 )
 
 from pecha_api.users.users_service import (
     validate_and_extract_user_details,
-    fetch_user_by_email
+    fetch_user_by_email,
+    fetch_users_by_emails
 )
 from pecha_api.texts.texts_enums import TextType
 from pecha_api.texts.texts_response_models import (
@@ -65,7 +67,8 @@ from pecha_api.texts.texts_response_models import (
     Section,
     TextSegment
 )
-from pecha_api.texts.mappings.mappings_repository import get_sheet_first_content_by_ids
+from pecha_api.texts.mappings.mappings_repository import get_sheet_content_segments_by_ids
+from pecha_api.texts.texts_repository import get_contents_by_text_ids, update_sheet_summary
 
 from pecha_api.texts.segments.segments_models import SegmentType
 from pecha_api.texts.segments.segments_response_models import (
@@ -79,6 +82,12 @@ from pecha_api.texts.segments.segments_service import (
     remove_segments_by_text_id,
     get_segments_details_by_ids
 )
+from pecha_api.texts.segments.segments_repository import (
+    create_segment,
+    delete_segments_by_ids,
+    update_segments_content
+)
+from pecha_api.texts.segments.segments_utils import SegmentUtils
 
 from pecha_api.sheets.sheets_response_models import (
     SheetIdResponse,
@@ -87,11 +96,12 @@ from pecha_api.sheets.sheets_response_models import (
     SheetSection,
     SheetSegment,
     SheetDTOResponse,
-    SheetDTO
+    SheetDTO,
+    SheetSegmentsDiff,
+    Source
 )
 from pecha_api.texts.texts_cache_service import (
-    delete_text_details_by_id_cache,
-    delete_table_of_content_by_sheet_id_cache
+    delete_text_details_by_id_cache
 )
 from pecha_api.texts.segments.segments_cache_service import (
     delete_segments_details_by_ids_cache
@@ -109,34 +119,49 @@ def _strip_html_tags_(html_content: str) -> str:
     clean = re.compile('<.*?>')
     return re.sub(clean, '', html_content).strip()
 
-async def _generate_sheet_summary_(sheet_id: str) -> str:
-    # Generate a summary from the first content segment limited to max_words.
+def _generate_sheet_summary_(create_sheet_request: CreateSheetRequest) -> str:
+    # Summary from the first content block of the sheet, stored with the sheet when it is saved
+    content_sources = sorted(
+        (source for source in create_sheet_request.source if source.type == SegmentType.CONTENT),
+        key=lambda source: source.position
+    )
+    if not content_sources:
+        return ""
+    return clean_text(content_sources[0].content)
+
+async def _generate_sheet_summaries_(sheet_ids: List[str]) -> Dict[str, str]:
+    # Summaries for sheets saved before they were stored, resolved for the whole page in two queries
     try:
-        # Get sheet table of content
-        sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(
-            sheet_id=sheet_id
-        )
-        
-        if not sheet_table_of_content or not sheet_table_of_content.sections:
-            return ""
-        
-        # Get all segment IDs from the table of content
-        segment_ids = _get_all_segment_ids_in_table_of_content_(sheet_sections=sheet_table_of_content.sections)
-        
+        table_of_contents: List[TableOfContent] = await get_contents_by_text_ids(text_ids=sheet_ids)
+        sheet_segment_ids: Dict[str, List[str]] = {}
+        for table_of_content in table_of_contents:
+            if table_of_content.text_id not in sheet_segment_ids:
+                sheet_segment_ids[table_of_content.text_id] = _get_all_segment_ids_in_table_of_content_(
+                    sheet_sections=table_of_content.sections
+                )
+
+        segment_ids = [segment_id for segment_ids in sheet_segment_ids.values() for segment_id in segment_ids]
         if not segment_ids:
-            return ""
-            
-        content_segment = await _get_sheet_first_content_details_by_type_(segment_ids=segment_ids, segment_type=SegmentType.CONTENT)    
-
-        if content_segment: # not NONE
-            content = content_segment.content
-            return clean_text(content)
-        # Return empty string if no content segment found
-        return ""
-            
+            return {}
+        content_segments = await get_sheet_content_segments_by_ids(segment_ids=segment_ids, segment_type=SegmentType.CONTENT)
+        contents: Dict[str, str] = {str(segment.id): segment.content for segment in content_segments}
+
+        summaries: Dict[str, str] = {}
+        for sheet_id, segment_ids in sheet_segment_ids.items():
+            content = next((contents[segment_id] for segment_id in segment_ids if segment_id in contents), None)
+            summaries[sheet_id] = clean_text(content) if content else ""
+        return summaries
+
     except Exception:
-        # Return empty string if any error occurs during summary generation
-        return ""
+        # Return no summaries if any error occurs during summary generation
+        return {}
+
+async def _get_sheet_summaries_(sheets) -> Dict[str, str]:
+    summaries: Dict[str, str] = {str(sheet.id): sheet.summary for sheet in sheets if sheet.summary is not None}
+    missing_sheet_ids = [str(sheet.id) for sheet in sheets if str(sheet.id) not in summaries]
+    if missing_sheet_ids:
+        summaries.update(await _generate_sheet_summaries_(sheet_ids=missing_sheet_ids))
+    return summaries
 
 def clean_text(content: str) -> str:
     max_words = 30
@@ -260,6 +285,7 @@ async def create_new_sheet(create_sheet_request: CreateSheetRequest, token: str)
         segment_dict=sheet_segments,
         token=token
     )
+    await update_sheet_summary(text_id=text_id, summary=_generate_sheet_summary_(create_sheet_request=create_sheet_request))
     return SheetIdResponse(sheet_id=text_id)
 
 async def update_sheet_by_id(
@@ -272,40 +298,167 @@ async def update_sheet_by_id(
     if not is_valid_user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
 
-    await delete_text_details_by_id_cache(text_id=sheet_id, cache_type=CacheType.TEXT_DETAIL)
-    sheet_table_of_content: Optional[TableOfContent] = await _delete_sheet_table_of_content_cache_(sheet_id=sheet_id)
-    
-    await _delete_sheet_segments_cache_(sheet_table_of_content=sheet_table_of_content)
-
-    await remove_segments_by_text_id(text_id=sheet_id)
-
-    await remove_table_of_content_by_text_id(text_id=sheet_id)
-
-    await _update_text_details_(sheet_id=sheet_id, update_sheet_request=update_sheet_request)
+    sheet_details: TextDTO = await TextUtils.get_text_details_by_id(text_id=sheet_id)
+    sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(sheet_id=sheet_id)
+    sections = sheet_table_of_content.sections if sheet_table_of_content else []
+    segments_dict: Dict[str, SegmentDTO] = await get_segments_details_by_ids(
+        segment_ids=_get_all_segment_ids_in_table_of_content_(sheet_sections=sections)
+    )
 
-    sheet_segments: Dict[str, str] = await _process_and_upload_sheet_segments(
-        create_sheet_request=update_sheet_request,
-        text_id=sheet_id,
-        token=token
+    # Source blocks quote segments of other texts, only the newly quoted ones need checking
+    added_source_ids = [
+        source.content
+        for source in update_sheet_request.source
+        if source.type == SegmentType.SOURCE and source.content not in segments_dict
+    ]
+    if added_source_ids:
+        await SegmentUtils.validate_segments_exists(segment_ids=added_source_ids)
+
+    segments_diff: SheetSegmentsDiff = _diff_sheet_segments_(
+        update_sheet_request=update_sheet_request,
+        sheet_id=sheet_id,
+        sheet_table_of_content=sheet_table_of_content,
+        segments_dict=segments_dict
     )
-    await _generate_and_upload_sheet_table_of_content(
-        create_sheet_request=update_sheet_request,
-        text_id=sheet_id,
-        segment_dict=sheet_segments,
+    segments_changed = bool(
+        segments_diff.new_segments or segments_diff.updated_segments or segments_diff.deleted_segment_ids
+    )
+    segment_dict: Dict[str, str] = await _apply_sheet_segments_diff_(sheet_id=sheet_id, segments_diff=segments_diff)
+    table_of_content_changed = await _update_sheet_table_of_content_(
+        update_sheet_request=update_sheet_request,
+        sheet_id=sheet_id,
+        sheet_table_of_content=sheet_table_of_content,
+        segment_dict=segment_dict,
         token=token
     )
-    sheet_details: TextDTO = await TextUtils.get_text_details_by_id(text_id=sheet_id)
+    details_changed = (
+        update_sheet_request.title != sheet_details.title
+        or update_sheet_request.is_published != sheet_details.is_published
+    )
+    # Autosave resends unchanged sheets, nothing is written or invalidated for them
+    if not (segments_changed or table_of_content_changed or details_changed):
+        return SheetIdResponse(sheet_id=sheet_id)
+
+    if segments_changed:
+        await _delete_sheet_segments_cache_(sheet_table_of_content=sheet_table_of_content)
+    if segments_changed or table_of_content_changed:
+        await update_sheet_summary(text_id=sheet_id, summary=_generate_sheet_summary_(create_sheet_request=update_sheet_request))
+
+    await delete_text_details_by_id_cache(text_id=sheet_id, cache_type=CacheType.TEXT_DETAIL)
+    await _update_text_details_(sheet_id=sheet_id, update_sheet_request=update_sheet_request)
+    sheet_details = await TextUtils.get_text_details_by_id(text_id=sheet_id)
     
     # Update cache with new sheet data after successful update
     await update_text_details_cache(text_id=sheet_id, updated_text_data=sheet_details, cache_type=CacheType.SHEET_DETAIL)
     
     return SheetIdResponse(sheet_id=sheet_id)
 
-async def _delete_sheet_table_of_content_cache_(sheet_id: str) -> Optional[TableOfContent]:
-    sheet_table_of_content: Optional[TableOfContent] = await get_table_of_content_by_sheet_id(sheet_id=sheet_id)
-    if sheet_table_of_content is not None:
-        await delete_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT)
-    return sheet_table_of_content
+def _diff_sheet_segments_(
+        update_sheet_request: CreateSheetRequest,
+        sheet_id: str,
+        sheet_table_of_content: Optional[TableOfContent],
+        segments_dict: Dict[str, SegmentDTO]
+) -> SheetSegmentsDiff:
+    # Stored segments are matched by content hash, as on create; an unmatched block left at the
+    # position of an unmatched stored segment of the same type is an edit of that segment.
+    stored_segments: Dict[tuple, str] = {}
+    stored_positions: Dict[int, str] = {}
+    sections = sheet_table_of_content.sections if sheet_table_of_content else []
+    for section in sections:
+        for text_segment in section.segments:
+            segment = segments_dict.get(text_segment.segment_id)
+            if segment is None or segment.type == SegmentType.SOURCE or segment.text_id != sheet_id:
+                continue
+            content_hash = hashlib.sha256(segment.content.encode()).hexdigest()
+            stored_segments.setdefault((segment.type, content_hash), text_segment.segment_id)
+            stored_positions[text_segment.segment_number] = text_segment.segment_id
+    unmatched_segment_ids = set(stored_positions.values())
+
+    segments_diff = SheetSegmentsDiff()
+    unmatched_sources: List[Source] = []
+    for source in sorted(update_sheet_request.source, key=lambda source: source.position):
+        if source.type == SegmentType.SOURCE:
+            continue
+        content_hash = hashlib.sha256(source.content.encode()).hexdigest()
+        if content_hash in segments_diff.segment_dict:
+            continue
+        segment_id = stored_segments.get((source.type, content_hash))
+        if segment_id in unmatched_segment_ids:
+            segments_diff.segment_dict[content_hash] = segment_id
+            unmatched_segment_ids.discard(segment_id)
+        else:
+            unmatched_sources.append(source)
+
+    new_hashes = set()
+    for source in unmatched_sources:
+        content_hash = hashlib.sha256(source.content.encode()).hexdigest()
+        if content_hash in segments_diff.segment_dict or content_hash in new_hashes:
+            continue
+        segment_id = stored_positions.get(source.position)
+        if segment_id in unmatched_segment_ids and segments_dict[segment_id].type == source.type:
+            segments_diff.updated_segments[segment_id] = source.content
+            segments_diff.segment_dict[content_hash] = segment_id
+            unmatched_segment_ids.discard(segment_id)
+        else:
+            segments_diff.new_segments.append(CreateSegment(content=source.content, type=source.type))
+            new_hashes.add(content_hash)
+
+    segments_diff.deleted_segment_ids = [
+        segment_id for segment_id in stored_positions.values() if segment_id in unmatched_segment_ids
+    ]
+    return segments_diff
+
+async def _apply_sheet_segments_diff_(sheet_id: str, segments_diff: SheetSegmentsDiff) -> Dict[str, str]:
+    segment_dict: Dict[str, str] = dict(segments_diff.segment_dict)
+    if segments_diff.new_segments:
+        new_segments = await create_segment(
+            create_segment_request=CreateSegmentRequest(text_id=sheet_id, segments=segments_diff.new_segments)
+        )
+        for segment in new_segments:
+            segment_dict[hashlib.sha256(segment.content.encode()).hexdigest()] = str(segment.id)
+    if segments_diff.updated_segments:
+        await update_segments_content(segments_content=segments_diff.updated_segments)
+    if segments_diff.deleted_segment_ids:
+        await delete_segments_by_ids(segment_ids=segments_diff.deleted_segment_ids)
+    return segment_dict
+
+async def _update_sheet_table_of_content_(
+        update_sheet_request: CreateSheetRequest,
+        sheet_id: str,
+        sheet_table_of_content: Optional[TableOfContent],
+        segment_dict: Dict[str, str],
+        token: str
+) -> bool:
+    if sheet_table_of_content is None:
+        await _generate_and_upload_sheet_table_of_content(
+            create_sheet_request=update_sheet_request,
+            text_id=sheet_id,
+            segment_dict=segment_dict,
+            token=token
+        )
+        return True
+
+    new_table_of_content: TableOfContent = _generate_sheet_table_of_content_(
+        create_sheet_request=update_sheet_request,
+        text_id=sheet_id,
+        segment_dict=segment_dict
+    )
+    new_section: Section = new_table_of_content.sections[0]
+    stored_segments = [
+        (segment.segment_number, segment.segment_id)
+        for section in sheet_table_of_content.sections
+        for segment in section.segments
+    ]
+    if stored_segments == [(segment.segment_number, segment.segment_id) for segment in new_section.segments]:
+        return False
+
+    if sheet_table_of_content.sections:
+        stored_section: Section = sheet_table_of_content.sections[0]
+        new_section.id = stored_section.id
+        new_section.created_date = stored_section.created_date
+    new_table_of_content.id = str(sheet_table_of_content.id)
+    await update_table_of_content_in_place(table_of_content=new_table_of_content)
+    return True
 
 async def _delete_sheet_segments_cache_(sheet_table_of_content: Optional[TableOfContent]):
     sections = sheet_table_of_content.sections if sheet_table_of_content else []
@@ -414,17 +567,19 @@ async def _fetch_user_sheets_(token: str, email: str, sort_by: SortBy, sort_orde
     return sheets
 
 async def _generate_sheet_dto_response_(sheets, total, skip: int, limit: int) -> SheetDTOResponse:
+    summaries: Dict[str, str] = await _get_sheet_summaries_(sheets=sheets)
+    publishers: Dict[str, Publisher] = _get_publishers_by_emails_(emails=[sheet.published_by for sheet in sheets])
     sheets_dto = [
         SheetDTO(
             id = str(sheet.id),
             title = sheet.title,
-            summary = await _generate_sheet_summary_(str(sheet.id)),
+            summary = summaries.get(str(sheet.id), ""),
             published_date = sheet.published_date,
             time_passed = Utils.time_passed(published_time=sheet.published_date, language=sheet.language),
             views = sheet.views,
             is_published = sheet.is_published,
             likes = sheet.likes or [],
-            publisher = _create_publisher_object_(published_by=sheet.published_by),
+            publisher = publishers[sheet.published_by],
             language = sheet.language
         )
         for sheet in sheets
@@ -436,15 +591,20 @@ async def _generate_sheet_dto_response_(sheets, total, skip: int, limit: int) ->
         limit = limit
     )
 
-def _create_publisher_object_(published_by: str) -> Publisher:
+def _get_publishers_by_emails_(emails: List[str]) -> Dict[str, Publisher]:
+    unique_emails = list(dict.fromkeys(emails))
+    users: List[Users] = fetch_users_by_emails(emails=unique_emails)
+    publishers = {user.email: _create_publisher_object_(user=user) for user in users}
+    if any(email not in publishers for email in unique_emails):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.USER_NOT_FOUND)
+    return publishers
 
-    user_profile: UserInfoResponse = fetch_user_by_email(email=published_by)
-    
+def _create_publisher_object_(user: Users) -> Publisher:
     return Publisher(
-        name=f"{user_profile.firstname} {user_profile.lastname}".strip() or user_profile.username,
-        username=user_profile.username,
-        email=user_profile.email,
-        avatar_url=user_profile.avatar_url
+        name=f"{user.firstname or ''} {user.lastname or ''}".strip() or user.username,
+        username=user.username,
+        email=user.email,
+        avatar_url=generate_presigned_access_url(bucket_name=get("AWS_BUCKET_NAME"), s3_key=user.avatar_url)
     )
 
 async def _generate_sheet_section_(segments: List[TextSegment], segments_dict: Dict[str, SegmentDTO]) -> SheetSection:
@@ -487,12 +647,6 @@ async def _generate_sheet_section_(segments: List[TextSegment], segments_dict: D
         segments=sheet_segments
     )
 
-async def _get_sheet_first_content_details_by_type_(segment_ids: List[str], segment_type: SegmentType) -> Optional[str]:
-    
-    # Get detailed firt segment information of type segment_type
-    segments_detail = await get_sheet_first_content_by_ids(segment_ids=segment_ids, segment_type=segment_type)
-    return segments_detail
-
 def _get_all_segment_ids_in_table_of_content_(sheet_sections: Section) -> List[str]:
     segment_ids = []
     for section in sheet_sections:
@@ -22,6 +22,7 @@ from .sheets_service import (
 )
 
 from pecha_api.sheets.sheets_response_models import SheetIdResponse
+from pecha_api.users.users_service import get_current_user_principal
 
 from .sheets_response_models import (
     CreateSheetRequest,
@@ -63,7 +64,7 @@ async def get_sheet(
 ) -> SheetDetailDTO:
     return await get_sheet_by_id(sheet_id=sheet_id, skip=skip, limit=limit)
 
-@sheets_router.post("", status_code=status.HTTP_201_CREATED)
+@sheets_router.post("", status_code=status.HTTP_201_CREATED, dependencies=[Depends(get_current_user_principal)])
 async def create_sheet(
     create_sheet_request: CreateSheetRequest,
     authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
@@ -74,7 +75,7 @@ async def create_sheet(
     )
 
 
-@sheets_router.put("/{sheet_id}", status_code=status.HTTP_200_OK)
+@sheets_router.put("/{sheet_id}", status_code=status.HTTP_200_OK, dependencies=[Depends(get_current_user_principal)])
 async def update_sheet(
     sheet_id: str,
     update_sheet_request: CreateSheetRequest,
@@ -86,7 +87,7 @@ async def update_sheet(
         token=authentication_credential.credentials
     )
 
-@sheets_router.delete("/{sheet_id}", status_code=status.HTTP_204_NO_CONTENT)
+@sheets_router.delete("/{sheet_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(get_current_user_principal)])
 async def delete_sheet(
     sheet_id: str,
     authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
@@ -18,6 +18,11 @@ class TextType(Enum):
 VERSION_TEXT_TYPE = [TextType.TRANSLATION.value, TextType.ROOT.value, TextType.TRANSLATION_SOURCE.value, TextType.NONE.value, TextType.ROOT.value]
 
 
+class UploadStage(Enum):
+    SEGMENTS = "segments"
+    TOC = "toc"
+
+
 class OpenPechaAPIURL(Enum):
     DEVELOPMENT = "https://api-l25bgmwqoa-uc.a.run.app"
     PRODUCTION = "https://api-aq25662yyq-uc.a.run.app"
@@ -0,0 +1,63 @@
+from typing import Any
+
+from pecha_api import config
+from pecha_api.collections.collections_cache_service import invalidate_collection_cache
+from pecha_api.text_uploader.constants import DestinationURL
+from pecha_api.text_uploader.text_metadata.text_metadata_model import TextGroupPayload
+from pecha_api.texts.groups.groups_repository import create_group
+from pecha_api.texts.groups.groups_response_models import CreateGroupRequest
+from pecha_api.texts.segments.segments_models import Segment
+from pecha_api.texts.segments.segments_repository import bulk_insert_segments
+from pecha_api.texts.texts_repository import create_text
+from pecha_api.texts.texts_response_models import CreateTextRequest, TableOfContent
+from pecha_api.texts.texts_service import get_table_of_content_by_type, save_table_of_content
+
+# The uploader is the only writer here and already knows the texts, groups and segments it
+# created, so the checks the public endpoints repeat on every request are skipped.
+
+
+def is_local_ingestion(destination_url: str) -> bool:
+    return (
+        destination_url == DestinationURL.LOCAL.value
+        and config.get("TEXT_UPLOADER_LOCAL_INGESTION").lower() == "true"
+    )
+
+
+def segment_batch_size(destination_url: str, default_batch_size: int) -> int:
+    if is_local_ingestion(destination_url):
+        return config.get_int("TEXT_UPLOADER_LOCAL_SEGMENT_BATCH_SIZE")
+    return default_batch_size
+
+
+async def ingest_group(type: str) -> dict[str, Any]:
+    group = await create_group(create_group_request=CreateGroupRequest(type=type))
+    return group.model_dump()
+
+
+async def ingest_text(text_payload: TextGroupPayload) -> dict[str, Any]:
+    create_text_request = CreateTextRequest(**text_payload.model_dump())
+    text = await create_text(create_text_request=create_text_request)
+    if create_text_request.categories:
+        # the collections it is listed under are cached without it, as in create_new_text
+        await invalidate_collection_cache(collection_ids=create_text_request.categories)
+    return {"id": str(text.id), "title": text.title}
+
+
+async def ingest_segments(segments_payload: dict[str, Any]) -> dict[str, Any]:
+    segments = [
+        Segment(
+            pecha_segment_id=segment["pecha_segment_id"],
+            text_id=segments_payload["text_id"],
+            content=segment["content"],
+            type=segment["type"],
+        )
+        for segment in segments_payload["segments"]
+    ]
+    await bulk_insert_segments(segments=segments)
+    return {"text_id": segments_payload["text_id"], "count": len(segments)}
+
+
+async def ingest_toc(toc_payload: dict[str, Any]) -> dict[str, Any]:
+    table_of_content = await get_table_of_content_by_type(table_of_content=TableOfContent(**toc_payload))
+    saved_table_of_content = await save_table_of_content(table_of_content_request=table_of_content)
+    return {"id": str(saved_table_of_content.id), "text_id": saved_table_of_content.text_id}
@@ -1,4 +1,3 @@
-import asyncio
 from fastapi import HTTPException
 from starlette import status
 from pecha_api.error_contants import ErrorConstants
@@ -6,9 +5,9 @@ from pecha_api.error_contants import ErrorConstants
 
 from pecha_api.text_uploader.collections.collection_service import CollectionService
 from pecha_api.text_uploader.text_metadata.text_metadata_service import TextMetadataService
-from pecha_api.text_uploader.segments.segment_service import SegmentService
 from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest
-from pecha_api.text_uploader.table_of_content.toc_service import TocService
+from pecha_api.text_uploader.text_upload_engine import TextUploadEngine
+from pecha_api.text_uploader.upload_checkpoint_repository import get_pending_uploads
 from pecha_api.text_uploader.mapping.mapping_services import MappingService
 from pecha_api.users.users_service import verify_admin_access
 from pecha_api.text_uploader.constants import DestinationURL, OpenPechaAPIURL
@@ -44,18 +43,22 @@ async def pipeline(text_upload_request: TextUploadRequest, token: str)-> TextUpl
     new_texts = instance_ids_response.new_text
     all_text = instance_ids_response.all_text
 
-    new_uploaded_texts_count = len(new_texts)
-
-    if new_uploaded_texts_count > 0:
-        # segment upload
-        segment = SegmentService()
-        await segment.upload_segments(text_upload_request=text_upload_request_payload,text_ids = new_texts, token=token)
-
-        # table of content upload
-        toc = TocService()
-        await toc.upload_toc(text_ids=new_texts, text_upload_request=text_upload_request_payload, token=token)
-
-   
+    # texts left half uploaded by a failed run are resumed along with the new ones
+    pending_uploads = await get_pending_uploads(
+        pecha_text_ids=[pecha_text_id for pecha_text_id in all_text.values() if pecha_text_id not in new_texts.values()],
+        destination_url=destination_url,
+    )
+    texts_to_upload = {**pending_uploads, **new_texts}
+
+    if len(texts_to_upload) > 0:
+        # segment and table of content upload
+        upload_engine = TextUploadEngine()
+        failed_text_ids = await upload_engine.upload_texts(text_ids=texts_to_upload, text_upload_request=text_upload_request_payload, token=token)
+        if failed_text_ids:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"{ErrorConstants.TEXT_UPLOAD_INCOMPLETE_MESSAGE}: {', '.join(failed_text_ids)}",
+            )
 
     #mapping upload
     if text_upload_request.destination_url != DestinationURL.LOCAL.name:
@@ -63,8 +66,8 @@ async def pipeline(text_upload_request: TextUploadRequest, token: str)-> TextUpl
         await mapping.trigger_mapping(text_ids=all_text, text_upload_request=text_upload_request)
 
 
-    if new_uploaded_texts_count > 0:
+    if len(texts_to_upload) > 0:
 
-        return TextUploadResponse(message=new_texts)
+        return TextUploadResponse(message=texts_to_upload)
     else:
-        return TextUploadResponse(message="All texts are already uploaded")
\ No newline at end of file
+        return TextUploadResponse(message="All texts are already uploaded")
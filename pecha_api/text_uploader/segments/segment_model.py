@@ -12,4 +12,9 @@ class SegmentModel(BaseModel):
 class ManifestationModel(BaseModel):
     job_id: Optional[str] = None
     status: Optional[str] = None
-    message: Optional[str] = None
\ No newline at end of file
+    message: Optional[str] = None
+
+class InstanceSegments(BaseModel):
+    # instance content and its segmentation annotation, fetched once and shared by the segment and toc stages
+    content: str
+    annotation: dict[str, Any]
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, List
+from typing import Any, Awaitable, Callable, List, Optional
 from pecha_api.text_uploader.segments.segment_respository import (
     get_segments_annotation,
     post_segments,
@@ -7,6 +7,8 @@ from pecha_api.text_uploader.segments.segment_respository import (
     get_segments_by_id
 )
 
+from pecha_api.text_uploader.segments.segment_model import InstanceSegments
+from pecha_api.text_uploader.local_ingestion import is_local_ingestion, ingest_segments, segment_batch_size
 from pecha_api.texts.segments.segments_repository import get_segments_by_text_id
 from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest
 
@@ -23,14 +25,8 @@ class SegmentService:
                     print(f"Segments for text_id {pecha_text_id} already uploaded. Skipping...")
                     continue
 
-                instance = await self.get_segments_annotation_by_pecha_text_id(text_upload_request, pecha_text_id)
-                annotation_ids = self.get_annotation_ids(instance)
-                annotation_sengments = await get_segments_id_by_annotation_id(annotation_ids[0], text_upload_request.openpecha_api_url)
-                segments_ids = [segment["id"] for segment in annotation_sengments["data"]]
-                # Process segment_ids in batches to manage batch size
-                
-                # segments_contents = await self.make_batch_segments_content(segments_ids, pecha_text_id)
-                segments_contents = self.parse_segments_content(annotation_sengments["data"], instance['content'])
+                instance_segments = await self.get_instance_segments(text_upload_request, pecha_text_id)
+                segments_contents = self.parse_segments_content(instance_segments.annotation["data"], instance_segments.content)
 
                 await self.upload_bulk_segments(text_id, segments_contents,text_upload_request, token)
         except Exception as e:
@@ -48,11 +44,19 @@ class SegmentService:
         return segments_content
 
 
-    async def upload_bulk_segments(self, text_id: str, segments_content: List[dict[str, Any]], text_upload_request, token: str) -> List[dict[str, Any]]:
+    async def upload_bulk_segments(
+        self,
+        text_id: str,
+        segments_content: List[dict[str, Any]],
+        text_upload_request,
+        token: str,
+        on_batch_uploaded: Optional[Callable[[int], Awaitable[None]]] = None,
+    ) -> List[dict[str, Any]]:
         """
         Create and post segments in batches to avoid payload size limits.
+        on_batch_uploaded is awaited with the number of segments posted so far after every batch.
         """
-        batch_size = 400  # Adjust batch size as needed
+        batch_size = segment_batch_size(text_upload_request.destination_url, 400)  # Adjust batch size as needed
         total_segments = len(segments_content)
 
         print(f"\nPosting {total_segments} segments in batches of {batch_size}...\n")
@@ -74,7 +78,12 @@ class SegmentService:
             }
             
             logging.info(f"Posting batch {batch_number}/{total_batches} ({len(batch)} segments)...\n")
-            await post_segments(payload, text_upload_request.destination_url, token)
+            if is_local_ingestion(text_upload_request.destination_url):
+                await ingest_segments(payload)
+            else:
+                await post_segments(payload, text_upload_request.destination_url, token)
+            if on_batch_uploaded is not None:
+                await on_batch_uploaded(i + len(batch))
 
     async def get_segments_annotation_by_pecha_text_id(
         self, text_upload_request: TextUploadRequest, pecha_text_id: str
@@ -82,6 +91,15 @@ class SegmentService:
         return await get_segments_annotation(pecha_text_id, text_upload_request.openpecha_api_url)
 
 
+    async def get_instance_segments(
+        self, text_upload_request: TextUploadRequest, pecha_text_id: str
+    ) -> InstanceSegments:
+        instance = await self.get_segments_annotation_by_pecha_text_id(text_upload_request, pecha_text_id)
+        annotation_ids = self.get_annotation_ids(instance)
+        annotation = await get_segments_id_by_annotation_id(annotation_ids[0], text_upload_request.openpecha_api_url)
+        return InstanceSegments(content=instance["content"], annotation=annotation)
+
+
     def get_annotation_ids(self, instance: dict[str, Any]) -> list[str]:
         annotations = instance["annotations"] or []
         segmentation_ids: list[str] = []
@@ -96,6 +114,11 @@ class SegmentService:
         return len(segments) > 0
 
 
+    async def get_uploaded_pecha_segment_ids(self, text_id: str) -> set[str]:
+        segments = await get_segments_by_text_id(text_id)
+        return {segment.pecha_segment_id for segment in segments if segment.pecha_segment_id}
+
+
     async def get_segments_by_id_list(self, annotation_ids: str, text_upload_request: TextUploadRequest) -> List[dict[str, Any]]:
         
         segments = await get_segments_by_id(annotation_ids, text_upload_request.openpecha_api_url)
@@ -1,13 +1,7 @@
 from typing import Any
-import asyncio
-import requests
+
+from pecha_api.text_uploader.uploader_http_client import uploader_http_client
 
 async def post_toc(toc_payload: dict[str, Any], destination_url: str, token: str):
     url = f"{destination_url}/texts/table-of-content"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
-    response = await asyncio.to_thread(requests.post, url, headers=headers, json=toc_payload)
-    response.raise_for_status()
-    return response.json()
\ No newline at end of file
+    return await uploader_http_client.post_json(url, toc_payload, token=token)
@@ -6,6 +6,7 @@ from pecha_api.text_uploader.segments.segment_service import SegmentService
 from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest
 
 from pecha_api.text_uploader.table_of_content.toc_repository import post_toc
+from pecha_api.text_uploader.local_ingestion import is_local_ingestion, ingest_toc
 
 
 logging.basicConfig(level=logging.INFO)
@@ -22,14 +23,18 @@ class TocService:
             instance = await self.segment_service.get_segments_annotation_by_pecha_text_id(text_upload_request, pecha_text_id)
             annotation_ids = self.segment_service.get_annotation_ids(instance)
             annotation_segments = await self.segment_service.get_segments_by_id_list(annotation_ids[0], text_upload_request)
-            ordered_segments = await self.order_segments_by_annotation_span(annotation_segments)
-            toc_payload = self.create_toc_payload(ordered_segments, text_id)
-            
-            
+            await self.upload_text_toc(text_id, annotation_segments, text_upload_request, token)
+
+    async def upload_text_toc(self, text_id: str, annotation_segments: dict[str, Any], text_upload_request: TextUploadRequest, token: str):
+        ordered_segments = await self.order_segments_by_annotation_span(annotation_segments)
+        toc_payload = self.create_toc_payload(ordered_segments, text_id)
+
+        if is_local_ingestion(text_upload_request.destination_url):
+            await ingest_toc(toc_payload)
+        else:
             await post_toc(toc_payload, text_upload_request.destination_url, token)
-            logging.info(f'Table of Content  uploaded successfully for text_id: {text_id}')
-            
-        
+        logging.info(f'Table of Content  uploaded successfully for text_id: {text_id}')
+
     async def order_segments_by_annotation_span(self, annotation_segments: dict[str, Any]):
 
         segments_data = annotation_segments.get("data", [])
@@ -1,7 +1,9 @@
 from typing import Any, List
 import logging
 
-from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest
+from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest, TextUploadCheckpoint
+from pecha_api.text_uploader.upload_checkpoint_repository import save_upload_checkpoint
+from pecha_api.text_uploader.local_ingestion import is_local_ingestion, ingest_group, ingest_text
 from pecha_api.text_uploader.text_metadata.text_metadata_model import CriticalInstanceResponse, TextInstanceIds
 from pecha_api.text_uploader.text_metadata.text_group_repository import (
     post_group,
@@ -82,22 +84,27 @@ class TextMetadataService:
             
             if type == "translation":
                 if not self.version_group_id:
-                    group_response = await post_group('text', text_upload_request.destination_url, token)
+                    group_response = await self.create_group('text', text_upload_request, token)
                     self.version_group_id = group_response["id"]
                     logging.info(f"Created new group {group_response['id']} for translation")
 
                 payload = await self.create_textmetada_payload(text_id, text_metadata, type="version", text_upload_request=text_upload_request)
 
             elif type == "commentary":
-                group_response = await post_group('commentary', text_upload_request.destination_url, token)
+                group_response = await self.create_group('commentary', text_upload_request, token)
                 self.commentary_group_id = group_response["id"]
                 logging.info(f"Created new group {group_response['id']} for commentary")
 
                 payload = await self.create_textmetada_payload(text_id, text_metadata, type="commentary", text_upload_request=text_upload_request)
 
-            text_response = await post_text(payload, token, text_upload_request.destination_url)   
+            text_response = await self.create_text(payload, text_upload_request, token)
             response_text_id = text_response["id"]
             new_texts[response_text_id] = instances[text_id]
+            # recorded right away so a failure later in the run can still resume this text
+            await save_upload_checkpoint(
+                TextUploadCheckpoint(text_id=response_text_id, pecha_text_id=instances[text_id]),
+                text_upload_request.destination_url,
+            )
             
             logging.info(f"Created new text {text_response['title']}")
 
@@ -141,6 +148,16 @@ class TextMetadataService:
 
 
 
+    async def create_group(self, type: str, text_upload_request: TextUploadRequest, token: str) -> dict[str, Any]:
+        if is_local_ingestion(text_upload_request.destination_url):
+            return await ingest_group(type)
+        return await post_group(type, text_upload_request.destination_url, token)
+
+    async def create_text(self, text_payload: TextGroupPayload, text_upload_request: TextUploadRequest, token: str) -> dict[str, Any]:
+        if is_local_ingestion(text_upload_request.destination_url):
+            return await ingest_text(text_payload)
+        return await post_text(text_payload, token, text_upload_request.destination_url)
+
     async def get_text_critical_instance(self, text_id: str, openpecha_api_url: str) -> CriticalInstanceResponse:
         critical_instances_response = await get_critical_instances(text_id, openpecha_api_url)
         critical_instances_list = critical_instances_response.critical_instances
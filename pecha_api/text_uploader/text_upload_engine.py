@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import List, Optional
+
+from pecha_api import config
+from pecha_api.text_uploader.constants import UploadStage
+from pecha_api.text_uploader.segments.segment_model import InstanceSegments
+from pecha_api.text_uploader.segments.segment_service import SegmentService
+from pecha_api.text_uploader.table_of_content.toc_service import TocService
+from pecha_api.text_uploader.text_uploader_response_model import TextUploadCheckpoint, TextUploadRequest
+from pecha_api.text_uploader.upload_checkpoint_repository import (
+    get_upload_checkpoint,
+    save_upload_checkpoint,
+    is_upload_completed
+)
+
+
+class TextUploadEngine:
+    """
+    Uploads the segments and table of content of several texts in parallel. Each instance and its
+    segmentation annotation are fetched once for both stages, and every stage (and segment batch)
+    is checkpointed so a failed upload resumes where it stopped.
+    """
+
+    def __init__(self):
+        self.segment_service = SegmentService()
+        self.toc_service = TocService()
+
+    async def upload_texts(self, text_ids: dict[str, str], text_upload_request: TextUploadRequest, token: str) -> List[str]:
+        """Upload {text_id: pecha_text_id}; returns the text ids that failed and can be resumed."""
+        semaphore = asyncio.Semaphore(config.get_int("TEXT_UPLOADER_TEXT_CONCURRENCY"))
+
+        async def _upload(text_id: str, pecha_text_id: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    await self.upload_text(text_id, pecha_text_id, text_upload_request, token)
+                    return None
+                except Exception:
+                    logging.error(f"Upload failed for text_id {text_id}, it resumes on the next run", exc_info=True)
+                    return text_id
+
+        results = await asyncio.gather(*[
+            _upload(text_id, pecha_text_id) for text_id, pecha_text_id in text_ids.items()
+        ])
+        return [text_id for text_id in results if text_id is not None]
+
+    async def upload_text(self, text_id: str, pecha_text_id: str, text_upload_request: TextUploadRequest, token: str):
+        destination_url = text_upload_request.destination_url
+        checkpoint = await get_upload_checkpoint(pecha_text_id, destination_url)
+        if checkpoint is None:
+            checkpoint = TextUploadCheckpoint(text_id=text_id, pecha_text_id=pecha_text_id)
+        if is_upload_completed(checkpoint):
+            logging.info(f"Text_id {checkpoint.text_id} already uploaded. Skipping...")
+            return
+
+        instance_segments = await self.segment_service.get_instance_segments(text_upload_request, pecha_text_id)
+
+        if UploadStage.SEGMENTS.value not in checkpoint.completed_stages:
+            await self._upload_segments(checkpoint, instance_segments, text_upload_request, token)
+            await self._complete_stage(checkpoint, UploadStage.SEGMENTS, destination_url)
+
+        if UploadStage.TOC.value not in checkpoint.completed_stages:
+            await self.toc_service.upload_text_toc(checkpoint.text_id, instance_segments.annotation, text_upload_request, token)
+            await self._complete_stage(checkpoint, UploadStage.TOC, destination_url)
+
+    async def _upload_segments(self, checkpoint: TextUploadCheckpoint, instance_segments: InstanceSegments, text_upload_request: TextUploadRequest, token: str):
+        segments_content = self.segment_service.parse_segments_content(instance_segments.annotation["data"], instance_segments.content)
+
+        # a batch can be stored without its checkpoint (a timed out POST, a crash before saving it),
+        # so what is left to post is decided by the segments already stored, not by uploaded_segments
+        uploaded_segment_ids = await self.segment_service.get_uploaded_pecha_segment_ids(checkpoint.text_id)
+        remaining_segments = [segment for segment in segments_content if segment["segment_id"] not in uploaded_segment_ids]
+        if not remaining_segments:
+            logging.info(f"Segments for text_id {checkpoint.text_id} already uploaded. Skipping...")
+            return
+        resumed_from = len(segments_content) - len(remaining_segments)
+
+        async def _record_progress(uploaded_segments: int):
+            checkpoint.uploaded_segments = resumed_from + uploaded_segments
+            await save_upload_checkpoint(checkpoint, text_upload_request.destination_url)
+
+        await self.segment_service.upload_bulk_segments(
+            checkpoint.text_id,
+            remaining_segments,
+            text_upload_request,
+            token,
+            on_batch_uploaded=_record_progress,
+        )
+
+    @staticmethod
+    async def _complete_stage(checkpoint: TextUploadCheckpoint, stage: UploadStage, destination_url: str):
+        checkpoint.completed_stages.append(stage.value)
+        await save_upload_checkpoint(checkpoint, destination_url)
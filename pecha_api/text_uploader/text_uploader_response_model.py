@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -9,3 +11,10 @@ class TextUploadRequest(BaseModel):
 
 class TextUploadResponse(BaseModel):
     message: dict[str, str] | str
+
+
+class TextUploadCheckpoint(BaseModel):
+    text_id: str
+    pecha_text_id: str
+    uploaded_segments: int = 0
+    completed_stages: List[str] = []
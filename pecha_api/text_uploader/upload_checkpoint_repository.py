@@ -0,0 +1,46 @@
+from typing import Dict, Iterable, Optional
+
+from pecha_api import config
+from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.cache_keys import CacheKeys
+from pecha_api.cache.cache_repository import get_cache_data, get_many, set_cache
+from pecha_api.text_uploader.constants import UploadStage
+from pecha_api.text_uploader.text_uploader_response_model import TextUploadCheckpoint
+
+
+def _checkpoint_key(pecha_text_id: str, destination_url: str) -> str:
+    return CacheKeys.build(CacheType.TEXT_UPLOAD_CHECKPOINT, pecha_text_id, destination_url)
+
+
+async def get_upload_checkpoint(pecha_text_id: str, destination_url: str) -> Optional[TextUploadCheckpoint]:
+    cache_data = await get_cache_data(hash_key=_checkpoint_key(pecha_text_id, destination_url))
+    if cache_data and isinstance(cache_data, dict):
+        return TextUploadCheckpoint(**cache_data)
+    return cache_data
+
+
+async def save_upload_checkpoint(checkpoint: TextUploadCheckpoint, destination_url: str) -> bool:
+    return await set_cache(
+        hash_key=_checkpoint_key(checkpoint.pecha_text_id, destination_url),
+        value=checkpoint,
+        cache_time_out=config.get_int("TEXT_UPLOADER_CHECKPOINT_TIMEOUT"),
+    )
+
+
+async def get_pending_uploads(pecha_text_ids: Iterable[str], destination_url: str) -> Dict[str, str]:
+    """
+    Texts whose metadata was posted by an earlier run that failed before every stage completed,
+    as {text_id: pecha_text_id}, read in a single round trip.
+    """
+    keys = [_checkpoint_key(pecha_text_id, destination_url) for pecha_text_id in pecha_text_ids]
+    checkpoints = await get_many(hash_keys=keys)
+    pending_uploads = {}
+    for cache_data in checkpoints.values():
+        checkpoint = TextUploadCheckpoint(**cache_data)
+        if not is_upload_completed(checkpoint):
+            pending_uploads[checkpoint.text_id] = checkpoint.pecha_text_id
+    return pending_uploads
+
+
+def is_upload_completed(checkpoint: TextUploadCheckpoint) -> bool:
+    return all(stage.value in checkpoint.completed_stages for stage in UploadStage)
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import httpx
+
+from pecha_api.config import get_int
+
+CONTENT_TYPE = "application/json"
+
+
+class UploaderHttpClient:
+    """
+    One pooled httpx.AsyncClient shared by every text uploader call, so connections to OpenPecha
+    and to the destination backend are reused. Each host gets at most TEXT_UPLOADER_PER_HOST_CONCURRENCY
+    requests in flight, however many texts are uploaded in parallel.
+    """
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(get_int("TEXT_UPLOADER_HTTP_TIMEOUT")),
+                limits=httpx.Limits(
+                    max_connections=get_int("TEXT_UPLOADER_MAX_CONNECTIONS"),
+                    max_keepalive_connections=get_int("TEXT_UPLOADER_MAX_CONNECTIONS"),
+                ),
+            )
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = httpx.URL(url).host
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(get_int("TEXT_UPLOADER_PER_HOST_CONCURRENCY"))
+        return self._host_limits[host]
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._host_limit(url):
+            response = await self._get_client().request(method, url, **kwargs)
+        if response.is_error:
+            logging.error(f"{method} {url} failed (status={response.status_code}) body={response.text}")
+        response.raise_for_status()
+        return response
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        response = await self.request("GET", url, params=params)
+        return response.json()
+
+    async def post_json(self, url: str, payload: Any, token: Optional[str] = None) -> Any:
+        headers = {"Content-Type": CONTENT_TYPE}
+        if token is not None:
+            headers["Authorization"] = f"Bearer {token}"
+        response = await self.request("POST", url, headers=headers, json=payload)
+        return response.json()
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._host_limits = {}
+
+
+uploader_http_client = UploaderHttpClient()
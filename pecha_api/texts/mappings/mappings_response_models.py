@@ -15,3 +15,8 @@ class TextMapping(BaseModel):
 
 class TextMappingRequest(BaseModel):
     text_mappings: List[TextMapping]
+
+
+class MappingEdgesRebuildResponse(BaseModel):
+    # False when a rebuild is already running
+    started: bool
@@ -1,10 +1,11 @@
 import asyncio
-from typing import List, Dict, Tuple
+import logging
+from typing import List, Dict, Optional, Tuple
 from fastapi import HTTPException
 from starlette import status
 
 from pecha_api.error_contants import ErrorConstants
-from pecha_api.texts.segments.segments_repository import get_segments_by_pecha_segment_ids
+from pecha_api.texts.segments.segments_repository import get_segments_by_pecha_segment_ids, rebuild_segment_mapping_edges
 from pecha_api.texts.texts_repository import get_texts_by_pecha_text_ids
 from .mappings_repository import (
     update_mappings, 
@@ -13,7 +14,8 @@ from .mappings_repository import (
 from .mappings_response_models import (
     TextMappingRequest, 
     MappingsModel, 
-    TextMapping
+    TextMapping,
+    MappingEdgesRebuildResponse
 )
 from ..segments.segments_models import Segment, Mapping
 from ..segments.segments_response_models import (
@@ -29,6 +31,9 @@ from ...users.users_service import verify_admin_access
 # Mappings Service
 # ===============
 
+# keeps a strong reference to the running backfill so it is not garbage collected
+_rebuild_task: Optional[asyncio.Task] = None
+
 async def update_segment_mapping(text_mapping_request: TextMappingRequest, token: str) -> SegmentResponse:
     # Verify admin access
     is_admin: bool = verify_admin_access(token=token)
@@ -134,6 +139,26 @@ async def delete_segment_mapping(text_mapping_request: TextMappingRequest,token:
             detail=ErrorConstants.SEGMENT_MAPPING_ERROR_MESSAGE
         )
 
+async def rebuild_mapping_edges(token: str) -> MappingEdgesRebuildResponse:
+    is_admin: bool = verify_admin_access(token=token)
+    if not is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=ErrorConstants.ADMIN_ERROR_MESSAGE
+        )
+    global _rebuild_task
+    # the backfill walks every mapped segment, far longer than a request should last
+    if _rebuild_task is not None and not _rebuild_task.done():
+        return MappingEdgesRebuildResponse(started=False)
+    _rebuild_task = asyncio.create_task(_rebuild_segment_mapping_edges_in_background())
+    return MappingEdgesRebuildResponse(started=True)
+
+async def _rebuild_segment_mapping_edges_in_background():
+    try:
+        await rebuild_segment_mapping_edges()
+    except Exception:
+        logging.error("Failed to rebuild segment mapping edges", exc_info=True)
+
 async def _get_text_and_segment_ids(text_mapping_request: TextMappingRequest) -> Tuple[Dict[str, str], Dict[str, str]]:
     segment_ids=[]
     text_ids=[]
@@ -4,8 +4,8 @@ from fastapi import APIRouter, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette import status
 
-from .mappings_response_models import TextMappingRequest
-from .mappings_service import update_segment_mapping, delete_segment_mapping
+from .mappings_response_models import TextMappingRequest, MappingEdgesRebuildResponse
+from .mappings_service import update_segment_mapping, delete_segment_mapping, rebuild_mapping_edges
 from ..segments.segments_response_models import SegmentResponse
 
 oauth2_scheme = HTTPBearer()
@@ -24,4 +24,8 @@ async def create_text_mapping(authentication_credential: Annotated[HTTPAuthoriza
 @mapping_router.delete("",status_code=status.HTTP_204_NO_CONTENT)
 async def delete_text_mapping(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                               text_mapping_request: TextMappingRequest) -> None:
-    await delete_segment_mapping(token=authentication_credential.credentials, text_mapping_request=text_mapping_request)
\ No newline at end of file
+    await delete_segment_mapping(token=authentication_credential.credentials, text_mapping_request=text_mapping_request)
+
+@mapping_router.post("/edges/rebuild",status_code=status.HTTP_202_ACCEPTED)
+async def rebuild_text_mapping_edges(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)]) -> MappingEdgesRebuildResponse:
+    return await rebuild_mapping_edges(token=authentication_credential.credentials)
@@ -1,4 +1,4 @@
-from pecha_api.utils import Utils
+from pecha_api.cache.cache_keys import CacheKeys
 from pecha_api.cache.cache_repository import (
     get_cache_data,
     set_cache,
@@ -12,96 +12,93 @@ from .segments_response_models import (
     SegmentTranslationsResponse,
     SegmentCommentariesResponse
 )
-from typing import Dict, List
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.local_cache import local_cache
+from pecha_api.cache.single_flight import get_cache_data_with_refresh
 
 # SEGMENTS
-async def get_segment_details_by_id_cache(segment_id: str = None, text_details: bool = None) -> SegmentDTO:
-    payload = [segment_id, text_details]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def get_segment_details_by_id_cache(segment_id: str = None, text_details: bool = None, cache_type: CacheType = CacheType.SEGMENT_DETAIL) -> SegmentDTO:
+    hashed_key: str = CacheKeys.build(cache_type, segment_id, text_details)
     cache_data: SegmentDTO = await get_cache_data(hash_key=hashed_key)
     if cache_data and isinstance(cache_data, dict):
         cache_data = SegmentDTO(**cache_data)
     return cache_data
 
-async def set_segment_details_by_id_cache(segment_id: str = None, text_details: bool = None, cache_type: CacheType = None, data: SegmentDTO = None):
-    payload = [segment_id, text_details, cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def set_segment_details_by_id_cache(segment_id: str = None, text_details: bool = None, cache_type: CacheType = CacheType.SEGMENT_DETAIL, data: SegmentDTO = None):
+    hashed_key: str = CacheKeys.build(cache_type, segment_id, text_details)
     cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
     await set_cache(hash_key=hashed_key, value=data, cache_time_out=cache_time_out)
 
-async def get_segment_info_by_id_cache(segment_id: str = None, cache_type: CacheType = None) -> SegmentInfoResponse:
-    payload = [segment_id, cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def get_segment_info_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_INFO) -> SegmentInfoResponse:
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
+    local_data = local_cache.get(cache_type=cache_type, hash_key=hashed_key)
+    if local_data is not None:
+        return local_data
     cache_data: SegmentInfoResponse = await get_cache_data(hash_key = hashed_key)
     if cache_data and isinstance(cache_data, dict):
         cache_data = SegmentInfoResponse(**cache_data)
+    local_cache.remember(cache_type=cache_type, hash_key=hashed_key, value=cache_data)
     return cache_data
 
-async def set_segment_info_by_id_cache(segment_id: str = None, cache_type: CacheType = None, data: SegmentInfoResponse = None):
-    payload = [segment_id, cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def set_segment_info_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_INFO, data: SegmentInfoResponse = None):
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
     await set_cache(hash_key=hashed_key, value=data, cache_time_out=cache_time_out)
+    local_cache.set(cache_type=cache_type, hash_key=hashed_key, value=data)
 
-async def get_segment_root_mapping_by_id_cache(segment_id: str = None) -> SegmentRootMappingResponse:
-    payload = [segment_id]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def get_segment_root_mapping_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_ROOT_TEXT) -> SegmentRootMappingResponse:
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_data: SegmentRootMappingResponse = await get_cache_data(hash_key = hashed_key)
     if cache_data and isinstance(cache_data, dict):
         cache_data = SegmentRootMappingResponse(**cache_data)
     return cache_data
 
-async def set_segment_root_mapping_by_id_cache(segment_id: str = None, cache_type: CacheType = None, data: SegmentRootMappingResponse = None):
-    payload = [segment_id, cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def set_segment_root_mapping_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_ROOT_TEXT, data: SegmentRootMappingResponse = None):
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
     await set_cache(hash_key=hashed_key, value=data, cache_time_out=cache_time_out)
 
-async def get_segment_translations_by_id_cache(segment_id: str = None) -> SegmentTranslationsResponse:
-    payload = [segment_id]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def get_segment_translations_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_TRANSLATIONS) -> SegmentTranslationsResponse:
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_data: SegmentTranslationsResponse = await get_cache_data(hash_key = hashed_key)
     if cache_data and isinstance(cache_data, dict):
         cache_data = SegmentTranslationsResponse(**cache_data)
     return cache_data
 
-async def set_segment_translations_by_id_cache(segment_id: str = None, cache_type: CacheType = None, data: SegmentTranslationsResponse = None):
-    payload = [segment_id, cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def set_segment_translations_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_TRANSLATIONS, data: SegmentTranslationsResponse = None):
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
     await set_cache(hash_key=hashed_key, value=data, cache_time_out=cache_time_out)
 
-async def get_segment_commentaries_by_id_cache(segment_id: str = None) -> SegmentCommentariesResponse:
-    payload = [segment_id]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def get_segment_commentaries_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_COMMENTARIES) -> SegmentCommentariesResponse:
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_data: SegmentCommentariesResponse = await get_cache_data(hash_key = hashed_key)
     if cache_data and isinstance(cache_data, dict):
         cache_data = SegmentCommentariesResponse(**cache_data)
     return cache_data
 
-async def set_segment_commentaries_by_id_cache(segment_id: str = None, cache_type: CacheType = None, data: SegmentCommentariesResponse = None):
-    payload = [segment_id, cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def set_segment_commentaries_by_id_cache(segment_id: str = None, cache_type: CacheType = CacheType.SEGMENT_COMMENTARIES, data: SegmentCommentariesResponse = None):
+    hashed_key: str = CacheKeys.build(cache_type, segment_id)
     cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
     await set_cache(hash_key=hashed_key, value=data, cache_time_out=cache_time_out)
 
 
-async def get_segments_details_by_ids_cache(segment_ids: List[str] = None, cache_type: CacheType = None) -> Dict[str, SegmentDTO]:
-    payload = list(segment_ids) + [cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
-    cache_data: Dict[str, SegmentDTO] = await get_cache_data(hash_key = hashed_key)
+async def get_segments_details_by_ids_cache(segment_ids: List[str], cache_type: CacheType, refresh: Optional[Callable[[], Awaitable[Any]]] = None) -> Dict[str, SegmentDTO]:
+    hashed_key: str = CacheKeys.build(cache_type, None, *segment_ids)
+    if refresh is None:
+        cache_data: Dict[str, SegmentDTO] = await get_cache_data(hash_key = hashed_key)
+    else:
+        cache_data: Dict[str, SegmentDTO] = await get_cache_data_with_refresh(hash_key = hashed_key, refresh = refresh, cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT"))
     if cache_data and isinstance(cache_data, dict):
         cache_data = {k: SegmentDTO(**v) for k, v in cache_data.items()}
     return cache_data
 
-async def set_segments_details_by_ids_cache(segment_ids: List[str] = None, cache_type: CacheType = None, data: Dict[str, SegmentDTO] = None):
-    payload = list(segment_ids) + [cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def set_segments_details_by_ids_cache(segment_ids: List[str], cache_type: CacheType, data: Dict[str, SegmentDTO] = None):
+    hashed_key: str = CacheKeys.build(cache_type, None, *segment_ids)
     cache_time_out = config.get_int("CACHE_TEXT_TIMEOUT")
     await set_cache(hash_key=hashed_key, value=data, cache_time_out=cache_time_out)
 
-async def delete_segments_details_by_ids_cache(segment_ids: List[str] = None, cache_type: CacheType = None):
-    payload = list(segment_ids) + [cache_type]
-    hashed_key: str = Utils.generate_hash_key(payload = payload)
+async def delete_segments_details_by_ids_cache(segment_ids: List[str], cache_type: CacheType):
+    hashed_key: str = CacheKeys.build(cache_type, None, *segment_ids)
     await clear_cache(hash_key = hashed_key)
\ No newline at end of file
@@ -2,14 +2,74 @@ from typing import List, Optional, Dict
 import uuid
 from pydantic import BaseModel, Field
 from beanie import Document
+from pymongo import ASCENDING, IndexModel
 
 from .segments_enum import SegmentType
+from ..texts_models import Text
 
 class Mapping(BaseModel):
     text_id: str
     segments: List[str]
 
 
+class SegmentMappingEdgeView(BaseModel):
+    parent_segment_id: str
+    child_segment_id: str
+    child_text_id: str
+    child_text_type: Optional[str] = None
+
+    class Settings:
+        # every projected field is part of the parent index, so reads are covered index scans
+        projection = {
+            "_id": 0,
+            "parent_segment_id": 1,
+            "child_segment_id": 1,
+            "child_text_id": 1,
+            "child_text_type": 1
+        }
+
+
+class SegmentMappingEdge(Document):
+    # reverse index of Segment.mapping: one edge per (parent segment, mapped child segment)
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    parent_segment_id: str
+    child_segment_id: str
+    child_text_id: str
+    child_text_type: Optional[str] = None
+
+    class Settings:
+        collection = "segment_mapping_edges"
+        indexes = [
+            IndexModel([
+                ("parent_segment_id", ASCENDING),
+                ("child_text_type", ASCENDING),
+                ("child_text_id", ASCENDING),
+                ("child_segment_id", ASCENDING)
+            ]),
+            IndexModel([("child_segment_id", ASCENDING)]),
+            IndexModel([("child_text_id", ASCENDING)])
+        ]
+
+    @classmethod
+    async def get_edges_by_parent_segment_ids(cls, parent_segment_ids: List[str]) -> List[SegmentMappingEdgeView]:
+        if not parent_segment_ids:
+            return []
+        return await cls.find(
+            {"parent_segment_id": {"$in": parent_segment_ids}}
+        ).project(SegmentMappingEdgeView).to_list()
+
+    @classmethod
+    async def replace_edges_by_child_segment_ids(cls, child_segment_ids: List[str], edges: List[SegmentMappingEdgeView]):
+        if child_segment_ids:
+            await cls.find({"child_segment_id": {"$in": child_segment_ids}}).delete()
+        if edges:
+            await cls.insert_many([cls(**edge.model_dump()) for edge in edges], ordered=False)
+
+    @classmethod
+    async def delete_edges_by_child_text_id(cls, text_id: str):
+        return await cls.find(cls.child_text_id == text_id).delete()
+
+
 class Segment(Document):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
     pecha_segment_id: Optional[str] = None
@@ -75,27 +135,53 @@ class Segment(Document):
         segment_ids = [uuid.UUID(segment_id) for segment_id in segment_ids]
         return await cls.find({"_id": {"$in": segment_ids}}).to_list(length=len(segment_ids))
     @classmethod
-    async def get_first_segment_by_ids_and_type(cls, segment_ids: List[str], segment_type: SegmentType) -> Optional["Segment"]:
-        """Get the first segment matching the IDs and type - optimized for single result"""
+    async def get_segments_by_ids_and_type(cls, segment_ids: List[str], segment_type: SegmentType) -> List["Segment"]:
         if not segment_ids:
-            return None
+            return []
         segment_uuid_ids = [uuid.UUID(segment_id) for segment_id in segment_ids]
-        return await cls.find_one({"_id": {"$in": segment_uuid_ids}, "type": segment_type})
+        return await cls.find({"_id": {"$in": segment_uuid_ids}, "type": segment_type}).to_list()
 
     @classmethod
-    async def get_related_mapped_segments(cls, parent_segment_id: str) -> List["Segment"]:
-        # Find segments where:
-        # 1. There exists a mapping object with text_id matching parent_text_id
-        # 2. Within that same mapping object, segments list contains parent_segment_id
+    async def get_mapped_segments(cls, after_id: Optional[uuid.UUID], limit: int) -> List["Segment"]:
+        # ranged on _id so every page is an index seek, however far the backfill has got
+        query = {"mapping.0": {"$exists": True}}
+        if after_id is not None:
+            query["_id"] = {"$gt": after_id}
+        return await cls.find(query).sort("_id").limit(limit).to_list()
+
+    @classmethod
+    async def get_segments_mapped_to(cls, parent_segment_ids: List[str]) -> List["Segment"]:
+        # read straight from Segment.mapping, for parents whose edges have not been backfilled
         query = {
             "mapping": {
                 "$elemMatch": {
-                    "segments": {"$in": [parent_segment_id]}
+                    "segments": {"$in": parent_segment_ids}
                 }
             }
         }
         return await cls.find(query).to_list()
+
+    @classmethod
+    async def get_related_mapped_segments(cls, parent_segment_id: str) -> List["Segment"]:
+        # Segments whose mapping points at parent_segment_id, resolved through the edge index
+        segments_dict = await cls.get_related_mapped_segments_batch(parent_segment_ids=[parent_segment_id])
+        return segments_dict.get(parent_segment_id, [])
     
+    @classmethod
+    async def get_related_mapped_segments_by_text_id(
+        cls,
+        parent_segment_ids: List[str],
+        text_id: str
+    ) -> List["Segment"]:
+        # Only the segments of one mapped text (e.g. a version) are loaded, in a single query
+        if not parent_segment_ids:
+            return []
+        query = {
+            "text_id": text_id,
+            "mapping.segments": {"$in": parent_segment_ids}
+        }
+        return await cls.find(query).to_list()
+
     @classmethod
     async def get_segments_by_pecha_ids(
         cls, 
@@ -113,6 +199,15 @@ class Segment(Document):
     async def delete_segment_by_text_id(cls, text_id: str):
         return await cls.find(cls.text_id == text_id).delete()
 
+    @classmethod
+    async def delete_segments_by_ids(cls, segment_ids: List[str]):
+        segment_uuid_ids = [uuid.UUID(segment_id) for segment_id in segment_ids]
+        return await cls.find({"_id": {"$in": segment_uuid_ids}}).delete()
+
+    @classmethod
+    async def update_content_by_id(cls, segment_id: str, content: str):
+        return await cls.find(cls.id == uuid.UUID(segment_id)).update({"$set": {"content": content}})
+
     @classmethod
     async def get_related_mapped_segments_batch(
         cls, 
@@ -122,25 +217,48 @@ class Segment(Document):
 
         if not parent_segment_ids:
             return {}
-        
-        query = {
-            "mapping": {
-                "$elemMatch": {
-                    "segments": {"$in": parent_segment_ids}
-                }
-            }
+
+        edges = await SegmentMappingEdge.get_edges_by_parent_segment_ids(parent_segment_ids=parent_segment_ids)
+        parents_with_edges = {edge.parent_segment_id for edge in edges}
+        if text_types is not None:
+            edges = [edge for edge in edges if edge.child_text_type in text_types]
+
+        child_segment_ids = list({edge.child_segment_id for edge in edges})
+        segments_by_id = {
+            str(segment.id): segment
+            for segment in await cls.get_segments_by_ids(segment_ids=child_segment_ids)
         }
-        
-        segments = await cls.find(query).to_list()
-        
+
         result: Dict[str, List["Segment"]] = {pid: [] for pid in parent_segment_ids}
-        
+        seen_edges = set()
+        for edge in edges:
+            segment = segments_by_id.get(edge.child_segment_id)
+            if segment is None or (edge.parent_segment_id, edge.child_segment_id) in seen_edges:
+                continue
+            seen_edges.add((edge.parent_segment_id, edge.child_segment_id))
+            result[edge.parent_segment_id].append(segment)
+
+        parents_without_edges = [pid for pid in parent_segment_ids if pid not in parents_with_edges]
+        if parents_without_edges:
+            await cls._add_segments_mapped_to(result, parents_without_edges, text_types)
+
+        return result
+
+    @classmethod
+    async def _add_segments_mapped_to(
+        cls,
+        result: Dict[str, List["Segment"]],
+        parent_segment_ids: List[str],
+        text_types: Optional[List[str]]
+    ):
+        segments = await cls.get_segments_mapped_to(parent_segment_ids=parent_segment_ids)
+        if text_types is not None and segments:
+            texts = await Text.get_texts_by_ids(text_ids=list({segment.text_id for segment in segments}))
+            wanted_text_ids = {str(text.id) for text in texts if text.type.value in text_types}
+            segments = [segment for segment in segments if segment.text_id in wanted_text_ids]
+        requested_parent_ids = set(parent_segment_ids)
         for segment in segments:
-            if segment.mapping:
-                for mapping in segment.mapping:
-                    for parent_id in parent_segment_ids:
-                        if parent_id in mapping.segments:
-                            if segment not in result[parent_id]:
-                                result[parent_id].append(segment)
-        
-        return result
\ No newline at end of file
+            for mapping in segment.mapping or []:
+                for parent_id in mapping.segments:
+                    if parent_id in requested_parent_ids and segment not in result[parent_id]:
+                        result[parent_id].append(segment)
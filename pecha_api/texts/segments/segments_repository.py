@@ -3,7 +3,8 @@ from __future__ import annotations
 from uuid import UUID
 
 from pecha_api.constants import Constants
-from .segments_models import Segment
+from .segments_models import Segment, SegmentMappingEdge, SegmentMappingEdgeView
+from ..texts_models import Text
 from .segments_response_models import CreateSegmentRequest, SegmentDTO, MappingResponse, SegmentUpdateRequest
 import logging
 from beanie.exceptions import CollectionWasNotInitialized
@@ -11,6 +12,12 @@ from typing import List, Dict, Optional
 from fastapi import HTTPException
 from starlette import status
 from pecha_api.error_contants import ErrorConstants
+from pecha_api.search.search_indexer import (
+    sync_search_segments,
+    sync_search_segment_contents,
+    remove_search_segments,
+    remove_search_text
+)
 
 async def get_segments_by_pecha_segment_ids(pecha_segment_ids: List[str]) -> List[SegmentDTO]:
     try:
@@ -87,9 +94,20 @@ async def create_segment(create_segment_request: CreateSegmentRequest) -> List[S
     ]
     # Store the insert result but don't return it directly
     await Segment.insert_many(new_segment_list)
+    await sync_segment_mapping_edges(segments=new_segment_list)
+    await sync_search_segments(segments=new_segment_list)
 
     return new_segment_list
 
+async def bulk_insert_segments(segments: List[Segment]) -> List[Segment]:
+    # unordered, so the server writes the whole batch without stopping at the first failing document
+    await Segment.insert_many(segments, ordered=False)
+    mapped_segments = [segment for segment in segments if segment.mapping]
+    if mapped_segments:
+        await sync_segment_mapping_edges(segments=mapped_segments)
+    await sync_search_segments(segments=segments)
+    return segments
+
 async def get_related_mapped_segments(parent_segment_id: str) -> List[SegmentDTO]:
     try:
         segments = await Segment.get_related_mapped_segments(parent_segment_id=parent_segment_id)
@@ -126,14 +144,135 @@ async def get_related_mapped_segments_batch(
         logging.debug(e)
         return {}
 
+async def get_mapped_text_types_by_parent_segment_id(parent_segment_id: str) -> Dict[str, Optional[str]]:
+    # text_id -> text type of every text mapped to the segment, read from the edge index
+    try:
+        edges = await SegmentMappingEdge.get_edges_by_parent_segment_ids(parent_segment_ids=[parent_segment_id])
+        if edges:
+            return {edge.child_text_id: edge.child_text_type for edge in edges}
+        # not backfilled yet, fall back to Segment.mapping
+        segments = await Segment.get_segments_mapped_to(parent_segment_ids=[parent_segment_id])
+        if not segments:
+            return {}
+        texts = await Text.get_texts_by_ids(text_ids=list({segment.text_id for segment in segments}))
+        text_types = {str(text.id): text.type.value for text in texts}
+        return {segment.text_id: text_types.get(segment.text_id) for segment in segments}
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return {}
+
+async def sync_segment_mapping_edges(segments: List[Segment]) -> int:
+    try:
+        if not segments:
+            return 0
+        texts = await Text.get_texts_by_ids(text_ids=list({segment.text_id for segment in segments}))
+        text_types = {str(text.id): text.type.value for text in texts}
+        edges = _build_segment_mapping_edges(segments=segments, text_types=text_types)
+        await SegmentMappingEdge.replace_edges_by_child_segment_ids(
+            child_segment_ids=[str(segment.id) for segment in segments],
+            edges=edges
+        )
+        return len(edges)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return 0
+
+async def rebuild_segment_mapping_edges() -> int:
+    # backfills the edge index from Segment.mapping, one range of mapped segments at a time
+    total_edges = 0
+    last_id = None
+    while True:
+        try:
+            segments = await Segment.get_mapped_segments(after_id=last_id, limit=Constants.MAPPING_EDGE_REBUILD_BATCH_SIZE)
+        except CollectionWasNotInitialized as e:
+            logging.debug(e)
+            return total_edges
+        if not segments:
+            logging.info(f"Segment mapping edges rebuilt with {total_edges} edges")
+            return total_edges
+        total_edges += await sync_segment_mapping_edges(segments=segments)
+        last_id = segments[-1].id
+
+def _build_segment_mapping_edges(segments: List[Segment], text_types: Dict[str, str]) -> List[SegmentMappingEdgeView]:
+    edges: List[SegmentMappingEdgeView] = []
+    seen_edges = set()
+    for segment in segments:
+        child_segment_id = str(segment.id)
+        for mapping in segment.mapping or []:
+            for parent_segment_id in mapping.segments:
+                if (parent_segment_id, child_segment_id) in seen_edges:
+                    continue
+                seen_edges.add((parent_segment_id, child_segment_id))
+                edges.append(SegmentMappingEdgeView(
+                    parent_segment_id=parent_segment_id,
+                    child_segment_id=child_segment_id,
+                    child_text_id=segment.text_id,
+                    child_text_type=text_types.get(segment.text_id)
+                ))
+    return edges
+
+async def get_related_mapped_segments_by_text_id(
+    parent_segment_ids: List[str],
+    text_id: str
+) -> Dict[str, List[SegmentDTO]]:
+    try:
+        if not parent_segment_ids:
+            return {}
+        segments = await Segment.get_related_mapped_segments_by_text_id(
+            parent_segment_ids=parent_segment_ids,
+            text_id=text_id
+        )
+        requested_parent_ids = set(parent_segment_ids)
+        result: Dict[str, List[SegmentDTO]] = {}
+        for segment in segments:
+            segment_dto = SegmentDTO(
+                id=str(segment.id),
+                text_id=segment.text_id,
+                content=segment.content,
+                mapping=[MappingResponse(**mapping.model_dump()) for mapping in segment.mapping] if segment.mapping else [],
+                type=segment.type
+            )
+            linked_parent_ids = {
+                parent_id
+                for mapping in segment.mapping or []
+                for parent_id in mapping.segments
+                if parent_id in requested_parent_ids
+            }
+            for parent_id in linked_parent_ids:
+                result.setdefault(parent_id, []).append(segment_dto)
+        return result
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return {}
+
 async def delete_segments_by_text_id(text_id: str):
     try:
         await Segment.delete_segment_by_text_id(text_id=text_id)
+        await SegmentMappingEdge.delete_edges_by_child_text_id(text_id=text_id)
+        await remove_search_text(text_id=text_id)
     except CollectionWasNotInitialized as e:
         logging.debug(e)
         return False
 
 
+async def delete_segments_by_ids(segment_ids: List[str]):
+    try:
+        await Segment.delete_segments_by_ids(segment_ids=segment_ids)
+        await SegmentMappingEdge.replace_edges_by_child_segment_ids(child_segment_ids=segment_ids, edges=[])
+        await remove_search_segments(segment_ids=segment_ids)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+
+
+async def update_segments_content(segments_content: Dict[str, str]):
+    try:
+        for segment_id, content in segments_content.items():
+            await Segment.update_content_by_id(segment_id=segment_id, content=content)
+        await sync_search_segment_contents(segments_content=segments_content)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+
+
 async def update_segment_by_id(segment_update_request: SegmentUpdateRequest) -> SegmentDTO | None:
     try:
         for segment_update in segment_update_request.segments:
@@ -142,6 +281,7 @@ async def update_segment_by_id(segment_update_request: SegmentUpdateRequest) ->
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.SEGMENT_NOT_FOUND_MESSAGE)
             segment.content = segment_update.content
             await segment.save()
+            await sync_search_segments(segments=[segment])
         
         return segment
     except CollectionWasNotInitialized as e:
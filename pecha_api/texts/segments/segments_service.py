@@ -5,6 +5,7 @@ from .segments_repository import (
     get_segments_by_ids,
     get_related_mapped_segments,
     get_related_mapped_segments_batch,
+    get_mapped_text_types_by_parent_segment_id,
     get_segments_by_text_id,
     delete_segments_by_text_id,
     update_segment_by_id
@@ -21,6 +22,8 @@ from .segments_response_models import (
 )
 
 from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.single_flight import single_flight
+from pecha_api.utils import Utils
 
 from fastapi import HTTPException
 from starlette import status
@@ -58,15 +61,24 @@ from ..texts_repository import get_text_by_pecha_text_id
 from ...users.users_service import validate_user_exists
 
 async def get_segments_details_by_ids(segment_ids: List[str]) -> Dict[str, SegmentDTO]:
-    cached_data: Dict[str, SegmentDTO] = await get_segments_details_by_ids_cache(segment_ids=segment_ids, cache_type=CacheType.SEGMENTS_DETAILS)
+    async def _load_segments_details_by_ids() -> Dict[str, SegmentDTO]:
+        segments: Dict[str, SegmentDTO] = await get_segments_by_ids(segment_ids=segment_ids)
+        await set_segments_details_by_ids_cache(segment_ids=segment_ids, cache_type=CacheType.SEGMENTS_DETAILS, data=segments)
+        return segments
+
+    cached_data: Dict[str, SegmentDTO] = await get_segments_details_by_ids_cache(
+        segment_ids=segment_ids,
+        cache_type=CacheType.SEGMENTS_DETAILS,
+        refresh=_load_segments_details_by_ids
+    )
     if cached_data is not None:
         return cached_data
-    
-    segments: Dict[str, SegmentDTO] = await get_segments_by_ids(segment_ids=segment_ids)
-    
-    await set_segments_details_by_ids_cache(segment_ids=segment_ids, cache_type=CacheType.SEGMENTS_DETAILS, data=segments)
-    
-    return segments
+
+    return await single_flight(
+        key=f"{CacheType.SEGMENTS_DETAILS.value}:{Utils.generate_hash_key(payload=list(segment_ids))}",
+        loader=_load_segments_details_by_ids,
+        read=lambda: get_segments_details_by_ids_cache(segment_ids=segment_ids, cache_type=CacheType.SEGMENTS_DETAILS)
+    )
 
 async def get_segment_details_by_id(segment_id: str, text_details: bool = False) -> SegmentDTO:
     
@@ -163,8 +175,8 @@ async def get_info_by_segment_id(segment_id: str) -> SegmentInfoResponse:
         return cache_data
     segment = await get_segment_by_id(segment_id=segment_id)
     text_detail=await TextUtils.get_text_details_by_id(text_id=segment.text_id)
-    mapped_segments = await get_related_mapped_segments(parent_segment_id=segment_id)
-    counts = await SegmentUtils.get_count_of_each_commentary_and_version(mapped_segments,parent_text=text_detail)
+    mapped_text_types = await get_mapped_text_types_by_parent_segment_id(parent_segment_id=segment_id)
+    counts = SegmentUtils.get_count_of_each_commentary_and_version_by_text_types(mapped_text_types, parent_text=text_detail)
     segment_root_mapping_count = await SegmentUtils.get_root_mapping_count(segment_id=segment_id)
     response = SegmentInfoResponse(
         segment_info= SegmentInfo(
@@ -13,7 +13,8 @@ from .segments_repository import (
     check_segment_exists,
     check_all_segment_exists,
     get_segment_by_id,
-    get_related_mapped_segments,
+    get_segments_by_ids,
+    get_related_mapped_segments_by_text_id,
 )
 from ..texts_response_models import TextDTO
 from ..texts_repository import get_contents_by_id
@@ -121,6 +122,22 @@ class SegmentUtils:
                 count["version"] += 1
         return count
 
+    @staticmethod
+    def get_count_of_each_commentary_and_version_by_text_types(
+        mapped_text_types: Dict[str, Optional[str]],
+        parent_text: TextDTO
+    ) -> Dict[str, int]:
+        """
+        Count the mapped commentary and version texts from a text_id -> text type mapping.
+        """
+        count = {"commentary": 0, "version": 0}
+        for text_type in mapped_text_types.values():
+            if text_type == "commentary":
+                count["commentary"] += 1
+            elif text_type == "version" and text_type == parent_text.type:
+                count["version"] += 1
+        return count
+
     @staticmethod
     async def filter_segment_mapping_by_type_or_text_id(
         segments: List[SegmentDTO], type: str, text_id: Optional[str] = None
@@ -210,23 +227,27 @@ class SegmentUtils:
     ) -> DetailTableOfContent:
         """
         Convert a TableOfContent model to a DetailTableOfContent model by enriching
-        each segment with detailed information fetched from get_segment_details_by_id.
+        each segment with its content and, when a version_id is given, its translation.
+
+        All segment contents are loaded with a single batched query and all translations
+        with a single mapping query scoped to the version text, so the number of database
+        round trips does not grow with the number of segments on the page.
         
         Args:
             table_of_content: The TableOfContent model to be converted
+            version_id: Optional ID of the version text used for translations
             
         Returns:
             A DetailTableOfContent model with enriched segment details
         """
-        
-        # Create a new DetailTableOfContent with the same base attributes
-        detail_table_of_content = DetailTableOfContent(
-            id=str(table_of_content.id) if table_of_content.id else None,
-            text_id=table_of_content.text_id,
-            sections=[]
+        segment_ids = TextUtils.get_all_segment_ids(table_of_content=table_of_content)
+        segments_dict = await get_segments_by_ids(segment_ids=segment_ids)
+        translations_dict = await SegmentUtils._get_version_translations_by_segment_ids(
+            segment_ids=segment_ids,
+            version_id=version_id
         )
-        
-        async def process_section(section) -> DetailSection:
+
+        def process_section(section) -> DetailSection:
             detail_section = DetailSection(
                 id=section.id,
                 title=section.title,
@@ -238,48 +259,51 @@ class SegmentUtils:
                 updated_date=section.updated_date,
                 published_date=section.published_date,
             )
-            # Process segments
             for segment in section.segments:
-                segment_details = await get_segment_by_id(segment_id=segment.segment_id)
-                translation = None
-                if version_id is not None:
-                    version_text_detail = await TextUtils.get_text_details_by_id(text_id=version_id)
-                    segments = await get_related_mapped_segments(parent_segment_id=segment.segment_id)
-                    filtered_translation_by_version_id = await SegmentUtils.filter_segment_mapping_by_type_or_text_id(
-                        segments=segments,
-                        type=TextType.VERSION.value,
-                        text_id=version_id #pass the version_id so that only the mapping with a particular text_id is selected
+                segment_details = segments_dict.get(segment.segment_id)
+                detail_section.segments.append(
+                    DetailTextSegment(
+                        segment_id=segment.segment_id,
+                        segment_number=segment.segment_number,
+                        content=segment_details.content if segment_details else None,
+                        translation=translations_dict.get(segment.segment_id)
                     )
-                    if filtered_translation_by_version_id:
-                        translation = Translation(
-                            text_id=filtered_translation_by_version_id[0].text_id,
-                            language=version_text_detail.language,
-                            content=filtered_translation_by_version_id[0].content
-                        )
-                # Create DetailTextSegment with enriched information
-                detail_segment = DetailTextSegment(
-                    segment_id=segment.segment_id,
-                    segment_number=segment.segment_number,
-                    content=segment_details.content,
-                    translation=translation
                 )
-                
-                detail_section.segments.append(detail_segment)
-            
-            # Process nested sections recursively
             if section.sections:
                 for subsection in section.sections:
-                    detail_subsection = await process_section(subsection)
-                    detail_section.sections.append(detail_subsection)
-            
+                    detail_section.sections.append(process_section(subsection))
             return detail_section
-        
-        # Process all top-level sections
-        for section in table_of_content.sections:
-            detail_section = await process_section(section)
-            detail_table_of_content.sections.append(detail_section)
-        
-        return detail_table_of_content
+
+        return DetailTableOfContent(
+            id=str(table_of_content.id) if table_of_content.id else None,
+            text_id=table_of_content.text_id,
+            sections=[process_section(section) for section in table_of_content.sections]
+        )
+
+    @staticmethod
+    async def _get_version_translations_by_segment_ids(
+        segment_ids: List[str], version_id: Optional[str]
+    ) -> Dict[str, Translation]:
+        if version_id is None or not segment_ids:
+            return {}
+        version_text_detail = await TextUtils.get_text_details_by_id(text_id=version_id)
+        if str(version_text_detail.id) in Constants.excluded_text_ids:
+            return {}
+        if version_text_detail.type != TextType.VERSION.value:
+            return {}
+        mapped_segments_dict = await get_related_mapped_segments_by_text_id(
+            parent_segment_ids=segment_ids,
+            text_id=version_id
+        )
+        return {
+            parent_segment_id: Translation(
+                text_id=mapped_segments[0].text_id,
+                language=version_text_detail.language,
+                content=mapped_segments[0].content
+            )
+            for parent_segment_id, mapped_segments in mapped_segments_dict.items()
+            if mapped_segments
+        }
     
     @staticmethod
     async def get_segment_root_mapping_details(segments: List[SegmentDTO], parent_segment_text: TextDTO) -> List[SegmentRootMapping]:
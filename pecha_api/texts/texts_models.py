@@ -2,10 +2,11 @@ import uuid
 from uuid import UUID
 from typing import List, Optional
 
-from .texts_response_models import Section
+from .texts_response_models import Section, SectionPathItem, TableOfContentSegmentIndexEntry
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 from beanie import Document
+from pymongo import ASCENDING, IndexModel
 
 from pecha_api.sheets.sheets_enum import (
     SortBy, 
@@ -14,6 +15,19 @@ from pecha_api.sheets.sheets_enum import (
 
 from .texts_enums import TextType
 from .texts_response_models import TextDTO, TableOfContentType
+from pecha_api.constants import Constants
+
+def _sections_have_segments(sections: List[Section]) -> bool:
+    return any(section.segments or _sections_have_segments(sections=section.sections or []) for section in sections)
+
+
+class TableOfContentSectionsPage(BaseModel):
+    id: uuid.UUID = Field(alias="_id")
+    text_id: str
+    type: Optional[TableOfContentType] = None
+    sections: List[Section]
+    total_sections: int
+
 
 class TableOfContent(Document):
     id: uuid.UUID = Field(default_factory=uuid.uuid4)
@@ -29,26 +43,169 @@ class TableOfContent(Document):
         query = cls.find(cls.text_id == text_id)
         return await query.to_list()
 
+    @classmethod
+    async def get_content_ids_by_text_id(cls, text_id: str) -> List[str]:
+        # same order as get_table_of_contents_by_text_id, without loading the sections
+        contents = await cls.find(cls.text_id == text_id).aggregate([{"$project": {"_id": 1}}]).to_list()
+        return [str(content["_id"]) for content in contents]
+
+    @classmethod
+    async def has_segments(cls, content_id: str) -> bool:
+        table_of_content = await cls.get(UUID(content_id))
+        return table_of_content is not None and _sections_have_segments(sections=table_of_content.sections)
+
+    @classmethod
+    async def update_sections_by_id(cls, content_id: str, sections: List[Section]):
+        return await cls.find(cls.id == UUID(content_id)).update(
+            {"$set": {"sections": [section.model_dump() for section in sections]}}
+        )
+
+    @classmethod
+    async def get_table_of_contents_by_text_ids(cls, text_ids: List[str]) -> List["TableOfContent"]:
+        return await cls.find({"text_id": {"$in": text_ids}}).to_list()
+
     @classmethod
     async def delete_table_of_content_by_text_id(cls, text_id: str):
         return await cls.find(cls.text_id == text_id).delete()
     
     @classmethod
     async def get_sections_count(cls, content_id: str) -> int:
-        table_of_content = await cls.find_one(cls.id == UUID(content_id))
-        if table_of_content and hasattr(table_of_content, "sections"):
-            return len(table_of_content.sections)
+        pipeline = [{"$project": {"total_sections": {"$size": {"$ifNull": ["$sections", []]}}}}]
+        result = await cls.find(cls.id == UUID(content_id)).aggregate(pipeline).to_list()
+        if result:
+            return result[0]["total_sections"]
         return 0
     
     @classmethod
     async def get_table_of_content_by_content_id(cls, content_id: str, skip: int = None, limit: int = None) -> Optional["TableOfContent"]:
-        contents = await cls.find_one(cls.id == UUID(content_id))
-        if contents and skip is not None and limit is not None:
-            contents.sections.sort(key=lambda section: section.section_number)
-            if (skip * limit) > len(contents.sections):
-                return None
-            contents.sections = contents.sections[skip * limit:skip+limit]
-        return contents
+        if skip is None or limit is None:
+            return await cls.find_one(cls.id == UUID(content_id))
+        pages = await cls.find(cls.id == UUID(content_id)).aggregate(
+            cls._paginated_sections_pipeline(skip=skip, limit=limit, first_segment_only=False),
+            projection_model=TableOfContentSectionsPage
+        ).to_list()
+        if not pages or skip > pages[0].total_sections:
+            return None
+        page = pages[0]
+        return cls(id=page.id, text_id=page.text_id, type=page.type, sections=page.sections)
+
+    @classmethod
+    async def get_paginated_table_of_contents_by_text_id(cls, text_id: str, skip: int, limit: int) -> List[TableOfContentSectionsPage]:
+        # only the first segment of each section is returned, as a section header preview
+        return await cls.find(cls.text_id == text_id).aggregate(
+            cls._paginated_sections_pipeline(skip=skip, limit=limit, first_segment_only=True),
+            projection_model=TableOfContentSectionsPage
+        ).to_list()
+
+    @staticmethod
+    def _paginated_sections_pipeline(skip: int, limit: int, first_segment_only: bool) -> List[dict]:
+        sections = "$sections"
+        if first_segment_only:
+            sections = {
+                "$filter": {
+                    "input": {"$ifNull": ["$sections", []]},
+                    "as": "section",
+                    "cond": {"$gt": [{"$size": {"$ifNull": ["$$section.segments", []]}}, 0]}
+                }
+            }
+        sorted_sections = {"$sortArray": {"input": {"$ifNull": [sections, []]}, "sortBy": {"section_number": 1}}}
+        pipeline = [
+            {"$project": {"text_id": 1, "type": 1, "sections": sorted_sections}},
+            {
+                "$project": {
+                    "text_id": 1,
+                    "type": 1,
+                    "total_sections": {"$size": "$sections"},
+                    "sections": {"$slice": ["$sections", skip, limit]} if limit > 0 else []
+                }
+            }
+        ]
+        if first_segment_only:
+            pipeline.append({
+                "$set": {
+                    "sections": {
+                        "$map": {
+                            "input": "$sections",
+                            "as": "section",
+                            "in": {"$mergeObjects": ["$$section", {"segments": {"$slice": ["$$section.segments", 1]}}]}
+                        }
+                    }
+                }
+            })
+        return pipeline
+
+
+class TableOfContentSegmentIndex(Document):
+    # flattened segment_id -> (position, section path) index of a table of content, one entry per segment
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    content_id: str
+    text_id: str
+    type: Optional[TableOfContentType] = None
+    index_version: int = Constants.TABLE_OF_CONTENT_SEGMENT_INDEX_VERSION
+    segment_id: str
+    segment_number: int
+    position: int
+    section_path: List[SectionPathItem]
+
+    class Settings:
+        collection = "table_of_content_segment_index"
+        indexes = [
+            IndexModel([("content_id", ASCENDING), ("index_version", ASCENDING), ("position", ASCENDING)], unique=True),
+            IndexModel([("text_id", ASCENDING), ("index_version", ASCENDING), ("segment_id", ASCENDING)]),
+            IndexModel([("text_id", ASCENDING), ("index_version", ASCENDING), ("position", ASCENDING)])
+        ]
+
+    @classmethod
+    async def replace_index(cls, content_id: str, entries: List[TableOfContentSegmentIndexEntry]) -> int:
+        await cls.find(cls.content_id == content_id).delete()
+        if entries:
+            await cls.insert_many([cls(**entry.model_dump()) for entry in entries], ordered=False)
+        return len(entries)
+
+    @classmethod
+    async def delete_index_by_text_id(cls, text_id: str):
+        return await cls.find(cls.text_id == text_id).delete()
+
+    @classmethod
+    async def get_anchor_entry(
+        cls,
+        text_id: str,
+        content_id: Optional[str] = None,
+        segment_id: Optional[str] = None
+    ) -> Optional["TableOfContentSegmentIndex"]:
+        query = {"index_version": Constants.TABLE_OF_CONTENT_SEGMENT_INDEX_VERSION}
+        if segment_id is None:
+            query.update({"text_id": text_id, "position": 1})
+            anchors = {anchor.content_id: anchor for anchor in await cls.find(query).to_list()}
+            # open the first table of content with segments, as walking them does
+            for table_of_content_id in await TableOfContent.get_content_ids_by_text_id(text_id=text_id):
+                if table_of_content_id in anchors:
+                    return anchors[table_of_content_id]
+                if await TableOfContent.has_segments(content_id=table_of_content_id):
+                    # not indexed yet: let the caller walk the tree
+                    return None
+            return None
+        if content_id is not None:
+            query.update({"content_id": content_id, "segment_id": segment_id})
+        else:
+            query.update({"text_id": text_id, "segment_id": segment_id})
+        return await cls.find_one(query)
+
+    @classmethod
+    async def count_by_content_id(cls, content_id: str) -> int:
+        return await cls.find({
+            "content_id": content_id,
+            "index_version": Constants.TABLE_OF_CONTENT_SEGMENT_INDEX_VERSION
+        }).count()
+
+    @classmethod
+    async def get_entries_by_position_range(cls, content_id: str, start: int, end: int) -> List["TableOfContentSegmentIndex"]:
+        query = {
+            "content_id": content_id,
+            "index_version": Constants.TABLE_OF_CONTENT_SEGMENT_INDEX_VERSION,
+            "position": {"$gte": start, "$lte": end}
+        }
+        return await cls.find(query).sort("position").to_list()
 
 
 class Text(Document):
@@ -69,6 +226,7 @@ class Text(Document):
     categories: Optional[List[str]] = None
     views: Optional[int] = 0
     likes: Optional[List[str]] = []
+    summary: Optional[str] = None
 
     class Settings:
         collection = "texts"
@@ -210,6 +368,10 @@ class Text(Document):
     async def delete_text_by_id(cls, text_id: UUID):
         return await cls.find_one(cls.id == text_id).delete()
 
+    @classmethod
+    async def update_summary_by_id(cls, text_id: UUID, summary: str):
+        return await cls.find(cls.id == text_id).update({"$set": {"summary": summary}})
+
 
     @classmethod
     async def get_sheets(
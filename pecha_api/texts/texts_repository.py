@@ -8,7 +8,9 @@ from beanie.exceptions import CollectionWasNotInitialized
 from pecha_api.constants import Constants
 from .texts_response_models import (
     CreateTextRequest, 
+    Section,
     TableOfContent, 
+    TableOfContentSegmentIndexEntry,
     TextDTO,
     UpdateTextRequest
 )
@@ -16,7 +18,7 @@ from pecha_api.sheets.sheets_enum import (
     SortBy, 
     SortOrder
 )
-from .texts_models import Text, TableOfContent
+from .texts_models import Text, TableOfContent, TableOfContentSegmentIndex, TableOfContentSectionsPage
 from datetime import datetime, timezone
 from pecha_api.utils import Utils
 
@@ -195,14 +197,69 @@ async def create_table_of_content_detail(table_of_content_request: TableOfConten
 
 async def get_contents_by_id(text_id: str) -> List[TableOfContent]:
     return await TableOfContent.get_table_of_contents_by_text_id(text_id=text_id)
+
+async def get_contents_by_text_ids(text_ids: List[str]) -> List[TableOfContent]:
+    try:
+        return await TableOfContent.get_table_of_contents_by_text_ids(text_ids=text_ids)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return []
+    
+async def get_paginated_table_of_contents_by_text_id(text_id: str, skip: int, limit: int) -> List[TableOfContentSectionsPage]:
+    try:
+        return await TableOfContent.get_paginated_table_of_contents_by_text_id(text_id=text_id, skip=skip, limit=limit)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return []
     
 async def get_table_of_content_by_content_id(content_id: str, skip: int = None, limit: int = None) -> Optional[TableOfContent]:
     return await TableOfContent.get_table_of_content_by_content_id(content_id=content_id, skip=skip, limit=limit)
 
 
 async def delete_table_of_content_by_text_id(text_id: str):
+    await delete_table_of_content_segment_index_by_text_id(text_id=text_id)
     return await TableOfContent.delete_table_of_content_by_text_id(text_id=text_id)
 
+async def update_table_of_content_sections(content_id: str, sections: List[Section]):
+    try:
+        await TableOfContent.update_sections_by_id(content_id=content_id, sections=sections)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+
+async def replace_table_of_content_segment_index(content_id: str, entries: List[TableOfContentSegmentIndexEntry]) -> int:
+    try:
+        return await TableOfContentSegmentIndex.replace_index(content_id=content_id, entries=entries)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return 0
+
+async def delete_table_of_content_segment_index_by_text_id(text_id: str):
+    try:
+        await TableOfContentSegmentIndex.delete_index_by_text_id(text_id=text_id)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+
+async def get_table_of_content_segment_index_anchor(
+    text_id: str,
+    content_id: Optional[str] = None,
+    segment_id: Optional[str] = None
+) -> TableOfContentSegmentIndex | None:
+    try:
+        return await TableOfContentSegmentIndex.get_anchor_entry(text_id=text_id, content_id=content_id, segment_id=segment_id)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return None
+
+async def get_table_of_content_segment_index_count(content_id: str) -> int:
+    try:
+        return await TableOfContentSegmentIndex.count_by_content_id(content_id=content_id)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+        return 0
+
+async def get_table_of_content_segment_index_range(content_id: str, start: int, end: int) -> List[TableOfContentSegmentIndex]:
+    return await TableOfContentSegmentIndex.get_entries_by_position_range(content_id=content_id, start=start, end=end)
+
 async def update_text_details_by_id(text_id: str, update_text_request: UpdateTextRequest) -> TextDTO:
     text_details = await Text.get_text(text_id=text_id)
     text_details.title = update_text_request.title
@@ -211,6 +268,12 @@ async def update_text_details_by_id(text_id: str, update_text_request: UpdateTex
     await text_details.save()
     return text_details
 
+async def update_sheet_summary(text_id: str, summary: str):
+    try:
+        await Text.update_summary_by_id(text_id=UUID(text_id), summary=summary)
+    except CollectionWasNotInitialized as e:
+        logging.debug(e)
+
 async def delete_text_by_id(text_id: str):
     try:
         text_uuid = UUID(text_id)
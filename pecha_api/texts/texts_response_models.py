@@ -116,6 +116,25 @@ class TableOfContent(BaseModel):
     type: TableOfContentType
     text_id: str
     sections: List[Section]
+    total_sections: Optional[int] = None
+
+class SectionPathItem(BaseModel):
+    id: str
+    title: Optional[str] = None
+    section_number: int
+    parent_id: Optional[str] = None
+    created_date: Optional[str] = None
+    updated_date: Optional[str] = None
+    published_date: Optional[str] = None
+
+class TableOfContentSegmentIndexEntry(BaseModel):
+    content_id: str
+    text_id: str
+    type: Optional[TableOfContentType] = None
+    segment_id: str
+    segment_number: int
+    position: int
+    section_path: List[SectionPathItem]
 
 class TableOfContentResponse(BaseModel):
     text_detail: TextDTO
@@ -19,8 +19,13 @@ from .texts_repository import (
     get_all_texts_by_collection,
     get_all_recitation_texts_by_collection,
     get_texts_by_pecha_text_ids,
-    get_texts_by_titles
-
+    get_texts_by_titles,
+    get_paginated_table_of_contents_by_text_id,
+    replace_table_of_content_segment_index,
+    update_table_of_content_sections,
+    get_table_of_content_segment_index_anchor,
+    get_table_of_content_segment_index_count,
+    get_table_of_content_segment_index_range
 )
 from .texts_response_models import (
     TableOfContent,
@@ -78,10 +83,12 @@ from pecha_api.sheets.sheets_enum import (
     SortOrder
 )
 from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.single_flight import single_flight
 
 from .texts_utils import TextUtils
 from pecha_api.users.users_service import validate_user_exists
 from pecha_api.collections.collections_service import get_collection
+from pecha_api.collections.collections_cache_service import invalidate_collection_cache
 from pecha_api.users.users_service import (
     validate_user_exists
 )
@@ -122,43 +129,60 @@ async def get_text_by_text_id_or_collection(
     if language is None:
         language = get("DEFAULT_LANGUAGE")
 
+    async def _load_text_by_text_id_or_collection() -> TextsCategoryResponse | TextDTO:
+        if collection_id is not None:
+            collection = await get_collection(collection_id=collection_id, language=language)
+            texts, total_unique_group_ids = await _get_texts_by_collection_id(collection_id=collection_id, language=language, skip=skip, limit=limit)
+
+            response = TextsCategoryResponse(
+                collection=collection,
+                texts=texts,
+                total=total_unique_group_ids,
+                skip=skip,
+                limit=limit
+            )
+        else:
+            response = await TextUtils.get_text_detail_by_id(text_id=text_id)
+
+        await set_text_by_text_id_or_collection_cache(
+            text_id = text_id,
+            collection_id = collection_id,
+            language = language,
+            skip = skip,
+            limit = limit,
+            cache_type = CacheType.TEXTS_BY_ID_OR_COLLECTION,
+            data = response
+        )
+        return response
+
+    async def _read_text_by_text_id_or_collection_cache() -> TextsCategoryResponse | TextDTO:
+        return await get_text_by_text_id_or_collection_cache(
+            text_id = text_id,
+            collection_id = collection_id,
+            language = language,
+            skip = skip,
+            limit = limit,
+            cache_type = CacheType.TEXTS_BY_ID_OR_COLLECTION
+        )
+
     cached_data: TextsCategoryResponse | TextDTO = await get_text_by_text_id_or_collection_cache(
         text_id = text_id,
         collection_id = collection_id,
         language = language,
         skip = skip,
         limit = limit,
-        cache_type = CacheType.TEXTS_BY_ID_OR_COLLECTION
+        cache_type = CacheType.TEXTS_BY_ID_OR_COLLECTION,
+        refresh = _load_text_by_text_id_or_collection
     )
 
     if cached_data is not None:
         return cached_data
 
-    if collection_id is not None:
-        collection = await get_collection(collection_id=collection_id, language=language)
-        texts, total_unique_group_ids = await _get_texts_by_collection_id(collection_id=collection_id, language=language, skip=skip, limit=limit)
-    
-        response = TextsCategoryResponse(
-            collection=collection,
-            texts=texts,
-            total=total_unique_group_ids,
-            skip=skip,
-            limit=limit
-        )
-    else:
-        response = await TextUtils.get_text_detail_by_id(text_id=text_id)
-    
-    await set_text_by_text_id_or_collection_cache(
-        text_id = text_id,
-        collection_id = collection_id,
-        language = language,
-        skip = skip,
-        limit = limit,
-        cache_type = CacheType.TEXTS_BY_ID_OR_COLLECTION,
-        data = response
+    return await single_flight(
+        key=f"{CacheType.TEXTS_BY_ID_OR_COLLECTION.value}:{text_id}:{collection_id}:{language}:{skip}:{limit}",
+        loader=_load_text_by_text_id_or_collection,
+        read=_read_text_by_text_id_or_collection_cache
     )
-    return response
-
 
 async def get_titles_and_ids_by_query(
     title: Optional[str],
@@ -224,23 +248,34 @@ async def get_sheet(published_by: Optional[str] = None, is_published: Optional[b
     return sheets
 
 async def get_table_of_content_by_sheet_id(sheet_id: str) -> Optional[TableOfContent]:
-    cached_data: TableOfContent = await get_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT)
+    async def _load_table_of_content_by_sheet_id() -> Optional[TableOfContent]:
+        table_of_content = None
+        is_valid_sheet: bool = await TextUtils.validate_text_exists(text_id=sheet_id)
+        if not is_valid_sheet:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TEXT_NOT_FOUND_MESSAGE)
+
+        table_of_contents: List[TableOfContent] = await get_contents_by_id(text_id=sheet_id)
+        if len(table_of_contents) > 0 and table_of_contents[0] is not None:
+            table_of_content: TableOfContent = table_of_contents[0]
+
+        if table_of_content is not None:
+            await set_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT, data=table_of_content)
+
+        return table_of_content
+
+    cached_data: TableOfContent = await get_table_of_content_by_sheet_id_cache(
+        sheet_id=sheet_id,
+        cache_type=CacheType.SHEET_TABLE_OF_CONTENT,
+        refresh=_load_table_of_content_by_sheet_id
+    )
     if cached_data is not None:
         return cached_data
-    
-    table_of_content = None
-    is_valid_sheet: bool = await TextUtils.validate_text_exists(text_id=sheet_id)
-    if not is_valid_sheet:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TEXT_NOT_FOUND_MESSAGE)
-    
-    table_of_contents: List[TableOfContent] = await get_contents_by_id(text_id=sheet_id)
-    if len(table_of_contents) > 0 and table_of_contents[0] is not None:
-        table_of_content: TableOfContent = table_of_contents[0]
-    
-    if table_of_content is not None:
-        await set_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT, data=table_of_content)
-    
-    return table_of_content
+
+    return await single_flight(
+        key=f"{CacheType.SHEET_TABLE_OF_CONTENT.value}:{sheet_id}",
+        loader=_load_table_of_content_by_sheet_id,
+        read=lambda: get_table_of_content_by_sheet_id_cache(sheet_id=sheet_id, cache_type=CacheType.SHEET_TABLE_OF_CONTENT)
+    )
 
 async def get_table_of_contents_by_text_id(text_id: str, language: str = None, skip: int = 0, limit: int = 10) -> TableOfContentResponse:
     
@@ -258,7 +293,7 @@ async def get_table_of_contents_by_text_id(text_id: str, language: str = None, s
     root_text: TextDTO = filtered_text_on_root_and_version[TextType.ROOT_TEXT.value]
     if root_text is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.TEXT_NOT_FOUND_MESSAGE)
-    table_of_contents: List[TableOfContent] = await get_contents_by_id(text_id=root_text.id)
+    table_of_contents = await get_paginated_table_of_contents_by_text_id(text_id=root_text.id, skip=skip, limit=limit)
 
     response = TableOfContentResponse(
         text_detail=root_text,
@@ -267,7 +302,8 @@ async def get_table_of_contents_by_text_id(text_id: str, language: str = None, s
                 id=str(content.id),
                 text_id=content.text_id,
                 type=content.type if content.type else TableOfContentType.TEXT,
-                sections=_get_paginated_sections(sections=content.sections, skip=skip, limit=limit)
+                sections=content.sections,
+                total_sections=content.total_sections
             )
             for content in table_of_contents
         ]
@@ -275,28 +311,6 @@ async def get_table_of_contents_by_text_id(text_id: str, language: str = None, s
     
     return response
 
-def _get_paginated_sections(sections: List[Section], skip: int, limit: int) -> List[Section]:
-    filtered_sections = [] 
-    skip_index = skip
-    limit_index = skip + limit
-    for section in sections:
-        first_segment = section.segments[0]
-        if section.segments:
-            new_section = Section(
-                id=section.id,
-                title=section.title,
-                section_number=section.section_number,
-                parent_id=section.parent_id,
-                segments=[first_segment],
-                sections=section.sections if section.sections else None,
-                created_date=section.created_date,
-                updated_date=section.updated_date,
-                published_date=section.published_date
-            )
-            filtered_sections.append(new_section)
-
-    return filtered_sections[skip_index:limit_index]
-
 async def remove_table_of_content_by_text_id(text_id: str):
     is_valid_text = await TextUtils.validate_text_exists(text_id=text_id)
     if not is_valid_text:
@@ -315,26 +329,35 @@ async def get_text_details_by_text_id(
         text_details_request=text_details_request
     )
     selected_text = await TextUtils.get_text_detail_by_id(text_id=text_id)
-    
-    table_of_content: TableOfContent = await _receive_table_of_content(
+
+    paginated_from_index = await _get_paginated_table_of_content_from_segment_index_(
         text_id=text_id,
         text_details_request=text_details_request
     )
-    segments_with_position: List[Tuple[str, int]] = _get_segments_with_position_(
-        table_of_content=table_of_content,
-    )
-    total_segments = len(segments_with_position)
-    trimmed_segment_dict = _get_trimmed_segment_dict_(
-        segments_with_position=segments_with_position,
-        segment_id=text_details_request.segment_id,
-        direction=text_details_request.direction,
-        size=text_details_request.size
-    )
-    current_segment_position = trimmed_segment_dict.get(text_details_request.segment_id)
-    paginated_table_of_content: TableOfContent = _generate_paginated_table_of_content_by_segments_(
-        table_of_content = table_of_content,
-        segment_dict = trimmed_segment_dict
-    )
+    if paginated_from_index is not None:
+        paginated_table_of_content, total_segments, current_segment_position = paginated_from_index
+    else:
+        table_of_content: TableOfContent = await _receive_table_of_content(
+            text_id=text_id,
+            text_details_request=text_details_request
+        )
+        segments_with_position: List[Tuple[str, int]] = _get_segments_with_position_(
+            table_of_content=table_of_content,
+        )
+        total_segments = len(segments_with_position)
+        trimmed_segment_dict = _get_trimmed_segment_dict_(
+            segments_with_position=segments_with_position,
+            segment_id=text_details_request.segment_id,
+            direction=text_details_request.direction,
+            size=text_details_request.size
+        )
+        current_segment_position = trimmed_segment_dict.get(text_details_request.segment_id)
+        paginated_table_of_content: TableOfContent = _generate_paginated_table_of_content_by_segments_(
+            table_of_content = table_of_content,
+            segment_dict = trimmed_segment_dict
+        )
+        # Index the table of content so the next page turn is served by a range read
+        await _index_table_of_content_on_read_(table_of_content=table_of_content)
 
     detail_table_of_content: DetailTableOfContentResponse = await _mapping_table_of_content(
         text=selected_text,
@@ -404,6 +427,9 @@ async def create_new_text(
         if not valid_group:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=ErrorConstants.GROUP_NOT_FOUND_MESSAGE)
         new_text = await create_text(create_text_request=create_text_request)
+        if create_text_request.categories:
+            # the collections it is listed under are cached without it
+            await invalidate_collection_cache(collection_ids=create_text_request.categories)
         return TextDTO(
             id=str(new_text.id),
             pecha_text_id=str(new_text.pecha_text_id),
@@ -434,10 +460,23 @@ async def create_table_of_content(table_of_content_request: TableOfContent, toke
         new_table_of_content = await get_table_of_content_by_type(table_of_content=table_of_content_request)
         segment_ids = TextUtils.get_all_segment_ids(table_of_content=new_table_of_content)
         await SegmentUtils.validate_segments_exists(segment_ids=segment_ids)
-        table_of_content = await create_table_of_content_detail(table_of_content_request=new_table_of_content)
-        return table_of_content
+        return await save_table_of_content(table_of_content_request=new_table_of_content)
     else:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
+
+
+async def save_table_of_content(table_of_content_request: TableOfContent):
+    """Store an already validated table of content, whose segments hold segment ids, and index it."""
+    table_of_content = await create_table_of_content_detail(table_of_content_request=table_of_content_request)
+    await _rebuild_table_of_content_segment_index_(table_of_content=table_of_content)
+    return table_of_content
+
+
+async def update_table_of_content_in_place(table_of_content: TableOfContent):
+    """Replace the sections of a stored table of content, keeping its id, and reindex it."""
+    await update_table_of_content_sections(content_id=str(table_of_content.id), sections=table_of_content.sections)
+    await _rebuild_table_of_content_segment_index_(table_of_content=table_of_content)
+    return table_of_content
     
 
 
@@ -735,6 +774,61 @@ def _generate_paginated_table_of_content_by_segments_(
     return paginated_table_of_content
 
 
+async def _rebuild_table_of_content_segment_index_(table_of_content: TableOfContent) -> None:
+    try:
+        entries = TextUtils.get_segment_index_entries(table_of_content=table_of_content)
+        await replace_table_of_content_segment_index(content_id=str(table_of_content.id), entries=entries)
+    except Exception as e:
+        # The index is an optimisation only, readers fall back to walking the table of content
+        logging.error(f"Failed to rebuild segment index for table of content {table_of_content.id}: {str(e)}")
+
+
+async def _index_table_of_content_on_read_(table_of_content: TableOfContent) -> None:
+    content_id = str(table_of_content.id)
+
+    async def _read_index_size() -> Optional[int]:
+        return await get_table_of_content_segment_index_count(content_id=content_id) or None
+
+    async def _build_index() -> None:
+        # concurrent readers that missed the index would otherwise race on its unique position key
+        if not await _read_index_size():
+            await _rebuild_table_of_content_segment_index_(table_of_content=table_of_content)
+
+    await single_flight(
+        key=f"table_of_content_segment_index:{content_id}",
+        loader=_build_index,
+        read=_read_index_size
+    )
+
+
+async def _get_paginated_table_of_content_from_segment_index_(
+    text_id: str,
+    text_details_request: TextDetailsRequest
+) -> Optional[Tuple[TableOfContent, int, int]]:
+    anchor = await get_table_of_content_segment_index_anchor(
+        text_id=text_id,
+        content_id=text_details_request.content_id,
+        segment_id=text_details_request.segment_id
+    )
+    if anchor is None:
+        return None
+
+    total_segments = await get_table_of_content_segment_index_count(content_id=anchor.content_id)
+    if text_details_request.direction == PaginationDirection.NEXT:
+        start = anchor.position
+        end = min(anchor.position + text_details_request.size - 1, total_segments)
+    else:
+        start = max(1, anchor.position - text_details_request.size + 1)
+        end = anchor.position
+    entries = await get_table_of_content_segment_index_range(content_id=anchor.content_id, start=start, end=end)
+    paginated_table_of_content = TextUtils.build_table_of_content_from_segment_index(entries=entries)
+    if paginated_table_of_content is None:
+        return None
+
+    text_details_request.segment_id = anchor.segment_id
+    return paginated_table_of_content, total_segments, anchor.position
+
+
 def _get_trimmed_segment_dict_(segments_with_position:List[Tuple[str,int]], segment_id: str, direction: PaginationDirection, size: int) -> Dict[str, int]:
     
 
@@ -14,8 +14,11 @@ from .texts_repository import (
 from .texts_response_models import TextDTO
 from .texts_response_models import (
     TableOfContent, 
+    TableOfContentType,
     TextSegment,
     Section,
+    SectionPathItem,
+    TableOfContentSegmentIndexEntry,
 )
 from pecha_api.texts.texts_enums import LANGUAGE_ORDERS
 
@@ -143,6 +146,109 @@ class TextUtils:
 
         return segment_ids
     
+    @staticmethod
+    def get_segment_index_entries(table_of_content: TableOfContent) -> List[TableOfContentSegmentIndexEntry]:
+        """
+        Flatten a TableOfContent into one entry per segment, in reading order.
+        
+        Args:
+            table_of_content: The TableOfContent to flatten
+            
+        Returns:
+            List[TableOfContentSegmentIndexEntry]: Entries with the 1-based position of each segment
+                                                   and the path of sections leading to it
+        """
+        entries: List[TableOfContentSegmentIndexEntry] = []
+        stack = [(section, []) for section in reversed(table_of_content.sections)]
+
+        while stack:
+            section, parent_path = stack.pop()
+            section_path = parent_path + [
+                SectionPathItem(
+                    id=section.id,
+                    title=section.title,
+                    section_number=section.section_number,
+                    parent_id=section.parent_id,
+                    created_date=section.created_date,
+                    updated_date=section.updated_date,
+                    published_date=section.published_date
+                )
+            ]
+            for segment in section.segments:
+                entries.append(
+                    TableOfContentSegmentIndexEntry(
+                        content_id=str(table_of_content.id),
+                        text_id=table_of_content.text_id,
+                        type=table_of_content.type,
+                        segment_id=segment.segment_id,
+                        segment_number=segment.segment_number,
+                        position=len(entries) + 1,
+                        section_path=section_path
+                    )
+                )
+            # Subsections are read after the segments of their parent section
+            if section.sections:
+                stack.extend((subsection, section_path) for subsection in reversed(section.sections))
+
+        return entries
+
+    @staticmethod
+    def build_table_of_content_from_segment_index(entries: List[TableOfContentSegmentIndexEntry]) -> Optional[TableOfContent]:
+        """
+        Rebuild the nested TableOfContent holding only the given index entries.
+        
+        Args:
+            entries: Index entries sorted by position, all from the same table of content
+            
+        Returns:
+            TableOfContent: The table of content restricted to the entries, or None if there are none
+        """
+        if not entries:
+            return None
+
+        sections_by_path: Dict[tuple, Section] = {}
+        top_level_sections: List[Section] = []
+        for entry in entries:
+            section = None
+            path_key = ()
+            for section_header in entry.section_path:
+                path_key = path_key + (section_header.id,)
+                parent_section = section
+                section = sections_by_path.get(path_key)
+                if section is not None:
+                    continue
+                section = Section(
+                    id=section_header.id,
+                    title=section_header.title,
+                    section_number=section_header.section_number,
+                    parent_id=section_header.parent_id,
+                    segments=[],
+                    sections=None,
+                    created_date=section_header.created_date,
+                    updated_date=section_header.updated_date,
+                    published_date=section_header.published_date
+                )
+                sections_by_path[path_key] = section
+                if parent_section is None:
+                    top_level_sections.append(section)
+                else:
+                    if parent_section.sections is None:
+                        parent_section.sections = []
+                    parent_section.sections.append(section)
+            section.segments.append(
+                TextSegment(
+                    segment_id=entry.segment_id,
+                    segment_number=entry.segment_number
+                )
+            )
+
+        return TableOfContent(
+            id=entries[0].content_id,
+            text_id=entries[0].text_id,
+            type=entries[0].type if entries[0].type else TableOfContentType.TEXT,
+            sections=top_level_sections
+        )
+    
     @staticmethod
     async def get_text_detail_by_id(text_id: str) -> TextDTO:
         """
@@ -1,5 +1,7 @@
 from http import HTTPMethod
 from io import BytesIO
+from typing import Dict, Iterable
+from urllib.parse import quote
 
 import boto3
 from botocore.exceptions import ClientError
@@ -8,7 +10,8 @@ import logging
 
 from starlette import status
 
-from ..config import get
+from ..config import get, get_int
+from .presigned_url_cache import presigned_url_cache
 
 s3_client = boto3.client(
     "s3",
@@ -64,17 +67,53 @@ def upload_bytes(bucket_name: str, s3_key: str, file: BytesIO, content_type: str
 
 def generate_presigned_access_url(bucket_name: str, s3_key: str):
     if isinstance(s3_key, str) and s3_key.strip():
-        # Generate a presigned URL for uploading an object
-        presigned_url = s3_client.generate_presigned_url(
+        return sign_many(bucket_name=bucket_name, s3_keys=[s3_key])[s3_key]
+    return ""
+
+
+def _get_public_url_(s3_key: str) -> str | None:
+    # CDN mode: keys under a public prefix are served unsigned from AWS_PUBLIC_MEDIA_BASE_URL
+    public_base_url = get("AWS_PUBLIC_MEDIA_BASE_URL")
+    if not public_base_url:
+        return None
+    public_prefixes = [prefix.strip() for prefix in get("AWS_PUBLIC_MEDIA_PREFIXES").split(",") if prefix.strip()]
+    if any(s3_key.startswith(prefix) for prefix in public_prefixes):
+        return f"{public_base_url.rstrip('/')}/{quote(s3_key)}"
+    return None
+
+
+def sign_many(bucket_name: str, s3_keys: Iterable[str]) -> Dict[str, str]:
+    """Access URLs of many keys at once, reusing the URLs already signed in the current window."""
+    urls: Dict[str, str] = {}
+    keys_to_sign = []
+    for s3_key in dict.fromkeys(s3_keys):
+        if not isinstance(s3_key, str) or not s3_key.strip():
+            continue
+        public_url = _get_public_url_(s3_key)
+        if public_url is not None:
+            urls[s3_key] = public_url
+        else:
+            keys_to_sign.append(s3_key)
+    if not keys_to_sign:
+        return urls
+    window = presigned_url_cache.current_window()
+    cached_urls = presigned_url_cache.get_many(bucket_name=bucket_name, s3_keys=keys_to_sign, window=window)
+    signed_urls = {
+        s3_key: s3_client.generate_presigned_url(
             ClientMethod="get_object",
             Params={
                 "Bucket": bucket_name,
                 "Key": s3_key
             },
-            ExpiresIn=3600
+            ExpiresIn=get_int("AWS_PRESIGNED_URL_EXPIRY")
         )
-        return presigned_url
-    return ""
+        for s3_key in keys_to_sign
+        if s3_key not in cached_urls
+    }
+    presigned_url_cache.set_many(bucket_name=bucket_name, urls=signed_urls, window=window)
+    urls.update(cached_urls)
+    urls.update(signed_urls)
+    return urls
 
 
 def delete_file(file_path: str):
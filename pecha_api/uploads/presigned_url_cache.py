@@ -0,0 +1,48 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Tuple
+
+from ..config import get_int
+
+
+class PresignedUrlCache:
+    """
+    Presigned GET URLs keyed by (bucket, key). Time is cut into windows of the URL expiry minus
+    AWS_PRESIGNED_URL_REFRESH_MARGIN, a URL signed in a window is handed out until the window
+    ends, so it is byte-stable for HTTP caches and always has at least the margin left to live.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[Tuple[str, str], Tuple[int, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def current_window() -> int:
+        window_seconds = max(get_int("AWS_PRESIGNED_URL_EXPIRY") - get_int("AWS_PRESIGNED_URL_REFRESH_MARGIN"), 1)
+        return int(time.time() // window_seconds)
+
+    def get_many(self, bucket_name: str, s3_keys: Iterable[str], window: int) -> Dict[str, str]:
+        urls = {}
+        with self._lock:
+            for s3_key in s3_keys:
+                entry = self._entries.get((bucket_name, s3_key))
+                if entry is not None and entry[0] == window:
+                    self._entries.move_to_end((bucket_name, s3_key))
+                    urls[s3_key] = entry[1]
+        return urls
+
+    def set_many(self, bucket_name: str, urls: Dict[str, str], window: int):
+        with self._lock:
+            for s3_key, url in urls.items():
+                self._entries[(bucket_name, s3_key)] = (window, url)
+                self._entries.move_to_end((bucket_name, s3_key))
+            while len(self._entries) > get_int("AWS_PRESIGNED_URL_CACHE_MAX_ENTRIES"):
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+presigned_url_cache = PresignedUrlCache()
@@ -0,0 +1,88 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Tuple
+
+from ..config import get_int
+from .user_response_models import UserPrincipal
+
+# principals already resolved by the current request, keyed by token hash
+_request_principals: ContextVar[Optional[Dict[str, UserPrincipal]]] = ContextVar("request_principals", default=None)
+
+
+class UserPrincipalCache:
+    """
+    Verified token claims plus a detached snapshot of the user, keyed by the token hash.
+    Entries live for USER_PRINCIPAL_CACHE_TTL seconds at most and never past the token expiry.
+    """
+
+    def __init__(self):
+        self._entries: OrderedDict[str, Tuple[float, UserPrincipal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def token_hash(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def get(self, token: str) -> Optional[UserPrincipal]:
+        key = self.token_hash(token)
+        request_principals = _request_principals.get()
+        if request_principals is not None and key in request_principals:
+            return request_principals[key]
+        principal = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, principal = entry
+                if time.monotonic() >= expires_at:
+                    del self._entries[key]
+                    principal = None
+                else:
+                    self._entries.move_to_end(key)
+        if principal is not None and request_principals is not None:
+            request_principals[key] = principal
+        return principal
+
+    def set(self, token: str, principal: UserPrincipal):
+        key = self.token_hash(token)
+        request_principals = _request_principals.get()
+        if request_principals is not None:
+            request_principals[key] = principal
+        time_to_live = get_int("USER_PRINCIPAL_CACHE_TTL")
+        token_expiry = principal.claims.get("exp")
+        if isinstance(token_expiry, (int, float)):
+            time_to_live = min(time_to_live, token_expiry - time.time())
+        if time_to_live <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + time_to_live, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > get_int("USER_PRINCIPAL_CACHE_MAX_ENTRIES"):
+                self._entries.popitem(last=False)
+
+    def invalidate_user(self, email: str):
+        with self._lock:
+            for key in [key for key, (_, principal) in self._entries.items() if principal.email == email]:
+                del self._entries[key]
+        request_principals = _request_principals.get()
+        if request_principals is not None:
+            for key in [key for key, principal in request_principals.items() if principal.email == email]:
+                del request_principals[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        scope_token = _request_principals.set({})
+        try:
+            yield
+        finally:
+            _request_principals.reset(scope_token)
+
+
+user_principal_cache = UserPrincipalCache()
@@ -1,6 +1,7 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from .users_enums import SocialProfile
 
 class SocialMediaProfile(BaseModel):
@@ -39,3 +40,13 @@ class PublisherInfoResponse(BaseModel):
     firstname: str
     lastname: str
     avatar_url: Optional[str] = None
+
+
+class UserPrincipal(BaseModel):
+    id: Optional[UUID] = None
+    email: str
+    username: Optional[str] = None
+    is_admin: bool = False
+    claims: Dict[str, Any] = {}
+    # column values of the user row, used to rebuild a detached Users without a lookup
+    user_values: Dict[str, Any] = Field(default_factory=dict, exclude=True, repr=False)
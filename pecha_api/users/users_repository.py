@@ -40,6 +40,10 @@ def get_user_by_email(db: Session, email: str) -> Users:
     return user
 
 
+def get_users_by_emails(db: Session, emails: List[str]) -> List[Users]:
+    return db.query(Users).filter(Users.email.in_(emails)).all()
+
+
 def get_user_by_username(db: Session, username: str) -> Users:
     user = db.query(Users).filter(Users.username == username).first()
     if user is None:
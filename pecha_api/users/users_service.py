@@ -1,24 +1,30 @@
 import logging
-from typing import List, Optional
+from typing import Annotated, Any, AsyncIterator, Dict, List, Optional
 
 import jose
-from fastapi import HTTPException, status, UploadFile
+from fastapi import Depends, HTTPException, status, UploadFile
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError
 from jose.exceptions import JWTClaimsError
 from jwt import ExpiredSignatureError
+from sqlalchemy.orm import make_transient_to_detached
 
 from pecha_api.error_contants import ErrorConstants
-from .user_response_models import UserInfoRequest, UserInfoResponse, SocialMediaProfile, PublisherInfoResponse
+from .user_response_models import UserInfoRequest, UserInfoResponse, SocialMediaProfile, PublisherInfoResponse, UserPrincipal
+from .user_principal_cache import user_principal_cache
 from .users_enums import SocialProfile
 from .users_models import Users, SocialMediaAccount
 from ..auth.auth_repository import validate_token
-from .users_repository import get_user_by_email, update_user, get_user_by_username
+from .users_repository import get_user_by_email, get_users_by_emails, update_user, get_user_by_username
 from ..uploads.S3_utils import delete_file, upload_bytes, generate_presigned_access_url
 from ..db.database import SessionLocal
 from ..config import get
 
 from pecha_api.utils import Utils
 from pecha_api.image_utils import ImageUtils
+from starlette.concurrency import run_in_threadpool
+
+oauth2_scheme = HTTPBearer()
 
 async def get_user_info(token: str) -> UserInfoResponse:
     current_user = validate_and_extract_user_details(token=token)
@@ -37,6 +43,14 @@ def fetch_user_by_email(email: str) -> Optional[UserInfoResponse]:
         db_session.close()
     return generate_user_info_response(user=user)
 
+def fetch_users_by_emails(emails: List[str]) -> List[Users]:
+    if not emails:
+        return []
+    with SessionLocal() as db_session:
+        users = get_users_by_emails(db=db_session, emails=emails)
+        db_session.close()
+    return users
+
 
 def generate_user_info_response(user: Users) -> Optional[UserInfoResponse]:
     if user:
@@ -84,6 +98,7 @@ def update_user_info(token: str, user_info_request: UserInfoRequest) -> Users:
             db_session.add(current_user)
             update_social_profiles(user=current_user, social_profiles=user_info_request.social_profiles)
             updated_user = update_user(db=db_session, user=current_user)
+            user_principal_cache.invalidate_user(email=updated_user.email)
             return updated_user
         except Exception as e:
             db_session.rollback()
@@ -130,18 +145,72 @@ def upload_user_image(token: str, file: UploadFile) -> str:
     current_user.avatar_url = Utils.extract_s3_key(presigned_url=presigned_url)
     with SessionLocal() as db_session:
         update_user(db=db_session, user=current_user)
+        user_principal_cache.invalidate_user(email=current_user.email)
         return presigned_url
 
 
 def validate_and_extract_user_details(token: str) -> Users:
+    principal = user_principal_cache.get(token=token)
+    if principal is not None:
+        return _detached_user(principal=principal)
+    claims = _verify_token_claims(token=token)
+    with SessionLocal() as db_session:
+        user = get_user_by_email(db=db_session, email=claims["email"])
+    if user is not None:
+        _cache_user_principal(token=token, claims=claims, user=user)
+    return user
+
+
+def get_user_principal(token: str) -> Optional[UserPrincipal]:
+    principal = user_principal_cache.get(token=token)
+    if principal is not None:
+        return principal
+    claims = _verify_token_claims(token=token)
+    with SessionLocal() as db_session:
+        user = get_user_by_email(db=db_session, email=claims["email"])
+    if user is None:
+        return None
+    return _cache_user_principal(token=token, claims=claims, user=user)
+
+
+async def get_current_user_principal(
+    authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)]
+) -> AsyncIterator[UserPrincipal]:
+    """Dependency verifying the bearer token once; later lookups of the same token in this request are free."""
+    with user_principal_cache.request_scope():
+        principal = await run_in_threadpool(get_user_principal, authentication_credential.credentials)
+        if principal is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
+        yield principal
+
+
+def _cache_user_principal(token: str, claims: Dict[str, Any], user: Users) -> UserPrincipal:
+    principal = UserPrincipal(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        is_admin=bool(user.is_admin),
+        claims=claims,
+        user_values={column.key: getattr(user, column.key) for column in Users.__table__.columns}
+    )
+    user_principal_cache.set(token=token, principal=principal)
+    return principal
+
+
+def _detached_user(principal: UserPrincipal) -> Users:
+    # a fresh instance per call, so callers mutating it never touch the cached snapshot
+    user = Users(**principal.user_values)
+    make_transient_to_detached(user)
+    return user
+
+
+def _verify_token_claims(token: str) -> Dict[str, Any]:
     try:
         payload = validate_token(token)
         email = payload.get("email")
         if email is None:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
-        with SessionLocal() as db_session:
-            user = get_user_by_email(db=db_session, email=email)
-            return user
+        return payload
     except ExpiredSignatureError as exception:
         logging.debug(f"exception: {exception}")
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=ErrorConstants.TOKEN_ERROR_MESSAGE)
@@ -160,15 +229,12 @@ def validate_and_extract_user_details(token: str) -> Users:
 
 
 def verify_admin_access(token: str) -> bool:
-    current_user = validate_and_extract_user_details(token=token)
-    if hasattr(current_user, 'is_admin') and current_user.is_admin is not None:
-        return current_user.is_admin
-    else:
-        return False
+    principal = get_user_principal(token=token)
+    return principal is not None and principal.is_admin
 
 
 def validate_user_exists(token: str) -> bool:
-    current_user = validate_and_extract_user_details(token=token)
+    current_user = get_user_principal(token=token)
     if current_user:
         return True
     else:
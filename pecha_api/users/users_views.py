@@ -5,7 +5,7 @@ from starlette import status
 from .user_response_models import UserInfoRequest, UserInfoResponse
 from ..db import database
 from typing import Annotated
-from .users_service import get_user_info, update_user_info, upload_user_image, get_user_info_by_username
+from .users_service import get_user_info, update_user_info, upload_user_image, get_user_info_by_username, get_current_user_principal
 
 oauth2_scheme = HTTPBearer()
 user_router = APIRouter(
@@ -22,7 +22,7 @@ def get_db():
         db.close()
 
 
-@user_router.get("/info", status_code=status.HTTP_200_OK)
+@user_router.get("/info", status_code=status.HTTP_200_OK, dependencies=[Depends(get_current_user_principal)])
 async def get_user_information(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)])  -> UserInfoResponse:
     return await get_user_info(token=authentication_credential.credentials)
 
@@ -31,13 +31,13 @@ async def get_user_detail_by_username(username:str) -> UserInfoResponse:
     return await get_user_info_by_username(username)
 
 
-@user_router.post("/info", status_code=status.HTTP_201_CREATED)
+@user_router.post("/info", status_code=status.HTTP_201_CREATED, dependencies=[Depends(get_current_user_principal)])
 def update_user_information(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                             user_info_request: UserInfoRequest):
     return update_user_info(token=authentication_credential.credentials, user_info_request=user_info_request)
 
 
-@user_router.post("/upload", status_code=status.HTTP_201_CREATED)
+@user_router.post("/upload", status_code=status.HTTP_201_CREATED, dependencies=[Depends(get_current_user_principal)])
 def upload_user_avatar_image(authentication_credential: Annotated[HTTPAuthorizationCredentials, Depends(oauth2_scheme)],
                              file: UploadFile = File(...)):
     return upload_user_image(token=authentication_credential.credentials, file=file)
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from pecha_api.auth.auth_repository import verify_auth0_token
+from pecha_api.auth.jwks_key_store import JwksKeyStore
+
+JWKS = {"keys": [{"kid": "key_1", "kty": "RSA"}, {"kid": "key_2", "kty": "RSA"}]}
+
+
+def _response(jwks=None, cache_control="public, max-age=900"):
+    response = MagicMock()
+    response.json.return_value = jwks or JWKS
+    response.headers = {"cache-control": cache_control}
+    return response
+
+
+def _mock_async_client(response=None, side_effect=None):
+    mock_client = MagicMock()
+    mock_client.get = AsyncMock(return_value=response, side_effect=side_effect)
+    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client.__aexit__ = AsyncMock(return_value=None)
+    return MagicMock(return_value=mock_client)
+
+
+@pytest.mark.asyncio
+async def test_refresh_stores_keys_for_max_age():
+    store = JwksKeyStore()
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.AsyncClient", _mock_async_client(_response())), \
+        patch("pecha_api.auth.jwks_key_store.time.monotonic", return_value=1000.0):
+        await store.refresh()
+
+    assert store._keys == {"key_1": JWKS["keys"][0], "key_2": JWKS["keys"][1]}
+    assert store._expires_at == 1900.0
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_keeps_last_good_keys():
+    store = JwksKeyStore()
+    with patch("pecha_api.auth.jwks_key_store.httpx.AsyncClient", _mock_async_client(_response())):
+        await store.refresh()
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.AsyncClient", _mock_async_client(side_effect=Exception("IdP down"))), \
+        patch("pecha_api.auth.jwks_key_store.time.monotonic", return_value=5000.0):
+        await store.refresh()
+        assert store.get_key("key_1") == JWKS["keys"][0]
+
+    assert store._expires_at == 5030.0
+
+
+def test_get_key_known_kid_does_not_fetch():
+    store = JwksKeyStore()
+    store._store(jwks=JWKS, cache_control="max-age=900")
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.get") as mock_get:
+        assert store.get_key("key_2") == JWKS["keys"][1]
+
+    mock_get.assert_not_called()
+
+
+def test_get_key_serves_expired_keys_without_fetching():
+    store = JwksKeyStore()
+    store._store(jwks=JWKS, cache_control="max-age=900")
+    store._expires_at = 0.0
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.get") as mock_get:
+        assert store.get_key("key_1") == JWKS["keys"][0]
+
+    mock_get.assert_not_called()
+
+
+def _wait_for_refetch(store: JwksKeyStore):
+    fetch_thread = store._fetch_thread
+    if fetch_thread is not None:
+        fetch_thread.join(timeout=5)
+
+
+def test_get_key_unknown_kid_refetches_in_background_with_rate_limit():
+    store = JwksKeyStore()
+    store._store(jwks=JWKS, cache_control="max-age=900")
+    rotated = {"keys": JWKS["keys"] + [{"kid": "key_3", "kty": "RSA"}]}
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.get", return_value=_response(rotated)) as mock_get:
+        assert store.get_key("key_3") is None
+        _wait_for_refetch(store)
+        assert store.get_key("key_3") == rotated["keys"][2]
+        assert store.get_key("unknown") is None
+        _wait_for_refetch(store)
+
+    mock_get.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_key_on_event_loop_does_not_wait_for_refetch():
+    store = JwksKeyStore()
+    release_fetch = threading.Event()
+
+    def _slow_get(*args, **kwargs):
+        release_fetch.wait(timeout=5)
+        return _response()
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.get", side_effect=_slow_get) as mock_get:
+        assert store.get_key("key_1") is None
+        release_fetch.set()
+        _wait_for_refetch(store)
+
+    mock_get.assert_called_once()
+    assert store.get_key("key_1") == JWKS["keys"][0]
+
+
+def test_get_key_concurrent_unknown_kids_share_one_fetch():
+    store = JwksKeyStore()
+    release_fetch = threading.Event()
+
+    def _slow_get(*args, **kwargs):
+        release_fetch.wait(timeout=5)
+        return _response()
+
+    with patch("pecha_api.auth.jwks_key_store.httpx.get", side_effect=_slow_get) as mock_get:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = [executor.submit(store.get_key, "key_1") for _ in range(4)]
+            assert all(result.result(timeout=5) is None for result in results)
+        release_fetch.set()
+        _wait_for_refetch(store)
+
+    mock_get.assert_called_once()
+    assert store.get_key("key_2") == JWKS["keys"][1]
+
+
+@pytest.mark.asyncio
+async def test_run_refresh_loop_waits_for_expiry_before_refreshing():
+    store = JwksKeyStore()
+    store.refresh = AsyncMock()
+
+    with patch("pecha_api.auth.jwks_key_store.asyncio.sleep", new_callable=AsyncMock, side_effect=[None, asyncio.CancelledError()]) as mock_sleep:
+        with pytest.raises(asyncio.CancelledError):
+            await store.run_refresh_loop()
+
+    assert mock_sleep.await_count == 2
+    store.refresh.assert_awaited_once()
+
+
+def test_max_age_parsing():
+    assert JwksKeyStore._max_age("public, max-age=15000") == 15000
+    assert JwksKeyStore._max_age("max-age=1") == 30
+    assert JwksKeyStore._max_age("no-cache") == 30
+    assert JwksKeyStore._max_age(None) == 600
+
+
+def test_verify_auth0_token_uses_key_store():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    public_jwk = jwk.construct(
+        private_key.public_key().public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo),
+        algorithm="RS256"
+    ).to_dict()
+    token = jwt.encode(
+        {"sub": "auth0|user", "aud": "client_id", "iss": "https://tenant.auth0.com/"},
+        private_pem,
+        algorithm="RS256",
+        headers={"kid": "key_1"}
+    )
+
+    def _mock_config_get(key):
+        return {"CLIENT_ID": "client_id", "DOMAIN_NAME": "tenant.auth0.com"}[key]
+
+    with patch("pecha_api.auth.auth_repository.jwks_key_store.get_key", return_value=public_jwk) as mock_get_key, \
+        patch("pecha_api.auth.auth_repository.get", side_effect=_mock_config_get):
+        payload = verify_auth0_token(token)
+
+    assert payload["sub"] == "auth0|user"
+    mock_get_key.assert_called_once_with("key_1")
+
+
+def test_verify_auth0_token_unknown_key():
+    token = jwt.encode({"sub": "auth0|user"}, "secret", algorithm="HS256", headers={"kid": "missing"})
+
+    with patch("pecha_api.auth.auth_repository.jwks_key_store.get_key", return_value=None):
+        with pytest.raises(ValueError, match="Unable to find appropriate key"):
+            verify_auth0_token(token)
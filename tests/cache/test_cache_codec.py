@@ -0,0 +1,77 @@
+import json
+from unittest.mock import patch
+import pytest
+
+from pecha_api.cache import cache_codec
+from pecha_api.cache.cache_codec import CacheCodec, CacheCompression, encode, decode, HEADER_MAGIC
+from pecha_api.cache.cache_codec_benchmark import build_table_of_content_response
+from pecha_api.texts.texts_response_models import TableOfContentResponse
+
+
+@pytest.mark.parametrize("codec", [CacheCodec.JSON, CacheCodec.ORJSON])
+@pytest.mark.parametrize("compression", [CacheCompression.NONE, CacheCompression.ZLIB])
+def test_encode_decode_round_trip_response_model(codec, compression):
+    response = build_table_of_content_response(sections=3, segments=4)
+
+    encoded = encode(response, codec=codec, compression=compression, compression_threshold=0)
+
+    assert encoded.startswith(HEADER_MAGIC)
+    assert encoded[len(HEADER_MAGIC) + 1] == codec.value
+    assert encoded[len(HEADER_MAGIC) + 2] == compression.value
+    assert TableOfContentResponse(**decode(encoded)) == response
+
+
+def test_encode_skips_compression_below_threshold():
+    encoded = encode({"id": "1"}, codec=CacheCodec.JSON, compression=CacheCompression.ZLIB, compression_threshold=1024)
+
+    assert encoded[len(HEADER_MAGIC) + 2] == CacheCompression.NONE.value
+    assert decode(encoded) == {"id": "1"}
+
+
+def test_encode_keeps_bytes_raw():
+    encoded = encode(b"\x01\x02", codec=CacheCodec.JSON, compression=CacheCompression.NONE)
+
+    assert decode(encoded) == b"\x01\x02"
+
+
+def test_decode_legacy_plain_json_entry():
+    assert decode(json.dumps({"id": "1"}).encode("utf-8")) == {"id": "1"}
+    assert decode(json.dumps([1, 2])) == [1, 2]
+
+
+def test_decode_rejects_unknown_header_version():
+    encoded = HEADER_MAGIC + bytes([99, CacheCodec.JSON.value, CacheCompression.NONE.value]) + b"{}"
+
+    with pytest.raises(ValueError):
+        decode(encoded)
+
+
+@pytest.fixture(autouse=True)
+def _clear_resolved_codecs_():
+    cache_codec._resolve_codec.cache_clear()
+    cache_codec._resolve_compression.cache_clear()
+    yield
+    cache_codec._resolve_codec.cache_clear()
+    cache_codec._resolve_compression.cache_clear()
+
+
+def test_configured_codec_falls_back_when_not_installed():
+    with patch("pecha_api.cache.cache_codec.config.get", return_value="msgpack"), \
+        patch.dict(cache_codec._CODEC_AVAILABLE, {CacheCodec.MSGPACK: False}):
+        assert cache_codec.get_configured_codec() == CacheCodec.JSON
+
+
+def test_configured_codec_fallback_is_only_reported_once():
+    with patch("pecha_api.cache.cache_codec.config.get", return_value="msgpack"), \
+        patch.dict(cache_codec._CODEC_AVAILABLE, {CacheCodec.MSGPACK: False}), \
+        patch("pecha_api.cache.cache_codec.logging.warning") as mock_warning:
+        assert cache_codec.get_configured_codec() == CacheCodec.JSON
+        assert cache_codec.get_configured_codec() == CacheCodec.JSON
+
+        mock_warning.assert_called_once()
+
+
+def test_configured_compression_falls_back_when_not_installed():
+    with patch("pecha_api.cache.cache_codec.config.get", return_value="zstd"), \
+        patch.dict(cache_codec._COMPRESSION_AVAILABLE, {CacheCompression.ZSTD: False}):
+        assert cache_codec.get_configured_compression() == CacheCompression.ZLIB
@@ -0,0 +1,44 @@
+from pecha_api.cache.cache_enums import CacheType, CacheTag
+from pecha_api.cache.cache_keys import CacheKeys
+from pecha_api.recitations.recitations_response_models import RecitationDetailsRequest
+
+
+def test_build_without_variant():
+    assert CacheKeys.build(CacheType.TEXT_DETAIL, "text_1") == "text_detail:text_1"
+
+
+def test_build_without_entity():
+    assert CacheKeys.build(CacheType.SEGMENTS_DETAILS) == "segments_details"
+
+
+def test_build_keeps_entity_readable_and_hashes_variant():
+    key = CacheKeys.build(CacheType.TEXT_VERSIONS, "text_1", "en", 0, 10)
+
+    prefix, digest = key.rsplit(":", 1)
+    assert prefix == "text_versions:text_1"
+    assert len(digest) == 16
+
+
+def test_build_is_stable_and_variant_sensitive():
+    first = CacheKeys.build(CacheType.TEXT_VERSIONS, "text_1", "en", 0, 10)
+
+    assert first == CacheKeys.build(CacheType.TEXT_VERSIONS, "text_1", "en", 0, 10)
+    assert first != CacheKeys.build(CacheType.TEXT_VERSIONS, "text_1", "en", 10, 10)
+    assert first != CacheKeys.build(CacheType.TEXT_VERSIONS, "text_1", "bo", 0, 10)
+
+
+def test_build_does_not_collide_on_joined_parts():
+    assert CacheKeys.build(CacheType.TEXT_DETAIL, "text_1", "ab", "c") != CacheKeys.build(CacheType.TEXT_DETAIL, "text_1", "a", "bc")
+
+
+def test_build_with_model_variant():
+    request = RecitationDetailsRequest(language="en", recitation=["bo"], translations=[], transliterations=[], adaptations=[])
+
+    assert CacheKeys.build(CacheType.RECITATION_DETAILS, "text_1", request) == CacheKeys.build(
+        CacheType.RECITATION_DETAILS, "text_1", request.model_copy()
+    )
+
+
+def test_tag():
+    assert CacheKeys.tag(CacheTag.TEXT, "text_1") == "tag:text:text_1"
+    assert CacheKeys.tag(CacheTag.COLLECTION, "collection_1") == "tag:collection:collection_1"
@@ -0,0 +1,174 @@
+import json
+from unittest.mock import patch, AsyncMock, MagicMock
+import pytest
+
+from pecha_api.config import DEFAULTS
+from pecha_api.cache.cache_codec import decode
+from pecha_api.cache.cache_repository import (
+    get_many,
+    set_many,
+    delete_many,
+    set_cache,
+    invalidate_tags,
+    invalidate_cache_by_prefix,
+    invalidate_multiple_cache_keys
+)
+
+
+def _mock_config_get(key: str):
+    return "pecha:" if key == "CACHE_PREFIX" else str(DEFAULTS[key])
+
+
+@pytest.mark.asyncio
+async def test_get_many_uses_single_mget_and_skips_misses():
+    mock_client = MagicMock()
+    mock_client.mget = AsyncMock(return_value=[json.dumps({"id": "1"}), None])
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await get_many(["key_1", "key_2"])
+
+    mock_client.mget.assert_awaited_once_with(["pecha:key_1", "pecha:key_2"])
+    assert result == {"key_1": {"id": "1"}}
+
+
+@pytest.mark.asyncio
+async def test_get_many_empty_keys():
+    with patch("pecha_api.cache.cache_repository.get_client") as mock_get_client:
+        result = await get_many([])
+
+    assert result == {}
+    mock_get_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_set_many_pipelines_setex():
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=[True, True])
+    mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+    mock_pipe.__aexit__ = AsyncMock(return_value=None)
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value = mock_pipe
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await set_many({"key_1": {"id": "1"}, "key_2": "raw"}, cache_time_out=60)
+
+    assert result is True
+    mock_client.pipeline.assert_called_once_with(transaction=False)
+    stored = {call.args[0]: (call.args[1], decode(call.args[2])) for call in mock_pipe.setex.call_args_list}
+    assert stored == {"pecha:key_1": (60, {"id": "1"}), "pecha:key_2": (60, "raw")}
+    mock_pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_many_single_del():
+    mock_client = MagicMock()
+    mock_client.delete = AsyncMock(return_value=2)
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await delete_many(["key_1", "key_2"])
+
+    assert result == 2
+    mock_client.delete.assert_awaited_once_with("pecha:key_1", "pecha:key_2")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_multiple_cache_keys_does_not_check_exists():
+    mock_client = MagicMock()
+    mock_client.exists = AsyncMock()
+    mock_client.delete = AsyncMock(return_value=1)
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await invalidate_multiple_cache_keys(["key_1", "key_2"])
+
+    assert result is True
+    mock_client.exists.assert_not_called()
+    mock_client.delete.assert_awaited_once_with("pecha:key_1", "pecha:key_2")
+
+
+@pytest.mark.asyncio
+async def test_invalidate_cache_by_prefix_scans_with_wildcard():
+    async def _scan_iter(match, count):
+        for key in [b"pecha:text_1:a", b"pecha:text_1:b"]:
+            yield key
+
+    mock_client = MagicMock()
+    mock_client.scan_iter = MagicMock(side_effect=_scan_iter)
+    mock_client.unlink = AsyncMock(return_value=2)
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await invalidate_cache_by_prefix(key_prefix="text_1")
+
+    assert result is True
+    assert mock_client.scan_iter.call_args.kwargs["match"] == "pecha:text_1*"
+    mock_client.unlink.assert_awaited_once_with(b"pecha:text_1:a", b"pecha:text_1:b")
+    mock_client.keys.assert_not_called()
+
+
+def _mock_pipeline(results):
+    mock_pipe = MagicMock()
+    mock_pipe.execute = AsyncMock(return_value=results)
+    mock_pipe.__aenter__ = AsyncMock(return_value=mock_pipe)
+    mock_pipe.__aexit__ = AsyncMock(return_value=None)
+    return mock_pipe
+
+
+@pytest.mark.asyncio
+async def test_set_cache_registers_key_in_tags():
+    mock_pipe = _mock_pipeline([True, 1, True, False])
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value = mock_pipe
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await set_cache(hash_key="text_detail:text_1", value={"id": "1"}, cache_time_out=60, tags=["tag:text:text_1"])
+
+    assert result is True
+    mock_pipe.sadd.assert_called_once_with("pecha:tag:text:text_1", "text_detail:text_1")
+    assert [call.kwargs for call in mock_pipe.expire.call_args_list] == [{"nx": True}, {"gt": True}]
+
+
+@pytest.mark.asyncio
+async def test_set_cache_without_tags_skips_pipeline():
+    mock_client = MagicMock()
+    mock_client.setex = AsyncMock(return_value=True)
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await set_cache(hash_key="text_detail:text_1", value={"id": "1"}, cache_time_out=60)
+
+    assert result is True
+    mock_client.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_unlinks_members_and_tags():
+    mock_pipe = _mock_pipeline([{b"text_detail:text_1", b"text_versions:text_1:abcd"}, {b"text_detail:text_1"}])
+    mock_client = MagicMock()
+    mock_client.pipeline.return_value = mock_pipe
+    mock_client.unlink = AsyncMock(return_value=4)
+
+    with patch("pecha_api.cache.cache_repository.get_client", return_value=mock_client), \
+        patch("pecha_api.cache.cache_repository.config.get", side_effect=_mock_config_get):
+        result = await invalidate_tags(tags=["tag:text:text_1", "tag:text:version_1"])
+
+    assert result == ["text_detail:text_1", "text_versions:text_1:abcd"]
+    mock_client.unlink.assert_awaited_once_with(
+        "pecha:text_detail:text_1",
+        "pecha:text_versions:text_1:abcd",
+        "pecha:tag:text:text_1",
+        "pecha:tag:text:version_1"
+    )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_empty_tags():
+    with patch("pecha_api.cache.cache_repository.get_client") as mock_get_client:
+        result = await invalidate_tags(tags=[])
+
+    assert result == []
+    mock_get_client.assert_not_called()
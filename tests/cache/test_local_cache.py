@@ -0,0 +1,109 @@
+import json
+from unittest.mock import patch, AsyncMock, MagicMock
+import pytest
+
+from pecha_api.cache.cache_enums import CacheType
+from pecha_api.cache.local_cache import LocalCache, publish_local_cache_invalidation
+from pecha_api.texts.texts_response_models import TextDTO
+
+
+def _text_dto(text_id: str = "text_id_1") -> TextDTO:
+    return TextDTO(
+        id=text_id,
+        title="title",
+        language="bo",
+        type="version",
+        group_id="group_id",
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="admin",
+        categories=[],
+        views=0
+    )
+
+
+def test_local_cache_returns_copy_of_stored_model():
+    cache = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    text = _text_dto()
+
+    cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=text)
+    result = cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1")
+
+    assert result == text
+    assert result is not text
+
+    result.categories.append("category_1")
+    assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1").categories == []
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (2, 60)})
+    cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=_text_dto("1"))
+    cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_2", value=_text_dto("2"))
+    cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1")
+    cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_3", value=_text_dto("3"))
+
+    assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_2") is None
+    assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1") is not None
+
+
+def test_local_cache_expires_entries():
+    cache = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    with patch("pecha_api.cache.local_cache.time.monotonic", return_value=100):
+        cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=_text_dto())
+    with patch("pecha_api.cache.local_cache.time.monotonic", return_value=161):
+        assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1") is None
+
+
+def test_local_cache_disabled_or_unlisted_type_is_noop():
+    disabled = LocalCache(enabled=False, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    disabled.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=_text_dto())
+    enabled = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    enabled.set(cache_type=CacheType.SHEETS, hash_key="key_1", value=_text_dto())
+
+    assert disabled.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1") is None
+    assert enabled.get(cache_type=CacheType.SHEETS, hash_key="key_1") is None
+
+
+def test_local_cache_applies_invalidation_from_other_workers_only():
+    cache = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=_text_dto())
+
+    cache.apply_invalidation_message(json.dumps({"origin": cache.instance_id, "cache_type": None, "hash_keys": ["key_1"]}))
+    assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1") is not None
+
+    cache.apply_invalidation_message(json.dumps({"origin": "other", "cache_type": "text_detail", "hash_keys": ["key_1"]}))
+    assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1") is None
+
+
+def test_local_cache_stats_per_tier():
+    cache = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1")
+    cache.remember(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=_text_dto())
+    cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1")
+
+    stats = cache.get_stats().stats[0]
+
+    assert stats.cache_type == "text_detail"
+    assert stats.local_entries == 1
+    assert (stats.local.hits, stats.local.misses, stats.local.hit_rate) == (1, 1, 0.5)
+    assert (stats.remote.hits, stats.remote.misses) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_publish_local_cache_invalidation():
+    cache = LocalCache(enabled=True, limits={CacheType.TEXT_DETAIL: (10, 60)})
+    cache.set(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1", value=_text_dto())
+    mock_client = MagicMock()
+    mock_client.publish = AsyncMock(return_value=1)
+
+    with patch("pecha_api.cache.local_cache.local_cache", cache), \
+        patch("pecha_api.cache.local_cache.get_client", return_value=mock_client):
+        result = await publish_local_cache_invalidation(hash_keys=["key_1"], cache_type=CacheType.TEXT_DETAIL)
+
+    assert result is True
+    assert cache.get(cache_type=CacheType.TEXT_DETAIL, hash_key="key_1") is None
+    message = json.loads(mock_client.publish.call_args.args[1])
+    assert message == {"origin": cache.instance_id, "cache_type": "text_detail", "hash_keys": ["key_1"]}
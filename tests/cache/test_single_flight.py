@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import patch, AsyncMock
+import pytest
+
+from pecha_api.cache import single_flight as single_flight_module
+from pecha_api.cache.single_flight import single_flight, get_cache_data_with_refresh
+
+
+def _mock_config_get(lock_enabled: str = "false"):
+    values = {
+        "CACHE_SINGLE_FLIGHT_LOCK_ENABLED": lock_enabled,
+        "CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT_MS": "100",
+        "CACHE_SINGLE_FLIGHT_WAIT_INTERVAL_MS": "10",
+        "CACHE_STALE_REFRESH_WINDOW": "120",
+    }
+    return lambda key: values[key]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_concurrent_loads():
+    calls = 0
+    release = asyncio.Event()
+
+    async def _loader():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "response"
+
+    with patch("pecha_api.cache.single_flight.config.get", side_effect=_mock_config_get()):
+        tasks = [asyncio.create_task(single_flight(key="key_1", loader=_loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert results == ["response"] * 5
+    assert calls == 1
+    assert "key_1" not in single_flight_module._in_flight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_to_waiters():
+    release = asyncio.Event()
+
+    async def _loader():
+        await release.wait()
+        raise ValueError("boom")
+
+    with patch("pecha_api.cache.single_flight.config.get", side_effect=_mock_config_get()):
+        tasks = [asyncio.create_task(single_flight(key="key_2", loader=_loader)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert "key_2" not in single_flight_module._in_flight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waits_for_other_worker_holding_lock():
+    loader = AsyncMock(return_value="loaded")
+    read = AsyncMock(side_effect=[None, "cached"])
+
+    with patch("pecha_api.cache.single_flight.config.get", side_effect=_mock_config_get(lock_enabled="true")), \
+        patch("pecha_api.cache.single_flight.config.get_int", side_effect=lambda key: int(_mock_config_get()(key))), \
+        patch("pecha_api.cache.single_flight.acquire_lock", new_callable=AsyncMock, return_value=False):
+        result = await single_flight(key="key_3", loader=loader, read=read)
+
+    assert result == "cached"
+    loader.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_releases_lock_after_load():
+    with patch("pecha_api.cache.single_flight.config.get", side_effect=_mock_config_get(lock_enabled="true")), \
+        patch("pecha_api.cache.single_flight.config.get_int", side_effect=lambda key: int(_mock_config_get()(key))), \
+        patch("pecha_api.cache.single_flight.acquire_lock", new_callable=AsyncMock, return_value=True), \
+        patch("pecha_api.cache.single_flight.release_lock", new_callable=AsyncMock) as mock_release:
+        result = await single_flight(key="key_4", loader=AsyncMock(return_value="loaded"), read=AsyncMock())
+
+    assert result == "loaded"
+    mock_release.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_cache_data_with_refresh_serves_stale_and_refreshes_once():
+    refresh = AsyncMock(return_value={"id": "new"})
+
+    with patch("pecha_api.cache.single_flight.config.get", side_effect=_mock_config_get()), \
+        patch("pecha_api.cache.single_flight.config.get_int", side_effect=lambda key: int(_mock_config_get()(key))), \
+        patch("pecha_api.cache.single_flight.get_cache_data_with_ttl", new_callable=AsyncMock, return_value=({"id": "old"}, 30)):
+        results = [await get_cache_data_with_refresh(hash_key="key_5", refresh=refresh, cache_time_out=1800) for _ in range(3)]
+        await asyncio.gather(*single_flight_module._background_refreshes.values())
+
+    assert results == [{"id": "old"}] * 3
+    refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_cache_data_with_refresh_fresh_entry_does_not_refresh():
+    refresh = AsyncMock()
+
+    with patch("pecha_api.cache.single_flight.config.get_int", side_effect=lambda key: int(_mock_config_get()(key))), \
+        patch("pecha_api.cache.single_flight.get_cache_data_with_ttl", new_callable=AsyncMock, return_value=({"id": "old"}, 1000)):
+        result = await get_cache_data_with_refresh(hash_key="key_6", refresh=refresh, cache_time_out=1800)
+
+    assert result == {"id": "old"}
+    refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_cache_data_with_refresh_short_lived_entry_window():
+    refresh = AsyncMock()
+
+    with patch("pecha_api.cache.single_flight.config.get_int", side_effect=lambda key: int(_mock_config_get()(key))), \
+        patch("pecha_api.cache.single_flight.get_cache_data_with_ttl", new_callable=AsyncMock, return_value=({"id": "old"}, 30)):
+        result = await get_cache_data_with_refresh(hash_key="key_7", refresh=refresh, cache_time_out=60)
+
+    assert result == {"id": "old"}
+    refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_follower_loads_when_leader_is_cancelled():
+    release = asyncio.Event()
+    calls = 0
+
+    async def _loader():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await release.wait()
+        return "response"
+
+    with patch("pecha_api.cache.single_flight.config.get", side_effect=_mock_config_get()):
+        leader = asyncio.create_task(single_flight(key="key_8", loader=_loader))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(single_flight(key="key_8", loader=_loader))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result = await follower
+
+    assert result == "response"
+    assert leader.cancelled()
+    assert calls == 2
+    assert "key_8" not in single_flight_module._in_flight
@@ -56,6 +56,7 @@ async def test_create_new_collection():
 @pytest.mark.asyncio
 async def test_update_existing_collection():
     with patch("pecha_api.collections.collections_service.verify_admin_access", return_value=True), \
+            patch("pecha_api.collections.collections_service.invalidate_collection_cache", new_callable=AsyncMock) as mock_invalidate, \
             patch("pecha_api.collections.collections_service.update_collection_titles",
                   new_callable=AsyncMock) as mock_update_collection_titles:
         mock_update_collection_titles.return_value = AsyncMock(pecha_collection_id="pecha_id_1", titles={"en": "Updated Collection"}, descriptions={"en": "Description 1"}, slug="updated-collection",parent_id=None)
@@ -64,15 +65,18 @@ async def test_update_existing_collection():
                                               language="en")
         assert isinstance(response, CollectionModel)
         assert response.title == "Updated Collection"
+        mock_invalidate.assert_awaited_once_with(collection_ids=["1"])
 
 
 @pytest.mark.asyncio
 async def test_delete_existing_collection():
     with patch("pecha_api.collections.collections_service.verify_admin_access", return_value=True), \
+            patch("pecha_api.collections.collections_service.invalidate_collection_cache", new_callable=AsyncMock) as mock_invalidate, \
             patch("pecha_api.collections.collections_service.delete_collection", new_callable=AsyncMock) as mock_delete_collection:
         mock_delete_collection.return_value = "id_1"
         response = await delete_existing_collection(collection_id="id_1", token="valid_token")
         assert response == "id_1"
+        mock_invalidate.assert_awaited_once_with(collection_ids=["id_1"])
 
 
 @pytest.mark.asyncio
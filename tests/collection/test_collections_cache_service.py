@@ -6,7 +6,8 @@ from pecha_api.collections.collections_cache_service import (
     set_collections_cache,
     get_collection_detail_cache,
     set_collection_detail_cache,
-    delete_collection_cache
+    delete_collection_cache,
+    invalidate_collection_cache
 )
 from pecha_api.collections.collections_response_models import (
     CollectionsResponse,
@@ -364,4 +365,21 @@ async def test_set_collection_detail_cache_with_none_data():
         mock_set_cache.assert_called_once()
         call_args = mock_set_cache.call_args
         assert call_args.kwargs["value"] is None
-        assert call_args.kwargs["cache_time_out"] == 1800 
\ No newline at end of file
+        assert call_args.kwargs["cache_time_out"] == 1800 
+
+
+@pytest.mark.asyncio
+async def test_invalidate_collection_cache_drops_tagged_entries():
+    with patch("pecha_api.collections.collections_cache_service.invalidate_tags", new_callable=AsyncMock, return_value=["key_1"]) as mock_invalidate_tags, \
+            patch("pecha_api.collections.collections_cache_service.publish_local_cache_invalidation", new_callable=AsyncMock) as mock_publish:
+        result = await invalidate_collection_cache(collection_ids=["collection_1", None])
+
+        assert result is True
+        mock_invalidate_tags.assert_awaited_once_with(tags=["tag:collection:collection_1"])
+        mock_publish.assert_awaited_once_with(hash_keys=["key_1"])
+
+
+@pytest.mark.asyncio
+async def test_invalidate_collection_cache_handles_errors():
+    with patch("pecha_api.collections.collections_cache_service.invalidate_tags", new_callable=AsyncMock, side_effect=Exception("redis down")):
+        assert await invalidate_collection_cache(collection_ids=["collection_1"]) is False
@@ -0,0 +1,20 @@
+import pytest
+
+from pecha_api.users.user_principal_cache import user_principal_cache
+from pecha_api.uploads.presigned_url_cache import presigned_url_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_user_principal_cache():
+    # tests reuse token strings with different mocked users
+    user_principal_cache.clear()
+    yield
+    user_principal_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_presigned_url_cache():
+    # tests sign the same keys against differently mocked S3 clients
+    presigned_url_cache.clear()
+    yield
+    presigned_url_cache.clear()
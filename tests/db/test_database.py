@@ -0,0 +1,45 @@
+import threading
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from pecha_api.db.database import (
+    _pool_options,
+    run_with_session,
+    dispose_engine
+)
+
+
+def test_pool_options_come_from_config():
+    options = _pool_options()
+
+    assert options["pool_size"] == 10
+    assert options["max_overflow"] == 20
+    assert options["pool_recycle"] == 1800
+    assert options["pool_timeout"] == 30
+    assert options["pool_pre_ping"] is True
+
+
+@pytest.mark.asyncio
+async def test_run_with_session_runs_off_the_event_loop_thread():
+    mock_db = MagicMock()
+    mock_session_local = MagicMock()
+    mock_session_local.return_value.__enter__.return_value = mock_db
+    loop_thread = threading.get_ident()
+
+    def work(db):
+        return db, threading.get_ident()
+
+    with patch("pecha_api.db.database.SessionLocal", mock_session_local):
+        db, worker_thread = await run_with_session(work)
+
+    assert db is mock_db
+    assert worker_thread != loop_thread
+    mock_session_local.return_value.__exit__.assert_called_once()
+
+
+def test_dispose_engine():
+    with patch("pecha_api.db.database.engine") as mock_engine:
+        dispose_engine()
+
+    mock_engine.dispose.assert_called_once()
@@ -1,7 +1,7 @@
 import os
 import uuid
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from pecha_api.db.database import Base
@@ -27,6 +27,9 @@ TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engin
 @pytest.fixture(scope="module")
 def db():
     # Create only the plans-related tables needed for these tests
+    with engine.begin() as connection:
+        # the plan title/description indexes use trigram operator classes
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(
         bind=engine,
         tables=[Users.__table__, Author.__table__, Plan.__table__, PlanItem.__table__, UserPlanProgress.__table__],
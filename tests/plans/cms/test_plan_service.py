@@ -1,6 +1,6 @@
 import uuid
 import pytest
-from unittest.mock import patch, MagicMock, ANY
+from unittest.mock import patch, MagicMock, AsyncMock, ANY
 from fastapi import HTTPException
 
 import pecha_api.plans.cms.cms_plans_service as plans_service
@@ -14,7 +14,7 @@ from pecha_api.plans.plans_response_models import (
 )
 from pecha_api.plans.cms.cms_plans_service import (
     create_new_plan, get_filtered_plans, get_details_plan,
-    update_plan_details, update_selected_plan_status, delete_selected_plan, get_plan_day_details,
+    update_plan_details, update_selected_plan_status, delete_selected_plan, get_plan_day_details, update_plan_featured_service,
     DUMMY_PLANS, DUMMY_DAYS
 )
 
@@ -777,6 +777,7 @@ async def test_update_selected_plan_status_success_db_backed():
          patch("pecha_api.plans.cms.cms_plans_service.get_plan_items_by_plan_id") as mock_get_items, \
          patch("pecha_api.plans.cms.cms_plans_service.get_plan_progress") as mock_get_progress, \
          patch("pecha_api.plans.cms.cms_plans_service.update_plan") as mock_update_plan, \
+         patch("pecha_api.plans.cms.cms_plans_service.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
          patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details") as mock_validate_author:
         db_session = _mock_session_local(mock_session_local)
 
@@ -801,6 +802,7 @@ async def test_update_selected_plan_status_success_db_backed():
         assert resp.total_days == len(items)
         assert resp.subscription_count == len(user_progress)
         assert resp.image_url == mock_plan.image_url
+        mock_invalidate.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -906,3 +908,26 @@ async def test_delete_selected_plan_success():
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id)
         mock_soft_delete.assert_called_once_with(db=db_session, plan_id=plan_id, author=author)
 
+
+
+@pytest.mark.asyncio
+async def test_update_plan_featured_service_toggles_and_invalidates_featured_day_cache():
+    plan_id = uuid.uuid4()
+    author_id = uuid.uuid4()
+    mock_plan = MagicMock(spec=Plan)
+    mock_plan.id = plan_id
+    mock_plan.author_id = author_id
+    mock_plan.featured = False
+
+    with patch("pecha_api.plans.cms.cms_plans_service.SessionLocal") as mock_session_local, \
+         patch("pecha_api.plans.cms.cms_plans_service.get_plan_by_id", return_value=mock_plan), \
+         patch("pecha_api.plans.cms.cms_plans_service.update_plan", return_value=mock_plan) as mock_update_plan, \
+         patch("pecha_api.plans.cms.cms_plans_service.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
+         patch("pecha_api.plans.cms.cms_plans_service.validate_and_extract_author_details", return_value=MagicMock(id=author_id, is_admin=False)):
+        db_session = _mock_session_local(mock_session_local)
+
+        await update_plan_featured_service(token="tkn", plan_id=plan_id)
+
+    assert mock_plan.featured is True
+    mock_update_plan.assert_called_once_with(db=db_session, plan=mock_plan)
+    mock_invalidate.assert_awaited_once()
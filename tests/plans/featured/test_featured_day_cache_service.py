@@ -0,0 +1,100 @@
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+from unittest.mock import patch, AsyncMock
+
+from pecha_api.plans.featured.featured_day_cache_service import (
+    featured_day_cache_key,
+    featured_day_cache_timeout,
+    get_featured_day_cache,
+    invalidate_featured_day_cache,
+    set_featured_day_cache
+)
+from pecha_api.plans.featured.featured_day_response_model import PlanDayDTO, TaskDTO, SubTaskDTO
+from pecha_api.plans.plans_enums import ContentType
+
+
+def _plan_day(content_type: ContentType) -> PlanDayDTO:
+    return PlanDayDTO(
+        id=uuid4(),
+        day_number=1,
+        tasks=[
+            TaskDTO(
+                id=uuid4(),
+                title="Morning Meditation",
+                subtasks=[SubTaskDTO(id=uuid4(), content_type=content_type, content="content")]
+            )
+        ]
+    )
+
+
+def test_featured_day_cache_key_per_language_and_day():
+    key = featured_day_cache_key(language="EN", day=date(2024, 5, 1))
+
+    assert key.startswith("featured_day:EN:")
+    assert key != featured_day_cache_key(language="EN", day=date(2024, 5, 2))
+    assert key != featured_day_cache_key(language="BO", day=date(2024, 5, 1))
+
+
+def test_featured_day_cache_timeout_until_midnight():
+    with patch("pecha_api.plans.featured.featured_day_cache_service.datetime") as mock_datetime:
+        mock_datetime.now.return_value = datetime(2024, 5, 1, 22, 0, 0)
+        mock_datetime.combine = datetime.combine
+
+        assert featured_day_cache_timeout(day=date(2024, 5, 1), featured_day=_plan_day(ContentType.TEXT)) == 7200
+
+
+def test_featured_day_cache_timeout_capped_for_signed_urls():
+    with patch("pecha_api.plans.featured.featured_day_cache_service.datetime") as mock_datetime, \
+         patch("pecha_api.plans.featured.featured_day_cache_service.config.get_int", return_value=900):
+        mock_datetime.now.return_value = datetime(2024, 5, 1, 22, 0, 0)
+        mock_datetime.combine = datetime.combine
+
+        assert featured_day_cache_timeout(day=date(2024, 5, 1), featured_day=_plan_day(ContentType.IMAGE)) == 900
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_cache_rebuilds_dto():
+    plan_day = _plan_day(ContentType.TEXT)
+
+    with patch("pecha_api.plans.featured.featured_day_cache_service.get_cache_data", new_callable=AsyncMock, return_value=plan_day.model_dump(mode="json")):
+
+        result = await get_featured_day_cache(language="EN", day=date(2024, 5, 1))
+
+        assert result == plan_day
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_cache_miss():
+    with patch("pecha_api.plans.featured.featured_day_cache_service.get_cache_data", new_callable=AsyncMock, return_value=None):
+
+        assert await get_featured_day_cache(language="EN", day=date(2024, 5, 1)) is None
+
+
+@pytest.mark.asyncio
+async def test_set_featured_day_cache():
+    plan_day = _plan_day(ContentType.TEXT)
+    day = date(2024, 5, 1)
+
+    with patch("pecha_api.plans.featured.featured_day_cache_service.set_cache", new_callable=AsyncMock) as mock_set_cache, \
+         patch("pecha_api.plans.featured.featured_day_cache_service.featured_day_cache_timeout", return_value=600):
+
+        await set_featured_day_cache(language="EN", day=day, featured_day=plan_day)
+
+        mock_set_cache.assert_awaited_once_with(
+            hash_key=featured_day_cache_key(language="EN", day=day),
+            value=plan_day,
+            cache_time_out=600,
+            tags=["tag:featured_day"]
+        )
+
+
+@pytest.mark.asyncio
+async def test_invalidate_featured_day_cache_drops_tagged_entries():
+    with patch("pecha_api.plans.featured.featured_day_cache_service.invalidate_tags", new_callable=AsyncMock, return_value=["featured_day:EN:abc"]) as mock_invalidate_tags, \
+         patch("pecha_api.plans.featured.featured_day_cache_service.publish_local_cache_invalidation", new_callable=AsyncMock) as mock_publish:
+
+        assert await invalidate_featured_day_cache() is True
+
+        mock_invalidate_tags.assert_awaited_once_with(tags=["tag:featured_day"])
+        mock_publish.assert_awaited_once_with(hash_keys=["featured_day:EN:abc"])
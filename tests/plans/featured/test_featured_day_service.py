@@ -1,15 +1,36 @@
 import pytest
 from uuid import uuid4
-from unittest.mock import patch, MagicMock, Mock
+from contextlib import contextmanager
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
 from fastapi import HTTPException
 from starlette import status
 from datetime import date
 
-from pecha_api.plans.featured.featured_day_service import get_featured_day_service
+from pecha_api.plans.featured.featured_day_service import get_featured_day_service, prewarm_featured_days
 from pecha_api.plans.featured.featured_day_response_model import PlanDayDTO, TaskDTO, SubTaskDTO
 from pecha_api.plans.plans_enums import ContentType
 
 
+@pytest.fixture(autouse=True)
+def mock_featured_day_cache():
+    with patch("pecha_api.plans.featured.featured_day_service.get_featured_day_cache", new_callable=AsyncMock, return_value=None) as mock_get_cache, \
+         patch("pecha_api.plans.featured.featured_day_service.set_featured_day_cache", new_callable=AsyncMock) as mock_set_cache:
+        yield mock_get_cache, mock_set_cache
+
+
+def _run_with(db):
+    async def _run(work):
+        return work(db)
+    return _run
+
+
+@contextmanager
+def _featured_days(featured_days):
+    with patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=len(featured_days)) as mock_count, \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_by_offset", side_effect=lambda db, offset, language: featured_days[offset]):
+        yield mock_count
+
+
 @pytest.fixture
 def mock_db_session():
     session = MagicMock()
@@ -54,13 +75,13 @@ async def test_get_featured_day_service_success(sample_plan_item, mock_db_sessio
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892 
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[sample_plan_item]) as mock_repo, \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([sample_plan_item]) as mock_repo, \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert isinstance(result, PlanDayDTO)
         assert result.id == sample_plan_item.id
@@ -83,7 +104,7 @@ async def test_get_featured_day_service_success(sample_plan_item, mock_db_sessio
         assert subtask.duration == "12:00"
         assert subtask.display_order == 1
         
-        mock_repo.assert_called_once_with(mock_db_session.__enter__.return_value, language="EN")
+        mock_repo.assert_called_once_with(mock_db_session, language="EN")
         mock_datetime.now.assert_called_once()
 
 
@@ -129,13 +150,13 @@ async def test_get_featured_day_service_multiple_tasks():
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]) as mock_repo, \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]) as mock_repo, \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.day_number == 7
         assert len(result.tasks) == 2
@@ -148,21 +169,21 @@ async def test_get_featured_day_service_multiple_tasks():
         assert result.tasks[1].title == "Evening Reflection"
         assert len(result.tasks[1].subtasks) == 0
         
-        mock_repo.assert_called_once_with(mock_db_session.__enter__.return_value, language="EN")
+        mock_repo.assert_called_once_with(mock_db_session, language="EN")
 
 
 @pytest.mark.asyncio
 async def test_get_featured_day_service_no_featured_plans(mock_db_session):
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[]) as mock_repo:
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([]) as mock_repo:
         
         with pytest.raises(HTTPException) as exc_info:
-            get_featured_day_service(language="EN")
+            await get_featured_day_service(language="EN")
         
         assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
         assert exc_info.value.detail == "No featured plans with days found"
         
-        mock_repo.assert_called_once_with(mock_db_session.__enter__.return_value, language="EN")
+        mock_repo.assert_called_once_with(mock_db_session, language="EN")
 
 
 @pytest.mark.asyncio
@@ -175,13 +196,13 @@ async def test_get_featured_day_service_empty_tasks(mock_db_session):
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.day_number == 1
         assert result.tasks == []
@@ -222,13 +243,13 @@ async def test_get_featured_day_service_task_sorting():
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert len(result.tasks) == 3
         assert result.tasks[0].title == "Task 1"
@@ -281,13 +302,13 @@ async def test_get_featured_day_service_subtask_sorting():
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert len(result.tasks[0].subtasks) == 3
         assert result.tasks[0].subtasks[0].content == "Subtask 1"
@@ -322,11 +343,11 @@ async def test_get_featured_day_service_date_based_selection_from_multiple():
     mock_db_session.__enter__ = Mock(return_value=mock_db_session)
     mock_db_session.__exit__ = Mock(return_value=None)
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=featured_days):
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days(featured_days):
         
-        result1 = get_featured_day_service(language="EN")
-        result2 = get_featured_day_service(language="EN")
+        result1 = await get_featured_day_service(language="EN")
+        result2 = await get_featured_day_service(language="EN")
         
         assert result1.id == result2.id
         assert result1.day_number == result2.day_number
@@ -385,13 +406,13 @@ async def test_get_featured_day_service_with_all_content_types():
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         subtasks = result.tasks[0].subtasks
         assert len(subtasks) == 4
@@ -429,13 +450,13 @@ async def test_get_featured_day_service_with_optional_fields_none():
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.tasks[0].title is None
         assert result.tasks[0].estimated_time is None
@@ -447,11 +468,11 @@ async def test_get_featured_day_service_with_optional_fields_none():
 
 @pytest.mark.asyncio
 async def test_get_featured_day_service_database_error(mock_db_session):
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", side_effect=Exception("Database connection error")):
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", side_effect=Exception("Database connection error")):
         
         with pytest.raises(Exception) as exc_info:
-            get_featured_day_service(language="EN")
+            await get_featured_day_service(language="EN")
         
         assert str(exc_info.value) == "Database connection error"
 
@@ -466,13 +487,13 @@ async def test_get_featured_day_service_large_day_number(mock_db_session):
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert result.day_number == 365
 
@@ -508,15 +529,96 @@ async def test_get_featured_day_service_many_subtasks():
     mock_date = MagicMock()
     mock_date.toordinal.return_value = 738892
     
-    with patch("pecha_api.plans.featured.featured_day_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.featured.featured_day_service.get_all_featured_plan_days", return_value=[plan_item]), \
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([plan_item]), \
          patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
         
         mock_datetime.now.return_value.date.return_value = mock_date
         
-        result = get_featured_day_service(language="EN")
+        result = await get_featured_day_service(language="EN")
         
         assert len(result.tasks[0].subtasks) == 20
         for i, subtask in enumerate(result.tasks[0].subtasks, 1):
             assert subtask.content == f"Subtask {i}"
             assert subtask.display_order == i
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_selects_day_by_offset(mock_db_session):
+    featured_days = []
+    for day_number in range(1, 4):
+        plan_item = MagicMock()
+        plan_item.id = uuid4()
+        plan_item.day_number = day_number
+        plan_item.tasks = []
+        featured_days.append(plan_item)
+
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         patch("pecha_api.plans.featured.featured_day_service.count_featured_plan_days", return_value=3), \
+         patch("pecha_api.plans.featured.featured_day_service.get_featured_plan_day_by_offset", return_value=featured_days[1]) as mock_by_offset, \
+         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
+
+        mock_datetime.now.return_value.date.return_value = date.fromordinal(738892)
+
+        result = await get_featured_day_service(language="en")
+
+        assert result.day_number == 2
+        mock_by_offset.assert_called_once_with(mock_db_session, offset=738892 % 3, language="EN")
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_caches_built_day(sample_plan_item, mock_db_session, mock_featured_day_cache):
+    _, mock_set_cache = mock_featured_day_cache
+    today = date(2024, 5, 1)
+
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([sample_plan_item]), \
+         patch("pecha_api.plans.featured.featured_day_service.datetime") as mock_datetime:
+
+        mock_datetime.now.return_value.date.return_value = today
+
+        result = await get_featured_day_service(language="en")
+
+        mock_set_cache.assert_awaited_once_with(language="EN", day=today, featured_day=result)
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_cache_hit(mock_featured_day_cache):
+    mock_get_cache, mock_set_cache = mock_featured_day_cache
+    cached_day = PlanDayDTO(id=uuid4(), day_number=3, tasks=[])
+    mock_get_cache.return_value = cached_day
+
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", new_callable=AsyncMock) as mock_run_with_session:
+
+        result = await get_featured_day_service(language="en")
+
+        assert result == cached_day
+        mock_run_with_session.assert_not_called()
+        mock_set_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_featured_day_service_no_featured_plans_not_cached(mock_db_session, mock_featured_day_cache):
+    _, mock_set_cache = mock_featured_day_cache
+
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", side_effect=_run_with(mock_db_session)), \
+         _featured_days([]):
+
+        with pytest.raises(HTTPException):
+            await get_featured_day_service(language="EN")
+
+        mock_set_cache.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_featured_days_builds_every_language():
+    tomorrow = date(2024, 5, 2)
+
+    with patch("pecha_api.plans.featured.featured_day_service.run_with_session", new_callable=AsyncMock, return_value=["EN", "BO"]), \
+         patch("pecha_api.plans.featured.featured_day_service.build_featured_day", new_callable=AsyncMock) as mock_build:
+
+        await prewarm_featured_days(day=tomorrow)
+
+        assert mock_build.await_count == 2
+        mock_build.assert_any_await(language="EN", day=tomorrow)
+        mock_build.assert_any_await(language="BO", day=tomorrow)
@@ -0,0 +1,81 @@
+import io
+from unittest.mock import patch
+
+from PIL import Image
+
+from pecha_api.plans.media.image_pipeline import (
+    convert_to_rgb,
+    downscale,
+    get_supported_formats,
+    render_image_versions
+)
+
+
+def _image_bytes(width: int, height: int, mode: str = "RGB", image_format: str = "JPEG") -> bytes:
+    output = io.BytesIO()
+    Image.new(mode, (width, height), color="red" if mode == "RGB" else None).save(output, format=image_format)
+    return output.getvalue()
+
+
+def _open(data: bytes) -> Image.Image:
+    return Image.open(io.BytesIO(data))
+
+
+def test_render_image_versions_sizes():
+    versions = render_image_versions(data=_image_bytes(1600, 900), formats=["jpeg"])
+
+    sizes = {version_name: _open(data).size for version_name, _, data in versions}
+    assert [version_name for version_name, _, _ in versions] == ["original", "medium", "thumbnail"]
+    assert sizes["original"] == (1600, 900)
+    assert sizes["medium"] == (800, 450)
+    assert sizes["thumbnail"] == (200, 112)
+
+
+def test_render_image_versions_every_format():
+    versions = render_image_versions(data=_image_bytes(400, 400), formats=["jpeg", "webp"])
+
+    assert [(version_name, image_format) for version_name, image_format, _ in versions] == [
+        ("original", "jpeg"), ("original", "webp"),
+        ("medium", "jpeg"), ("medium", "webp"),
+        ("thumbnail", "jpeg"), ("thumbnail", "webp"),
+    ]
+    assert _open(versions[1][2]).format == "WEBP"
+
+
+def test_render_image_versions_never_upscales():
+    versions = render_image_versions(data=_image_bytes(150, 100), formats=["jpeg"])
+
+    assert all(_open(data).size == (150, 100) for _, _, data in versions)
+
+
+def test_render_image_versions_max_width():
+    versions = render_image_versions(data=_image_bytes(3200, 1600), formats=["jpeg"], max_width=1000)
+
+    assert _open(versions[0][2]).size == (1000, 500)
+    assert _open(versions[1][2]).size == (800, 400)
+
+
+def test_render_image_versions_transparent_png():
+    versions = render_image_versions(data=_image_bytes(300, 300, mode="RGBA", image_format="PNG"), formats=["jpeg"])
+
+    original = _open(versions[0][2])
+    assert original.mode == "RGB"
+    assert original.getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_downscale_keeps_aspect_ratio():
+    assert downscale(Image.new("RGB", (1000, 500)), 200).size == (200, 100)
+
+
+def test_convert_to_rgb_from_grayscale():
+    assert convert_to_rgb(Image.new("L", (10, 10))).mode == "RGB"
+
+
+def test_get_supported_formats():
+    with patch("pecha_api.plans.media.image_pipeline.features.check", return_value=True):
+        assert get_supported_formats([" WebP", "avif", "gif", "webp", ""]) == ["jpeg", "webp", "avif"]
+
+
+def test_get_supported_formats_without_encoder():
+    with patch("pecha_api.plans.media.image_pipeline.features.check", side_effect=lambda image_format: image_format == "webp"):
+        assert get_supported_formats(["webp", "avif"]) == ["jpeg", "webp"]
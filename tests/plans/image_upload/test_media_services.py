@@ -28,7 +28,8 @@ TEST_PRESIGNED_URL = f"https://s3.amazonaws.com/{TEST_BUCKET_NAME}/{TEST_S3_KEY}
 IMAGE_UTILS_PATH = "pecha_api.plans.media.media_services.ImageUtils"
 IMAGE_OPEN_PATH = "pecha_api.plans.media.media_services.Image.open"
 UPLOAD_BYTES_PATH = "pecha_api.plans.media.media_services.upload_bytes"
-GENERATE_URL_PATH = "pecha_api.plans.media.media_services.generate_presigned_access_url"
+SIGN_MANY_PATH = "pecha_api.plans.media.media_services.sign_many"
+RENDER_IMAGE_VERSIONS_PATH = "pecha_api.plans.media.media_services.render_image_versions"
 VALIDATE_AUTHOR_PATH = "pecha_api.plans.media.media_services.validate_and_extract_author_details"
 UUID_PATH = "pecha_api.plans.media.media_services.uuid.uuid4"
 GET_CONFIG_PATH = "pecha_api.plans.media.media_services.get"
@@ -81,7 +82,10 @@ class TestDataFactory:
         return {
             "ALLOWED_EXTENSIONS": [".jpg", ".jpeg", ".png", ".webp"],
             "AWS_BUCKET_NAME": TEST_BUCKET_NAME,
-            "MAX_FILE_SIZE": 5 * 1024 * 1024  # 5MB
+            "MAX_FILE_SIZE": 5 * 1024 * 1024,  # 5MB
+            "MEDIA_IMAGE_FORMATS": "",
+            "MEDIA_IMAGE_WORKERS": 0,
+            "MEDIA_IMAGE_MAX_WIDTH": 0
         }
     
     @staticmethod
@@ -147,7 +151,8 @@ class MockManager:
             'get_int_config': patch(GET_INT_CONFIG_PATH),
             'image_open': patch(IMAGE_OPEN_PATH),
             'upload_bytes': patch(UPLOAD_BYTES_PATH),
-            'presigned_url': patch(GENERATE_URL_PATH),
+            'sign_many': patch(SIGN_MANY_PATH),
+            'render_image_versions': patch(RENDER_IMAGE_VERSIONS_PATH),
             'validate_author': patch(VALIDATE_AUTHOR_PATH),
             'uuid': patch(UUID_PATH)
         }
@@ -172,7 +177,14 @@ class MockManager:
         
         # Mock S3 operations - return different keys for different versions
         self.mocks['upload_bytes'].side_effect = lambda **kwargs: kwargs['s3_key']
-        self.mocks['presigned_url'].side_effect = lambda **kwargs: f"https://s3.amazonaws.com/{TEST_BUCKET_NAME}/{kwargs['s3_key']}"
+        self.mocks['sign_many'].side_effect = lambda **kwargs: {
+            s3_key: f"https://s3.amazonaws.com/{TEST_BUCKET_NAME}/{s3_key}" for s3_key in kwargs['s3_keys']
+        }
+        self.mocks['render_image_versions'].side_effect = lambda data, formats, max_width: [
+            (version_name, image_format, b"rendered image")
+            for version_name in ("original", "medium", "thumbnail")
+            for image_format in formats
+        ]
         self.mocks['validate_author'].return_value = TestDataFactory.create_mock_author()
         self.mocks['uuid'].return_value = TEST_UUID
         
@@ -301,14 +313,15 @@ class TestImageUploadSuccess:
         mocks['image_open'].assert_called_once()
         # Should be called 3 times (thumbnail, medium, original)
         assert mocks['upload_bytes'].call_count == 3
-        assert mocks['presigned_url'].call_count == 3
+        mocks['sign_many'].assert_called_once()
     
-    def test_successful_upload_without_plan_id(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_successful_upload_without_plan_id(self, mock_upload_file):
         """Test successful upload without plan_id"""
         with MockManager() as mock_manager:
             from pecha_api.plans.media.media_services import upload_plan_image
             
-            result = upload_plan_image(
+            result = await upload_plan_image(
                 token=VALID_TOKEN,
                 plan_id=None,
                 file=mock_upload_file
@@ -328,12 +341,13 @@ class TestImageUploadSuccess:
             
             self._assert_successful_response(result, f"images/plan_images/{TEST_UUID}")
     
-    def test_successful_upload_with_plan_id(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_successful_upload_with_plan_id(self, mock_upload_file):
         """Test successful upload with plan_id"""
         with MockManager() as mock_manager:
             from pecha_api.plans.media.media_services import upload_plan_image
             
-            result = upload_plan_image(
+            result = await upload_plan_image(
                 token=VALID_TOKEN,
                 plan_id=TEST_PLAN_ID,
                 file=mock_upload_file
@@ -346,7 +360,8 @@ class TestImageUploadSuccess:
                 assert f"images/plan_images/{TEST_PLAN_ID}/{TEST_UUID}" in s3_key
             assert TEST_PLAN_ID in result.path
     
-    def test_upload_with_different_content_types(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_upload_with_different_content_types(self, mock_upload_file):
         """Test upload with different image content types"""
         content_types = ["image/jpeg", "image/png", "image/webp"]
         
@@ -355,7 +370,7 @@ class TestImageUploadSuccess:
                 mock_upload_file.content_type = content_type
                 
                 from pecha_api.plans.media.media_services import upload_plan_image
-                result = upload_plan_image(
+                result = await upload_plan_image(
                     token=VALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -370,13 +385,14 @@ class TestImageUploadSuccess:
         ("简体中文.jpg", "unicode characters"),
         ("file-with-dashes.png", "dashes in filename")
     ])
-    def test_upload_with_edge_case_filenames(self, mock_upload_file, filename, description):
+    @pytest.mark.asyncio
+    async def test_upload_with_edge_case_filenames(self, mock_upload_file, filename, description):
         """Test upload with various edge case filenames"""
         with MockManager() as mock_manager:
             mock_upload_file.filename = filename
             
             from pecha_api.plans.media.media_services import upload_plan_image
-            result = upload_plan_image(
+            result = await upload_plan_image(
                 token=VALID_TOKEN,
                 plan_id=None,
                 file=mock_upload_file
@@ -385,13 +401,14 @@ class TestImageUploadSuccess:
             assert isinstance(result, PlanUploadResponse)
             assert result.message == IMAGE_UPLOAD_SUCCESS
     
-    def test_upload_with_empty_file_content(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_upload_with_empty_file_content(self, mock_upload_file):
         """Test upload with empty file content"""
         with MockManager() as mock_manager:
             mock_upload_file.file = io.BytesIO(b"")
             
             from pecha_api.plans.media.media_services import upload_plan_image
-            result = upload_plan_image(
+            result = await upload_plan_image(
                 token=VALID_TOKEN,
                 plan_id=None,
                 file=mock_upload_file
@@ -404,7 +421,8 @@ class TestImageUploadSuccess:
 class TestImageUploadAuthentication:
     """Test cases for authentication-related upload scenarios"""
     
-    def test_upload_with_invalid_token_fails(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_upload_with_invalid_token_fails(self, mock_upload_file):
         """Test that upload fails with invalid authentication token"""
         with patch(VALIDATE_AUTHOR_PATH) as mock_validate_author:
             mock_validate_author.side_effect = HTTPException(
@@ -414,7 +432,7 @@ class TestImageUploadAuthentication:
             
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(HTTPException) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token=INVALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -423,7 +441,8 @@ class TestImageUploadAuthentication:
             assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
             assert exc_info.value.detail == AUTHOR_NOT_FOUND
     
-    def test_upload_with_expired_token_fails(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_upload_with_expired_token_fails(self, mock_upload_file):
         """Test that upload fails with expired token"""
         with patch(VALIDATE_AUTHOR_PATH) as mock_validate_author:
             mock_validate_author.side_effect = HTTPException(
@@ -433,7 +452,7 @@ class TestImageUploadAuthentication:
             
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(HTTPException) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token="expired_token",
                     plan_id=None,
                     file=mock_upload_file
@@ -446,7 +465,8 @@ class TestImageUploadAuthentication:
 class TestImageUploadValidation:
     """Test cases for file validation during upload"""
     
-    def test_upload_with_invalid_file_format_fails(self, mock_upload_file, test_config):
+    @pytest.mark.asyncio
+    async def test_upload_with_invalid_file_format_fails(self, mock_upload_file, test_config):
         """Test that upload fails with invalid file format"""
         mock_upload_file.filename = "test_document.pdf"
         
@@ -455,7 +475,7 @@ class TestImageUploadValidation:
              patch(VALIDATE_AUTHOR_PATH):
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(HTTPException) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token=VALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -464,7 +484,8 @@ class TestImageUploadValidation:
             assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
             assert exc_info.value.detail == INVALID_FILE_FORMAT
     
-    def test_upload_with_oversized_file_fails(self, mock_upload_file, test_config):
+    @pytest.mark.asyncio
+    async def test_upload_with_oversized_file_fails(self, mock_upload_file, test_config):
         """Test that upload fails with oversized file"""
         mock_upload_file.size = 6 * 1024 * 1024  # 6MB
         
@@ -473,7 +494,7 @@ class TestImageUploadValidation:
              patch(VALIDATE_AUTHOR_PATH):
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(HTTPException) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token=VALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -486,7 +507,8 @@ class TestImageUploadValidation:
 class TestImageUploadErrorHandling:
     """Test cases for error handling during upload process"""
     
-    def test_image_open_failure(self, mock_upload_file, test_config):
+    @pytest.mark.asyncio
+    async def test_image_open_failure(self, mock_upload_file, test_config):
         """Test handling of image open failures"""
         with patch(GET_CONFIG_PATH, side_effect=lambda key: test_config.get(key)), \
              patch(GET_INT_CONFIG_PATH, side_effect=lambda key: test_config.get(key)), \
@@ -496,7 +518,7 @@ class TestImageUploadErrorHandling:
             
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(HTTPException) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token=VALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -505,14 +527,15 @@ class TestImageUploadErrorHandling:
             assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
             assert exc_info.value.detail == "Invalid image file"
     
-    def test_s3_upload_failure(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_s3_upload_failure(self, mock_upload_file):
         """Test handling of S3 upload failures"""
         with MockManager() as mock_manager:
             mock_manager.mocks['upload_bytes'].side_effect = Exception("S3 upload failed")
             
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(Exception) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token=VALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -520,14 +543,15 @@ class TestImageUploadErrorHandling:
                 
             assert "S3 upload failed" in str(exc_info.value)
     
-    def test_presigned_url_generation_failure(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_presigned_url_generation_failure(self, mock_upload_file):
         """Test handling of presigned URL generation failures"""
         with MockManager() as mock_manager:
-            mock_manager.mocks['presigned_url'].side_effect = Exception("Failed to generate presigned URL")
+            mock_manager.mocks['sign_many'].side_effect = Exception("Failed to generate presigned URL")
             
             from pecha_api.plans.media.media_services import upload_plan_image
             with pytest.raises(Exception) as exc_info:
-                upload_plan_image(
+                await upload_plan_image(
                     token=VALID_TOKEN,
                     plan_id=None,
                     file=mock_upload_file
@@ -539,12 +563,13 @@ class TestImageUploadErrorHandling:
 class TestImageUploadIntegration:
     """Integration test cases for complete upload workflow"""
     
-    def test_complete_upload_workflow(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_complete_upload_workflow(self, mock_upload_file):
         """Test the complete upload workflow from start to finish"""
         with MockManager() as mock_manager:
             from pecha_api.plans.media.media_services import upload_plan_image
             
-            result = upload_plan_image(
+            result = await upload_plan_image(
                 token=VALID_TOKEN,
                 plan_id=TEST_PLAN_ID,
                 file=mock_upload_file
@@ -554,7 +579,7 @@ class TestImageUploadIntegration:
             mock_manager.mocks['validate_author'].assert_called_once_with(token=VALID_TOKEN)
             mock_manager.mocks['image_open'].assert_called_once()
             assert mock_manager.mocks['upload_bytes'].call_count == 3
-            assert mock_manager.mocks['presigned_url'].call_count == 3
+            mock_manager.mocks['sign_many'].assert_called_once()
             
             # Verify response structure
             assert isinstance(result, PlanUploadResponse)
@@ -610,7 +635,8 @@ class TestTextImageUploadValidation:
 
             assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
     
-    def test_upload_with_all_parameters(self, mock_upload_file):
+    @pytest.mark.asyncio
+    async def test_upload_with_all_parameters(self, mock_upload_file):
         """Test upload with all possible parameters specified"""
         with MockManager() as mock_manager:
             mock_upload_file.filename = "custom_image.png"
@@ -618,7 +644,7 @@ class TestTextImageUploadValidation:
             
             from pecha_api.plans.media.media_services import upload_plan_image
             
-            result = upload_plan_image(
+            result = await upload_plan_image(
                 token=VALID_TOKEN,
                 plan_id=TEST_PLAN_ID,
                 file=mock_upload_file
@@ -635,4 +661,78 @@ class TestTextImageUploadValidation:
                 assert TEST_PLAN_ID in upload_args['s3_key']
                 assert "custom_image" in upload_args['s3_key']
             
-            assert isinstance(result, PlanUploadResponse)
\ No newline at end of file
+            assert isinstance(result, PlanUploadResponse)
+
+class TestImageVersionFormats:
+    """Test cases for the image versions rendered next to the JPEG ones"""
+
+    @pytest.mark.asyncio
+    async def test_upload_with_webp_versions(self, mock_upload_file):
+        with MockManager() as mock_manager:
+            mock_manager.config["MEDIA_IMAGE_FORMATS"] = "webp"
+
+            from pecha_api.plans.media.media_services import upload_plan_image
+
+            result = await upload_plan_image(
+                token=VALID_TOKEN,
+                plan_id=TEST_PLAN_ID,
+                file=mock_upload_file
+            )
+
+            upload_calls = mock_manager.mocks['upload_bytes'].call_args_list
+            assert len(upload_calls) == 6
+            content_types = {call[1]['s3_key']: call[1]['content_type'] for call in upload_calls}
+            path = f"images/plan_images/{TEST_PLAN_ID}/{TEST_UUID}"
+            assert content_types[f"{path}/medium/test_image.jpg"] == "image/jpeg"
+            assert content_types[f"{path}/medium/test_image.webp"] == "image/webp"
+
+            assert result.key == f"{path}/original/test_image.jpg"
+            assert result.image.original.endswith("/original/test_image.jpg")
+            assert set(result.image.formats) == {"webp"}
+            assert result.image.formats["webp"].thumbnail.endswith("/thumbnail/test_image.webp")
+
+            mock_manager.mocks['sign_many'].assert_called_once()
+            assert len(list(mock_manager.mocks['sign_many'].call_args[1]['s3_keys'])) == 6
+
+    @pytest.mark.asyncio
+    async def test_unknown_formats_are_skipped(self, mock_upload_file):
+        with MockManager() as mock_manager:
+            mock_manager.config["MEDIA_IMAGE_FORMATS"] = "gif, tiff"
+
+            from pecha_api.plans.media.media_services import upload_plan_image
+
+            result = await upload_plan_image(
+                token=VALID_TOKEN,
+                plan_id=None,
+                file=mock_upload_file
+            )
+
+            assert mock_manager.mocks['render_image_versions'].call_args[1]['formats'] == ["jpeg"]
+            assert result.image.formats == {}
+
+    def test_image_executor_uses_worker_processes(self, test_config):
+        test_config["MEDIA_IMAGE_WORKERS"] = 3
+        with patch(GET_INT_CONFIG_PATH, side_effect=lambda key: test_config.get(key)), \
+             patch("pecha_api.plans.media.media_services._image_executor", None), \
+             patch("pecha_api.plans.media.media_services.ProcessPoolExecutor") as mock_executor:
+            from pecha_api.plans.media.media_services import _get_image_executor
+
+            assert _get_image_executor() is mock_executor.return_value
+            assert mock_executor.call_args[1]['max_workers'] == 3
+
+    def test_image_executor_disabled(self, test_config):
+        with patch(GET_INT_CONFIG_PATH, side_effect=lambda key: test_config.get(key)), \
+             patch("pecha_api.plans.media.media_services._image_executor", None):
+            from pecha_api.plans.media.media_services import _get_image_executor
+
+            assert _get_image_executor() is None
+
+    def test_shutdown_image_executor(self):
+        executor = MagicMock()
+        with patch("pecha_api.plans.media.media_services._image_executor", executor):
+            from pecha_api.plans.media import media_services
+
+            media_services.shutdown_image_executor()
+
+            executor.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+            assert media_services._image_executor is None
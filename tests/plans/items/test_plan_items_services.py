@@ -1,6 +1,6 @@
 import uuid
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import HTTPException
 
 from pecha_api.plans.items.plan_items_services import create_plan_item, delete_plan_day_by_id, update_plans_day_number
@@ -15,7 +15,8 @@ def _mock_session_local(mock_session_local):
     return mock_db_session
 
 
-def test_create_plan_item_success():
+@pytest.mark.asyncio
+async def test_create_plan_item_success():
     plan_id = uuid.uuid4()
     saved_item_id = uuid.uuid4()
 
@@ -30,6 +31,7 @@ def test_create_plan_item_success():
          patch("pecha_api.plans.items.plan_items_services.validate_and_extract_author_details") as mock_validate_author, \
          patch("pecha_api.plans.items.plan_items_services.get_plan_by_id_and_created_by") as mock_get_plan_by_id, \
          patch("pecha_api.plans.items.plan_items_services.get_last_day_number") as mock_get_last_day_number, \
+         patch("pecha_api.plans.items.plan_items_services.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
          patch("pecha_api.plans.items.plan_items_services.save_plan_item") as mock_save_plan_item:
         db_session = _mock_session_local(mock_session_local)
 
@@ -43,7 +45,7 @@ def test_create_plan_item_success():
         saved_item.day_number = 4
         mock_save_plan_item.return_value = saved_item
 
-        resp = create_plan_item(token="dummy-token", plan_id=plan_id)
+        resp = await create_plan_item(token="dummy-token", plan_id=plan_id)
 
         assert mock_validate_author.call_count == 1
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id, created_by=author.email, is_admin=author.is_admin)
@@ -64,9 +66,11 @@ def test_create_plan_item_success():
         assert resp.id == saved_item_id
         assert resp.plan_id == plan_id
         assert resp.day_number == 4
+        mock_invalidate.assert_awaited_once()
 
 
-def test_create_plan_item_propagates_repository_error():
+@pytest.mark.asyncio
+async def test_create_plan_item_propagates_repository_error():
     plan_id = uuid.uuid4()
 
     plan = MagicMock()
@@ -92,13 +96,14 @@ def test_create_plan_item_propagates_repository_error():
         mock_save_plan_item.side_effect = error
 
         with pytest.raises(HTTPException) as exc_info:
-            create_plan_item(token="dummy-token", plan_id=plan_id)
+            await create_plan_item(token="dummy-token", plan_id=plan_id)
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == {"error": "Bad request", "message": "duplicate"}
 
 
-def test_delete_plan_day_success_reorders():
+@pytest.mark.asyncio
+async def test_delete_plan_day_success_reorders():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -125,6 +130,7 @@ def test_delete_plan_day_success_reorders():
          patch("pecha_api.plans.items.plan_items_services.get_day_by_plan_day_id") as mock_get_day, \
          patch("pecha_api.plans.items.plan_items_services.delete_day_by_id") as mock_delete, \
          patch("pecha_api.plans.items.plan_items_services.get_days_by_plan_id") as mock_get_days, \
+         patch("pecha_api.plans.items.plan_items_services.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
          patch("pecha_api.plans.items.plan_items_services.update_day_by_id") as mock_update_day:
         db_session = _mock_session_local(mock_session_local)
 
@@ -133,7 +139,7 @@ def test_delete_plan_day_success_reorders():
         mock_get_day.return_value = item_to_delete
         mock_get_days.return_value = remaining_items
 
-        delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
+        await delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
 
         assert mock_validate_author.call_count == 1
         mock_get_plan_by_id.assert_called_once_with(db=db_session, plan_id=plan_id, created_by=author.email, is_admin=author.is_admin)
@@ -150,9 +156,11 @@ def test_delete_plan_day_success_reorders():
             assert kwargs["plan_id"] == plan_id
             assert "day_id" in kwargs and kwargs["day_id"] is not None
             assert kwargs["day_number"] == new_num
+        mock_invalidate.assert_awaited_once()
 
 
-def test_delete_plan_day_not_found():
+@pytest.mark.asyncio
+async def test_delete_plan_day_not_found():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -173,13 +181,14 @@ def test_delete_plan_day_not_found():
         mock_get_day.side_effect = HTTPException(status_code=404, detail={"error": "Not Found", "message": "day not found"})
 
         with pytest.raises(HTTPException) as exc_info:
-            delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
+            await delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
 
         assert exc_info.value.status_code == 404
         assert exc_info.value.detail == {"error": "Not Found", "message": "day not found"}
 
 
-def test_delete_plan_day_auth_error():
+@pytest.mark.asyncio
+async def test_delete_plan_day_auth_error():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -187,13 +196,14 @@ def test_delete_plan_day_auth_error():
         mock_validate_author.side_effect = HTTPException(status_code=401, detail="Unauthorized")
 
         with pytest.raises(HTTPException) as exc_info:
-            delete_plan_day_by_id(token="bad-token", plan_id=plan_id, day_id=day_id)
+            await delete_plan_day_by_id(token="bad-token", plan_id=plan_id, day_id=day_id)
 
         assert exc_info.value.status_code == 401
         assert exc_info.value.detail == "Unauthorized"
 
 
-def test_delete_plan_day_repository_error():
+@pytest.mark.asyncio
+async def test_delete_plan_day_repository_error():
     plan_id = uuid.uuid4()
     day_id = uuid.uuid4()
 
@@ -219,13 +229,14 @@ def test_delete_plan_day_repository_error():
         mock_delete.side_effect = HTTPException(status_code=400, detail={"error": "Bad request", "message": "cannot delete"})
 
         with pytest.raises(HTTPException) as exc_info:
-            delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
+            await delete_plan_day_by_id(token="dummy-token", plan_id=plan_id, day_id=day_id)
 
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == {"error": "Bad request", "message": "cannot delete"}
 
 
-def test_update_plans_day_number_success_calls_bulk_update():
+@pytest.mark.asyncio
+async def test_update_plans_day_number_success_calls_bulk_update():
     plan_id = uuid.uuid4()
 
     plan = MagicMock()
@@ -246,13 +257,14 @@ def test_update_plans_day_number_success_calls_bulk_update():
     with patch("pecha_api.plans.items.plan_items_services.SessionLocal") as mock_session_local, \
          patch("pecha_api.plans.items.plan_items_services.validate_and_extract_author_details") as mock_validate_author, \
          patch("pecha_api.plans.items.plan_items_services.get_plan_by_id_and_created_by") as mock_get_plan_by_id, \
+         patch("pecha_api.plans.items.plan_items_services.invalidate_featured_day_cache", new_callable=AsyncMock) as mock_invalidate, \
          patch("pecha_api.plans.items.plan_items_services.update_days_in_bulk_by_plan_id") as mock_bulk_update:
         db_session = _mock_session_local(mock_session_local)
 
         mock_validate_author.return_value = author
         mock_get_plan_by_id.return_value = plan
 
-        update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
+        await update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
 
         # validate called once in the service
         assert mock_validate_author.call_count == 1
@@ -261,9 +273,11 @@ def test_update_plans_day_number_success_calls_bulk_update():
         called_kwargs = mock_bulk_update.call_args.kwargs
         assert called_kwargs["db"] is db_session
         assert called_kwargs["days"] == payload.days
+        mock_invalidate.assert_awaited_once()
 
 
-def test_update_plans_day_number_duplicate_payload_raises_400():
+@pytest.mark.asyncio
+async def test_update_plans_day_number_duplicate_payload_raises_400():
     plan_id = uuid.uuid4()
 
     payload = ReorderDaysRequest(
@@ -285,7 +299,7 @@ def test_update_plans_day_number_duplicate_payload_raises_400():
         mock_get_plan_by_id.return_value = plan
 
         with pytest.raises(HTTPException) as exc_info:
-            update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
+            await update_plans_day_number(token="dummy-token", plan_id=plan_id, reorder_days_request=payload)
 
         assert exc_info.value.status_code == 400
         assert exc_info.value.detail == {"error": "Bad request", "message": "Duplicate day numbers"}
\ No newline at end of file
@@ -63,9 +63,8 @@ def mock_db_session():
 
 @pytest.mark.asyncio
 async def test_get_published_plans_success(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([sample_plan_aggregate], 1)) as mock_repo, \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url") as mock_presigned_url:
         
         result = await get_published_plans(
@@ -113,9 +112,8 @@ async def test_get_published_plans_success(sample_plan_aggregate, mock_db_sessio
 
 @pytest.mark.asyncio
 async def test_get_published_plans_with_search(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([sample_plan_aggregate], 1)) as mock_repo, \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
         result = await get_published_plans(
@@ -142,9 +140,8 @@ async def test_get_published_plans_with_search(sample_plan_aggregate, mock_db_se
 
 @pytest.mark.asyncio
 async def test_get_published_plans_with_language_filter(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([sample_plan_aggregate], 1)) as mock_repo, \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
         result = await get_published_plans(
@@ -205,9 +202,8 @@ async def test_get_published_plans_sort_by_title_asc(sample_plan_aggregate, mock
     
     aggregates = [agg1, agg2]
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=(aggregates, 2)), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
         
         result = await get_published_plans(sort_by="title", sort_order="asc")
@@ -252,9 +248,8 @@ async def test_get_published_plans_sort_by_title_desc(sample_plan_aggregate, moc
     
     aggregates = [agg1, agg2]
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=(aggregates, 2)), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
         
         result = await get_published_plans(sort_by="title", sort_order="desc")
@@ -300,9 +295,8 @@ async def test_get_published_plans_sort_by_total_days(sample_plan_aggregate, moc
     
     aggregates = [agg1, agg2]
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=(aggregates, 2)), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
         
         result = await get_published_plans(sort_by="total_days", sort_order="asc")
@@ -347,9 +341,8 @@ async def test_get_published_plans_sort_by_subscription_count(sample_plan_aggreg
     
     aggregates = [agg1, agg2]
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=aggregates), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=2), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=(aggregates, 2)), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value=None):
         
         result = await get_published_plans(sort_by="subscription_count", sort_order="desc")
@@ -361,9 +354,8 @@ async def test_get_published_plans_sort_by_subscription_count(sample_plan_aggreg
 
 @pytest.mark.asyncio
 async def test_get_published_plans_empty_result(mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[]), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=0):
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([], 0)):
         
         result = await get_published_plans()
         
@@ -390,9 +382,8 @@ async def test_get_published_plans_without_author(mock_db_session):
     aggregate.total_days = 10
     aggregate.subscription_count = 0
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[aggregate]), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([aggregate], 1)), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
         result = await get_published_plans()
@@ -403,9 +394,8 @@ async def test_get_published_plans_without_author(mock_db_session):
 
 @pytest.mark.asyncio
 async def test_get_published_plans_with_pagination(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]) as mock_repo, \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([sample_plan_aggregate], 1)) as mock_repo, \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
         result = await get_published_plans(skip=10, limit=5)
@@ -426,9 +416,8 @@ async def test_get_published_plans_with_pagination(sample_plan_aggregate, mock_d
 
 @pytest.mark.asyncio
 async def test_get_published_plans_image_url_generation_failure(sample_plan_aggregate, mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=[sample_plan_aggregate]), \
-         patch("pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
+         patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", return_value=([sample_plan_aggregate], 1)), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
         result = await get_published_plans()
@@ -439,7 +428,7 @@ async def test_get_published_plans_image_url_generation_failure(sample_plan_aggr
 
 @pytest.mark.asyncio
 async def test_get_published_plans_database_error(mock_db_session):
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plans_from_db", side_effect=Exception("Database connection error")):
         
         with pytest.raises(HTTPException) as exc_info:
@@ -457,7 +446,7 @@ async def test_get_published_plan_success(sample_plan, sample_author, mock_db_se
     mock_query.filter.return_value.count.return_value = 30 
     mock_query.filter.return_value.distinct.return_value.count.return_value = 150 
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan) as mock_repo, \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url") as mock_presigned_url:
         
@@ -486,7 +475,7 @@ async def test_get_published_plan_success(sample_plan, sample_author, mock_db_se
 async def test_get_published_plan_not_found(mock_db_session):
     plan_id = uuid4()
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=None):
         
         with pytest.raises(HTTPException) as exc_info:
@@ -514,7 +503,7 @@ async def test_get_published_plan_without_author(mock_db_session):
     mock_query.filter.return_value.count.return_value = 10
     mock_query.filter.return_value.distinct.return_value.count.return_value = 5
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=plan_no_author), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
@@ -533,7 +522,7 @@ async def test_get_published_plan_image_url_generation_failure(sample_plan, mock
     mock_query.filter.return_value.count.return_value = 30
     mock_query.filter.return_value.distinct.return_value.count.return_value = 150
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
@@ -546,7 +535,7 @@ async def test_get_published_plan_image_url_generation_failure(sample_plan, mock
 async def test_get_published_plan_database_error(mock_db_session):
     plan_id = uuid4()
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", side_effect=Exception("Database connection error")):
         
         with pytest.raises(HTTPException) as exc_info:
@@ -565,7 +554,7 @@ async def test_get_published_plan_with_empty_tags(sample_plan, mock_db_session):
     mock_query.filter.return_value.count.return_value = 10
     mock_query.filter.return_value.distinct.return_value.count.return_value = 5
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
@@ -581,7 +570,7 @@ async def test_get_published_plan_zero_subscriptions(sample_plan, mock_db_sessio
     mock_query.filter.return_value.count.return_value = 15
     mock_query.filter.return_value.distinct.return_value.count.return_value = 0
     
-    with patch("pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session), \
+    with patch("pecha_api.db.database.SessionLocal", return_value=mock_db_session), \
          patch("pecha_api.plans.public.plan_service.get_published_plan_by_id", return_value=sample_plan), \
          patch("pecha_api.plans.public.plan_service.generate_presigned_access_url", return_value="https://bucket.s3.amazonaws.com/presigned-url"):
         
@@ -609,7 +598,7 @@ async def test_get_plan_days_success():
     
     mock_plan_days = [mock_day_1, mock_day_2]
 
-    with patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+    with patch("pecha_api.db.database.SessionLocal") as mock_session_local, \
          patch("pecha_api.plans.public.plan_service.get_plan_by_id") as mock_get_plan, \
          patch("pecha_api.plans.public.plan_service.get_days_by_plan_id") as mock_get_days:
         
@@ -640,7 +629,7 @@ async def test_get_plan_days_empty_days():
     mock_plan.id = plan_id
     mock_plan.title = "Empty Plan"
 
-    with patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+    with patch("pecha_api.db.database.SessionLocal") as mock_session_local, \
          patch("pecha_api.plans.public.plan_service.get_plan_by_id") as mock_get_plan, \
          patch("pecha_api.plans.public.plan_service.get_days_by_plan_id") as mock_get_days:
         
@@ -662,7 +651,7 @@ async def test_get_plan_days_plan_not_found():
     """Test when plan does not exist"""
     plan_id = uuid4()
 
-    with patch("pecha_api.plans.public.plan_service.SessionLocal") as mock_session_local, \
+    with patch("pecha_api.db.database.SessionLocal") as mock_session_local, \
          patch("pecha_api.plans.public.plan_service.get_plan_by_id") as mock_get_plan:
         
         db_session = _mock_session_local(mock_session_local)
@@ -767,13 +756,11 @@ async def test_get_published_plans_with_tag_filter(
     sample_plan_aggregate, mock_db_session
 ):
     with patch(
-        "pecha_api.plans.public.plan_service.SessionLocal", return_value=mock_db_session
+        "pecha_api.db.database.SessionLocal", return_value=mock_db_session
     ), patch(
         "pecha_api.plans.public.plan_service.get_published_plans_from_db",
-        return_value=[sample_plan_aggregate],
+        return_value=([sample_plan_aggregate], 1),
     ) as mock_repo, patch(
-        "pecha_api.plans.public.plan_service.get_published_plans_count", return_value=1
-    ), patch(
         "pecha_api.plans.public.plan_service.generate_presigned_access_url",
         return_value="https://bucket.s3.amazonaws.com/presigned-url",
     ):
@@ -0,0 +1,36 @@
+from sqlalchemy.dialects import postgresql
+
+from pecha_api.plans.shared.plan_search import build_plan_search_filter, build_plan_search_rank
+
+
+def _compile_(expression) -> str:
+    return str(expression.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+def test_build_plan_search_filter_without_search():
+    assert build_plan_search_filter(None) is None
+    assert build_plan_search_filter("") is None
+
+
+def test_build_plan_search_filter_matches_title_or_description_substring_or_full_text():
+    sql = _compile_(build_plan_search_filter("meditation"))
+
+    assert "plans.title ILIKE '%%meditation%%'" in sql
+    assert "plans.description ILIKE '%%meditation%%'" in sql
+    assert "plans.search_vector @@" in sql
+    assert "websearch_to_tsquery(CAST('english' AS REGCONFIG), 'meditation')" in sql
+    assert "websearch_to_tsquery(CAST('simple' AS REGCONFIG), 'meditation')" in sql
+
+
+def test_build_plan_search_filter_escapes_like_wildcards():
+    sql = _compile_(build_plan_search_filter("100%_done"))
+
+    assert "100\\\\%%\\\\_done" in sql
+    assert sql.count("ESCAPE") == 2
+
+
+def test_build_plan_search_rank_combines_full_text_and_trigram():
+    sql = _compile_(build_plan_search_rank("meditation"))
+
+    assert sql.startswith("greatest(ts_rank_cd(plans.search_vector")
+    assert "similarity(plans.title, 'meditation')" in sql
@@ -9,6 +9,8 @@ from fastapi import HTTPException
 from starlette import status
 
 from pecha_api.app import api
+from pecha_api.users.user_response_models import UserPrincipal
+from pecha_api.users.users_service import get_current_user_principal
 
 
 VALID_TOKEN = "valid_token"
@@ -24,6 +26,7 @@ def authenticated_client():
         return HTTPAuthorizationCredentials(scheme="Bearer", credentials=VALID_TOKEN)
 
     api.dependency_overrides[plan_users_views.oauth2_scheme] = get_token_override
+    api.dependency_overrides[get_current_user_principal] = lambda: UserPrincipal(email="john.doe@example.com")
     client = TestClient(api)
 
     yield client
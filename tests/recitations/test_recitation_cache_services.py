@@ -37,7 +37,7 @@ class TestSetRecitationByTextIdCache:
         )
         
         with patch("pecha_api.recitations.recication_cache_services.set_cache", new_callable=AsyncMock) as mock_set_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="test_hash_key") as mock_hash, \
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="test_hash_key") as mock_hash, \
              patch("pecha_api.recitations.recication_cache_services.config.get_int", return_value=1800) as mock_get_int:
             
             await set_recitation_by_text_id_cache(
@@ -47,14 +47,8 @@ class TestSetRecitationByTextIdCache:
                 data=recitation_response
             )
             
-            # Verify hash key generation
-            mock_hash.assert_called_once()
-            call_args = mock_hash.call_args[1]
-            assert "payload" in call_args
-            payload = call_args["payload"]
-            assert payload[0] == text_id
-            assert payload[1] == recitation_request
-            assert payload[2] == CacheType.RECITATION_DETAILS
+            # Verify structured key generation
+            mock_hash.assert_called_once_with(CacheType.RECITATION_DETAILS, text_id, recitation_request)
             
             # Verify cache timeout config was retrieved
             mock_get_int.assert_called_once_with("CACHE_TEXT_TIMEOUT")
@@ -63,7 +57,8 @@ class TestSetRecitationByTextIdCache:
             mock_set_cache.assert_called_once_with(
                 hash_key="test_hash_key",
                 value=recitation_response,
-                cache_time_out=1800
+                cache_time_out=1800,
+                tags=[f"tag:text:{text_id}"]
             )
 
     @pytest.mark.asyncio
@@ -85,7 +80,7 @@ class TestSetRecitationByTextIdCache:
         )
         
         with patch("pecha_api.recitations.recication_cache_services.set_cache", new_callable=AsyncMock) as mock_set_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="hash_empty") as mock_hash, \
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="hash_empty") as mock_hash, \
              patch("pecha_api.recitations.recication_cache_services.config.get_int", return_value=1800):
             
             await set_recitation_by_text_id_cache(
@@ -141,7 +136,7 @@ class TestSetRecitationByTextIdCache:
         )
         
         with patch("pecha_api.recitations.recication_cache_services.set_cache", new_callable=AsyncMock) as mock_set_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="hash_multi") as mock_hash, \
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="hash_multi") as mock_hash, \
              patch("pecha_api.recitations.recication_cache_services.config.get_int", return_value=1800):
             
             await set_recitation_by_text_id_cache(
@@ -177,7 +172,7 @@ class TestSetRecitationByTextIdCache:
         
         # Test with RECITATION_DETAILS cache type
         with patch("pecha_api.recitations.recication_cache_services.set_cache", new_callable=AsyncMock) as mock_set_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="hash_1"), \
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="hash_1"), \
              patch("pecha_api.recitations.recication_cache_services.config.get_int", return_value=1800):
             
             await set_recitation_by_text_id_cache(
@@ -206,7 +201,7 @@ class TestGetRecitationByTextIdCache:
         )
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=None) as mock_get_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="test_hash_key"):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="test_hash_key"):
             
             result = await get_recitation_by_text_id_cache(
                 text_id=text_id,
@@ -238,7 +233,7 @@ class TestGetRecitationByTextIdCache:
         }
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=mock_cache_dict) as mock_get_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="test_hash_key"):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="test_hash_key"):
             
             result = await get_recitation_by_text_id_cache(
                 text_id=text_id,
@@ -274,7 +269,7 @@ class TestGetRecitationByTextIdCache:
         )
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=mock_cache_response) as mock_get_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="test_hash_key"):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="test_hash_key"):
             
             result = await get_recitation_by_text_id_cache(
                 text_id=text_id,
@@ -332,7 +327,7 @@ class TestGetRecitationByTextIdCache:
         }
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=mock_cache_dict) as mock_get_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="test_hash_key"):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="test_hash_key"):
             
             result = await get_recitation_by_text_id_cache(
                 text_id=text_id,
@@ -361,7 +356,7 @@ class TestGetRecitationByTextIdCache:
         )
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=None), \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="complex_hash_key") as mock_hash:
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="complex_hash_key") as mock_hash:
             
             await get_recitation_by_text_id_cache(
                 text_id=text_id,
@@ -369,21 +364,14 @@ class TestGetRecitationByTextIdCache:
                 cache_type=CacheType.RECITATION_DETAILS
             )
             
-            # Verify hash generation was called with correct payload
-            mock_hash.assert_called_once()
-            call_args = mock_hash.call_args[1]
-            assert "payload" in call_args
-            payload = call_args["payload"]
-            assert len(payload) == 3
-            assert payload[0] == text_id
-            assert payload[1] == recitation_request
-            assert payload[2] == CacheType.RECITATION_DETAILS
+            # Verify key generation was called with the cache type, text and request
+            mock_hash.assert_called_once_with(CacheType.RECITATION_DETAILS, text_id, recitation_request)
 
     @pytest.mark.asyncio
     async def test_get_recitation_by_text_id_cache_with_none_parameters(self):
         """Test getting recitation from cache with None parameters."""
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=None) as mock_get_cache, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="none_hash_key"):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="none_hash_key"):
             
             result = await get_recitation_by_text_id_cache(
                 text_id=None,
@@ -438,7 +426,7 @@ class TestGetRecitationByTextIdCache:
         }
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=mock_cache_dict), \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="complex_hash"):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="complex_hash"):
             
             result = await get_recitation_by_text_id_cache(
                 text_id=text_id,
@@ -509,7 +497,7 @@ class TestRecitationCacheIntegration:
         
         with patch("pecha_api.recitations.recication_cache_services.set_cache", new_callable=AsyncMock) as mock_set, \
              patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=response_dict) as mock_get, \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", return_value="integration_hash"), \
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", return_value="integration_hash"), \
              patch("pecha_api.recitations.recication_cache_services.config.get_int", return_value=1800):
             
             # Set cache
@@ -562,12 +550,12 @@ class TestRecitationCacheIntegration:
         
         hash_calls = []
         
-        def capture_hash(payload):
-            hash_calls.append(payload)
+        def capture_hash(*args):
+            hash_calls.append(args)
             return f"hash_{len(hash_calls)}"
         
         with patch("pecha_api.recitations.recication_cache_services.get_cache_data", new_callable=AsyncMock, return_value=None), \
-             patch("pecha_api.recitations.recication_cache_services.Utils.generate_hash_key", side_effect=capture_hash):
+             patch("pecha_api.recitations.recication_cache_services.CacheKeys.build", side_effect=capture_hash):
             
             # Get cache for first request
             await get_recitation_by_text_id_cache(
@@ -586,6 +574,6 @@ class TestRecitationCacheIntegration:
             # Verify different payloads were used
             assert len(hash_calls) == 2
             assert hash_calls[0] != hash_calls[1]
-            assert hash_calls[0][1] == request1
-            assert hash_calls[1][1] == request2
+            assert hash_calls[0][2] == request1
+            assert hash_calls[1][2] == request2
 
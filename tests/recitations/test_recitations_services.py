@@ -9,7 +9,6 @@ from pecha_api.recitations.recitations_services import (
     get_recitation_details_service,
     segments_mapping_by_toc,
     filter_by_type_and_language,
-    _filter_and_map_segments,
 )
 from pecha_api.recitations.recitations_response_models import (
     RecitationDTO,
@@ -379,13 +378,13 @@ class TestSegmentsMappingByToc:
             content=content
         )
 
-    @patch('pecha_api.recitations.recitations_services.get_segment_details_by_id')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+    @patch('pecha_api.recitations.recitations_services.get_segments_details_by_ids')
+    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_batch')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
     async def test_segments_mapping_by_toc_empty_table_of_contents(
         self,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments,
         mock_get_segment_details
     ):
@@ -408,7 +407,7 @@ class TestSegmentsMappingByToc:
         # Verify no mock calls were made
         mock_get_segment_details.assert_not_called()
         mock_get_related_segments.assert_not_called()
-        mock_filter_segments.assert_not_called()
+        mock_get_text_details.assert_not_called()
 
 class TestFilterByTypeAndLanguage:
     """Test cases for filter_by_type_and_language function."""
@@ -597,155 +596,6 @@ class TestFilterByTypeAndLanguage:
         assert result["en"].id == UUID(segment_id)
 
 
-class TestFilterAndMapSegments:
-    """Test cases for _filter_and_map_segments helper function."""
-
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
-    @patch('pecha_api.recitations.recitations_services.filter_by_type_and_language')
-    @pytest.mark.asyncio
-    async def test_filter_and_map_segments_success(
-        self,
-        mock_filter_by_type_lang,
-        mock_filter_segments
-    ):
-        """Test _filter_and_map_segments successfully filters and maps segments."""
-        segment_id = str(uuid4())
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=str(uuid4()),
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        
-        # Mock filter_segment_mapping_by_type_or_text_id to return segments
-        mock_translation = SegmentTranslation(
-            segment_id=segment_id,
-            text_id=str(uuid4()),
-            title="Translation",
-            source="test",
-            language="en",
-            content="Translated content"
-        )
-        mock_filter_segments.return_value = [mock_translation]
-        
-        # Mock filter_by_type_and_language to return mapped result
-        expected_result = {
-            "en": Segment(id=UUID(segment_id), content="Translated content")
-        }
-        mock_filter_by_type_lang.return_value = expected_result
-        
-        # Execute
-        result = await _filter_and_map_segments(
-            all_segments=[segment_dto],
-            filter_type=RecitationListTextType.TRANSLATIONS.value,
-            languages=["en"]
-        )
-        
-        # Verify
-        assert result == expected_result
-        mock_filter_segments.assert_called_once_with(
-            segments=[segment_dto],
-            type=TextType.VERSION.value
-        )
-        mock_filter_by_type_lang.assert_called_once_with(
-            type=RecitationListTextType.TRANSLATIONS.value,
-            segments=[mock_translation],
-            languages=["en"]
-        )
-
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
-    @patch('pecha_api.recitations.recitations_services.filter_by_type_and_language')
-    @pytest.mark.asyncio
-    async def test_filter_and_map_segments_empty_result(
-        self,
-        mock_filter_by_type_lang,
-        mock_filter_segments
-    ):
-        """Test _filter_and_map_segments with no matching segments."""
-        segment_dto = SegmentDTO(
-            id=str(uuid4()),
-            text_id=str(uuid4()),
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        
-        mock_filter_segments.return_value = []
-        mock_filter_by_type_lang.return_value = {}
-        
-        # Execute
-        result = await _filter_and_map_segments(
-            all_segments=[segment_dto],
-            filter_type=RecitationListTextType.RECITATIONS.value,
-            languages=["en"]
-        )
-        
-        # Verify
-        assert result == {}
-        mock_filter_segments.assert_called_once()
-        mock_filter_by_type_lang.assert_called_once_with(
-            type=RecitationListTextType.RECITATIONS.value,
-            segments=[],
-            languages=["en"]
-        )
-
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
-    @patch('pecha_api.recitations.recitations_services.filter_by_type_and_language')
-    @pytest.mark.asyncio
-    async def test_filter_and_map_segments_multiple_languages(
-        self,
-        mock_filter_by_type_lang,
-        mock_filter_segments
-    ):
-        """Test _filter_and_map_segments with multiple languages."""
-        segment_id = str(uuid4())
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=str(uuid4()),
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        
-        # Mock segments in different languages
-        mock_segments = [
-            SegmentTranslation(
-                segment_id=segment_id,
-                text_id=str(uuid4()),
-                title="English Translation",
-                source="test",
-                language="en",
-                content="English content"
-            ),
-            SegmentTranslation(
-                segment_id=segment_id,
-                text_id=str(uuid4()),
-                title="Tibetan Translation",
-                source="test",
-                language="bo",
-                content="Tibetan content"
-            )
-        ]
-        mock_filter_segments.return_value = mock_segments
-        
-        expected_result = {
-            "en": Segment(id=UUID(segment_id), content="English content"),
-            "bo": Segment(id=UUID(segment_id), content="Tibetan content")
-        }
-        mock_filter_by_type_lang.return_value = expected_result
-        
-        # Execute
-        result = await _filter_and_map_segments(
-            all_segments=[segment_dto],
-            filter_type=RecitationListTextType.TRANSLATIONS.value,
-            languages=["en", "bo"]
-        )
-        
-        # Verify
-        assert result == expected_result
-        assert len(result) == 2
-        assert "en" in result
-        assert "bo" in result
-
-
 class TestGetTextDetailsByTextId:
     """Test cases for get_text_details_by_text_id function."""
 
@@ -874,22 +724,9 @@ class TestGetRecitationDetailsServiceSuccess:
 class TestSegmentsMappingByTocWithData:
     """Test cases for segments_mapping_by_toc with actual data."""
 
-    @patch('pecha_api.recitations.recitations_services.get_segments_details_by_ids')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_batch')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
-    @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_with_single_segment(
-        self,
-        mock_filter_segments,
-        mock_get_related_segments_batch,
-        mock_get_segments_by_ids
-    ):
-        """Test segments_mapping_by_toc with a single segment."""
-        segment_id = str(uuid4())
-        text_id = str(uuid4())
-        
-        # Create table of content with one segment
-        toc = [
+    @staticmethod
+    def _toc(text_id: str, segment_ids: list) -> list:
+        return [
             TableOfContent(
                 id=str(uuid4()),
                 type=TableOfContentType.TEXT,
@@ -900,369 +737,129 @@ class TestSegmentsMappingByTocWithData:
                         title="Section 1",
                         section_number=1,
                         segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
+                            TextSegment(segment_id=segment_id, segment_number=number)
+                            for number, segment_id in enumerate(segment_ids, start=1)
                         ]
                     )
                 ]
             )
         ]
-        
-        # Mock segment details - batch function returns dict
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test segment content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_segments_by_ids.return_value = {segment_id: segment_dto}
-        mock_get_related_segments_batch.return_value = {segment_id: []}
-        
-        # Mock filter responses for each type
-        mock_filter_segments.return_value = []
-        
-        request = RecitationDetailsRequest(
-            language="en",
-            recitation=["en"],
-            translations=["en"],
-            transliterations=["bo"],
-            adaptations=["en"]
+
+    @staticmethod
+    def _segment(text_id: str, content: str, segment_id: str = None) -> SegmentDTO:
+        return SegmentDTO(id=segment_id or str(uuid4()), text_id=text_id, content=content, type=SegmentType.SOURCE)
+
+    @staticmethod
+    def _text(text_id: str, language: str, text_type: str = TextType.VERSION.value) -> TextDTO:
+        return TextDTO(
+            id=text_id,
+            title=f"Text {language}",
+            language=language,
+            group_id=str(uuid4()),
+            type=text_type,
+            is_published=True,
+            created_date="2023-01-01",
+            updated_date="2023-01-01",
+            published_date="2023-01-01",
+            published_by="test"
         )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 1
-        assert isinstance(result[0], RecitationSegment)
-        
-        # Verify batch functions were called
-        mock_get_segments_by_ids.assert_called_once_with(segment_ids=[segment_id])
-        mock_get_related_segments_batch.assert_called_once_with(parent_segment_ids=[segment_id])
-        
-        # Verify filter was called 4 times (recitations, translations, transliterations, adaptations)
-        assert mock_filter_segments.call_count == 4
 
     @patch('pecha_api.recitations.recitations_services.get_segments_details_by_ids')
     @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_batch')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_with_multiple_segments(
+    async def test_segments_mapping_by_toc_classifies_segments_by_language(
         self,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments_batch,
         mock_get_segments_by_ids
     ):
-        """Test segments_mapping_by_toc with multiple segments."""
-        segment_id_1 = str(uuid4())
-        segment_id_2 = str(uuid4())
-        text_id = str(uuid4())
-        
-        # Create table of content with two segments
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id_1, segment_number=1),
-                            TextSegment(segment_id=segment_id_2, segment_number=2)
-                        ]
-                    )
-                ]
-            )
-        ]
-        
-        # Mock segment details - batch function returns dict
+        root_text_id, bo_text_id, en_text_id, phonetic_text_id = (str(uuid4()) for _ in range(4))
+        segment_ids = [str(uuid4()), str(uuid4())]
         mock_get_segments_by_ids.return_value = {
-            segment_id_1: SegmentDTO(
-                id=segment_id_1,
-                text_id=text_id,
-                content=f"Content for {segment_id_1}",
-                type=SegmentType.SOURCE
-            ),
-            segment_id_2: SegmentDTO(
-                id=segment_id_2,
-                text_id=text_id,
-                content=f"Content for {segment_id_2}",
-                type=SegmentType.SOURCE
-            )
+            segment_id: self._segment(root_text_id, f"root {index}", segment_id)
+            for index, segment_id in enumerate(segment_ids)
+        }
+        bo_segment = self._segment(bo_text_id, "bo 0")
+        en_segment = self._segment(en_text_id, "en 0")
+        phonetic_segment = self._segment(phonetic_text_id, "phonetic 0")
+        mock_get_related_segments_batch.return_value = {
+            segment_ids[0]: [bo_segment, en_segment, phonetic_segment],
+            segment_ids[1]: [self._segment(en_text_id, "en 1")]
+        }
+        mock_get_text_details.return_value = {
+            root_text_id: self._text(root_text_id, "bo", TextType.ROOT_TEXT.value),
+            bo_text_id: self._text(bo_text_id, "bo"),
+            en_text_id: self._text(en_text_id, "en"),
+            phonetic_text_id: self._text(phonetic_text_id, "bo-phon")
         }
-        mock_get_related_segments_batch.return_value = {segment_id_1: [], segment_id_2: []}
-        mock_filter_segments.return_value = []
-        
         request = RecitationDetailsRequest(
             language="en",
-            recitation=["en"],
-            translations=[],
-            transliterations=[],
-            adaptations=[]
+            recitation=["bo"],
+            translations=["en"],
+            transliterations=["bo-phon"],
+            adaptations=["en"]
         )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
+
+        result = await segments_mapping_by_toc(table_of_contents=self._toc(root_text_id, segment_ids), recitation_details_request=request)
+
         assert len(result) == 2
-        assert all(isinstance(seg, RecitationSegment) for seg in result)
-        
-        # Verify batch functions were called once with all segment IDs
-        mock_get_segments_by_ids.assert_called_once_with(segment_ids=[segment_id_1, segment_id_2])
-        # Related segments batch not called since no translations/transliterations/adaptations requested
-        mock_get_related_segments_batch.assert_not_called()
+        assert result[0].recitation == {"bo": Segment(id=bo_segment.id, content="bo 0")}
+        assert result[0].translations == {"en": Segment(id=en_segment.id, content="en 0")}
+        assert result[0].transliterations == {"bo-phon": Segment(id=phonetic_segment.id, content="phonetic 0")}
+        assert result[0].adaptations == {"en": Segment(id=en_segment.id, content="en 0")}
+        assert result[1].recitation == {}
+        assert result[1].translations["en"].content == "en 1"
+
+        # text metadata is loaded once for every text of the document
+        mock_get_text_details.assert_called_once()
+        assert set(mock_get_text_details.call_args.kwargs["text_ids"]) == {root_text_id, bo_text_id, en_text_id, phonetic_text_id}
+        mock_get_segments_by_ids.assert_called_once_with(segment_ids=segment_ids)
+        mock_get_related_segments_batch.assert_called_once_with(parent_segment_ids=segment_ids)
 
     @patch('pecha_api.recitations.recitations_services.get_segments_details_by_ids')
     @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_batch')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_with_filtered_data(
+    async def test_segments_mapping_by_toc_recitation_only_skips_mapped_segments(
         self,
-        mock_filter_segments,
+        mock_get_text_details,
         mock_get_related_segments_batch,
         mock_get_segments_by_ids
     ):
-        """Test segments_mapping_by_toc with filtered segment data."""
-        segment_id = str(uuid4())
         text_id = str(uuid4())
-        
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
-                        ]
-                    )
-                ]
-            )
-        ]
-        
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_segments_by_ids.return_value = {segment_id: segment_dto}
-        
-        # Mock some related segments - batch function returns dict
-        related_segment = SegmentDTO(
-            id=str(uuid4()),
-            text_id=str(uuid4()),
-            content="Related content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_related_segments_batch.return_value = {segment_id: [related_segment]}
-        
-        # Mock filter to return actual segments
-        mock_translation = SegmentTranslation(
-            segment_id=str(uuid4()),
-            text_id=str(uuid4()),
-            title="Translation",
-            source="test",
-            language="en",
-            content="Translated content"
-        )
-        
-        def filter_side_effect(segments, type):
-            if type == TextType.VERSION.value:
-                return [mock_translation]
-            return []
-        
-        mock_filter_segments.side_effect = filter_side_effect
-        
-        request = RecitationDetailsRequest(
-            language="en",
-            recitation=["en"],
-            translations=["en"],
-            transliterations=[],
-            adaptations=[]
-        )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 1
-        recitation_segment = result[0]
-        assert isinstance(recitation_segment, RecitationSegment)
-        
-        # Verify that related segments batch was called (since translations requested)
-        mock_get_related_segments_batch.assert_called_once_with(parent_segment_ids=[segment_id])
+        segment_ids = [str(uuid4()), str(uuid4())]
+        mock_get_segments_by_ids.return_value = {
+            segment_id: self._segment(text_id, f"content {segment_id}", segment_id) for segment_id in segment_ids
+        }
+        mock_get_text_details.return_value = {text_id: self._text(text_id, "bo")}
+        request = RecitationDetailsRequest(language="en", recitation=["bo"])
 
-    @patch('pecha_api.recitations.recitations_services.get_segments_details_by_ids')
-    @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_batch')
-    @patch('pecha_api.recitations.recitations_services.SegmentUtils.filter_segment_mapping_by_type_or_text_id')
-    @patch('pecha_api.recitations.recitations_services.filter_by_type_and_language')
-    @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_calls_filter_by_type_and_language(
-        self,
-        mock_filter_by_type_lang,
-        mock_filter_segments,
-        mock_get_related_segments_batch,
-        mock_get_segments_by_ids
-    ):
-        """Test that segments_mapping_by_toc properly calls filter_by_type_and_language for all segment types."""
-        segment_id = str(uuid4())
-        text_id = str(uuid4())
-        
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
-                        ]
-                    )
-                ]
-            )
-        ]
-        
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_segments_by_ids.return_value = {segment_id: segment_dto}
-        mock_get_related_segments_batch.return_value = {segment_id: []}
-        
-        # Mock filter to return mock segments
-        mock_recitation = SegmentTranslation(
-            segment_id=str(uuid4()),
-            text_id=str(uuid4()),
-            title="Recitation",
-            source="test",
-            language="en",
-            content="Recitation content"
-        )
-        mock_translation = SegmentTranslation(
-            segment_id=str(uuid4()),
-            text_id=str(uuid4()),
-            title="Translation",
-            source="test",
-            language="bo",
-            content="Translation content"
-        )
-        
-        mock_filter_segments.return_value = [mock_recitation, mock_translation]
-        
-        # Mock filter_by_type_and_language to return empty dicts
-        mock_filter_by_type_lang.return_value = {}
-        
-        request = RecitationDetailsRequest(
-            language="en",
-            recitation=["en"],
-            translations=["bo"],
-            transliterations=["bo"],
-            adaptations=["en"]
-        )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 1
-        
-        # Verify filter_by_type_and_language was called 4 times (once for each type)
-        assert mock_filter_by_type_lang.call_count == 4
-        
-        # Verify the calls were made with correct types
-        call_types = [call.kwargs['type'] for call in mock_filter_by_type_lang.call_args_list]
-        assert RecitationListTextType.RECITATIONS.value in call_types
-        assert RecitationListTextType.TRANSLATIONS.value in call_types
-        assert RecitationListTextType.TRANSLITERATIONS.value in call_types
-        assert RecitationListTextType.ADAPTATIONS.value in call_types
+        result = await segments_mapping_by_toc(table_of_contents=self._toc(text_id, segment_ids), recitation_details_request=request)
+
+        assert [segment.recitation["bo"].id for segment in result] == [UUID(segment_id) for segment_id in segment_ids]
+        mock_get_related_segments_batch.assert_not_called()
 
     @patch('pecha_api.recitations.recitations_services.get_segments_details_by_ids')
     @patch('pecha_api.recitations.recitations_services.get_related_mapped_segments_batch')
-    @patch('pecha_api.recitations.recitations_services._filter_and_map_segments')
+    @patch('pecha_api.recitations.recitations_services.TextUtils.get_text_details_by_ids')
     @pytest.mark.asyncio
-    async def test_segments_mapping_by_toc_uses_helper_function(
+    async def test_segments_mapping_by_toc_skips_unknown_texts_and_missing_segments(
         self,
-        mock_filter_and_map,
+        mock_get_text_details,
         mock_get_related_segments_batch,
         mock_get_segments_by_ids
     ):
-        """Test that segments_mapping_by_toc correctly uses _filter_and_map_segments helper."""
-        segment_id = str(uuid4())
         text_id = str(uuid4())
-        
-        toc = [
-            TableOfContent(
-                id=str(uuid4()),
-                type=TableOfContentType.TEXT,
-                text_id=text_id,
-                sections=[
-                    Section(
-                        id=str(uuid4()),
-                        title="Section 1",
-                        section_number=1,
-                        segments=[
-                            TextSegment(segment_id=segment_id, segment_number=1)
-                        ]
-                    )
-                ]
-            )
-        ]
-        
-        segment_dto = SegmentDTO(
-            id=segment_id,
-            text_id=text_id,
-            content="Test content",
-            type=SegmentType.SOURCE
-        )
-        mock_get_segments_by_ids.return_value = {segment_id: segment_dto}
-        mock_get_related_segments_batch.return_value = {segment_id: []}
-        
-        # Mock the helper function to return empty dicts
-        mock_filter_and_map.return_value = {}
-        
-        request = RecitationDetailsRequest(
-            language="en",
-            recitation=["en"],
-            translations=["bo"],
-            transliterations=["bo"],
-            adaptations=["en"]
+        known_segment_id, missing_segment_id = str(uuid4()), str(uuid4())
+        mock_get_segments_by_ids.return_value = {known_segment_id: self._segment(text_id, "root", known_segment_id)}
+        mock_get_related_segments_batch.return_value = {known_segment_id: [self._segment(str(uuid4()), "orphan")]}
+        mock_get_text_details.return_value = {text_id: self._text(text_id, "bo", TextType.ROOT_TEXT.value)}
+        request = RecitationDetailsRequest(language="en", translations=["en"])
+
+        result = await segments_mapping_by_toc(
+            table_of_contents=self._toc(text_id, [known_segment_id, missing_segment_id]),
+            recitation_details_request=request
         )
-        
-        # Execute
-        result = await segments_mapping_by_toc(table_of_contents=toc, recitation_details_request=request)
-        
-        # Verify
-        assert len(result) == 1
-        assert isinstance(result[0], RecitationSegment)
-        
-        # Verify _filter_and_map_segments was called 4 times
-        assert mock_filter_and_map.call_count == 4
-        
-        # Verify it was called with correct filter types
-        call_filter_types = [call.kwargs['filter_type'] for call in mock_filter_and_map.call_args_list]
-        assert RecitationListTextType.RECITATIONS.value in call_filter_types
-        assert RecitationListTextType.TRANSLATIONS.value in call_filter_types
-        assert RecitationListTextType.TRANSLITERATIONS.value in call_filter_types
-        assert RecitationListTextType.ADAPTATIONS.value in call_filter_types
-        
-        # Verify it was called with correct languages
-        calls = mock_filter_and_map.call_args_list
-        recitation_call = [c for c in calls if c.kwargs['filter_type'] == RecitationListTextType.RECITATIONS.value][0]
-        assert recitation_call.kwargs['languages'] == ["en"]
-        
-        translation_call = [c for c in calls if c.kwargs['filter_type'] == RecitationListTextType.TRANSLATIONS.value][0]
-        assert translation_call.kwargs['languages'] == ["bo"]
\ No newline at end of file
+
+        assert result == [RecitationSegment()]
@@ -0,0 +1,195 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pecha_api.search.local_search_index import (
+    LocalSearchIndex,
+    index_segments,
+    remove_indexed_text,
+    update_indexed_segment_contents,
+    _encode_postings,
+    _decode_postings
+)
+from pecha_api.texts.segments.segments_enum import SegmentType
+
+
+@pytest.fixture(autouse=True)
+def _syllable_tokenizer_():
+    with patch("pecha_api.search.search_tokenizer._word_tokenizer", None), \
+            patch("pecha_api.search.search_tokenizer._word_tokenizer_unavailable", True):
+        yield
+
+
+def _build_index_() -> LocalSearchIndex:
+    index = LocalSearchIndex()
+    index.add_segments([
+        ("segment_1", "text_1", "compassion compassion wisdom"),
+        ("segment_2", "text_1", "wisdom and the path of the bodhisattva"),
+        ("segment_3", "text_2", "compassion for all beings"),
+        ("segment_4", "text_2", "བྱང་ཆུབ་སེམས།")
+    ])
+    return index
+
+
+def test_search_ranks_by_bm25():
+    index = _build_index_()
+
+    hits, total = index.search(query="compassion")
+
+    assert total == 2
+    assert [segment_id for segment_id, _, _ in hits] == ["segment_1", "segment_3"]
+    assert hits[0][2] > hits[1][2]
+
+
+def test_search_filters_by_text_id():
+    index = _build_index_()
+
+    hits, total = index.search(query="compassion wisdom", text_id="text_2")
+
+    assert total == 1
+    assert hits[0][:2] == ("segment_3", "text_2")
+
+
+def test_search_tibetan_syllables():
+    index = _build_index_()
+
+    hits, total = index.search(query="བྱང་ཆུབ")
+
+    assert total == 1
+    assert hits[0][0] == "segment_4"
+
+
+def test_search_paginates():
+    index = _build_index_()
+
+    hits, total = index.search(query="compassion wisdom", skip=1, limit=1)
+
+    assert total == 3
+    assert len(hits) == 1
+
+
+def test_search_without_matches():
+    index = _build_index_()
+
+    assert index.search(query="nirvana") == ([], 0)
+    assert LocalSearchIndex().search(query="compassion") == ([], 0)
+
+
+def test_add_segments_replaces_previous_content():
+    index = _build_index_()
+
+    index.add_segments([("segment_1", "text_1", "emptiness")])
+
+    assert [segment_id for segment_id, _, _ in index.search(query="compassion")[0]] == ["segment_3"]
+    assert index.search(query="emptiness")[0][0][0] == "segment_1"
+    assert index.size == 4
+
+
+def test_remove_segments_and_text():
+    index = _build_index_()
+
+    index.remove_segments(segment_ids=["segment_3"])
+    assert [segment_id for segment_id, _, _ in index.search(query="compassion")[0]] == ["segment_1"]
+
+    index.remove_text(text_id="text_1")
+    assert index.search(query="compassion") == ([], 0)
+    assert index.size == 1
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    index = _build_index_()
+    index.remove_segments(segment_ids=["segment_2"])
+    path = str(tmp_path / "search" / "segments.idx")
+
+    index.save(path)
+    loaded = LocalSearchIndex()
+
+    assert loaded.load(path) is True
+    assert loaded.size == 3
+    assert not loaded.dirty
+    assert loaded.search(query="compassion wisdom") == index.search(query="compassion wisdom")
+    assert loaded.search(query="bodhisattva") == ([], 0)
+
+
+def test_save_writes_through_a_unique_temporary_file(tmp_path):
+    index = _build_index_()
+    path = tmp_path / "segments.idx"
+    # a stale temporary file left by another process is neither reused nor removed
+    stale_path = tmp_path / "segments.idx.tmp"
+    stale_path.write_bytes(b"stale")
+
+    index.save(str(path))
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == ["segments.idx", "segments.idx.tmp"]
+    assert stale_path.read_bytes() == b"stale"
+    assert LocalSearchIndex().load(str(path)) is True
+
+
+def test_save_removes_its_temporary_file_on_failure(tmp_path):
+    index = _build_index_()
+    path = tmp_path / "segments.idx"
+
+    with patch("pecha_api.search.local_search_index.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError):
+            index.save(str(path))
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_load_missing_or_unknown_file(tmp_path):
+    path = tmp_path / "segments.idx"
+    index = LocalSearchIndex()
+
+    assert index.load(str(path)) is False
+
+    path.write_bytes(b"JUNK" + bytes(5))
+    assert index.load(str(path)) is False
+
+
+def test_postings_encoding_roundtrip():
+    postings = {0: 1, 5: 300, 70000: 2}
+
+    assert _decode_postings(_encode_postings(postings)) == postings
+
+
+@pytest.mark.asyncio
+async def test_index_segments_only_indexes_sources_when_enabled():
+    index = LocalSearchIndex()
+    segments = [
+        SimpleNamespace(id="segment_1", text_id="text_1", content="compassion", type=SegmentType.SOURCE),
+        SimpleNamespace(id="segment_2", text_id="sheet_1", content="compassion", type=SegmentType.CONTENT)
+    ]
+
+    with patch("pecha_api.search.local_search_index.local_search_index", index), \
+            patch("pecha_api.search.local_search_index.get", return_value="local"):
+        await index_segments(segments=segments)
+        await update_indexed_segment_contents(segments_content={"segment_1": "wisdom", "segment_2": "wisdom"})
+
+    assert index.size == 1
+    assert index.search(query="wisdom")[0][0][:2] == ("segment_1", "text_1")
+
+
+@pytest.mark.asyncio
+async def test_index_segments_disabled_for_elasticsearch():
+    index = LocalSearchIndex()
+    segments = [SimpleNamespace(id="segment_1", text_id="text_1", content="compassion", type=SegmentType.SOURCE)]
+
+    with patch("pecha_api.search.local_search_index.local_search_index", index), \
+            patch("pecha_api.search.local_search_index.get", return_value="elasticsearch"):
+        await index_segments(segments=segments)
+
+    assert index.size == 0
+
+
+@pytest.mark.asyncio
+async def test_remove_indexed_text_runs_off_the_event_loop():
+    index = _build_index_()
+
+    with patch("pecha_api.search.local_search_index.local_search_index", index), \
+            patch("pecha_api.search.local_search_index.get", return_value="local"), \
+            patch("pecha_api.search.local_search_index.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+        await remove_indexed_text(text_id="text_1")
+
+    mock_to_thread.assert_called_once_with(index.remove_text, "text_1")
+    assert index.search(query="wisdom") == ([], 0)
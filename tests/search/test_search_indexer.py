@@ -0,0 +1,203 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock, Mock, MagicMock
+from fastapi import HTTPException
+
+from pecha_api.search import search_indexer
+from pecha_api.search.search_indexer import (
+    reindex_segments,
+    sync_search_segments,
+    sync_search_segment_contents,
+    sync_search_segment_mappings,
+    remove_search_segments,
+    start_segment_reindex,
+    is_search_indexing_enabled,
+    _generate_segment_actions_,
+    _swap_segment_alias_
+)
+from pecha_api.texts.segments.segments_enum import SegmentType
+
+
+def _mock_segment_(segment_id: str, text_id: str = "text_1", segment_type: SegmentType = SegmentType.SOURCE, mapping=None):
+    return SimpleNamespace(
+        id=segment_id,
+        pecha_segment_id=f"pecha_{segment_id}",
+        text_id=text_id,
+        content=f"content {segment_id}",
+        type=segment_type,
+        mapping=mapping or []
+    )
+
+
+def _mock_text_(text_id: str):
+    return SimpleNamespace(id=text_id, language="bo", title=f"title {text_id}", published_date="2024-01-01")
+
+
+class _MockCursor:
+    def __init__(self, segments):
+        self._segments = segments
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for segment in self._segments:
+            yield segment
+
+
+def _mock_search_client_():
+    client = Mock()
+    client.indices = Mock()
+    for method in ("create", "put_settings", "refresh", "update_aliases", "delete", "exists_alias", "exists", "get_alias"):
+        setattr(client.indices, method, AsyncMock())
+    client.delete_by_query = AsyncMock()
+    return client
+
+
+@pytest.mark.asyncio
+async def test_generate_segment_actions_joins_texts_per_batch():
+    segments = [_mock_segment_("segment_1"), _mock_segment_("segment_2", text_id="text_2"), _mock_segment_("segment_3")]
+
+    with patch("pecha_api.search.search_indexer.Segment.find", return_value=_MockCursor(segments)), \
+            patch("pecha_api.search.search_indexer.Text.get_texts_by_ids", new_callable=AsyncMock) as mock_get_texts, \
+            patch("pecha_api.search.search_indexer.get_int", return_value=2):
+        mock_get_texts.return_value = [_mock_text_("text_1")]
+
+        actions = [action async for action in _generate_segment_actions_(index="pecha-segments-1")]
+
+    # text_2 is missing, its segment cannot be shown in search results
+    assert [action["_id"] for action in actions] == ["segment_1", "segment_3"]
+    assert actions[0]["_index"] == "pecha-segments-1"
+    assert actions[0]["_source"]["text"] == {
+        "text_id": "text_1", "language": "bo", "title": "title text_1", "published_date": "2024-01-01"
+    }
+    assert actions[0]["_source"]["content"] == "content segment_1"
+    # the second batch only holds text_1, which the first batch already fetched
+    mock_get_texts.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reindex_segments_swaps_alias_after_loading():
+    client = _mock_search_client_()
+    client.indices.exists_alias.return_value = True
+    client.indices.get_alias.return_value = {"pecha-segments-old": {}}
+
+    with patch("pecha_api.search.search_indexer.search_client", return_value=client), \
+            patch("pecha_api.search.search_indexer.async_bulk", new_callable=AsyncMock, return_value=(10, 1)):
+        response = await reindex_segments()
+
+    assert response.index.startswith("pecha-segments-")
+    assert response.indexed == 10
+    assert response.failed == 1
+    assert client.indices.create.await_args.kwargs["settings"] == {"number_of_replicas": 0, "refresh_interval": "-1"}
+    client.indices.update_aliases.assert_awaited_once_with(actions=[
+        {"remove": {"index": "pecha-segments-old", "alias": "pecha-segments"}},
+        {"add": {"index": response.index, "alias": "pecha-segments"}}
+    ])
+    client.indices.delete.assert_awaited_once_with(index="pecha-segments-old", ignore_unavailable=True)
+    assert search_indexer._building_index is None
+
+
+@pytest.mark.asyncio
+async def test_swap_alias_replaces_concrete_index():
+    client = _mock_search_client_()
+    client.indices.exists_alias.return_value = False
+    client.indices.exists.return_value = True
+
+    await _swap_segment_alias_(client=client, alias="pecha-segments", index="pecha-segments-1")
+
+    client.indices.update_aliases.assert_awaited_once_with(actions=[
+        {"remove_index": {"index": "pecha-segments"}},
+        {"add": {"index": "pecha-segments-1", "alias": "pecha-segments"}}
+    ])
+    client.indices.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_reindex_segments_drops_new_index_on_failure():
+    client = _mock_search_client_()
+
+    with patch("pecha_api.search.search_indexer.search_client", return_value=client), \
+            patch("pecha_api.search.search_indexer.async_bulk", new_callable=AsyncMock, side_effect=Exception("bulk failed")):
+        with pytest.raises(Exception):
+            await reindex_segments()
+
+    client.indices.update_aliases.assert_not_awaited()
+    created_index = client.indices.create.await_args.kwargs["index"]
+    client.indices.delete.assert_awaited_once_with(index=created_index, ignore_unavailable=True)
+    assert search_indexer._building_index is None
+
+
+@pytest.mark.asyncio
+async def test_start_segment_reindex_rejects_concurrent_run():
+    running_task = Mock()
+    running_task.done.return_value = False
+
+    with patch("pecha_api.search.search_indexer._reindex_task", running_task):
+        with pytest.raises(HTTPException) as exc_info:
+            start_segment_reindex()
+
+    assert exc_info.value.status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_sync_search_segments_writes_to_alias_and_building_index():
+    segments = [_mock_segment_("segment_1"), _mock_segment_("segment_2", segment_type=SegmentType.CONTENT)]
+
+    with patch("pecha_api.search.search_indexer.is_search_indexing_enabled", return_value=True), \
+            patch("pecha_api.search.search_indexer._building_index", "pecha-segments-new"), \
+            patch("pecha_api.search.search_indexer.search_client"), \
+            patch("pecha_api.search.search_indexer.Text.get_texts_by_ids", new_callable=AsyncMock, return_value=[_mock_text_("text_1")]) as mock_get_texts, \
+            patch("pecha_api.search.search_indexer.async_bulk", new_callable=AsyncMock, return_value=(2, 0)) as mock_bulk:
+        await sync_search_segments(segments=segments)
+
+    actions = mock_bulk.await_args.args[1]
+    assert [(action["_index"], action["_id"]) for action in actions] == [
+        ("pecha-segments", "segment_1"),
+        ("pecha-segments-new", "segment_1")
+    ]
+    mock_get_texts.assert_awaited_once()
+
+
+@pytest.mark.parametrize("elasticsearch_url,expected", [
+    ("None", False),
+    ("", False),
+    ("http://localhost:9200", True),
+])
+def test_is_search_indexing_enabled(elasticsearch_url, expected):
+    values = {"SEARCH_ENGINE": "elasticsearch", "ELASTICSEARCH_URL": elasticsearch_url}
+    with patch("pecha_api.search.search_indexer.get", side_effect=lambda key: values[key]):
+        assert is_search_indexing_enabled() is expected
+
+
+@pytest.mark.asyncio
+async def test_sync_search_segments_disabled_without_elasticsearch():
+    with patch("pecha_api.search.search_indexer.async_bulk", new_callable=AsyncMock) as mock_bulk:
+        await sync_search_segments(segments=[_mock_segment_("segment_1")])
+
+    mock_bulk.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_partial_updates_and_deletes():
+    segment = _mock_segment_("segment_1", mapping=[SimpleNamespace(parent_text_id="text_9"), SimpleNamespace(parent_text_id="text_8")])
+
+    with patch("pecha_api.search.search_indexer.is_search_indexing_enabled", return_value=True), \
+            patch("pecha_api.search.search_indexer.search_client"), \
+            patch("pecha_api.search.search_indexer.async_bulk", new_callable=AsyncMock, return_value=(1, 0)) as mock_bulk:
+        await sync_search_segment_contents(segments_content={"segment_1": "new content"})
+        await sync_search_segment_mappings(segments=[segment])
+        await remove_search_segments(segment_ids=["segment_1"])
+
+    content_actions, mapping_actions, delete_actions = [call.args[1] for call in mock_bulk.await_args_list]
+    assert content_actions == [{"_op_type": "update", "_index": "pecha-segments", "_id": "segment_1", "doc": {"content": "new content"}}]
+    assert mapping_actions == [{"_op_type": "update", "_index": "pecha-segments", "_id": "segment_1", "doc": {"mapped_text_ids": ["text_8", "text_9"]}}]
+    assert delete_actions == [{"_op_type": "delete", "_index": "pecha-segments", "_id": "segment_1"}]
+
+
+@pytest.mark.asyncio
+async def test_incremental_update_failure_does_not_fail_the_write():
+    with patch("pecha_api.search.search_indexer.is_search_indexing_enabled", return_value=True), \
+            patch("pecha_api.search.search_indexer.search_client"), \
+            patch("pecha_api.search.search_indexer.async_bulk", new_callable=AsyncMock, side_effect=Exception("unavailable")):
+        await remove_search_segments(segment_ids=["segment_1"])
@@ -1142,3 +1142,47 @@ def test_apply_pagination_to_sources_sorting():
     assert len(all_matches) == 2
     scores = sorted([m.relevance_score for m in all_matches])
     assert scores == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_from_local_index():
+    text_id = "e6370d09-aa0c-4a41-96ef-deffb89c7810"
+    other_text_id = str(uuid4())
+    segment_ids = [str(uuid4()) for _ in range(3)]
+    hits = [(segment_ids[0], text_id, 3.0), (segment_ids[1], other_text_id, 2.0), (segment_ids[2], text_id, 1.0)]
+    segments = [Mock(id=segment_id, content=f"content {index}") for index, segment_id in enumerate(segment_ids)]
+    texts = [
+        Mock(id=other_text_id, language="bo", title="other", published_date="2024-01-01"),
+        Mock(id=text_id, language="en", title="The Way of the Bodhisattva", published_date="2024-01-02")
+    ]
+
+    with patch("pecha_api.search.search_service.is_local_search_enabled", return_value=True), \
+            patch("pecha_api.search.search_service.local_search_index") as mock_index, \
+            patch("pecha_api.search.search_service.Segment.get_segments_by_ids", new_callable=AsyncMock, return_value=segments), \
+            patch("pecha_api.search.search_service.Text.get_texts_by_ids", new_callable=AsyncMock, return_value=texts), \
+            patch("pecha_api.search.search_service.search_client") as mock_search_client:
+        mock_index.search.return_value = (hits, 45)
+
+        response = await get_search_results(query="query", search_type=SearchType.SOURCE, skip=0, limit=3)
+
+        mock_search_client.assert_not_called()
+        mock_index.search.assert_called_once_with(query="query", text_id=None, skip=0, limit=3)
+        assert response.total == 30
+        assert [source.text.text_id for source in response.sources] == [text_id, other_text_id]
+        assert [match.segment_id for match in response.sources[0].segment_match] == [segment_ids[0], segment_ids[2]]
+        assert response.sources[0].segment_match[1].content == "content 2"
+        assert response.sources[0].text.title == "The Way of the Bodhisattva"
+
+
+@pytest.mark.asyncio
+async def test_get_search_results_for_source_from_empty_local_index():
+    with patch("pecha_api.search.search_service.is_local_search_enabled", return_value=True), \
+            patch("pecha_api.search.search_service.local_search_index") as mock_index, \
+            patch("pecha_api.search.search_service.Segment.get_segments_by_ids", new_callable=AsyncMock) as mock_get_segments:
+        mock_index.search.return_value = ([], 0)
+
+        response = await get_search_results(query="query", search_type=SearchType.SOURCE, skip=0, limit=10)
+
+        mock_get_segments.assert_not_called()
+        assert response.sources == []
+        assert response.total == 0
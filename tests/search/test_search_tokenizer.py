@@ -0,0 +1,46 @@
+import pytest
+from unittest.mock import patch
+
+from pecha_api.search.search_tokenizer import SearchTokenizer
+
+
+@pytest.fixture(autouse=True)
+def _syllable_tokenizer_():
+    # botok downloads its dialect pack on first use, the syllable fallback keeps the tests offline
+    with patch("pecha_api.search.search_tokenizer._word_tokenizer", None), \
+            patch("pecha_api.search.search_tokenizer._word_tokenizer_unavailable", True):
+        yield
+
+
+def test_tokenize_empty_text():
+    assert SearchTokenizer.tokenize(None) == []
+    assert SearchTokenizer.tokenize("") == []
+
+
+def test_tokenize_latin_text_is_casefolded():
+    assert SearchTokenizer.tokenize("Hello, WORLD!") == ["hello", "world"]
+
+
+def test_tokenize_han_characters_are_single_terms():
+    assert SearchTokenizer.tokenize("菩提心 abc") == ["菩", "提", "心", "abc"]
+
+
+def test_tokenize_tibetan_splits_syllables_and_strips_punctuation():
+    assert SearchTokenizer.tokenize("བཀྲ་ཤིས་བདེ་ལེགས།ང་ཚོ།") == ["བཀྲ", "ཤིས", "བདེ", "ལེགས", "ང", "ཚོ"]
+
+
+def test_tokenize_tibetan_with_word_tokenizer():
+    class _Token:
+        def __init__(self, text):
+            self.text = text
+
+    class _WordTokenizer:
+        def tokenize(self, text):
+            return [_Token("བཀྲ་ཤིས་"), _Token("བདེ་ལེགས"), _Token("།")]
+
+    with patch("pecha_api.search.search_tokenizer._word_tokenizer", _WordTokenizer()):
+        assert SearchTokenizer.tokenize("བཀྲ་ཤིས་བདེ་ལེགས།") == ["བཀྲ་ཤིས", "བདེ་ལེགས"]
+
+
+def test_tokenize_mixed_scripts():
+    assert SearchTokenizer.tokenize("Tashi བཀྲ་ཤིས་ delek") == ["tashi", "བཀྲ", "ཤིས", "delek"]
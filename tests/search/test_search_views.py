@@ -700,4 +700,20 @@ def test_get_url_link_with_long_pecha_segment_id():
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["text_id"] == "text123"
-        assert data["segment_id"] == "seg456"
\ No newline at end of file
+        assert data["segment_id"] == "seg456"
+
+def test_reindex_search_accepted():
+    with patch("pecha_api.search.search_views.reindex_search_segments") as mock_reindex:
+        response = client.post("/search/reindex", headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        mock_reindex.assert_called_once_with(token="token")
+
+
+def test_reindex_search_forbidden_for_non_admin():
+    with patch("pecha_api.search.search_service.verify_admin_access", return_value=False), \
+            patch("pecha_api.search.search_service.start_segment_reindex") as mock_start:
+        response = client.post("/search/reindex", headers={"Authorization": "Bearer token"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        mock_start.assert_not_called()
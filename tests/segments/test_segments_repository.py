@@ -0,0 +1,115 @@
+from unittest.mock import AsyncMock, patch, MagicMock
+import uuid
+import pytest
+
+from pecha_api.texts.segments.segments_repository import (
+    sync_segment_mapping_edges,
+    rebuild_segment_mapping_edges,
+    get_mapped_text_types_by_parent_segment_id,
+    _build_segment_mapping_edges
+)
+from pecha_api.texts.segments.segments_models import Mapping, SegmentMappingEdge, SegmentMappingEdgeView, Segment
+from pecha_api.texts.texts_models import Text
+from pecha_api.texts.texts_enums import TextType
+
+
+def _mock_segment(text_id: str, mapping: list):
+    segment = MagicMock()
+    segment.id = uuid.uuid4()
+    segment.text_id = text_id
+    segment.mapping = mapping
+    return segment
+
+
+def test_build_segment_mapping_edges_deduplicates_parent_child_pairs():
+    segment = _mock_segment(
+        text_id="commentary-text",
+        mapping=[
+            Mapping(text_id="root-text", segments=["parent-1", "parent-2"]),
+            Mapping(text_id="root-text", segments=["parent-1"])
+        ]
+    )
+
+    edges = _build_segment_mapping_edges(segments=[segment], text_types={"commentary-text": "commentary"})
+
+    assert [edge.parent_segment_id for edge in edges] == ["parent-1", "parent-2"]
+    assert all(edge.child_segment_id == str(segment.id) for edge in edges)
+    assert all(edge.child_text_type == "commentary" for edge in edges)
+
+
+@pytest.mark.asyncio
+async def test_sync_segment_mapping_edges_replaces_edges_of_child_segments():
+    segment = _mock_segment(text_id="version-text", mapping=[Mapping(text_id="root-text", segments=["parent-1"])])
+    mock_text = MagicMock()
+    mock_text.id = "version-text"
+    mock_text.type = TextType.VERSION
+
+    with patch.object(Text, "get_texts_by_ids", new_callable=AsyncMock, return_value=[mock_text]), \
+        patch.object(SegmentMappingEdge, "replace_edges_by_child_segment_ids", new_callable=AsyncMock) as mock_replace:
+        total_edges = await sync_segment_mapping_edges(segments=[segment])
+
+    assert total_edges == 1
+    kwargs = mock_replace.call_args.kwargs
+    assert kwargs["child_segment_ids"] == [str(segment.id)]
+    assert kwargs["edges"][0].child_text_type == "version"
+
+
+@pytest.mark.asyncio
+async def test_rebuild_segment_mapping_edges_pages_through_mapped_segments():
+    first_page = [_mock_segment(text_id="text-1", mapping=[]), _mock_segment(text_id="text-1", mapping=[])]
+
+    with patch.object(Segment, "get_mapped_segments", new_callable=AsyncMock, side_effect=[first_page, []]) as mock_get_mapped, \
+        patch("pecha_api.texts.segments.segments_repository.sync_segment_mapping_edges", new_callable=AsyncMock, return_value=3):
+        total_edges = await rebuild_segment_mapping_edges()
+
+    assert total_edges == 3
+    assert mock_get_mapped.call_args_list[0].kwargs["after_id"] is None
+    assert mock_get_mapped.call_args_list[1].kwargs["after_id"] == first_page[-1].id
+
+
+@pytest.mark.asyncio
+async def test_get_mapped_text_types_by_parent_segment_id():
+    edges = [
+        SegmentMappingEdgeView(parent_segment_id="parent-1", child_segment_id="child-1", child_text_id="text-1", child_text_type="commentary"),
+        SegmentMappingEdgeView(parent_segment_id="parent-1", child_segment_id="child-2", child_text_id="text-1", child_text_type="commentary"),
+        SegmentMappingEdgeView(parent_segment_id="parent-1", child_segment_id="child-3", child_text_id="text-2", child_text_type="version")
+    ]
+
+    with patch.object(SegmentMappingEdge, "get_edges_by_parent_segment_ids", new_callable=AsyncMock, return_value=edges):
+        result = await get_mapped_text_types_by_parent_segment_id(parent_segment_id="parent-1")
+
+    assert result == {"text-1": "commentary", "text-2": "version"}
+
+
+@pytest.mark.asyncio
+async def test_get_mapped_text_types_by_parent_segment_id_falls_back_to_segment_mapping():
+    segments = [
+        _mock_segment(text_id="text-1", mapping=[Mapping(text_id="root-text", segments=["parent-1"])]),
+        _mock_segment(text_id="text-2", mapping=[Mapping(text_id="root-text", segments=["parent-1"])])
+    ]
+    texts = [MagicMock(id="text-1", type=TextType.COMMENTARY), MagicMock(id="text-2", type=TextType.VERSION)]
+
+    with patch.object(SegmentMappingEdge, "get_edges_by_parent_segment_ids", new_callable=AsyncMock, return_value=[]), \
+        patch.object(Segment, "get_segments_mapped_to", new_callable=AsyncMock, return_value=segments) as mock_mapped_to, \
+        patch.object(Text, "get_texts_by_ids", new_callable=AsyncMock, return_value=texts):
+        result = await get_mapped_text_types_by_parent_segment_id(parent_segment_id="parent-1")
+
+    assert result == {"text-1": "commentary", "text-2": "version"}
+    mock_mapped_to.assert_awaited_once_with(parent_segment_ids=["parent-1"])
+
+
+@pytest.mark.asyncio
+async def test_get_related_mapped_segments_batch_falls_back_for_parents_without_edges():
+    indexed_child = _mock_segment(text_id="text-1", mapping=[Mapping(text_id="root-text", segments=["parent-1"])])
+    legacy_child = _mock_segment(text_id="text-2", mapping=[Mapping(text_id="root-text", segments=["parent-2"])])
+    edges = [
+        SegmentMappingEdgeView(parent_segment_id="parent-1", child_segment_id=str(indexed_child.id), child_text_id="text-1", child_text_type="version")
+    ]
+
+    with patch.object(SegmentMappingEdge, "get_edges_by_parent_segment_ids", new_callable=AsyncMock, return_value=edges), \
+        patch.object(Segment, "get_segments_by_ids", new_callable=AsyncMock, return_value=[indexed_child]), \
+        patch.object(Segment, "get_segments_mapped_to", new_callable=AsyncMock, return_value=[legacy_child]) as mock_mapped_to:
+        result = await Segment.get_related_mapped_segments_batch(parent_segment_ids=["parent-1", "parent-2"])
+
+    assert result == {"parent-1": [indexed_child], "parent-2": [legacy_child]}
+    mock_mapped_to.assert_awaited_once_with(parent_segment_ids=["parent-2"])
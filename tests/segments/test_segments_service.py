@@ -412,11 +412,11 @@ async def test_get_infos_by_segment_id_success():
         patch("pecha_api.texts.segments.segments_service.get_segment_info_by_id_cache", new_callable=AsyncMock, return_value=None), \
         patch("pecha_api.texts.segments.segments_service.get_segment_by_id", new_callable=AsyncMock, return_value=mock_segment), \
         patch("pecha_api.texts.segments.segments_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
-        patch("pecha_api.texts.segments.segments_service.get_related_mapped_segments", new_callable=AsyncMock) as mock_get_related_mapped_segment, \
-        patch("pecha_api.texts.segments.segments_service.SegmentUtils.get_count_of_each_commentary_and_version", new_callable=AsyncMock, return_value={"version": 1, "commentary": 2}), \
+        patch("pecha_api.texts.segments.segments_service.get_mapped_text_types_by_parent_segment_id", new_callable=AsyncMock) as mock_get_mapped_text_types, \
+        patch("pecha_api.texts.segments.segments_service.SegmentUtils.get_count_of_each_commentary_and_version_by_text_types", return_value={"version": 1, "commentary": 2}), \
         patch("pecha_api.texts.segments.segments_service.SegmentUtils.get_root_mapping_count", new_callable=AsyncMock, return_value=3), \
         patch("pecha_api.texts.segments.segments_service.set_segment_info_by_id_cache", new_callable=AsyncMock):
-        mock_get_related_mapped_segment.return_value = related_mapped_segments
+        mock_get_mapped_text_types.return_value = {segment.text_id: "commentary" for segment in related_mapped_segments}
         
         response = await get_info_by_segment_id(segment_id=segment_id)
         assert isinstance(response, SegmentInfoResponse)
@@ -116,6 +116,33 @@ async def test_get_count_of_each_commentary_and_version_success():
         assert result["commentary"] == 2
         assert result["version"] == 1
 
+def test_get_count_of_each_commentary_and_version_by_text_types_success():
+    parent_text = TextDTO(
+        id="parent-text-id",
+        title="Parent Text",
+        language="bo",
+        group_id="group_id",
+        type="version",
+        is_published=True,
+        created_date="created_date",
+        updated_date="updated_date",
+        published_date="published_date",
+        published_by="published_by",
+        categories=["categories"],
+        views=0
+    )
+    mapped_text_types = {
+        "commentary-text-1": "commentary",
+        "commentary-text-2": "commentary",
+        "version-text-1": "version",
+        "unknown-text": None
+    }
+
+    result = SegmentUtils.get_count_of_each_commentary_and_version_by_text_types(mapped_text_types, parent_text=parent_text)
+
+    assert result["commentary"] == 2
+    assert result["version"] == 1
+
 @pytest.mark.asyncio
 async def test_filter_segment_mapping_by_type_success():
     """Test filtering segments by commentary type returns correct SegmentCommentry objects."""
@@ -409,9 +436,11 @@ async def test_mapped_segment_content_for_table_of_content_without_version_id_su
             type=SegmentType.SOURCE
         )
     ]
-    with patch("pecha_api.texts.segments.segments_utils.get_segment_by_id", new_callable=AsyncMock, return_value=segment), \
-        patch("pecha_api.texts.segments.segments_utils.get_related_mapped_segments", new_callable=AsyncMock, return_value=related_mapped_segments):
+    with patch("pecha_api.texts.segments.segments_utils.get_segments_by_ids", new_callable=AsyncMock, return_value={segment.id: segment}) as mock_get_segments_by_ids, \
+        patch("pecha_api.texts.segments.segments_utils.get_related_mapped_segments_by_text_id", new_callable=AsyncMock, return_value={}) as mock_get_related:
         response = await SegmentUtils.get_mapped_segment_content_for_table_of_content(table_of_content=table_of_content, version_id=None)
+        mock_get_segments_by_ids.assert_awaited_once_with(segment_ids=["anju6a06-f373-a50b-ba57-e7a8d4dd5555"])
+        mock_get_related.assert_not_called()
         assert isinstance(response, DetailTableOfContent)
         assert response.text_id == "5f3c2e9d-9b7a-4f5e-8e2a-6a8b7c9d4e0f"
         assert response.sections[0].title == "title"
@@ -808,11 +837,11 @@ async def test_mapped_segment_content_for_table_of_content_with_version_id_succe
         views=0
     )
 
-    with patch("pecha_api.texts.segments.segments_utils.get_segment_by_id", new_callable=AsyncMock, return_value=root_segment), \
-        patch("pecha_api.texts.segments.segments_utils.get_related_mapped_segments", new_callable=AsyncMock, return_value=related_mapped_segments), \
-        patch("pecha_api.texts.segments.segments_utils.TextUtils.get_text_details_by_ids", new_callable=AsyncMock, return_value={version_id: version_text_detail}), \
+    with patch("pecha_api.texts.segments.segments_utils.get_segments_by_ids", new_callable=AsyncMock, return_value={"root-seg-1": root_segment}), \
+        patch("pecha_api.texts.segments.segments_utils.get_related_mapped_segments_by_text_id", new_callable=AsyncMock, return_value={"root-seg-1": related_mapped_segments}) as mock_get_related, \
         patch("pecha_api.texts.segments.segments_utils.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=version_text_detail):
         response = await SegmentUtils.get_mapped_segment_content_for_table_of_content(table_of_content=table_of_content, version_id=version_id)
+        mock_get_related.assert_awaited_once_with(parent_segment_ids=["root-seg-1"], text_id=version_id)
 
         assert isinstance(response, DetailTableOfContent)
         seg = response.sections[0].segments[0]
@@ -824,6 +853,66 @@ async def test_mapped_segment_content_for_table_of_content_with_version_id_succe
         assert seg.translation.content == "translated content"
 
 
+@pytest.mark.asyncio
+async def test_mapped_segment_content_for_table_of_content_with_version_id_without_translation():
+    table_of_content = TableOfContent(
+        id="efb26a06-f373-450b-ba57-e7a8d4dd5b64",
+        text_id="5f3c2e9d-9b7a-4f5e-8e2a-6a8b7c9d4e0f",
+        type=TableOfContentType.TEXT,
+        sections=[
+            Section(
+                id="parent-section",
+                title="parent",
+                section_number=1,
+                segments=[TextSegment(segment_id="root-seg-1", segment_number=1)],
+                sections=[
+                    Section(
+                        id="child-section",
+                        title="child",
+                        section_number=1,
+                        parent_id="parent-section",
+                        segments=[TextSegment(segment_id="root-seg-2", segment_number=2)],
+                        sections=[]
+                    )
+                ]
+            )
+        ]
+    )
+    version_id = "version-text-1"
+    root_segments = {
+        "root-seg-1": SegmentDTO(id="root-seg-1", text_id="root-text-1", content="first", mapping=[], type=SegmentType.SOURCE),
+        "root-seg-2": SegmentDTO(id="root-seg-2", text_id="root-text-1", content="second", mapping=[], type=SegmentType.SOURCE)
+    }
+    translated_segment = SegmentDTO(id=str(uuid4()), text_id=version_id, content="translated", mapping=[], type=SegmentType.SOURCE)
+    version_text_detail = TextDTO(
+        id=version_id,
+        title="Version Title",
+        language="en",
+        type="version",
+        group_id="group-id",
+        is_published=True,
+        created_date="created_date",
+        updated_date="updated_date",
+        published_date="published_date",
+        published_by="published_by",
+        categories=["cat"],
+        views=0
+    )
+
+    with patch("pecha_api.texts.segments.segments_utils.get_segments_by_ids", new_callable=AsyncMock, return_value=root_segments), \
+        patch("pecha_api.texts.segments.segments_utils.get_related_mapped_segments_by_text_id", new_callable=AsyncMock, return_value={"root-seg-2": [translated_segment]}), \
+        patch("pecha_api.texts.segments.segments_utils.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=version_text_detail) as mock_get_text_details:
+        response = await SegmentUtils.get_mapped_segment_content_for_table_of_content(table_of_content=table_of_content, version_id=version_id)
+
+        mock_get_text_details.assert_awaited_once_with(text_id=version_id)
+        parent_segment = response.sections[0].segments[0]
+        child_segment = response.sections[0].sections[0].segments[0]
+        assert parent_segment.content == "first"
+        assert parent_segment.translation is None
+        assert child_segment.content == "second"
+        assert child_segment.translation.content == "translated"
+
+
 @pytest.mark.asyncio
 async def test_validate_segment_exists_not_found_raises_404():
     with patch("pecha_api.texts.segments.segments_utils.check_segment_exists", new_callable=AsyncMock, return_value=False):
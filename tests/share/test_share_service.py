@@ -1,17 +1,15 @@
-from unittest.mock import patch, AsyncMock, mock_open
+from unittest.mock import patch, AsyncMock
 import pytest
-import io
-from fastapi import HTTPException
-from starlette.responses import StreamingResponse
 
 from pecha_api.share.share_service import (
     generate_short_url,
     get_generated_image,
     _generate_short_url_payload_,
     _generate_url_,
-    _generate_logo_image_,
     _generate_segment_content_image_
 )
+from pecha_api.share.share_cache_service import share_image_cache_key
+from pecha_api.share.pecha_text_image_generator import generate_segment_image
 from pecha_api.share.share_response_models import (
     ShortUrlResponse,
     ShareRequest
@@ -23,27 +21,85 @@ from pecha_api.texts.segments.segments_enum import SegmentType
 
 
 @pytest.mark.asyncio
-async def test_get_generated_image_success():
-    mock_image_data = b"fake_image_data"
-    
-    with patch("anyio.open_file", new_callable=AsyncMock) as mock_open_file:
-        mock_file = AsyncMock()
-        mock_file.read.return_value = mock_image_data
-        cm = AsyncMock()
-        cm.__aenter__.return_value = mock_file
-        mock_open_file.return_value = cm
-        
-        response = await get_generated_image()
-        
-        assert isinstance(response, StreamingResponse)
-        assert response.media_type == "image/png"
+async def test_get_generated_image_serves_cached_image_with_etag():
+    share_request = ShareRequest(segment_id="seg_1", language="en")
+
+    with patch("pecha_api.share.share_service.get_share_image_cache", new_callable=AsyncMock, return_value=b"png") as mock_get_cache, \
+         patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
+        response = await get_generated_image(share_request=share_request)
+
+    assert response.status_code == 200
+    assert response.media_type == "image/png"
+    assert response.body == b"png"
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "public, max-age=86400"
+    mock_get_cache.assert_awaited_once_with(share_request=share_request)
+    mock_generate_image.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_get_generated_image_file_not_found():
-    with patch("anyio.open_file", new_callable=AsyncMock, side_effect=FileNotFoundError()):
-        with pytest.raises(FileNotFoundError):
-            await get_generated_image()
+async def test_get_generated_image_returns_not_modified_for_matching_etag():
+    share_request = ShareRequest(segment_id="seg_1", language="en")
+
+    with patch("pecha_api.share.share_service.get_share_image_cache", new_callable=AsyncMock, return_value=b"png"):
+        first_response = await get_generated_image(share_request=share_request)
+        response = await get_generated_image(share_request=share_request, if_none_match=first_response.headers["etag"])
+
+    assert response.status_code == 304
+    assert response.body == b""
+
+
+@pytest.mark.asyncio
+async def test_get_generated_image_renders_and_caches_on_miss():
+    share_request = ShareRequest(text_id="text_1", language="en")
+    mock_text_detail = TextDTO(
+        id="text_1",
+        title="Test Title",
+        language="en",
+        type="version",
+        group_id="group_1",
+        is_published=True,
+        created_date="2021-01-01",
+        updated_date="2021-01-01",
+        published_date="2021-01-01",
+        published_by="user_1",
+        categories=[],
+        views=0
+    )
+
+    with patch("pecha_api.share.share_service.get_share_image_cache", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.share.share_service.set_share_image_cache", new_callable=AsyncMock) as mock_set_cache, \
+         patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
+         patch("pecha_api.share.share_service.generate_segment_image", return_value=b"rendered"):
+        response = await get_generated_image(share_request=share_request)
+
+    assert response.body == b"rendered"
+    mock_set_cache.assert_awaited_once_with(share_request=share_request, text_id="text_1", data=b"rendered")
+
+
+def test_generate_segment_image_renders_png_in_memory():
+    image = generate_segment_image(text="<p>Test</p>", ref_str="Ref", lang="en", logo_path="pecha_api/share/static/img/pecha-logo.png")
+
+    assert image.startswith(b"\x89PNG")
+
+
+def test_share_image_cache_key_changes_with_colors():
+    default_key = share_image_cache_key(ShareRequest(segment_id="seg_1", language="en"))
+    black_key = share_image_cache_key(ShareRequest(segment_id="seg_1", language="en", bg_color=BgColor.BLACK))
+
+    assert default_key.startswith("share_image:segment:seg_1:")
+    assert default_key != black_key
+
+
+def test_share_image_cache_key_ignores_inputs_that_do_not_change_the_image():
+    segment_key = share_image_cache_key(ShareRequest(segment_id="seg_1", language="en"))
+
+    assert share_image_cache_key(ShareRequest(segment_id="seg_1", language="bo", logo=True)) == segment_key
+    assert share_image_cache_key(ShareRequest(text_id="text_1", language="en")) == \
+        share_image_cache_key(ShareRequest(text_id="text_1", language="xx"))
+    assert share_image_cache_key(ShareRequest(language="unknown_1")) == \
+        share_image_cache_key(ShareRequest(language="unknown_2"))
+    assert share_image_cache_key(ShareRequest(language="bo")) != share_image_cache_key(ShareRequest(language="en"))
 
 
 @pytest.mark.asyncio
@@ -71,7 +127,9 @@ async def test_generate_short_url_with_logo():
         views=0
     )
     
-    with patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock) as mock_short_url, \
+    with patch("pecha_api.share.share_service.get_share_image_cache", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.share.share_service.set_share_image_cache", new_callable=AsyncMock), \
+         patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock) as mock_short_url, \
          patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
          patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
         
@@ -82,8 +140,8 @@ async def test_generate_short_url_with_logo():
         assert response is not None
         assert isinstance(response, ShortUrlResponse)
         assert response.shortUrl == "https://pecha.io/share/123"
-        # Verify logo image generation was called
-        assert mock_generate_image.call_count == 2  # Once for logo, once for content
+        # The content image carries the logo, it is rendered once
+        assert mock_generate_image.call_count == 1
 
 
 @pytest.mark.asyncio
@@ -118,7 +176,9 @@ async def test_generate_short_url_for_segment_content_success():
         views=0
     )
     
-    with patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock, return_value=mock_short_url_response), \
+    with patch("pecha_api.share.share_service.get_share_image_cache", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.share.share_service.set_share_image_cache", new_callable=AsyncMock), \
+         patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock, return_value=mock_short_url_response), \
          patch("pecha_api.share.share_service.SegmentUtils.validate_segment_exists", new_callable=AsyncMock, return_value=True), \
          patch("pecha_api.share.share_service.get_segment_details_by_id", new_callable=AsyncMock, return_value=mock_segment_details), \
          patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
@@ -158,7 +218,9 @@ async def test_generate_short_url_without_segment_id():
         views=0
     )
     
-    with patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock, return_value=mock_short_url_response), \
+    with patch("pecha_api.share.share_service.get_share_image_cache", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.share.share_service.set_share_image_cache", new_callable=AsyncMock), \
+         patch("pecha_api.share.share_service.get_short_url", new_callable=AsyncMock, return_value=mock_short_url_response), \
          patch("pecha_api.share.share_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
          patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
         
@@ -171,23 +233,6 @@ async def test_generate_short_url_without_segment_id():
         mock_generate_image.assert_called()
 
 
-def test_generate_logo_image():
-    share_request = ShareRequest(
-        text_id="text_123",
-        text_color=TextColor.BLACK,
-        bg_color=BgColor.DEFAULT
-    )
-    
-    with patch("pecha_api.share.share_service.generate_segment_image") as mock_generate_image:
-        _generate_logo_image_(share_request)
-        
-        mock_generate_image.assert_called_once_with(
-            text_color=TextColor.BLACK,
-            bg_color=BgColor.DEFAULT,
-            logo_path="pecha_api/share/static/img/pecha-logo.png"
-        )
-
-
 @pytest.mark.asyncio
 async def test_generate_segment_content_image_with_segment():
     share_request = ShareRequest(
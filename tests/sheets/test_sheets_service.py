@@ -1,6 +1,7 @@
 import io
 import pytest
 import uuid
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock, AsyncMock
 from fastapi import UploadFile, HTTPException, status
 from pecha_api.error_contants import ErrorConstants
@@ -40,6 +41,9 @@ from pecha_api.sheets.sheets_service import (
     delete_sheet_by_id,
     fetch_sheets,
     _generate_sheet_summary_,
+    _generate_sheet_summaries_,
+    _get_sheet_summaries_,
+    _get_publishers_by_emails_,
     _strip_html_tags_,
     _generate_sheet_detail_dto_,
     upload_sheet_image_request,
@@ -218,7 +222,8 @@ async def test_create_new_sheet_success():
         patch("pecha_api.sheets.sheets_service.create_new_text", new_callable=AsyncMock, return_value=mock_text_response), \
         patch("pecha_api.sheets.sheets_service.validate_and_extract_user_details", return_value=mock_user_details), \
         patch("pecha_api.sheets.sheets_service.create_new_segment", new_callable=AsyncMock, return_value=mock_segment_response), \
-        patch("pecha_api.sheets.sheets_service.create_table_of_content", new_callable=AsyncMock, return_value=mock_table_of_content_response):
+        patch("pecha_api.sheets.sheets_service.create_table_of_content", new_callable=AsyncMock, return_value=mock_table_of_content_response), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock) as mock_update_summary:
 
         response = await create_new_sheet(
             create_sheet_request=mock_create_sheet_request,
@@ -228,6 +233,7 @@ async def test_create_new_sheet_success():
         assert response is not None
         assert isinstance(response, SheetIdResponse)
         assert response.sheet_id == "text_id"
+        mock_update_summary.assert_awaited_once_with(text_id="text_id", summary="content")
 
 @pytest.mark.asyncio
 async def test_create_sheet_invalid_token():
@@ -243,60 +249,32 @@ async def test_create_sheet_invalid_token():
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert exc_info.value.detail == ErrorConstants.TOKEN_ERROR_MESSAGE
 
-@pytest.mark.asyncio
-async def test_update_sheet_success():
-    # Use proper UUID format for sheet_id
-    sheet_id = str(uuid.uuid4())
-    
-    mock_source = [
-        Source(
-            position=1,
-            type=SegmentType.SOURCE,
-            content="source_segment_id"
-        ),
-        Source(
-            position=2,
-            type=SegmentType.CONTENT,
-            content="content"
-        ),
-        Source(
-            position=3,
-            type=SegmentType.IMAGE,
-            content="image_url"
-        )
-    ]
-    mock_segment_response = SegmentResponse(
-        segments=[
-            SegmentDTO(
-                id="segment_id_1",
-                text_id=sheet_id,
-                content="source_segment_id",
-                type=SegmentType.SOURCE
-            ),
-            SegmentDTO(
-                id="segment_id_2",
-                text_id=sheet_id,
-                content="content",
-                type=SegmentType.CONTENT
-            ),
-            SegmentDTO(
-                id="segment_id_3",
-                text_id=sheet_id,
-                content="image_url",
-                type=SegmentType.IMAGE
+def _generate_mock_stored_sheet_(sheet_id: str):
+    mock_table_of_content = TableOfContent(
+        id="table_of_content_id",
+        text_id=sheet_id,
+        type=TableOfContentType.SHEET,
+        sections=[
+            Section(
+                id="section_id",
+                section_number=1,
+                created_date="2021-01-01",
+                segments=[
+                    TextSegment(segment_id="source_segment_id", segment_number=1),
+                    TextSegment(segment_id="content_segment_id", segment_number=2),
+                    TextSegment(segment_id="image_segment_id", segment_number=3)
+                ]
             )
         ]
     )
-    mock_update_sheet_request = CreateSheetRequest(
-        title="updated_sheet_title",
-        source=mock_source,
-        is_published=True
-    )
-    
-    # Add mock for TextUtils.get_text_details_by_id which is called at the end of update_sheet_by_id
+    mock_segments_dict = {
+        "source_segment_id": SegmentDTO(id="source_segment_id", text_id="other_text_id", content="quoted", type=SegmentType.SOURCE),
+        "content_segment_id": SegmentDTO(id="content_segment_id", text_id=sheet_id, content="content", type=SegmentType.CONTENT),
+        "image_segment_id": SegmentDTO(id="image_segment_id", text_id=sheet_id, content="image_url", type=SegmentType.IMAGE)
+    }
     mock_text_details = TextDTO(
         id=sheet_id,
-        title="updated_sheet_title",
+        title="sheet_title",
         language="language",
         group_id="group_id",
         type=TextType.SHEET,
@@ -308,18 +286,38 @@ async def test_update_sheet_success():
         categories=[],
         views=10
     )
+    return mock_table_of_content, mock_segments_dict, mock_text_details
+
+@pytest.mark.asyncio
+async def test_update_sheet_success():
+    # Use proper UUID format for sheet_id
+    sheet_id = str(uuid.uuid4())
+    mock_table_of_content, mock_segments_dict, mock_text_details = _generate_mock_stored_sheet_(sheet_id=sheet_id)
     
-    with patch("pecha_api.sheets.sheets_service.remove_segments_by_text_id", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
-        patch("pecha_api.sheets.sheets_service.remove_table_of_content_by_text_id", new_callable=AsyncMock), \
+    mock_update_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[
+            Source(position=1, type=SegmentType.SOURCE, content="source_segment_id"),
+            Source(position=2, type=SegmentType.CONTENT, content="edited content"),
+            Source(position=3, type=SegmentType.IMAGE, content="image_url"),
+            Source(position=4, type=SegmentType.CONTENT, content="new content")
+        ],
+        is_published=True
+    )
+    new_segment = SegmentDTO(id="new_segment_id", text_id=sheet_id, content="new content", type=SegmentType.CONTENT)
+    
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
+        patch("pecha_api.sheets.sheets_service.get_segments_details_by_ids", new_callable=AsyncMock, return_value=mock_segments_dict), \
+        patch("pecha_api.sheets.sheets_service.create_segment", new_callable=AsyncMock, return_value=[new_segment]) as mock_create_segment, \
+        patch("pecha_api.sheets.sheets_service.update_segments_content", new_callable=AsyncMock) as mock_update_segments, \
+        patch("pecha_api.sheets.sheets_service.delete_segments_by_ids", new_callable=AsyncMock) as mock_delete_segments, \
+        patch("pecha_api.sheets.sheets_service.update_table_of_content_in_place", new_callable=AsyncMock) as mock_update_toc, \
+        patch("pecha_api.sheets.sheets_service.delete_segments_details_by_ids_cache", new_callable=AsyncMock) as mock_delete_segments_cache, \
         patch("pecha_api.sheets.sheets_service.delete_text_details_by_id_cache", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.delete_segments_details_by_ids_cache", new_callable=AsyncMock), \
         patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.create_new_segment", new_callable=AsyncMock, return_value=mock_segment_response), \
-        patch("pecha_api.sheets.sheets_service.create_table_of_content", new_callable=AsyncMock), \
-        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock) as mock_update_summary, \
         patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock):
 
         response = await update_sheet_by_id(
@@ -331,6 +329,126 @@ async def test_update_sheet_success():
         assert response is not None
         assert isinstance(response, SheetIdResponse)
         assert response.sheet_id == sheet_id
+        # only the edited block is rewritten and only the added one inserted
+        mock_update_segments.assert_awaited_once_with(segments_content={"content_segment_id": "edited content"})
+        new_segments = mock_create_segment.await_args.kwargs["create_segment_request"].segments
+        assert [segment.content for segment in new_segments] == ["new content"]
+        mock_delete_segments.assert_not_awaited()
+        updated_table_of_content = mock_update_toc.await_args.kwargs["table_of_content"]
+        assert updated_table_of_content.id == "table_of_content_id"
+        assert updated_table_of_content.sections[0].id == "section_id"
+        assert [segment.segment_id for segment in updated_table_of_content.sections[0].segments] == [
+            "source_segment_id", "content_segment_id", "image_segment_id", "new_segment_id"
+        ]
+        mock_delete_segments_cache.assert_awaited_once()
+        mock_update_summary.assert_awaited_once_with(text_id=sheet_id, summary="edited content")
+
+@pytest.mark.asyncio
+async def test_update_sheet_unchanged_writes_nothing():
+    sheet_id = str(uuid.uuid4())
+    mock_table_of_content, mock_segments_dict, mock_text_details = _generate_mock_stored_sheet_(sheet_id=sheet_id)
+    mock_update_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[
+            Source(position=1, type=SegmentType.SOURCE, content="source_segment_id"),
+            Source(position=2, type=SegmentType.CONTENT, content="content"),
+            Source(position=3, type=SegmentType.IMAGE, content="image_url")
+        ],
+        is_published=True
+    )
+
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
+        patch("pecha_api.sheets.sheets_service.get_segments_details_by_ids", new_callable=AsyncMock, return_value=mock_segments_dict), \
+        patch("pecha_api.sheets.sheets_service.create_segment", new_callable=AsyncMock) as mock_create_segment, \
+        patch("pecha_api.sheets.sheets_service.update_table_of_content_in_place", new_callable=AsyncMock) as mock_update_toc, \
+        patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock) as mock_update_text_details, \
+        patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock) as mock_update_cache:
+
+        response = await update_sheet_by_id(
+            sheet_id=sheet_id,
+            update_sheet_request=mock_update_sheet_request,
+            token="valid_token"
+        )
+
+    assert response.sheet_id == sheet_id
+    mock_create_segment.assert_not_awaited()
+    mock_update_toc.assert_not_awaited()
+    mock_update_text_details.assert_not_awaited()
+    mock_update_cache.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_update_sheet_removed_block_is_deleted():
+    sheet_id = str(uuid.uuid4())
+    mock_table_of_content, mock_segments_dict, mock_text_details = _generate_mock_stored_sheet_(sheet_id=sheet_id)
+    mock_update_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[
+            Source(position=1, type=SegmentType.SOURCE, content="source_segment_id"),
+            Source(position=2, type=SegmentType.IMAGE, content="image_url")
+        ],
+        is_published=True
+    )
+
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
+        patch("pecha_api.sheets.sheets_service.get_segments_details_by_ids", new_callable=AsyncMock, return_value=mock_segments_dict), \
+        patch("pecha_api.sheets.sheets_service.create_segment", new_callable=AsyncMock) as mock_create_segment, \
+        patch("pecha_api.sheets.sheets_service.update_segments_content", new_callable=AsyncMock) as mock_update_segments, \
+        patch("pecha_api.sheets.sheets_service.delete_segments_by_ids", new_callable=AsyncMock) as mock_delete_segments, \
+        patch("pecha_api.sheets.sheets_service.update_table_of_content_in_place", new_callable=AsyncMock) as mock_update_toc, \
+        patch("pecha_api.sheets.sheets_service.delete_segments_details_by_ids_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.delete_text_details_by_id_cache", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.update_text_details", new_callable=AsyncMock), \
+        patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock) as mock_update_summary, \
+        patch("pecha_api.sheets.sheets_service.update_text_details_cache", new_callable=AsyncMock):
+
+        await update_sheet_by_id(
+            sheet_id=sheet_id,
+            update_sheet_request=mock_update_sheet_request,
+            token="valid_token"
+        )
+
+    mock_create_segment.assert_not_awaited()
+    mock_update_segments.assert_not_awaited()
+    mock_delete_segments.assert_awaited_once_with(segment_ids=["content_segment_id"])
+    updated_segments = mock_update_toc.await_args.kwargs["table_of_content"].sections[0].segments
+    assert [(segment.segment_number, segment.segment_id) for segment in updated_segments] == [
+        (1, "source_segment_id"), (2, "image_segment_id")
+    ]
+    mock_update_summary.assert_awaited_once_with(text_id=sheet_id, summary="")
+
+@pytest.mark.asyncio
+async def test_update_sheet_validates_newly_quoted_sources():
+    sheet_id = str(uuid.uuid4())
+    mock_table_of_content, mock_segments_dict, mock_text_details = _generate_mock_stored_sheet_(sheet_id=sheet_id)
+    mock_update_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[
+            Source(position=1, type=SegmentType.SOURCE, content="source_segment_id"),
+            Source(position=2, type=SegmentType.SOURCE, content="missing_segment_id")
+        ],
+        is_published=True
+    )
+
+    with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+        patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+        patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
+        patch("pecha_api.sheets.sheets_service.get_segments_details_by_ids", new_callable=AsyncMock, return_value=mock_segments_dict), \
+        patch("pecha_api.sheets.sheets_service.SegmentUtils.validate_segments_exists", new_callable=AsyncMock, side_effect=HTTPException(status_code=404, detail=ErrorConstants.SEGMENT_NOT_FOUND_MESSAGE)) as mock_validate, \
+        patch("pecha_api.sheets.sheets_service.delete_segments_by_ids", new_callable=AsyncMock) as mock_delete_segments:
+
+        with pytest.raises(HTTPException):
+            await update_sheet_by_id(
+                sheet_id=sheet_id,
+                update_sheet_request=mock_update_sheet_request,
+                token="valid_token"
+            )
+
+    mock_validate.assert_awaited_once_with(segment_ids=["missing_segment_id"])
+    mock_delete_segments.assert_not_awaited()
 
 @pytest.mark.asyncio
 async def test_update_sheet_invalid_token():
@@ -572,22 +690,11 @@ async def test_delete_sheet_invalid_sheet_id():
 # Test cases for fetch_sheets function
 @pytest.mark.asyncio
 async def test_fetch_sheets_community_page_all_published():
-    mock_user = UserInfoResponse(
-        firstname="firstname",
-        lastname="lastname",
-        username="username",
-        email="test_user@gmail.com",
-        educations=[],
-        avatar_url="avatar_url",
-        social_profiles=[],
-        followers=0,
-        following=0,
-    )
     mock_sheets = _generate_mock_sheets_response_()
     
     with patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets), \
         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="time passed"), \
-        patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_user), \
+        patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=[_generate_mock_publisher_(email=mock_sheets[0].published_by)]), \
         patch("pecha_api.texts.texts_models.Text.get_published_sheets_count_from_db", new_callable=AsyncMock, return_value=5):
         
         result = await fetch_sheets(
@@ -612,23 +719,13 @@ async def test_fetch_sheets_user_own_sheets():
     mock_user_details = type("User", (), {
         "email": "mock_user@gmail.com",
     })
-    mock_publisher_details = UserInfoResponse(
-        firstname="firstname",
-        lastname="lastname",
-        username="username",
-        email="mock_user@gmail.com",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
-    )
     mock_sheets = _generate_mock_sheets_response_()
     for i in range(len(mock_sheets)):
         mock_sheets[i].published_by = "mock_user@gmail.com"
     
     with patch("pecha_api.sheets.sheets_service.validate_and_extract_user_details", return_value=mock_user_details), \
         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="time passed"), \
-        patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_publisher_details), \
+        patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=[_generate_mock_publisher_(email=mock_sheets[0].published_by)]), \
         patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets), \
         patch("pecha_api.texts.texts_models.Text.get_published_sheets_count_from_db", new_callable=AsyncMock, return_value=5):
         
@@ -653,23 +750,13 @@ async def test_fetch_sheets_user_viewing_other_users_sheets_status_logged_in():
     mock_user_details = type("User", (), {
         "email": "mock_user@gmail.com",
     })
-    mock_publisher_details = UserInfoResponse(
-        firstname="firstname",
-        lastname="lastname",
-        username="username",
-        email="other_user@gmail.com",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
-    )
     mock_sheets = _generate_mock_sheets_response_()
     for i in range(len(mock_sheets)):
         mock_sheets[i].published_by = "other_user@gmail.com"
     
     with patch("pecha_api.sheets.sheets_service.validate_and_extract_user_details", return_value=mock_user_details), \
         patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="time passed"), \
-        patch("pecha_api.sheets.sheets_service.fetch_user_by_email", new_callable=MagicMock, return_value=mock_publisher_details), \
+        patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=[_generate_mock_publisher_(email=mock_sheets[0].published_by)]), \
         patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets), \
         patch("pecha_api.texts.texts_models.Text.get_published_sheets_count_from_db", new_callable=AsyncMock, return_value=5):
         
@@ -726,314 +813,121 @@ def _generate_mock_sheets_response_():
             for i in range(1,6)
         ]
     
-# Test cases for _generate_sheet_summary_ function
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_success():
-    #Test normal case with content segments#
-    sheet_id = "test_sheet_id"
-    
-    # Mock table of content with sections and segments
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1),
-                    TextSegment(segment_id="content_segment_2", segment_number=2),
-                    TextSegment(segment_id="image_segment_1", segment_number=3)
-                ]
-            )
-        ]
-    )
-    
-    # Mock the first content segment that will be returned
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="This is the first content segment.",
-        type=SegmentType.CONTENT
+def _generate_mock_publisher_(email: str) -> Users:
+    return Users(
+        firstname="firstname",
+        lastname="lastname",
+        username="username",
+        email=email,
+        avatar_url=None
     )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        expected = "This is the first content segment."
-        assert result == expected
-
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_with_html_tags():
-    #Test HTML tag stripping functionality
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="<p>This is <strong>bold text</strong> with <em>italics</em> and <a href='#'>links</a>.</p>",
-        type=SegmentType.CONTENT
+# Test cases for _generate_sheet_summary_ function
+def test_generate_sheet_summary_uses_first_content_by_position():
+    create_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[
+            Source(position=3, type=SegmentType.CONTENT, content="<p>Second content</p>"),
+            Source(position=1, type=SegmentType.SOURCE, content="source_segment_id"),
+            Source(position=2, type=SegmentType.CONTENT, content="<p>First content</p>")
+        ],
+        is_published=True
     )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        expected = "This is bold text with italics and links."
-        assert result == expected
 
+    assert _generate_sheet_summary_(create_sheet_request=create_sheet_request) == "First content"
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_exceeds_max_words():
-    #Test content that exceeds max_words limit
-    sheet_id = "test_sheet_id"
-    
-    # Create content with more than 30 words (default max_words)
-    long_content = " ".join([f"word{i}" for i in range(1, 41)])  # 40 words
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content=long_content,
-        type=SegmentType.CONTENT
+def test_generate_sheet_summary_exceeds_max_words():
+    create_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[Source(position=1, type=SegmentType.CONTENT, content=" ".join(f"word{i}" for i in range(40)))],
+        is_published=True
     )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        # Should contain exactly 30 words plus "..."
-        words = result.split()
-        assert len(words) == 30  # 30 words (the last word has "..." appended)
-        assert result.endswith("...")
-        assert "word1" in result
-        assert "word30" in result
-        assert "word31" not in result.replace("...", "")
 
+    result = _generate_sheet_summary_(create_sheet_request=create_sheet_request)
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_custom_max_words():
-    #Test with limited content (less than default 30 words)
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="This is a test content with only a few words.",
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        expected = "This is a test content with only a few words."
-        assert result == expected
+    assert result.endswith("...")
+    assert len(result[:-3].split()) == 30
 
+def test_generate_sheet_summary_no_content_sources():
+    create_sheet_request = CreateSheetRequest(
+        title="sheet_title",
+        source=[Source(position=1, type=SegmentType.IMAGE, content="image_key")],
+        is_published=True
+    )
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_no_table_of_content():
-    #Test when table of content doesn't exist
-    sheet_id = "test_sheet_id"
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=None):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
+    assert _generate_sheet_summary_(create_sheet_request=create_sheet_request) == ""
 
 
+# Test cases for _generate_sheet_summaries_ function
 @pytest.mark.asyncio
-async def test_generate_sheet_summary_empty_sections():
-    #Test when table of content exists but has no sections
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
+async def test_generate_sheet_summaries_resolves_page_in_bulk():
+    first_segment_id = str(uuid.uuid4())
+    second_segment_id = str(uuid.uuid4())
+    third_segment_id = str(uuid.uuid4())
+    mock_table_of_contents = [
+        TableOfContent(
+            text_id="sheet_1",
+            type=TableOfContentType.SHEET,
+            sections=[
+                Section(
+                    id="section_1",
+                    section_number=1,
+                    segments=[
+                        TextSegment(segment_id=first_segment_id, segment_number=1),
+                        TextSegment(segment_id=second_segment_id, segment_number=2)
+                    ]
+                )
+            ]
+        ),
+        TableOfContent(
+            text_id="sheet_2",
+            type=TableOfContentType.SHEET,
+            sections=[
+                Section(
+                    id="section_2",
+                    section_number=1,
+                    segments=[TextSegment(segment_id=third_segment_id, segment_number=1)]
+                )
+            ]
+        )
+    ]
+    # returned out of table of content order, as the database may
+    mock_content_segments = [
+        SegmentDTO(id=second_segment_id, text_id="sheet_1", content="<p>Second</p>", type=SegmentType.CONTENT),
+        SegmentDTO(id=first_segment_id, text_id="sheet_1", content="<p>First</p>", type=SegmentType.CONTENT)
+    ]
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_no_segments():
-    #Test when no segments exist in the table of content
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[]
-            )
-        ]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
+    with patch("pecha_api.sheets.sheets_service.get_contents_by_text_ids", new_callable=AsyncMock, return_value=mock_table_of_contents) as mock_get_contents, \
+         patch("pecha_api.sheets.sheets_service.get_sheet_content_segments_by_ids", new_callable=AsyncMock, return_value=mock_content_segments) as mock_get_segments:
 
+        result = await _generate_sheet_summaries_(sheet_ids=["sheet_1", "sheet_2", "sheet_3"])
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_no_content_segments():
-    #Test when no content type segments exist (only images, sources, etc.)
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="image_segment_1", segment_number=1),
-                    TextSegment(segment_id="source_segment_1", segment_number=2)
-                ]
-            )
-        ]
+    assert result == {"sheet_1": "First", "sheet_2": ""}
+    mock_get_contents.assert_awaited_once_with(text_ids=["sheet_1", "sheet_2", "sheet_3"])
+    mock_get_segments.assert_awaited_once_with(
+        segment_ids=[first_segment_id, second_segment_id, third_segment_id],
+        segment_type=SegmentType.CONTENT
     )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=None):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
-
 
 @pytest.mark.asyncio
-async def test_generate_sheet_summary_empty_content():
-    #Test when content segments exist but have empty content
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="content_segment_1", segment_number=1),
-                    TextSegment(segment_id="content_segment_2", segment_number=2)
-                ]
-            )
-        ]
-    )
-    
-    mock_content_segment = SegmentDTO(
-        id="content_segment_1",
-        text_id=sheet_id,
-        content="",  # Empty string instead of None
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_content_segment):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
+async def test_generate_sheet_summaries_error_handling():
+    with patch("pecha_api.sheets.sheets_service.get_contents_by_text_ids", new_callable=AsyncMock, side_effect=Exception("Database error")):
+        result = await _generate_sheet_summaries_(sheet_ids=["sheet_1"])
 
+    assert result == {}
 
 @pytest.mark.asyncio
-async def test_generate_sheet_summary_error_handling():
-    #Test error handling - should return empty string when exceptions occurd
-    sheet_id = "test_sheet_id"
-    
-    # Simulate an exception in get_table_of_content_by_sheet_id
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, side_effect=Exception("Database error")):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == ""
+async def test_get_sheet_summaries_only_generates_missing_summaries():
+    stored_sheet = SimpleNamespace(id=uuid.uuid4(), summary="Stored summary")
+    legacy_sheet = _generate_mock_sheets_response_()[0]
+    legacy_sheet.summary = None
 
+    with patch("pecha_api.sheets.sheets_service._generate_sheet_summaries_", new_callable=AsyncMock, return_value={"sheet_id_1": "Generated summary"}) as mock_generate:
+        result = await _get_sheet_summaries_(sheets=[stored_sheet, legacy_sheet])
+
+    assert result == {str(stored_sheet.id): "Stored summary", "sheet_id_1": "Generated summary"}
+    mock_generate.assert_awaited_once_with(sheet_ids=["sheet_id_1"])
 
-@pytest.mark.asyncio
-async def test_generate_sheet_summary_segment_not_found():
-    #Test when segment IDs in table of content don't exist in segments dictionaryx1
-    sheet_id = "test_sheet_id"
-    
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[
-            Section(
-                id="section_1",
-                section_number=1,
-                segments=[
-                    TextSegment(segment_id="missing_segment", segment_number=1)
-                ]
-            )
-        ]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=None):
-        
-        result = await _generate_sheet_summary_(sheet_id)
-        
-        assert result == "" 
 
 # Test cases for _strip_html_tags_ function
 def test_strip_html_tags_simple_tags():
@@ -1187,20 +1081,10 @@ async def test_fetch_user_sheets_other_user():
 async def test_generate_sheet_dto_response():
     #Test _generate_sheet_dto_response_#
     mock_sheets = _generate_mock_sheets_response_()
-    mock_user = UserInfoResponse(
-        firstname="Test",
-        lastname="User",
-        username="testuser",
-        email="test@example.com",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
-    )
     
-    with patch("pecha_api.sheets.sheets_service._generate_sheet_summary_", new_callable=AsyncMock, return_value="Test summary"), \
+    with patch("pecha_api.sheets.sheets_service._get_sheet_summaries_", new_callable=AsyncMock, return_value={sheet.id: "Test summary" for sheet in mock_sheets}), \
          patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="2 days ago"), \
-         patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
+         patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=[_generate_mock_publisher_(email="test_user")]) as mock_fetch_users:
         
         result = await _generate_sheet_dto_response_(sheets=mock_sheets, total=5, skip=0, limit=10)
         
@@ -1210,25 +1094,34 @@ async def test_generate_sheet_dto_response():
         assert result.limit == 10
         assert result.total == 5
         assert all(sheet.summary == "Test summary" for sheet in result.sheets)
+        assert all(sheet.publisher.email == "test_user" for sheet in result.sheets)
+        # one lookup for every publisher on the page
+        mock_fetch_users.assert_called_once_with(emails=["test_user"])
+
+
+# Test cases for _get_publishers_by_emails_ function
+def test_get_publishers_by_emails_missing_user():
+    with patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=[_generate_mock_publisher_(email="john@example.com")]):
+        with pytest.raises(HTTPException) as exc_info:
+            _get_publishers_by_emails_(emails=["john@example.com", "missing@example.com"])
+
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+    assert exc_info.value.detail == ErrorConstants.USER_NOT_FOUND
 
 
 # Test cases for _create_publisher_object_ function
 def test_create_publisher_object():
     #Test _create_publisher_object_#
-    mock_user = UserInfoResponse(
+    mock_user = Users(
         firstname="John",
         lastname="Doe",
         username="johndoe",
         email="john@example.com",
-        avatar_url="https://avatar.url",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
+        avatar_url="avatar_key"
     )
     
-    with patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
-        result = _create_publisher_object_(published_by="john@example.com")
+    with patch("pecha_api.sheets.sheets_service.generate_presigned_access_url", return_value="https://avatar.url"):
+        result = _create_publisher_object_(user=mock_user)
         
         assert isinstance(result, Publisher)
         assert result.name == "John Doe"
@@ -1238,22 +1131,18 @@ def test_create_publisher_object():
 
 def test_create_publisher_object_no_name():
     #Test _create_publisher_object_ when user has no first/last name#
-    mock_user = UserInfoResponse(
+    mock_user = Users(
         firstname="",
-        lastname="",
+        lastname=None,
         username="johndoe",
         email="john@example.com",
-        avatar_url="https://avatar.url",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
+        avatar_url=None
     )
     
-    with patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user):
-        result = _create_publisher_object_(published_by="john@example.com")
-        
-        assert result.name == "johndoe"  # Falls back to username
+    result = _create_publisher_object_(user=mock_user)
+    
+    assert result.name == "johndoe"  # Falls back to username
+    assert result.avatar_url == ""
 
 
 # Test cases for _generate_sheet_section_ function
@@ -1708,41 +1597,6 @@ def test_clean_text_whitespace_only():
     assert result == ""
 
 
-# Test cases for _delete_sheet_table_of_content_cache_ function
-@pytest.mark.asyncio
-async def test_delete_sheet_table_of_content_cache_success():
-    #Test _delete_sheet_table_of_content_cache_ with valid table of content#
-    sheet_id = "test_sheet_id"
-    mock_table_of_content = TableOfContent(
-        text_id=sheet_id,
-        type=TableOfContentType.SHEET,
-        sections=[]
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=mock_table_of_content), \
-         patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock) as mock_delete_cache:
-        
-        from pecha_api.sheets.sheets_service import _delete_sheet_table_of_content_cache_
-        result = await _delete_sheet_table_of_content_cache_(sheet_id=sheet_id)
-        
-        assert result == mock_table_of_content
-        mock_delete_cache.assert_called_once()
-
-@pytest.mark.asyncio
-async def test_delete_sheet_table_of_content_cache_no_content():
-    #Test _delete_sheet_table_of_content_cache_ with no table of content#
-    sheet_id = "test_sheet_id"
-    
-    with patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=None), \
-         patch("pecha_api.sheets.sheets_service.delete_table_of_content_by_sheet_id_cache", new_callable=AsyncMock) as mock_delete_cache:
-        
-        from pecha_api.sheets.sheets_service import _delete_sheet_table_of_content_cache_
-        result = await _delete_sheet_table_of_content_cache_(sheet_id=sheet_id)
-        
-        assert result is None
-        mock_delete_cache.assert_not_called()
-
-
 # Test cases for _delete_sheet_segments_cache_ function
 @pytest.mark.asyncio
 async def test_delete_sheet_segments_cache_with_content():
@@ -1827,42 +1681,6 @@ async def test_delete_sheet_forbidden_access():
         assert exc_info.value.detail == ErrorConstants.FORBIDDEN_ERROR_MESSAGE
 
 
-# Test cases for _get_sheet_first_content_details_by_type_ function
-@pytest.mark.asyncio
-async def test_get_sheet_first_content_details_by_type_success():
-    #Test _get_sheet_first_content_details_by_type_ with valid segment IDs#
-    segment_ids = ["seg_1", "seg_2", "seg_3"]
-    mock_segment = SegmentDTO(
-        id="seg_1",
-        text_id="text_id",
-        content="first content",
-        type=SegmentType.CONTENT
-    )
-    
-    with patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=mock_segment):
-        from pecha_api.sheets.sheets_service import _get_sheet_first_content_details_by_type_
-        result = await _get_sheet_first_content_details_by_type_(
-            segment_ids=segment_ids, 
-            segment_type=SegmentType.CONTENT
-        )
-        
-        assert result == mock_segment
-
-@pytest.mark.asyncio
-async def test_get_sheet_first_content_details_by_type_no_result():
-    #Test _get_sheet_first_content_details_by_type_ with no matching segments#
-    segment_ids = ["seg_1", "seg_2", "seg_3"]
-    
-    with patch("pecha_api.sheets.sheets_service.get_sheet_first_content_by_ids", new_callable=AsyncMock, return_value=None):
-        from pecha_api.sheets.sheets_service import _get_sheet_first_content_details_by_type_
-        result = await _get_sheet_first_content_details_by_type_(
-            segment_ids=segment_ids, 
-            segment_type=SegmentType.CONTENT
-        )
-        
-        assert result is None
-
-
 # Test cases for _get_all_segment_ids_in_table_of_content_ edge cases
 def test_get_all_segment_ids_empty_segments():
     #Test _get_all_segment_ids_in_table_of_content_ with sections containing no segments#
@@ -1911,21 +1729,11 @@ def test_get_all_segment_ids_multiple_sections():
 @pytest.mark.asyncio
 async def test_fetch_sheets_with_sort_parameters():
     #Test fetch_sheets with sorting parameters#
-    mock_user = UserInfoResponse(
-        firstname="Test",
-        lastname="User", 
-        username="testuser",
-        email="test@example.com",
-        educations=[],
-        followers=0,
-        following=0,
-        social_profiles=[]
-    )
     mock_sheets = _generate_mock_sheets_response_()
     
     with patch("pecha_api.sheets.sheets_service.get_sheet", new_callable=AsyncMock, return_value=mock_sheets) as mock_get_sheet, \
          patch("pecha_api.sheets.sheets_service.Utils.time_passed", return_value="1 day ago"), \
-         patch("pecha_api.sheets.sheets_service.fetch_user_by_email", return_value=mock_user), \
+         patch("pecha_api.sheets.sheets_service.fetch_users_by_emails", return_value=[_generate_mock_publisher_(email=mock_sheets[0].published_by)]), \
          patch("pecha_api.texts.texts_models.Text.get_published_sheets_count_from_db", new_callable=AsyncMock, return_value=5):
         
         result = await fetch_sheets(
@@ -2072,7 +1880,15 @@ async def test_update_sheet_cache_deletion_error():
         is_published=True
     )
     
+    _, _, mock_text_details = _generate_mock_stored_sheet_(sheet_id=sheet_id)
+    
     with patch("pecha_api.sheets.sheets_service.validate_user_exists", return_value=True), \
+         patch("pecha_api.sheets.sheets_service.TextUtils.get_text_details_by_id", new_callable=AsyncMock, return_value=mock_text_details), \
+         patch("pecha_api.sheets.sheets_service.get_table_of_content_by_sheet_id", new_callable=AsyncMock, return_value=None), \
+         patch("pecha_api.sheets.sheets_service.get_segments_details_by_ids", new_callable=AsyncMock, return_value={}), \
+         patch("pecha_api.sheets.sheets_service.create_segment", new_callable=AsyncMock, return_value=[]), \
+         patch("pecha_api.sheets.sheets_service._generate_and_upload_sheet_table_of_content", new_callable=AsyncMock), \
+         patch("pecha_api.sheets.sheets_service.update_sheet_summary", new_callable=AsyncMock), \
          patch("pecha_api.sheets.sheets_service.delete_text_details_by_id_cache", new_callable=AsyncMock, side_effect=Exception("Cache error")):
         
         # Should propagate the cache error since there's no error handling in the function
@@ -2,7 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 from fastapi import UploadFile
 from io import BytesIO
-from pecha_api.uploads.S3_utils import upload_file, upload_bytes, generate_presigned_access_url, delete_file
+from pecha_api.uploads.S3_utils import upload_file, upload_bytes, generate_presigned_access_url, delete_file, sign_many
 
 
 @pytest.fixture
@@ -54,6 +54,65 @@ def test_generate_presigned_access_url_client_error(mock_s3_client):
         generate_presigned_access_url("test-bucket", "test-key")
 
 
+def test_generate_presigned_access_url_reuses_url_within_window(mock_s3_client):
+    mock_s3_client.generate_presigned_url.side_effect = ["http://example.com/1", "http://example.com/2"]
+
+    first = generate_presigned_access_url("test-bucket", "test-key")
+    second = generate_presigned_access_url("test-bucket", "test-key")
+
+    assert first == second == "http://example.com/1"
+    mock_s3_client.generate_presigned_url.assert_called_once_with(
+        ClientMethod="get_object",
+        Params={"Bucket": "test-bucket", "Key": "test-key"},
+        ExpiresIn=3600
+    )
+
+
+def test_generate_presigned_access_url_resigns_in_next_window(mock_s3_client):
+    mock_s3_client.generate_presigned_url.side_effect = ["http://example.com/1", "http://example.com/2"]
+
+    with patch("pecha_api.uploads.presigned_url_cache.time.time", return_value=0):
+        first = generate_presigned_access_url("test-bucket", "test-key")
+    # one window is the expiry minus the refresh margin
+    with patch("pecha_api.uploads.presigned_url_cache.time.time", return_value=2700):
+        second = generate_presigned_access_url("test-bucket", "test-key")
+
+    assert first == "http://example.com/1"
+    assert second == "http://example.com/2"
+
+
+def test_generate_presigned_access_url_empty_key(mock_s3_client):
+    assert generate_presigned_access_url("test-bucket", " ") == ""
+    mock_s3_client.generate_presigned_url.assert_not_called()
+
+
+def test_sign_many_signs_each_key_once(mock_s3_client):
+    mock_s3_client.generate_presigned_url.side_effect = lambda ClientMethod, Params, ExpiresIn: f"http://example.com/{Params['Key']}"
+    generate_presigned_access_url("test-bucket", "a")
+
+    result = sign_many("test-bucket", ["a", "b", "b", "", None])
+
+    assert result == {"a": "http://example.com/a", "b": "http://example.com/b"}
+    assert mock_s3_client.generate_presigned_url.call_count == 2
+
+
+def test_sign_many_serves_public_prefixes_unsigned(mock_s3_client):
+    mock_s3_client.generate_presigned_url.return_value = "http://example.com/signed"
+    config = {
+        "AWS_PUBLIC_MEDIA_BASE_URL": "https://cdn.example.com/",
+        "AWS_PUBLIC_MEDIA_PREFIXES": "images/plan_images/, images/author_images/"
+    }
+
+    with patch("pecha_api.uploads.S3_utils.get", side_effect=lambda key: config[key]):
+        result = sign_many("test-bucket", ["images/plan_images/a b.jpg", "private/doc.pdf"])
+
+    assert result == {
+        "images/plan_images/a b.jpg": "https://cdn.example.com/images/plan_images/a%20b.jpg",
+        "private/doc.pdf": "http://example.com/signed"
+    }
+    mock_s3_client.generate_presigned_url.assert_called_once()
+
+
 def test_delete_file_success(mock_s3_client):
     mock_s3_client.delete_object.return_value = None
     result = delete_file("test-key")
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from pecha_api.text_uploader.segments.segment_service import SegmentService
 from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest
@@ -44,6 +44,17 @@ async def test_segment_service_is_text_segments_uploaded_true_when_any_segments_
         assert await service.is_text_segments_uploaded("t1") is True
 
 
+@pytest.mark.asyncio
+async def test_segment_service_get_uploaded_pecha_segment_ids():
+    service = SegmentService()
+    with patch(
+        "pecha_api.text_uploader.segments.segment_service.get_segments_by_text_id",
+        new_callable=AsyncMock,
+        return_value=[Mock(pecha_segment_id="s1"), Mock(pecha_segment_id=None), Mock(pecha_segment_id="s2")],
+    ):
+        assert await service.get_uploaded_pecha_segment_ids("t1") == {"s1", "s2"}
+
+
 @pytest.mark.asyncio
 async def test_segment_service_upload_bulk_segments_batches_and_posts():
     service = SegmentService()
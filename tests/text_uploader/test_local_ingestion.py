@@ -0,0 +1,156 @@
+import uuid
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from pecha_api.text_uploader.constants import DestinationURL
+from pecha_api.text_uploader.local_ingestion import (
+    ingest_segments,
+    ingest_text,
+    ingest_toc,
+    is_local_ingestion,
+    segment_batch_size
+)
+from pecha_api.text_uploader.segments.segment_service import SegmentService
+from pecha_api.text_uploader.text_metadata.text_metadata_model import TextGroupPayload
+from pecha_api.text_uploader.text_uploader_response_model import TextUploadRequest
+
+
+def test_is_local_ingestion_only_for_local_destination():
+    assert is_local_ingestion(DestinationURL.LOCAL.value) is True
+    assert is_local_ingestion(DestinationURL.DEVELOPMENT.value) is False
+
+
+def test_is_local_ingestion_can_be_disabled():
+    with patch("pecha_api.text_uploader.local_ingestion.config.get", return_value="false"):
+        assert is_local_ingestion(DestinationURL.LOCAL.value) is False
+
+
+def test_segment_batch_size_is_larger_for_local_ingestion():
+    assert segment_batch_size(DestinationURL.LOCAL.value, 400) == 5000
+    assert segment_batch_size(DestinationURL.DEVELOPMENT.value, 400) == 400
+
+
+@pytest.mark.asyncio
+async def test_ingest_segments_bulk_inserts_segment_documents():
+    payload = {
+        "text_id": "wb_text_1",
+        "segments": [
+            {"pecha_segment_id": "p1", "content": "c1", "type": "source"},
+            {"pecha_segment_id": "p2", "content": "c2", "type": "source"},
+        ],
+    }
+
+    with patch(
+        "pecha_api.text_uploader.local_ingestion.Segment",
+        side_effect=lambda **fields: SimpleNamespace(**fields),
+    ), patch(
+        "pecha_api.text_uploader.local_ingestion.bulk_insert_segments",
+        new_callable=AsyncMock,
+    ) as mock_bulk_insert:
+        result = await ingest_segments(payload)
+
+    assert result == {"text_id": "wb_text_1", "count": 2}
+    segments = mock_bulk_insert.await_args.kwargs["segments"]
+    assert [segment.pecha_segment_id for segment in segments] == ["p1", "p2"]
+    assert all(segment.text_id == "wb_text_1" for segment in segments)
+
+
+@pytest.mark.asyncio
+async def test_ingest_text_creates_text_without_http_round_trip():
+    text_id = uuid.uuid4()
+    payload = TextGroupPayload(
+        pecha_text_id="inst_1",
+        title="Title",
+        language="bo",
+        group_id="group_1",
+        published_by="",
+        type="version",
+    )
+
+    with patch(
+        "pecha_api.text_uploader.local_ingestion.create_text",
+        new_callable=AsyncMock,
+        return_value=SimpleNamespace(id=text_id, title="Title"),
+    ) as mock_create_text:
+        result = await ingest_text(payload)
+
+    assert result == {"id": str(text_id), "title": "Title"}
+    assert mock_create_text.await_args.kwargs["create_text_request"].pecha_text_id == "inst_1"
+
+
+@pytest.mark.asyncio
+async def test_ingest_text_invalidates_its_collections():
+    payload = TextGroupPayload(
+        pecha_text_id="inst_1",
+        title="Title",
+        language="bo",
+        group_id="group_1",
+        published_by="",
+        type="version",
+        categories=["collection_1", "collection_2"],
+    )
+
+    with patch(
+        "pecha_api.text_uploader.local_ingestion.create_text",
+        new_callable=AsyncMock,
+        return_value=SimpleNamespace(id=uuid.uuid4(), title="Title"),
+    ), patch(
+        "pecha_api.text_uploader.local_ingestion.invalidate_collection_cache",
+        new_callable=AsyncMock,
+    ) as mock_invalidate:
+        await ingest_text(payload)
+
+    mock_invalidate.assert_awaited_once_with(collection_ids=["collection_1", "collection_2"])
+
+
+@pytest.mark.asyncio
+async def test_ingest_toc_maps_pecha_segment_ids_and_saves():
+    toc_payload = {
+        "text_id": "wb_text_1",
+        "type": "text",
+        "sections": [
+            {"id": "sec", "title": "1", "section_number": 1, "segments": [{"segment_id": "p1", "segment_number": 1}]}
+        ],
+    }
+    mapped_toc = SimpleNamespace(text_id="wb_text_1")
+
+    with patch(
+        "pecha_api.text_uploader.local_ingestion.get_table_of_content_by_type",
+        new_callable=AsyncMock,
+        return_value=mapped_toc,
+    ) as mock_by_type, patch(
+        "pecha_api.text_uploader.local_ingestion.save_table_of_content",
+        new_callable=AsyncMock,
+        return_value=SimpleNamespace(id="toc_1", text_id="wb_text_1"),
+    ) as mock_save:
+        result = await ingest_toc(toc_payload)
+
+    assert result == {"id": "toc_1", "text_id": "wb_text_1"}
+    assert mock_by_type.await_args.kwargs["table_of_content"].sections[0].segments[0].segment_id == "p1"
+    mock_save.assert_awaited_once_with(table_of_content_request=mapped_toc)
+
+
+@pytest.mark.asyncio
+async def test_upload_bulk_segments_ingests_directly_for_local_destination():
+    service = SegmentService()
+    request = TextUploadRequest(
+        destination_url=DestinationURL.LOCAL.value,
+        openpecha_api_url="https://openpecha.example",
+        text_id="T1",
+    )
+    segments_content = [{"segment_id": f"s{i}", "content": f"c{i}"} for i in range(401)]
+
+    with patch(
+        "pecha_api.text_uploader.segments.segment_service.ingest_segments",
+        new_callable=AsyncMock,
+    ) as mock_ingest, patch(
+        "pecha_api.text_uploader.segments.segment_service.post_segments",
+        new_callable=AsyncMock,
+    ) as mock_post:
+        await service.upload_bulk_segments("wb_text_1", segments_content, request, "tok")
+
+    mock_post.assert_not_awaited()
+    mock_ingest.assert_awaited_once()
+    assert len(mock_ingest.await_args.args[0]["segments"]) == 401
@@ -41,18 +41,19 @@ async def test_pipeline_runs_segment_toc_and_returns_new_texts_when_any_new():
     ) as MockCollectionService, patch(
         "pecha_api.text_uploader.pipeline.TextMetadataService"
     ) as MockTextMetadataService, patch(
-        "pecha_api.text_uploader.pipeline.SegmentService"
-    ) as MockSegmentService, patch(
-        "pecha_api.text_uploader.pipeline.TocService"
-    ) as MockTocService, patch(
+        "pecha_api.text_uploader.pipeline.TextUploadEngine"
+    ) as MockTextUploadEngine, patch(
+        "pecha_api.text_uploader.pipeline.get_pending_uploads",
+        new_callable=AsyncMock,
+        return_value={},
+    ) as mock_get_pending_uploads, patch(
         "pecha_api.text_uploader.pipeline.MappingService"
     ) as MockMappingService:
         MockCollectionService.return_value.upload_collections = AsyncMock()
         MockTextMetadataService.return_value.upload_text_metadata_service = AsyncMock(
             return_value=instance_ids
         )
-        MockSegmentService.return_value.upload_segments = AsyncMock()
-        MockTocService.return_value.upload_toc = AsyncMock()
+        MockTextUploadEngine.return_value.upload_texts = AsyncMock(return_value=[])
         MockMappingService.return_value.trigger_mapping = AsyncMock()
 
         response = await pipeline(text_upload_request=request, token="tok")
@@ -67,8 +68,12 @@ async def test_pipeline_runs_segment_toc_and_returns_new_texts_when_any_new():
         assert payload.openpecha_api_url.startswith("https://")
         assert payload.text_id == "T1"
 
-        MockSegmentService.return_value.upload_segments.assert_awaited_once()
-        MockTocService.return_value.upload_toc.assert_awaited_once()
+        MockTextUploadEngine.return_value.upload_texts.assert_awaited_once()
+        assert MockTextUploadEngine.return_value.upload_texts.await_args.kwargs["text_ids"] == {
+            "wb_text_1": "pecha_instance_1"
+        }
+        # the new text is excluded from the resume lookup
+        assert mock_get_pending_uploads.await_args.kwargs["pecha_text_ids"] == []
         MockMappingService.return_value.trigger_mapping.assert_not_awaited()
 
 
@@ -86,10 +91,12 @@ async def test_pipeline_skips_segment_and_toc_when_no_new_texts():
     ) as MockCollectionService, patch(
         "pecha_api.text_uploader.pipeline.TextMetadataService"
     ) as MockTextMetadataService, patch(
-        "pecha_api.text_uploader.pipeline.SegmentService"
-    ) as MockSegmentService, patch(
-        "pecha_api.text_uploader.pipeline.TocService"
-    ) as MockTocService, patch(
+        "pecha_api.text_uploader.pipeline.TextUploadEngine"
+    ) as MockTextUploadEngine, patch(
+        "pecha_api.text_uploader.pipeline.get_pending_uploads",
+        new_callable=AsyncMock,
+        return_value={},
+    ) as mock_get_pending_uploads, patch(
         "pecha_api.text_uploader.pipeline.MappingService"
     ) as MockMappingService:
         MockCollectionService.return_value.upload_collections = AsyncMock()
@@ -101,8 +108,7 @@ async def test_pipeline_skips_segment_and_toc_when_no_new_texts():
         response = await pipeline(text_upload_request=request, token="tok")
 
         assert response.message == "All texts are already uploaded"
-        assert MockSegmentService.called is False
-        assert MockTocService.called is False
+        assert MockTextUploadEngine.called is False
         MockMappingService.return_value.trigger_mapping.assert_not_awaited()
 
         payload = MockCollectionService.return_value.upload_collections.await_args.kwargs[
@@ -128,18 +134,19 @@ async def test_pipeline_triggers_mapping_when_destination_is_not_local():
     ) as MockCollectionService, patch(
         "pecha_api.text_uploader.pipeline.TextMetadataService"
     ) as MockTextMetadataService, patch(
-        "pecha_api.text_uploader.pipeline.SegmentService"
-    ) as MockSegmentService, patch(
-        "pecha_api.text_uploader.pipeline.TocService"
-    ) as MockTocService, patch(
+        "pecha_api.text_uploader.pipeline.TextUploadEngine"
+    ) as MockTextUploadEngine, patch(
+        "pecha_api.text_uploader.pipeline.get_pending_uploads",
+        new_callable=AsyncMock,
+        return_value={},
+    ) as mock_get_pending_uploads, patch(
         "pecha_api.text_uploader.pipeline.MappingService"
     ) as MockMappingService:
         MockCollectionService.return_value.upload_collections = AsyncMock()
         MockTextMetadataService.return_value.upload_text_metadata_service = AsyncMock(
             return_value=instance_ids
         )
-        MockSegmentService.return_value.upload_segments = AsyncMock()
-        MockTocService.return_value.upload_toc = AsyncMock()
+        MockTextUploadEngine.return_value.upload_texts = AsyncMock(return_value=[])
         MockMappingService.return_value.trigger_mapping = AsyncMock()
 
         response = await pipeline(text_upload_request=request, token="tok")
@@ -156,3 +163,74 @@ async def test_pipeline_triggers_mapping_when_destination_is_not_local():
         assert called_payload.openpecha_api_url == "DEVELOPMENT"
         assert called_payload.text_id == "T1"
 
+
+
+@pytest.mark.asyncio
+async def test_pipeline_resumes_texts_left_pending_by_a_failed_run():
+    request = TextUploadRequest(
+        destination_url="LOCAL",
+        openpecha_api_url="DEVELOPMENT",
+        text_id="T1",
+    )
+    instance_ids = TextInstanceIds(new_text={}, all_text={"T1": "pecha_instance_1"})
+
+    with patch("pecha_api.text_uploader.pipeline.verify_admin_access", return_value=True), patch(
+        "pecha_api.text_uploader.pipeline.CollectionService"
+    ) as MockCollectionService, patch(
+        "pecha_api.text_uploader.pipeline.TextMetadataService"
+    ) as MockTextMetadataService, patch(
+        "pecha_api.text_uploader.pipeline.TextUploadEngine"
+    ) as MockTextUploadEngine, patch(
+        "pecha_api.text_uploader.pipeline.get_pending_uploads",
+        new_callable=AsyncMock,
+        return_value={"wb_text_1": "pecha_instance_1"},
+    ) as mock_get_pending_uploads:
+        MockCollectionService.return_value.upload_collections = AsyncMock()
+        MockTextMetadataService.return_value.upload_text_metadata_service = AsyncMock(
+            return_value=instance_ids
+        )
+        MockTextUploadEngine.return_value.upload_texts = AsyncMock(return_value=[])
+
+        response = await pipeline(text_upload_request=request, token="tok")
+
+        assert response.message == {"wb_text_1": "pecha_instance_1"}
+        assert mock_get_pending_uploads.await_args.kwargs["pecha_text_ids"] == ["pecha_instance_1"]
+        assert MockTextUploadEngine.return_value.upload_texts.await_args.kwargs["text_ids"] == {
+            "wb_text_1": "pecha_instance_1"
+        }
+
+
+@pytest.mark.asyncio
+async def test_pipeline_raises_when_some_texts_fail_to_upload():
+    request = TextUploadRequest(
+        destination_url="LOCAL",
+        openpecha_api_url="DEVELOPMENT",
+        text_id="T1",
+    )
+    instance_ids = TextInstanceIds(
+        new_text={"wb_text_1": "pecha_instance_1"},
+        all_text={"T1": "pecha_instance_1"},
+    )
+
+    with patch("pecha_api.text_uploader.pipeline.verify_admin_access", return_value=True), patch(
+        "pecha_api.text_uploader.pipeline.CollectionService"
+    ) as MockCollectionService, patch(
+        "pecha_api.text_uploader.pipeline.TextMetadataService"
+    ) as MockTextMetadataService, patch(
+        "pecha_api.text_uploader.pipeline.TextUploadEngine"
+    ) as MockTextUploadEngine, patch(
+        "pecha_api.text_uploader.pipeline.get_pending_uploads",
+        new_callable=AsyncMock,
+        return_value={},
+    ):
+        MockCollectionService.return_value.upload_collections = AsyncMock()
+        MockTextMetadataService.return_value.upload_text_metadata_service = AsyncMock(
+            return_value=instance_ids
+        )
+        MockTextUploadEngine.return_value.upload_texts = AsyncMock(return_value=["wb_text_1"])
+
+        with pytest.raises(HTTPException) as exc:
+            await pipeline(text_upload_request=request, token="tok")
+
+    assert exc.value.status_code == 500
+    assert exc.value.detail == f"{ErrorConstants.TEXT_UPLOAD_INCOMPLETE_MESSAGE}: wb_text_1"
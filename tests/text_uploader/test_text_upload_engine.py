@@ -0,0 +1,178 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from pecha_api.text_uploader.segments.segment_model import InstanceSegments
+from pecha_api.text_uploader.text_upload_engine import TextUploadEngine
+from pecha_api.text_uploader.text_uploader_response_model import TextUploadCheckpoint, TextUploadRequest
+
+
+def _request() -> TextUploadRequest:
+    return TextUploadRequest(
+        destination_url="https://dest.example/api/v1",
+        openpecha_api_url="https://openpecha.example",
+        text_id="T1",
+    )
+
+
+def _instance_segments() -> InstanceSegments:
+    return InstanceSegments(
+        content="abcdef",
+        annotation={
+            "data": [
+                {"id": "s2", "span": {"start": 3, "end": 6}},
+                {"id": "s1", "span": {"start": 0, "end": 3}},
+            ]
+        },
+    )
+
+
+def _engine() -> TextUploadEngine:
+    engine = TextUploadEngine()
+    engine.segment_service.get_instance_segments = AsyncMock(return_value=_instance_segments())
+    engine.segment_service.get_uploaded_pecha_segment_ids = AsyncMock(return_value=set())
+    engine.segment_service.upload_bulk_segments = AsyncMock()
+    engine.toc_service.upload_text_toc = AsyncMock()
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_upload_text_fetches_instance_once_for_both_stages():
+    engine = _engine()
+
+    with patch(
+        "pecha_api.text_uploader.text_upload_engine.get_upload_checkpoint",
+        new_callable=AsyncMock,
+        return_value=None,
+    ), patch(
+        "pecha_api.text_uploader.text_upload_engine.save_upload_checkpoint",
+        new_callable=AsyncMock,
+    ) as mock_save:
+        await engine.upload_text("wb_text_1", "pecha_1", _request(), "tok")
+
+    engine.segment_service.get_instance_segments.assert_awaited_once()
+    segments_call = engine.segment_service.upload_bulk_segments.await_args
+    assert segments_call.args[0] == "wb_text_1"
+    assert [segment["segment_id"] for segment in segments_call.args[1]] == ["s2", "s1"]
+    engine.toc_service.upload_text_toc.assert_awaited_once_with(
+        "wb_text_1", _instance_segments().annotation, _request(), "tok"
+    )
+    saved_checkpoint = mock_save.await_args.args[0]
+    assert saved_checkpoint.completed_stages == ["segments", "toc"]
+
+
+@pytest.mark.asyncio
+async def test_upload_text_resumes_segments_after_last_uploaded_batch():
+    engine = _engine()
+    engine.segment_service.get_uploaded_pecha_segment_ids.return_value = {"s2"}
+    checkpoint = TextUploadCheckpoint(text_id="wb_text_1", pecha_text_id="pecha_1", uploaded_segments=1)
+
+    with patch(
+        "pecha_api.text_uploader.text_upload_engine.get_upload_checkpoint",
+        new_callable=AsyncMock,
+        return_value=checkpoint,
+    ), patch(
+        "pecha_api.text_uploader.text_upload_engine.save_upload_checkpoint",
+        new_callable=AsyncMock,
+    ):
+        await engine.upload_text("wb_text_1", "pecha_1", _request(), "tok")
+
+        engine.segment_service.get_uploaded_pecha_segment_ids.assert_awaited_once_with("wb_text_1")
+        segments_call = engine.segment_service.upload_bulk_segments.await_args
+        assert [segment["segment_id"] for segment in segments_call.args[1]] == ["s1"]
+
+        await segments_call.kwargs["on_batch_uploaded"](1)
+        assert checkpoint.uploaded_segments == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_text_does_not_repost_a_batch_stored_before_its_checkpoint():
+    engine = _engine()
+    engine.segment_service.get_uploaded_pecha_segment_ids.return_value = {"s2"}
+    checkpoint = TextUploadCheckpoint(text_id="wb_text_1", pecha_text_id="pecha_1", uploaded_segments=0)
+
+    with patch(
+        "pecha_api.text_uploader.text_upload_engine.get_upload_checkpoint",
+        new_callable=AsyncMock,
+        return_value=checkpoint,
+    ), patch(
+        "pecha_api.text_uploader.text_upload_engine.save_upload_checkpoint",
+        new_callable=AsyncMock,
+    ):
+        await engine.upload_text("wb_text_1", "pecha_1", _request(), "tok")
+
+    segments_call = engine.segment_service.upload_bulk_segments.await_args
+    assert [segment["segment_id"] for segment in segments_call.args[1]] == ["s1"]
+
+
+@pytest.mark.asyncio
+async def test_upload_text_skips_segments_already_stored():
+    engine = _engine()
+    engine.segment_service.get_uploaded_pecha_segment_ids.return_value = {"s1", "s2"}
+
+    with patch(
+        "pecha_api.text_uploader.text_upload_engine.get_upload_checkpoint",
+        new_callable=AsyncMock,
+        return_value=None,
+    ), patch(
+        "pecha_api.text_uploader.text_upload_engine.save_upload_checkpoint",
+        new_callable=AsyncMock,
+    ) as mock_save:
+        await engine.upload_text("wb_text_1", "pecha_1", _request(), "tok")
+
+    engine.segment_service.upload_bulk_segments.assert_not_awaited()
+    assert mock_save.await_args.args[0].completed_stages == ["segments", "toc"]
+
+
+@pytest.mark.asyncio
+async def test_upload_text_skips_completed_stages():
+    engine = _engine()
+    checkpoint = TextUploadCheckpoint(text_id="wb_text_1", pecha_text_id="pecha_1", completed_stages=["segments"])
+
+    with patch(
+        "pecha_api.text_uploader.text_upload_engine.get_upload_checkpoint",
+        new_callable=AsyncMock,
+        return_value=checkpoint,
+    ), patch(
+        "pecha_api.text_uploader.text_upload_engine.save_upload_checkpoint",
+        new_callable=AsyncMock,
+    ):
+        await engine.upload_text("wb_text_1", "pecha_1", _request(), "tok")
+
+    engine.segment_service.upload_bulk_segments.assert_not_awaited()
+    engine.toc_service.upload_text_toc.assert_awaited_once()
+    assert checkpoint.completed_stages == ["segments", "toc"]
+
+
+@pytest.mark.asyncio
+async def test_upload_text_skips_fully_uploaded_text():
+    engine = _engine()
+    checkpoint = TextUploadCheckpoint(text_id="wb_text_1", pecha_text_id="pecha_1", completed_stages=["segments", "toc"])
+
+    with patch(
+        "pecha_api.text_uploader.text_upload_engine.get_upload_checkpoint",
+        new_callable=AsyncMock,
+        return_value=checkpoint,
+    ):
+        await engine.upload_text("wb_text_1", "pecha_1", _request(), "tok")
+
+    engine.segment_service.get_instance_segments.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_upload_texts_returns_failed_text_ids_and_keeps_going():
+    engine = TextUploadEngine()
+
+    async def upload_text(text_id, pecha_text_id, text_upload_request, token):
+        if text_id == "wb_text_2":
+            raise RuntimeError("boom")
+
+    engine.upload_text = AsyncMock(side_effect=upload_text)
+
+    failed_text_ids = await engine.upload_texts(
+        text_ids={"wb_text_1": "pecha_1", "wb_text_2": "pecha_2", "wb_text_3": "pecha_3"},
+        text_upload_request=_request(),
+        token="tok",
+    )
+
+    assert failed_text_ids == ["wb_text_2"]
+    assert engine.upload_text.await_count == 3
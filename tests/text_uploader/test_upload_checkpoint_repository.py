@@ -0,0 +1,47 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from pecha_api.text_uploader.text_uploader_response_model import TextUploadCheckpoint
+from pecha_api.text_uploader.upload_checkpoint_repository import (
+    get_pending_uploads,
+    get_upload_checkpoint,
+    is_upload_completed
+)
+
+
+@pytest.mark.asyncio
+async def test_get_pending_uploads_returns_only_incomplete_checkpoints():
+    cached = {
+        "text_upload_checkpoint:pecha_1:digest": {"text_id": "wb_1", "pecha_text_id": "pecha_1", "completed_stages": ["segments"]},
+        "text_upload_checkpoint:pecha_2:digest": {"text_id": "wb_2", "pecha_text_id": "pecha_2", "completed_stages": ["segments", "toc"]},
+    }
+    with patch(
+        "pecha_api.text_uploader.upload_checkpoint_repository.get_many",
+        new_callable=AsyncMock,
+        return_value=cached,
+    ) as mock_get_many:
+        pending_uploads = await get_pending_uploads(["pecha_1", "pecha_2", "pecha_3"], "https://dest.example")
+
+    assert pending_uploads == {"wb_1": "pecha_1"}
+    assert len(mock_get_many.await_args.kwargs["hash_keys"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_upload_checkpoint_keys_by_destination():
+    with patch(
+        "pecha_api.text_uploader.upload_checkpoint_repository.get_cache_data",
+        new_callable=AsyncMock,
+        return_value={"text_id": "wb_1", "pecha_text_id": "pecha_1", "uploaded_segments": 400},
+    ) as mock_get_cache_data:
+        checkpoint = await get_upload_checkpoint("pecha_1", "https://dest.example")
+        await get_upload_checkpoint("pecha_1", "https://other.example")
+
+    assert checkpoint == TextUploadCheckpoint(text_id="wb_1", pecha_text_id="pecha_1", uploaded_segments=400)
+    first_key, second_key = [call.kwargs["hash_key"] for call in mock_get_cache_data.await_args_list]
+    assert first_key.startswith("text_upload_checkpoint:pecha_1:")
+    assert first_key != second_key
+
+
+def test_is_upload_completed_requires_every_stage():
+    assert is_upload_completed(TextUploadCheckpoint(text_id="wb_1", pecha_text_id="p", completed_stages=["segments", "toc"]))
+    assert not is_upload_completed(TextUploadCheckpoint(text_id="wb_1", pecha_text_id="p", completed_stages=["toc"]))
@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+import pytest
+
+from pecha_api.text_uploader.uploader_http_client import UploaderHttpClient
+
+
+def _client_with_transport(handler) -> UploaderHttpClient:
+    client = UploaderHttpClient()
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+@pytest.mark.asyncio
+async def test_get_json_returns_decoded_body_and_passes_params():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["url"] = str(request.url)
+        return httpx.Response(200, json={"ok": True})
+
+    client = _client_with_transport(handler)
+    result = await client.get_json("https://openpecha.example/v2/texts", params={"type": "root"})
+    await client.aclose()
+
+    assert result == {"ok": True}
+    assert seen["url"] == "https://openpecha.example/v2/texts?type=root"
+
+
+@pytest.mark.asyncio
+async def test_post_json_sends_bearer_token_and_payload():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["authorization"] = request.headers.get("Authorization")
+        seen["body"] = request.content
+        return httpx.Response(201, json={"id": "seg_1"})
+
+    client = _client_with_transport(handler)
+    result = await client.post_json("https://dest.example/segments", {"text_id": "t1"}, token="tok")
+    await client.aclose()
+
+    assert result == {"id": "seg_1"}
+    assert seen["authorization"] == "Bearer tok"
+    assert seen["body"] == b'{"text_id":"t1"}'
+
+
+@pytest.mark.asyncio
+async def test_request_raises_for_error_status():
+    client = _client_with_transport(lambda request: httpx.Response(400, text="bad"))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.post_json("https://dest.example/segments", {"text_id": "t1"}, token="tok")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_bounds_concurrency_per_host(monkeypatch):
+    monkeypatch.setattr("pecha_api.text_uploader.uploader_http_client.get_int", lambda key: 2)
+    in_flight = {"current": 0, "peak": 0}
+
+    class SlowTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            in_flight["current"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["current"])
+            await asyncio.sleep(0.01)
+            in_flight["current"] -= 1
+            return httpx.Response(200, json={})
+
+    client = UploaderHttpClient()
+    client._client = httpx.AsyncClient(transport=SlowTransport())
+    await asyncio.gather(*[client.get_json("https://openpecha.example/v2/texts") for _ in range(6)])
+    await client.aclose()
+
+    assert in_flight["peak"] == 2
@@ -341,7 +341,11 @@ async def test_get_text_meta_data_service_creates_group_for_first_text():
         "pecha_api.text_uploader.text_metadata.text_metadata_service.post_text",
         new_callable=AsyncMock,
         return_value={"id": "new_text_id", "title": "Test Text"}
-    ):
+    ), \
+    patch(
+        "pecha_api.text_uploader.text_metadata.text_metadata_service.save_upload_checkpoint",
+        new_callable=AsyncMock
+    ) as mock_save_checkpoint:
         result = await service.get_text_meta_data_service(
             text_ids=["text_1"],
             type="translation",
@@ -352,6 +356,11 @@ async def test_get_text_meta_data_service_creates_group_for_first_text():
         mock_post_group.assert_awaited_once()
         assert service.version_group_id == "new_group_id"
         assert "new_text_id" in result
+        checkpoint, destination_url = mock_save_checkpoint.await_args.args
+        assert checkpoint.text_id == "new_text_id"
+        assert checkpoint.pecha_text_id == "inst_1"
+        assert checkpoint.completed_stages == []
+        assert destination_url == "https://destination.example"
 
 
 @pytest.mark.asyncio
@@ -484,7 +493,11 @@ async def test_get_text_meta_data_service_commentary_creates_separate_group():
         "pecha_api.text_uploader.text_metadata.text_metadata_service.post_text",
         new_callable=AsyncMock,
         return_value={"id": "commentary_text_id", "title": "Commentary"}
-    ):
+    ), \
+    patch(
+        "pecha_api.text_uploader.text_metadata.text_metadata_service.save_upload_checkpoint",
+        new_callable=AsyncMock
+    ) as mock_save_checkpoint:
         result = await service.get_text_meta_data_service(
             text_ids=["commentary_1"],
             type="commentary",
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch
 import pytest
 from fastapi import HTTPException, status
@@ -5,7 +6,8 @@ import uuid
 
 from pecha_api.error_contants import ErrorConstants
 from pecha_api.texts.mappings.mappings_response_models import TextMappingRequest, MappingsModel, TextMapping
-from pecha_api.texts.mappings.mappings_service import update_segment_mapping
+from pecha_api.texts.mappings import mappings_service
+from pecha_api.texts.mappings.mappings_service import update_segment_mapping, rebuild_mapping_edges
 from pecha_api.texts.segments.segments_models import Mapping
 from pecha_api.texts.segments.segments_response_models import SegmentResponse
 from pecha_api.texts.segments.segments_enum import SegmentType
@@ -197,3 +199,34 @@ async def test_update_segment_mapping_invalid_parent_segment():
         # Act & Assert
         with pytest.raises(KeyError):
             await update_segment_mapping(text_mapping_request=mapping_request, token="Bearer token")
+
+
+@pytest.mark.asyncio
+async def test_rebuild_mapping_edges_non_admin():
+    with patch('pecha_api.texts.mappings.mappings_service.verify_admin_access', return_value=False), \
+            patch('pecha_api.texts.mappings.mappings_service.rebuild_segment_mapping_edges', new_callable=AsyncMock) as mock_rebuild:
+        with pytest.raises(HTTPException) as exc_info:
+            await rebuild_mapping_edges(token="Bearer token")
+
+        assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+        mock_rebuild.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rebuild_mapping_edges_runs_in_background_once():
+    release_rebuild = asyncio.Event()
+
+    async def _rebuild():
+        await release_rebuild.wait()
+        return 42
+
+    with patch('pecha_api.texts.mappings.mappings_service.verify_admin_access', return_value=True), \
+            patch('pecha_api.texts.mappings.mappings_service.rebuild_segment_mapping_edges', side_effect=_rebuild) as mock_rebuild:
+        first_response = await rebuild_mapping_edges(token="Bearer token")
+        second_response = await rebuild_mapping_edges(token="Bearer token")
+        release_rebuild.set()
+        await mappings_service._rebuild_task
+
+        assert first_response.started is True
+        assert second_response.started is False
+        mock_rebuild.assert_awaited_once()
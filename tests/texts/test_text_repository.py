@@ -2,9 +2,10 @@ from unittest.mock import AsyncMock, patch, MagicMock
 import pytest
 from uuid import uuid4
 
-from pecha_api.texts.texts_repository import fetch_sheets_from_db
-from pecha_api.texts.texts_models import Text
+from pecha_api.texts.texts_repository import fetch_sheets_from_db, get_table_of_content_segment_index_anchor
+from pecha_api.texts.texts_models import Text, TableOfContent, TableOfContentSegmentIndex
 from pecha_api.texts.texts_enums import TextType
+from pecha_api.texts.texts_response_models import Section, TextSegment
 from pecha_api.sheets.sheets_enum import SortBy, SortOrder
 
 
@@ -258,4 +259,74 @@ async def test_fetch_sheets_from_db_unpublished_only():
             sort_order=None,
             skip=0,
             limit=10
-        ) 
\ No newline at end of file
+        ) 
+
+@pytest.mark.asyncio
+async def test_get_table_of_content_segment_index_anchor_opens_first_table_of_content_with_segments():
+    first_anchor = MagicMock(content_id="content_id_1", segment_id="segment_id_1")
+    second_anchor = MagicMock(content_id="content_id_2", segment_id="segment_id_9")
+    mock_find = MagicMock()
+    mock_find.return_value.to_list = AsyncMock(return_value=[second_anchor, first_anchor])
+
+    with patch.object(TableOfContentSegmentIndex, "find", mock_find), \
+        patch.object(
+            TableOfContent,
+            "get_content_ids_by_text_id",
+            new_callable=AsyncMock,
+            return_value=["content_id_0", "content_id_1", "content_id_2"]
+        ), \
+        patch.object(TableOfContent, "has_segments", new_callable=AsyncMock, return_value=False) as mock_has_segments:
+        result = await get_table_of_content_segment_index_anchor(text_id="text_id_1")
+
+    assert result is first_anchor
+    assert mock_find.call_args.args[0]["position"] == 1
+    mock_has_segments.assert_awaited_once_with(content_id="content_id_0")
+
+
+@pytest.mark.asyncio
+async def test_get_table_of_content_segment_index_anchor_single_table_of_content():
+    anchor = MagicMock(content_id="content_id_1", segment_id="segment_id_1")
+    mock_find = MagicMock()
+    mock_find.return_value.to_list = AsyncMock(return_value=[anchor])
+
+    with patch.object(TableOfContentSegmentIndex, "find", mock_find), \
+        patch.object(TableOfContent, "get_content_ids_by_text_id", new_callable=AsyncMock, return_value=["content_id_1"]), \
+        patch.object(TableOfContent, "has_segments", new_callable=AsyncMock) as mock_has_segments:
+        result = await get_table_of_content_segment_index_anchor(text_id="text_id_1")
+
+    assert result is anchor
+    mock_has_segments.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_table_of_content_segment_index_anchor_first_table_of_content_not_indexed():
+    anchor = MagicMock(content_id="content_id_2", segment_id="segment_id_9")
+    mock_find = MagicMock()
+    mock_find.return_value.to_list = AsyncMock(return_value=[anchor])
+
+    with patch.object(TableOfContentSegmentIndex, "find", mock_find), \
+        patch.object(
+            TableOfContent,
+            "get_content_ids_by_text_id",
+            new_callable=AsyncMock,
+            return_value=["content_id_1", "content_id_2"]
+        ), \
+        patch.object(TableOfContent, "has_segments", new_callable=AsyncMock, return_value=True):
+        result = await get_table_of_content_segment_index_anchor(text_id="text_id_1")
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_table_of_content_has_segments_checks_nested_sections():
+    nested = MagicMock(
+        sections=[Section(id="s1", section_number=1, sections=[
+            Section(id="s2", section_number=1, segments=[TextSegment(segment_id="segment_id_1", segment_number=1)])
+        ])]
+    )
+    empty = MagicMock(sections=[Section(id="s1", section_number=1, sections=[])])
+
+    with patch.object(TableOfContent, "get", new_callable=AsyncMock, side_effect=[nested, empty, None]):
+        assert await TableOfContent.has_segments(content_id=str(uuid4())) is True
+        assert await TableOfContent.has_segments(content_id=str(uuid4())) is False
+        assert await TableOfContent.has_segments(content_id=str(uuid4())) is False
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, patch, MagicMock, Mock
 import httpx
 from fastapi import HTTPException
@@ -19,6 +20,7 @@ from pecha_api.texts.texts_service import (
     get_table_of_content_by_sheet_id,
     get_table_of_content_by_type,
     _validate_text_detail_request,
+    _index_table_of_content_on_read_,
     get_root_text_by_collection_id,
     get_commentaries_by_text_id,
     replace_pecha_segment_id_with_segment_id,
@@ -48,6 +50,7 @@ from pecha_api.texts.texts_response_models import (
     TextsByPechaTextIdsRequest
 )
 from pecha_api.recitations.recitations_response_models import RecitationDTO, RecitationsResponse
+from pecha_api.texts.texts_utils import TextUtils
 
 from pecha_api.texts.texts_enums import TextType, PaginationDirection, LANGUAGE_ORDERS
 from pecha_api.sheets.sheets_enum import SortBy, SortOrder
@@ -327,6 +330,45 @@ async def test_create_new_text():
         assert response.published_by == published_by
         assert response.categories == categories
 
+@pytest.mark.asyncio
+async def test_create_new_text_invalidates_its_collections():
+    with patch("pecha_api.texts.texts_service.validate_user_exists", return_value=True), \
+            patch("pecha_api.texts.texts_service.validate_group_exists", new_callable=AsyncMock, return_value=True), \
+            patch("pecha_api.texts.texts_service.invalidate_collection_cache", new_callable=AsyncMock) as mock_invalidate, \
+            patch("pecha_api.texts.texts_service.create_text", new_callable=AsyncMock) as mock_create_text:
+        mock_create_text.return_value = Mock(
+            id="efb26a06-f373-450b-ba57-e7a8d4dd5b64",
+            pecha_text_id="test_pecha_id",
+            title="title",
+            language="bo",
+            group_id="group_id",
+            type=TextType.VERSION,
+            is_published=True,
+            created_date="2025-03-16 04:40:54.757652",
+            updated_date="2025-03-16 04:40:54.757652",
+            published_date="2025-03-16 04:40:54.757652",
+            published_by="pecha",
+            categories=["collection_1", "collection_2"],
+            views=0,
+            source_link=None,
+            ranking=None,
+            license=None
+        )
+        await create_new_text(
+            create_text_request=CreateTextRequest(
+                title="title",
+                language="bo",
+                group_id="group_id",
+                published_by="pecha",
+                type=TextType.VERSION,
+                categories=["collection_1", "collection_2"]
+            ),
+            token="admin"
+        )
+
+        mock_invalidate.assert_awaited_once_with(collection_ids=["collection_1", "collection_2"])
+
+
 @pytest.mark.asyncio
 async def test_create_new_text_invalid_group_id():
     with patch("pecha_api.texts.texts_service.validate_user_exists", return_value=True), \
@@ -572,7 +614,7 @@ async def test_get_table_of_contents_by_text_id_success():
         patch("pecha_api.texts.texts_service.set_table_of_contents_by_text_id_cache", new_callable=MagicMock, return_value=None),\
         patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
         patch("pecha_api.texts.texts_service.get_texts_by_group_id", new_callable=AsyncMock, return_value=mock_group_texts), \
-        patch("pecha_api.texts.texts_service.get_contents_by_id", new_callable=AsyncMock, return_value=table_of_contents):
+        patch("pecha_api.texts.texts_service.get_paginated_table_of_contents_by_text_id", new_callable=AsyncMock, return_value=table_of_contents) as mock_get_paginated:
         
         response = await get_table_of_contents_by_text_id(
             text_id=text_id,
@@ -581,6 +623,7 @@ async def test_get_table_of_contents_by_text_id_success():
             limit=limit
         )
         
+        mock_get_paginated.assert_awaited_once_with(text_id="text_id_1", skip=skip, limit=limit)
         assert response is not None
         assert isinstance(response, TableOfContentResponse)
         assert response.text_detail is not None
@@ -678,7 +721,7 @@ async def test_get_table_of_contents_by_text_id_success_language_is_none():
         patch("pecha_api.texts.texts_service.set_table_of_contents_by_text_id_cache", new_callable=MagicMock, return_value=None),\
         patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
         patch("pecha_api.texts.texts_service.get_texts_by_group_id", new_callable=AsyncMock, return_value=mock_group_texts), \
-        patch("pecha_api.texts.texts_service.get_contents_by_id", new_callable=AsyncMock, return_value=table_of_contents):
+        patch("pecha_api.texts.texts_service.get_paginated_table_of_contents_by_text_id", new_callable=AsyncMock, return_value=table_of_contents) as mock_get_paginated:
         
         response = await get_table_of_contents_by_text_id(
             text_id=text_id,
@@ -767,7 +810,7 @@ async def test_get_table_of_contents_by_text_id_root_text_is_none():
         patch("pecha_api.texts.texts_service.set_table_of_contents_by_text_id_cache", new_callable=MagicMock, return_value=None),\
         patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
         patch("pecha_api.texts.texts_service.get_texts_by_group_id", new_callable=AsyncMock, return_value=mock_group_texts), \
-        patch("pecha_api.texts.texts_service.get_contents_by_id", new_callable=AsyncMock, return_value=table_of_contents), \
+        patch("pecha_api.texts.texts_service.get_paginated_table_of_contents_by_text_id", new_callable=AsyncMock, return_value=table_of_contents), \
         patch("pecha_api.constants.Constants.excluded_text_ids", [excluded_id]):
         
         with pytest.raises(HTTPException) as exc_info:
@@ -1351,6 +1394,95 @@ async def test_get_text_details_by_text_id_with_content_id_only_success():
         assert response.pagination_direction == PaginationDirection.NEXT
     
 
+@pytest.mark.asyncio
+async def test_get_text_details_by_text_id_served_from_segment_index():
+    text_id = "text_id_1"
+    content_id = "content_id_1"
+    mock_text_detail = TextDTO(
+        id=text_id,
+        title="text_title",
+        language="bo",
+        group_id="group_id_1",
+        type="version",
+        is_published=False,
+        created_date="created_date",
+        updated_date="updated_date",
+        published_date="published_date",
+        published_by="published_by",
+        categories=[],
+        views=0
+    )
+    table_of_content = TableOfContent(
+        id=content_id,
+        text_id=text_id,
+        type=TableOfContentType.TEXT,
+        sections=[
+            Section(
+                id="section_id_1",
+                title="section_title",
+                section_number=1,
+                segments=[
+                    TextSegment(segment_id=f"segment_id_{number}", segment_number=number)
+                    for number in range(1, 6)
+                ]
+            )
+        ]
+    )
+    index_entries = TextUtils.get_segment_index_entries(table_of_content=table_of_content)
+    mock_mapped_table_of_content = DetailTableOfContent(id=content_id, text_id=text_id, sections=[])
+
+    with patch("pecha_api.texts.texts_service._validate_text_detail_request", new_callable=AsyncMock, return_value=True), \
+        patch("pecha_api.texts.texts_service.TextUtils.get_text_detail_by_id", new_callable=AsyncMock, return_value=mock_text_detail), \
+        patch("pecha_api.texts.texts_service.get_table_of_content_segment_index_anchor", new_callable=AsyncMock, return_value=index_entries[3]), \
+        patch("pecha_api.texts.texts_service.get_table_of_content_segment_index_count", new_callable=AsyncMock, return_value=5), \
+        patch("pecha_api.texts.texts_service.get_table_of_content_segment_index_range", new_callable=AsyncMock, return_value=index_entries[1:4]) as mock_get_range, \
+        patch("pecha_api.texts.texts_service.get_table_of_content_by_content_id", new_callable=AsyncMock) as mock_get_table_of_content, \
+        patch("pecha_api.texts.texts_service.SegmentUtils.get_mapped_segment_content_for_table_of_content", new_callable=AsyncMock, return_value=mock_mapped_table_of_content) as mock_mapped:
+
+        response = await get_text_details_by_text_id(
+            text_id=text_id,
+            text_details_request=TextDetailsRequest(
+                content_id=content_id,
+                segment_id="segment_id_4",
+                size=3,
+                direction=PaginationDirection.PREVIOUS
+            )
+        )
+
+        mock_get_range.assert_awaited_once_with(content_id=content_id, start=2, end=4)
+        mock_get_table_of_content.assert_not_called()
+        paginated_table_of_content = mock_mapped.call_args.kwargs["table_of_content"]
+        assert [segment.segment_id for segment in paginated_table_of_content.sections[0].segments] == [
+            "segment_id_2", "segment_id_3", "segment_id_4"
+        ]
+        assert response.total_segments == 5
+        assert response.current_segment_position == 4
+
+
+@pytest.mark.asyncio
+async def test_index_table_of_content_on_read_rebuilds_once_for_concurrent_readers():
+    table_of_content = TableOfContent(
+        id="content_id_1",
+        text_id="text_id_1",
+        type=TableOfContentType.TEXT,
+        sections=[]
+    )
+    index_sizes = [0, 5]
+
+    async def _rebuild(table_of_content):
+        await asyncio.sleep(0)
+
+    with patch("pecha_api.texts.texts_service.get_table_of_content_segment_index_count", new_callable=AsyncMock, side_effect=index_sizes), \
+        patch("pecha_api.texts.texts_service._rebuild_table_of_content_segment_index_", side_effect=_rebuild) as mock_rebuild:
+        await asyncio.gather(
+            _index_table_of_content_on_read_(table_of_content=table_of_content),
+            _index_table_of_content_on_read_(table_of_content=table_of_content)
+        )
+        await _index_table_of_content_on_read_(table_of_content=table_of_content)
+
+    mock_rebuild.assert_awaited_once_with(table_of_content=table_of_content)
+
+
 @pytest.mark.asyncio
 async def test_get_table_of_content_by_sheet_id_success():
     sheet_id = "sheet_id_1"
@@ -2674,83 +2806,27 @@ async def test_receive_table_of_content_not_found():
     assert exc_info.value.status_code == 404
     assert exc_info.value.detail == ErrorConstants.TABLE_OF_CONTENT_NOT_FOUND_MESSAGE
 
-def test_get_paginated_sections():
-    """Test _get_paginated_sections"""
-    from pecha_api.texts.texts_service import _get_paginated_sections
-    
-    sections = [
-        Section(
-            id="section_1",
-            title="Section 1",
-            section_number=1,
-            segments=[
-                TextSegment(segment_id="seg_1", segment_number=1),
-                TextSegment(segment_id="seg_2", segment_number=2)
-            ],
-            sections=[]
-        ),
-        Section(
-            id="section_2",
-            title="Section 2",
-            section_number=2,
-            segments=[
-                TextSegment(segment_id="seg_3", segment_number=1)
-            ],
-            sections=[]
-        ),
-        Section(
-            id="section_3",
-            title="Section 3",
-            section_number=3,
-            segments=[
-                TextSegment(segment_id="seg_4", segment_number=1)
-            ],
-            sections=[]
-        )
-    ]
-    
-    result = _get_paginated_sections(sections=sections, skip=0, limit=2)
-    
-    assert result is not None
-    assert isinstance(result, list)
-    assert len(result) == 2
-    assert result[0].id == "section_1"
-    assert result[1].id == "section_2"
-    # Each section should only have first segment
-    assert len(result[0].segments) == 1
-    assert result[0].segments[0].segment_id == "seg_1"
+def test_paginated_sections_pipeline_first_segment_only():
+    from pecha_api.texts.texts_models import TableOfContent as TableOfContentDocument
 
-def test_get_paginated_sections_with_skip():
-    """Test _get_paginated_sections with skip"""
-    from pecha_api.texts.texts_service import _get_paginated_sections
-    
-    sections = [
-        Section(
-            id="section_1",
-            title="Section 1",
-            section_number=1,
-            segments=[
-                TextSegment(segment_id="seg_1", segment_number=1)
-            ],
-            sections=[]
-        ),
-        Section(
-            id="section_2",
-            title="Section 2",
-            section_number=2,
-            segments=[
-                TextSegment(segment_id="seg_2", segment_number=1)
-            ],
-            sections=[]
-        )
-    ]
-    
-    result = _get_paginated_sections(sections=sections, skip=1, limit=2)
-    
-    assert result is not None
-    assert isinstance(result, list)
-    assert len(result) == 1
-    assert result[0].id == "section_2"
+    pipeline = TableOfContentDocument._paginated_sections_pipeline(skip=10, limit=5, first_segment_only=True)
+
+    sorted_sections = pipeline[0]["$project"]["sections"]["$sortArray"]
+    assert sorted_sections["sortBy"] == {"section_number": 1}
+    assert "$filter" in sorted_sections["input"]["$ifNull"][0]
+    assert pipeline[1]["$project"]["total_sections"] == {"$size": "$sections"}
+    assert pipeline[1]["$project"]["sections"] == {"$slice": ["$sections", 10, 5]}
+    first_segment = pipeline[2]["$set"]["sections"]["$map"]["in"]["$mergeObjects"][1]
+    assert first_segment == {"segments": {"$slice": ["$$section.segments", 1]}}
+
+def test_paginated_sections_pipeline_keeps_all_segments():
+    from pecha_api.texts.texts_models import TableOfContent as TableOfContentDocument
+
+    pipeline = TableOfContentDocument._paginated_sections_pipeline(skip=0, limit=0, first_segment_only=False)
+
+    assert len(pipeline) == 2
+    assert pipeline[0]["$project"]["sections"]["$sortArray"]["input"] == {"$ifNull": ["$sections", []]}
+    assert pipeline[1]["$project"]["sections"] == []
 
 @pytest.mark.asyncio
 async def test_update_text_details_cache_update_fails():
@@ -976,4 +976,71 @@ async def test_filter_text_base_on_group_id_type_and_language_preference_filters
         assert len(result[TextType.COMMENTARY.value]) == 1
         assert result[TextType.COMMENTARY.value][0].id == "text_id_2"
         assert result[TextType.COMMENTARY.value][0].language == "bo"
-    
\ No newline at end of file
+    
+
+def _nested_table_of_content_() -> TableOfContent:
+    return TableOfContent(
+        id="content_id_1",
+        text_id="text_id_1",
+        type=TableOfContentType.TEXT,
+        sections=[
+            Section(
+                id="section_1",
+                title="section 1",
+                section_number=1,
+                segments=[TextSegment(segment_id="segment_1", segment_number=1)],
+                sections=[
+                    Section(
+                        id="section_1_1",
+                        title="section 1.1",
+                        section_number=1,
+                        parent_id="section_1",
+                        segments=[
+                            TextSegment(segment_id="segment_2", segment_number=2),
+                            TextSegment(segment_id="segment_3", segment_number=3)
+                        ]
+                    )
+                ]
+            ),
+            Section(
+                id="section_2",
+                title="section 2",
+                section_number=2,
+                segments=[TextSegment(segment_id="segment_4", segment_number=4)]
+            )
+        ]
+    )
+
+
+def test_get_segment_index_entries_positions_follow_reading_order():
+    entries = TextUtils.get_segment_index_entries(table_of_content=_nested_table_of_content_())
+
+    assert [(entry.segment_id, entry.position) for entry in entries] == [
+        ("segment_1", 1),
+        ("segment_2", 2),
+        ("segment_3", 3),
+        ("segment_4", 4)
+    ]
+    assert [section.id for section in entries[2].section_path] == ["section_1", "section_1_1"]
+    assert [section.id for section in entries[3].section_path] == ["section_2"]
+    assert all(entry.content_id == "content_id_1" for entry in entries)
+
+
+def test_build_table_of_content_from_segment_index_window():
+    entries = TextUtils.get_segment_index_entries(table_of_content=_nested_table_of_content_())
+
+    response = TextUtils.build_table_of_content_from_segment_index(entries=entries[2:4])
+
+    assert response.id == "content_id_1"
+    assert response.text_id == "text_id_1"
+    assert [section.id for section in response.sections] == ["section_1", "section_2"]
+    assert response.sections[0].segments == []
+    assert response.sections[0].sections[0].id == "section_1_1"
+    assert response.sections[0].sections[0].parent_id == "section_1"
+    assert [segment.segment_id for segment in response.sections[0].sections[0].segments] == ["segment_3"]
+    assert response.sections[1].sections is None
+    assert [segment.segment_id for segment in response.sections[1].segments] == ["segment_4"]
+
+
+def test_build_table_of_content_from_segment_index_empty():
+    assert TextUtils.build_table_of_content_from_segment_index(entries=[]) is None
@@ -0,0 +1,76 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pecha_api.users.user_principal_cache import UserPrincipalCache
+from pecha_api.users.user_response_models import UserPrincipal
+
+
+def _principal(email="john.doe@example.com", claims=None):
+    return UserPrincipal(email=email, username="johndoe", is_admin=False, claims=claims or {"email": email})
+
+
+def test_get_returns_cached_principal_by_token():
+    cache = UserPrincipalCache()
+    principal = _principal()
+    cache.set(token="token_1", principal=principal)
+
+    assert cache.get(token="token_1") == principal
+    assert cache.get(token="token_2") is None
+
+
+def test_entries_expire_after_ttl():
+    cache = UserPrincipalCache()
+    with patch("pecha_api.users.user_principal_cache.time.monotonic", return_value=1000.0):
+        cache.set(token="token_1", principal=_principal())
+    with patch("pecha_api.users.user_principal_cache.time.monotonic", return_value=1061.0):
+        assert cache.get(token="token_1") is None
+
+
+def test_entries_never_outlive_the_token():
+    cache = UserPrincipalCache()
+    cache.set(token="expired", principal=_principal(claims={"email": "john.doe@example.com", "exp": time.time() - 1}))
+
+    assert cache.get(token="expired") is None
+
+
+def test_oldest_entries_are_evicted():
+    cache = UserPrincipalCache()
+    with patch("pecha_api.users.user_principal_cache.get_int", side_effect=lambda key: {"USER_PRINCIPAL_CACHE_TTL": 60, "USER_PRINCIPAL_CACHE_MAX_ENTRIES": 2}[key]):
+        cache.set(token="token_1", principal=_principal())
+        cache.set(token="token_2", principal=_principal())
+        cache.get(token="token_1")
+        cache.set(token="token_3", principal=_principal())
+
+    assert cache.get(token="token_1") is not None
+    assert cache.get(token="token_2") is None
+    assert cache.get(token="token_3") is not None
+
+
+def test_invalidate_user_drops_every_token_of_the_user():
+    cache = UserPrincipalCache()
+    cache.set(token="token_1", principal=_principal())
+    cache.set(token="token_2", principal=_principal())
+    cache.set(token="token_3", principal=_principal(email="other@example.com"))
+
+    cache.invalidate_user(email="john.doe@example.com")
+
+    assert cache.get(token="token_1") is None
+    assert cache.get(token="token_2") is None
+    assert cache.get(token="token_3") is not None
+
+
+def test_request_scope_keeps_principal_for_the_request_only():
+    cache = UserPrincipalCache()
+    principal = _principal(claims={"email": "john.doe@example.com", "exp": time.time() - 1})
+
+    with cache.request_scope():
+        cache.set(token="token_1", principal=principal)
+        assert cache.get(token="token_1") == principal
+
+    assert cache.get(token="token_1") is None
+
+
+def test_token_hash_does_not_keep_the_token():
+    assert "secret" not in UserPrincipalCache.token_hash("secret")
@@ -1,3 +1,4 @@
+import uuid
 import jose
 import pytest
 from jose.exceptions import JWTClaimsError
@@ -7,13 +8,17 @@ from pecha_api.image_utils import ImageUtils
 from pecha_api.utils import Utils
 from pecha_api.users.users_service import get_user_info, update_user_info, \
     validate_and_extract_user_details, verify_admin_access, get_social_profile, update_social_profiles, \
-    get_publisher_info_by_username, fetch_user_by_email, validate_user_exists, get_user_info_by_username
+    get_publisher_info_by_username, fetch_user_by_email, validate_user_exists, get_user_info_by_username, \
+    get_user_principal, get_current_user_principal
 from pecha_api.users.user_response_models import UserInfoRequest, SocialMediaProfile, PublisherInfoResponse, \
-    UserInfoResponse
+    UserInfoResponse, UserPrincipal
+from pecha_api.users.user_principal_cache import user_principal_cache
 from pecha_api.users.users_models import Users, SocialMediaAccount
 from pecha_api.users.users_enums import SocialProfile
 from unittest.mock import patch, MagicMock, AsyncMock
-from fastapi import HTTPException, UploadFile
+from fastapi import Depends, FastAPI, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
 from pecha_api.users.users_service import upload_user_image
 import io
 
@@ -333,21 +338,9 @@ def test_verify_admin_access_true():
 
 def test_verify_admin_access_false():
     token = "valid_non_admin_token"
-    user = Users(
-        firstname="Regular",
-        lastname="User",
-        username="regularuser",
-        email="regular.user@example.com",
-        title="User",
-        organization="ExampleOrg",
-        education="BSc, MSc",
-        avatar_url="http://example.com/avatar.jpg",
-        about_me="About User",
-        social_media_accounts=[],
-        is_admin=False
-    )
+    principal = UserPrincipal(email="regular.user@example.com", username="regularuser", is_admin=False)
 
-    with patch("pecha_api.users.users_service.validate_and_extract_user_details", return_value=user):
+    with patch("pecha_api.users.users_service.get_user_principal", return_value=principal):
         assert verify_admin_access(token) is False
 
 
@@ -366,7 +359,8 @@ def test_verify_admin_access_no_attribute_false():
         social_media_accounts=[]
     )
 
-    with patch("pecha_api.users.users_service.validate_and_extract_user_details", return_value=user):
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "regular.user@example.com"}), \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=user):
         assert verify_admin_access(token) is False
 
 
@@ -596,7 +590,7 @@ async def test_fetch_user_by_email_success():
 
 def test_validate_user_exists_success():
     token = "valid_token"
-    with patch("pecha_api.users.users_service.validate_and_extract_user_details", return_value=True):
+    with patch("pecha_api.users.users_service.get_user_principal", return_value=UserPrincipal(email="john.doe@example.com")):
 
         response = validate_user_exists(token)
 
@@ -604,7 +598,7 @@ def test_validate_user_exists_success():
 
 def test_validate_user_exists_false():
     token = "invalid_token"
-    with patch("pecha_api.users.users_service.validate_and_extract_user_details", return_value=False):
+    with patch("pecha_api.users.users_service.get_user_principal", return_value=None):
 
         response = validate_user_exists(token)
 
@@ -765,3 +759,115 @@ async def test_get_user_info_by_username_database_error():
             await get_user_info_by_username(username)
         
         mock_get_user.assert_called_once_with(db=mock_db_session, username=username)
+
+
+def test_get_user_principal_verifies_token_once():
+    token = "cached_token"
+    user = Users(username="johndoe", email="john.doe@example.com", is_admin=True)
+
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}) as mock_validate, \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=user) as mock_get_user:
+        first = get_user_principal(token)
+        second = get_user_principal(token)
+        assert verify_admin_access(token) is True
+
+    assert first == second
+    assert first.email == "john.doe@example.com"
+    assert first.is_admin is True
+    mock_validate.assert_called_once()
+    mock_get_user.assert_called_once()
+
+
+def test_validate_and_extract_user_details_reuses_cached_claims():
+    token = "cached_token"
+    user = Users(id=uuid.uuid4(), username="johndoe", email="john.doe@example.com")
+
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}) as mock_validate, \
+            patch("pecha_api.users.users_service.SessionLocal") as mock_session_local, \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=user) as mock_get_user:
+        assert validate_and_extract_user_details(token) is user
+        cached_user = validate_and_extract_user_details(token)
+
+    assert cached_user is not user
+    assert cached_user.id == user.id
+    assert cached_user.email == "john.doe@example.com"
+    assert inspect(cached_user).detached
+    mock_validate.assert_called_once()
+    mock_get_user.assert_called_once()
+    mock_session_local.assert_called_once()
+
+
+def test_validate_and_extract_user_details_cached_user_mutations_do_not_leak():
+    token = "cached_token"
+    user = Users(id=uuid.uuid4(), username="johndoe", email="john.doe@example.com", firstname="John")
+
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}), \
+            patch("pecha_api.users.users_service.SessionLocal"), \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=user):
+        get_user_principal(token)
+        validate_and_extract_user_details(token).firstname = "Changed"
+
+        assert validate_and_extract_user_details(token).firstname == "John"
+
+
+def test_validate_and_extract_user_details_does_not_cache_unknown_user():
+    token = "cached_token"
+
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}), \
+            patch("pecha_api.users.users_service.SessionLocal"), \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=None):
+        assert validate_and_extract_user_details(token) is None
+        assert verify_admin_access(token) is False
+
+    assert user_principal_cache.get(token=token) is None
+
+
+def test_update_user_info_invalidates_user_principal():
+    token = "cached_token"
+    user = Users(username="johndoe", email="john.doe@example.com", social_media_accounts=[])
+    user_info_request = UserInfoRequest(firstname="John", lastname="Doe", educations=[], social_profiles=[])
+
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}), \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=user), \
+            patch("pecha_api.users.users_service.SessionLocal"), \
+            patch("pecha_api.users.users_service.update_social_profiles"), \
+            patch("pecha_api.users.users_service.update_user", return_value=user):
+        get_user_principal(token)
+        update_user_info(token=token, user_info_request=user_info_request)
+
+    assert user_principal_cache.get(token=token) is None
+
+
+
+def test_get_current_user_principal_dependency_verifies_once_per_request():
+    app = FastAPI()
+
+    @app.get("/whoami")
+    async def whoami(principal: UserPrincipal = Depends(get_current_user_principal)):
+        # service code called with the same token inside the request hits the request scope
+        return {"email": principal.email, "is_admin": verify_admin_access("request_token")}
+
+    user = Users(username="johndoe", email="john.doe@example.com", is_admin=False)
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}) as mock_validate, \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=user), \
+            patch("pecha_api.users.users_service.SessionLocal"):
+        response = TestClient(app).get("/whoami", headers={"Authorization": "Bearer request_token"})
+
+    assert response.status_code == 200
+    assert response.json() == {"email": "john.doe@example.com", "is_admin": False}
+    mock_validate.assert_called_once()
+
+
+def test_get_current_user_principal_dependency_rejects_unknown_user():
+    app = FastAPI()
+
+    @app.get("/whoami")
+    async def whoami(principal: UserPrincipal = Depends(get_current_user_principal)):
+        return {"email": principal.email}
+
+    with patch("pecha_api.users.users_service.validate_token", return_value={"email": "john.doe@example.com"}), \
+            patch("pecha_api.users.users_service.get_user_by_email", return_value=None), \
+            patch("pecha_api.users.users_service.SessionLocal"):
+        response = TestClient(app).get("/whoami", headers={"Authorization": "Bearer request_token"})
+
+    assert response.status_code == 401
@@ -6,9 +6,20 @@ from fastapi.testclient import TestClient
 from pecha_api.app import api
 from pecha_api.users.user_response_models import UserInfoResponse
 from fastapi import HTTPException
+import pytest
+from pecha_api.users.user_response_models import UserPrincipal
+from pecha_api.users.users_service import get_current_user_principal
 client = TestClient(api)
 
 
+@pytest.fixture(autouse=True)
+def override_current_user_principal():
+    original_dependency_overrides = api.dependency_overrides.copy()
+    api.dependency_overrides[get_current_user_principal] = lambda: UserPrincipal(email="john.doe@gmail.com")
+    yield
+    api.dependency_overrides = original_dependency_overrides
+
+
 def test_get_user_information():
     user_info_response = UserInfoResponse(
         firstname="John",